@@ -1,9 +1,17 @@
+import argparse
 import psycopg2
 import requests
 import json
 from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 import os
+from datetime import datetime, timezone
+
+from lib.etl.keys import KeyResolver
+from lib.etl.metrics import InstrumentedConnection, RunReport
+from lib.etl.rows import RowBatches
+from lib.etl.snapshot import read_snapshot, write_snapshot
+from lib.etl.transform import transform_all
 
 load_dotenv()
 
@@ -23,6 +31,8 @@ DB_CONFIG = {
     "port":  PORT
 }
 
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
 URLS = {
     "character": "https://raw.githubusercontent.com/ArknightsAssets/ArknightsGamedata/refs/heads/master/kr/gamedata/excel/character_table.json",
     "skill": "https://raw.githubusercontent.com/ArknightsAssets/ArknightsGamedata/refs/heads/master/kr/gamedata/excel/skill_table.json",
@@ -30,19 +40,23 @@ URLS = {
     "module": "https://raw.githubusercontent.com/ArknightsAssets/ArknightsGamedata/refs/heads/master/kr/gamedata/excel/uniequip_table.json",
     "item": "https://raw.githubusercontent.com/ArknightsAssets/ArknightsGamedata/refs/heads/master/kr/gamedata/excel/item_table.json",
     "map": "https://raw.githubusercontent.com/ArknightsAssets/ArknightsGamedata/refs/heads/master/kr/gamedata/excel/stage_table.json",
-    "zone": "https://raw.githubusercontent.com/ArknightsAssets/ArknightsGamedata/refs/heads/master/kr/gamedata/excel/zone_table.json"
+    "zone": "https://raw.githubusercontent.com/ArknightsAssets/ArknightsGamedata/refs/heads/master/kr/gamedata/excel/zone_table.json",
+    "skin": "https://raw.githubusercontent.com/ArknightsAssets/ArknightsGamedata/refs/heads/master/kr/gamedata/excel/skin_table.json"
 }
 
 # DB의 Serial ID와 JSON의 String ID를 매핑하기 위한 메모리 저장소
+# (테이블당 INSERT 1회 + SELECT 1회로 일괄 해석)
 ID_MAP = {
-    "profession": {},
-    "sub_profession": {},
-    "tag": {},
-    "item": {},
-    "zone": {},
-    "character": {},
-    "skill": {},
-    "module": {}
+    "profession": KeyResolver("professions", "code", "profession_id"),
+    "sub_profession": KeyResolver("sub_professions", "code", "sub_profession_id"),
+    "tag": KeyResolver("tags", "name", "tag_id"),
+    "item": KeyResolver("items", "item_code", "item_id"),
+    "zone": KeyResolver("zones", "zone_code", "zone_id"),
+    "character": KeyResolver("characters", "code", "character_id"),
+    "skill": KeyResolver("skills", "skill_code", "skill_id"),
+    "module": KeyResolver("character_modules", "module_code", "module_id"),
+    "skin_group": KeyResolver("skin_groups", "name_ko", "skin_group_id"),
+    "skin": KeyResolver("character_skins", "skin_code", "skin_id")
 }
 
 # ==========================================
@@ -58,672 +72,456 @@ def get_json(url):
         print(f"Failed to download {url}: {e}")
         return {}
 
-def connect_db():
-    return psycopg2.connect(**DB_CONFIG)
-
-def parse_phase(phase_val):
-    """PHASE_1 같은 문자열을 정수 1로 변환"""
-    if phase_val is None:
-        return 0
-    if isinstance(phase_val, int):
-        return phase_val
-    if isinstance(phase_val, str):
-        if phase_val.startswith("PHASE_"):
-            try:
-                return int(phase_val.split('_')[1])
-            except:
-                return 0
-        elif phase_val.isdigit():
-            return int(phase_val)
-    return 0
-
-def parse_rarity(rarity_value):
-    """JSON의 rarity 값이 정수일 수도 있고, 'TIER_5' 같은 문자열일 수도 있음을 처리"""
-    if rarity_value is None:
-        return 0
-    if isinstance(rarity_value, int):
-        return rarity_value
-    if isinstance(rarity_value, str):
-        if rarity_value.startswith("TIER_"):
-            try:
-                return int(rarity_value.split('_')[1]) - 1
-            except:
-                return 0
-        elif rarity_value.isdigit():
-            return int(rarity_value)
-    return 0
-
-def parse_skill_type(val):
-    """스킬 타입 파싱"""
-    if isinstance(val, int): 
-        return val
-    if val == "PASSIVE": 
+def load_sources(data_dir=None, download=True):
+    """
+    원본 JSON 수집
+    - data_dir에 같은 이름의 파일(예: data/item_table.json)이 있으면 로컬 파일 사용
+    - 없으면 다운로드 (download=False면 해당 소스는 건너뜀)
+    """
+    jsons = {}
+    for key, url in URLS.items():
+        local_path = os.path.join(data_dir, url.rsplit('/', 1)[-1]) if data_dir else None
+        if local_path and os.path.exists(local_path):
+            print(f"Reading {local_path}...")
+            with open(local_path, 'r', encoding='utf-8') as f:
+                jsons[key] = json.load(f)
+        elif download:
+            jsons[key] = get_json(url)
+        else:
+            print(f"Skipping {key}: no local file and downloads disabled")
+            jsons[key] = {}
+    return jsons
+
+def connect_db(report=None):
+    # 모든 커서가 문장별 소요 시간을 report에 기록하도록 계측 커넥션 사용
+    conn = psycopg2.connect(**DB_CONFIG, connection_factory=InstrumentedConnection)
+    conn.report = report
+    return conn
+
+def note_unresolved(conn, table, total, loaded):
+    """외래키 해석 실패로 빠진 행 수를 현재 stage의 스킵 사유로 기록"""
+    if conn.report is not None and total > loaded:
+        conn.report.skip(table, "unresolved_reference", total - loaded)
+
+def bulk_insert(cur, table, columns, values, conflict="ON CONFLICT DO NOTHING", total=None):
+    """
+    execute_values 기반 일괄 INSERT (행 단위 cur.execute 대신 사용)
+    - total: 필터링 전 입력 행 수 (주어지면 빠진 행을 스킵으로 집계)
+    """
+    if total is not None:
+        note_unresolved(cur.connection, table, total, len(values))
+    if not values:
         return 0
-    if val == "MANUAL": 
-        return 1
-    if val == "AUTO": 
-        return 2
-    return 0
-
-def parse_sp_type(val):
-    """SP 타입 파싱"""
-    if isinstance(val, int): 
-        return val
-    if val == "INCREASE_WITH_TIME": 
-        return 1
-    if val == "INCREASE_WHEN_ATTACK": 
-        return 2
-    if val == "INCREASE_WHEN_TAKEN_DAMAGE": 
-        return 4
-    return 8
+    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s {conflict}"
+    execute_values(cur, query, values, page_size=1000)
+    return len(values)
 
-def pre_load_ids(conn):
-    """기존 DB의 ID들을 미리 로드"""
+def pre_load_ids(conn, batches=None):
+    """기존 DB의 ID들을 미리 로드 (테이블당 SELECT 1회)"""
     print(">> Pre-loading existing IDs from DB...")
     cur = conn.cursor()
     
-    # Characters
-    cur.execute("SELECT code, character_id FROM characters")
-    for code, char_id in cur.fetchall():
-        ID_MAP["character"][code] = char_id
-    
-    # Skills
-    cur.execute("SELECT skill_code, skill_id FROM skills")
-    for code, skill_id in cur.fetchall():
-        ID_MAP["skill"][code] = skill_id
-    
-    # Items
-    cur.execute("SELECT item_code, item_id FROM items")
-    for code, item_id in cur.fetchall():
-        ID_MAP["item"][code] = item_id
+    for key in ("character", "skill", "item"):
+        ID_MAP[key].load(cur)
     
     print(f"   - Loaded {len(ID_MAP['character'])} characters, {len(ID_MAP['skill'])} skills, {len(ID_MAP['item'])} items")
 
 # ==========================================
 # 3. 데이터 로딩 함수 (실행 순서 중요)
+# - 입력은 transform 단계의 RowBatches (자연키 -> ID는 ID_MAP으로 일괄 해석)
 # ==========================================
 
-def load_ranges(conn, data):
+def load_ranges(conn, batches):
     print(">> Loading Ranges...")
     cur = conn.cursor()
-    values = []
-    for range_id, info in data.items():
-        grids_json = json.dumps(info.get('grids', []))
-        values.append((range_id, grids_json))
-    
-    query = "INSERT INTO ranges (range_id, grids) VALUES %s ON CONFLICT (range_id) DO NOTHING"
-    execute_values(cur, query, values)
+    values = [(r.range_id, json.dumps(r.grids)) for r in batches["ranges"]]
+    bulk_insert(cur, "ranges", ("range_id", "grids"), values, "ON CONFLICT (range_id) DO NOTHING")
     conn.commit()
 
-def load_items(conn, data):
+def load_items(conn, batches):
     print(">> Loading Items...")
     cur = conn.cursor()
-    items_dict = data.get("items", {})
-    
-    for item_code, info in items_dict.items():
-        if info.get('isDeleted', False): 
-            continue
-
-        raw_rarity = info.get('rarity')
-        rarity_int = parse_rarity(raw_rarity)
-
-        try:
-            cur.execute("""
-                INSERT INTO items (item_code, name_ko, rarity, icon_id, item_type, classify_type, usage_text, description, obtain_approach)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (item_code) DO UPDATE SET name_ko = EXCLUDED.name_ko
-                RETURNING item_id
-            """, (
-                item_code, 
-                info.get('name'), 
-                rarity_int,
-                info.get('iconId'),
-                info.get('itemType'), 
-                info.get('classifyType'), 
-                info.get('usage'), 
-                info.get('description'), 
-                info.get('obtainApproach')
-            ))
-            
-            db_id = cur.fetchone()[0]
-            ID_MAP["item"][item_code] = db_id
-            
-        except Exception as e:
-            print(f"Skipping item {item_code}: {e}")
-            conn.rollback()
-            continue
-            
+    rows = batches["items"]
+    ID_MAP["item"].resolve(cur, rows, columns=rows[0]._fields if rows else None, update_columns=("name_ko",))
     conn.commit()
 
-def load_zones(conn, data):
+def load_zones(conn, batches):
     print(">> Loading Zones...")
     cur = conn.cursor()
-    zones_dict = data.get("zones", {})
-    
-    for zone_code, info in zones_dict.items():
-        name_ko = info.get('zoneNameSecond')
-        if not name_ko:
-            name_ko = info.get('zoneNameFirst')
-        if not name_ko:
-            name_ko = zone_code
-            
-        try:
-            cur.execute("""
-                INSERT INTO zones (zone_code, name_ko, zone_type, zone_index)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (zone_code) DO NOTHING
-                RETURNING zone_id
-            """, (
-                zone_code, 
-                name_ko, 
-                info.get('type'), 
-                info.get('zoneIndex')
-            ))
-            
-            row = cur.fetchone()
-            if row:
-                ID_MAP["zone"][zone_code] = row[0]
-            else:
-                cur.execute("SELECT zone_id FROM zones WHERE zone_code = %s", (zone_code,))
-                res = cur.fetchone()
-                if res: 
-                    ID_MAP["zone"][zone_code] = res[0]
-                
-        except Exception as e:
-            print(f"Skipping zone {zone_code}: {e}")
-            conn.rollback()
-            continue
-            
+    rows = batches["zones"]
+    ID_MAP["zone"].resolve(cur, rows, columns=rows[0]._fields if rows else None)
     conn.commit()
 
-def load_professions_tags(conn, char_data):
+def load_professions_tags(conn, batches):
     print(">> Loading Professions & Tags...")
     cur = conn.cursor()
+    ID_MAP["profession"].resolve(cur, batches["professions"], columns=("code", "name_ko"))
+    ID_MAP["sub_profession"].resolve(cur, batches["sub_professions"], columns=("code", "name_ko"))
+    ID_MAP["tag"].resolve(cur, batches["tags"])
+    conn.commit()
+
+def load_characters(conn, batches):
+    print(">> Loading Characters & Related Data...")
+    cur = conn.cursor()
+    char_ids = ID_MAP["character"]
+    item_ids = ID_MAP["item"]
     
-    profs = {}
-    sub_profs = {}
-    tags = set()
+    # 1. Character (전체 캐릭터를 한 번에 upsert 후 ID 맵 일괄 조회)
+    char_ids.resolve(
+        cur,
+        [
+            (c.code, c.name_ko, c.rarity, ID_MAP["profession"].get(c.profession_code),
+             ID_MAP["sub_profession"].get(c.sub_profession_code), c.position, c.description, c.nation_id)
+            for c in batches["characters"]
+        ],
+        columns=("code", "name_ko", "rarity", "profession_id", "sub_profession_id", "position", "description", "nation_id"),
+        update_columns=("name_ko",)
+    )
     
-    for char_code, info in char_data.items():
-        prof = info.get('profession')
-        subprof = info.get('subProfessionId')
-        tag_list = info.get('tagList') or []
-        
-        if prof:
-            profs[prof] = info.get('professionName', prof)
-        if subprof:
-            sub_profs[subprof] = subprof
-        for t in tag_list:
-            if t:
-                tags.add(t)
+    # 2. Potential
+    bulk_insert(cur, "character_potentials", ("character_id", "potential_rank", "buff_type", "buff_value", "attributes"), [
+        (char_ids[p.char_code], p.potential_rank, p.buff_type, p.buff_value, json.dumps(p.attributes))
+        for p in batches["character_potentials"] if p.char_code in char_ids
+    ], """ON CONFLICT (character_id, potential_rank) DO UPDATE SET
+        attributes = EXCLUDED.attributes""", total=len(batches["character_potentials"]))
     
-    for code, name in profs.items():
-        cur.execute("INSERT INTO professions (code, name_ko) VALUES (%s, %s) ON CONFLICT (code) DO NOTHING RETURNING profession_id", (code, name))
-        row = cur.fetchone()
-        if row:
-            ID_MAP["profession"][code] = row[0]
-        else:
-            cur.execute("SELECT profession_id FROM professions WHERE code = %s", (code,))
-            res = cur.fetchone()
-            if res:
-                ID_MAP["profession"][code] = res[0]
+    # 3. Stats & Promotion Costs
+    bulk_insert(cur, "character_stats", (
+        "character_id", "phase", "max_level", "range_id",
+        "base_hp", "base_atk", "base_def",
+        "max_hp", "max_atk", "max_def",
+        "magic_resistance", "cost", "block_count", "attack_speed", "keyframes"
+    ), [
+        (char_ids[s.char_code], *s[1:-1], json.dumps(s.keyframes))
+        for s in batches["character_stats"] if s.char_code in char_ids
+    ], """ON CONFLICT (character_id, phase) DO UPDATE SET
+        base_hp = EXCLUDED.base_hp,
+        base_atk = EXCLUDED.base_atk,
+        base_def = EXCLUDED.base_def,
+        keyframes = EXCLUDED.keyframes""", total=len(batches["character_stats"]))
     
-    for code in sub_profs:
-        cur.execute("INSERT INTO sub_professions (code, name_ko) VALUES (%s, %s) ON CONFLICT (code) DO NOTHING RETURNING sub_profession_id", (code, code))
-        row = cur.fetchone()
-        if row:
-            ID_MAP["sub_profession"][code] = row[0]
-        else:
-            cur.execute("SELECT sub_profession_id FROM sub_professions WHERE code = %s", (code,))
-            res = cur.fetchone()
-            if res:
-                ID_MAP["sub_profession"][code] = res[0]
+    bulk_insert(cur, "character_promotion_costs", ("character_id", "target_phase", "item_id", "count"), [
+        (char_ids[c.char_code], c.target_phase, item_ids[c.item_code], c.count)
+        for c in batches["character_promotion_costs"] if c.char_code in char_ids and c.item_code in item_ids
+    ], total=len(batches["character_promotion_costs"]))
     
-    for t in tags:
-        cur.execute("INSERT INTO tags (name) VALUES (%s) ON CONFLICT (name) DO NOTHING RETURNING tag_id", (t,))
-        row = cur.fetchone()
-        if row:
-            ID_MAP["tag"][t] = row[0]
-        else:
-            cur.execute("SELECT tag_id FROM tags WHERE name = %s", (t,))
-            res = cur.fetchone()
-            if res:
-                ID_MAP["tag"][t] = res[0]
+    # 4. Skill Codes
+    bulk_insert(cur, "character_skill", ("character_id", "phase_0_code", "phase_1_code", "phase_2_code"), [
+        (char_ids[s.char_code], s.phase_0_code, s.phase_1_code, s.phase_2_code)
+        for s in batches["character_skill"] if s.char_code in char_ids
+    ], "ON CONFLICT (character_id) DO NOTHING", total=len(batches["character_skill"]))
     
-    conn.commit()
-
-def load_characters(conn, data):
-    print(">> Loading Characters & Related Data...")
-    cur = conn.cursor()
+    # 5. Character Skill Costs (레벨 2-7)
+    bulk_insert(cur, "character_skill_costs", ("character_id", "level", "item_id", "count"), [
+        (char_ids[c.char_code], c.level, item_ids[c.item_code], c.count)
+        for c in batches["character_skill_costs"] if c.char_code in char_ids and c.item_code in item_ids
+    ], total=len(batches["character_skill_costs"]))
+    
+    # 6. Talents
+    bulk_insert(cur, "character_talents", (
+        "character_id", "talent_index", "candidate_index",
+        "unlock_phase", "unlock_level", "required_potential",
+        "range_id", "name", "description", "blackboard"
+    ), [
+        (char_ids[t.char_code], *t[1:-1], json.dumps(t.blackboard))
+        for t in batches["character_talents"] if t.char_code in char_ids
+    ], total=len(batches["character_talents"]))
+    
+    # 7. Tags
+    bulk_insert(cur, "character_tag", ("character_id", "tag_id"), [
+        (char_ids[t.char_code], ID_MAP["tag"][t.tag_name])
+        for t in batches["character_tag"] if t.char_code in char_ids and t.tag_name in ID_MAP["tag"]
+    ], total=len(batches["character_tag"]))
+    
+    # 8. Favor
+    bulk_insert(cur, "character_favor_templates", ("character_id", "max_favor_level", "bonus_hp", "bonus_atk", "bonus_def"), [
+        (char_ids[f.char_code], *f[1:])
+        for f in batches["character_favor_templates"] if f.char_code in char_ids
+    ], "ON CONFLICT (character_id) DO NOTHING", total=len(batches["character_favor_templates"]))
     
-    for char_code, info in data.items():
-        if info.get('isNotObtainable', False):
-            continue
-        
-        try:
-            # 1. Character
-            raw_rarity = info.get('rarity')
-            rarity_int = parse_rarity(raw_rarity)
-            
-            prof_id = ID_MAP["profession"].get(info.get('profession'))
-            subprof_id = ID_MAP["sub_profession"].get(info.get('subProfessionId'))
-            
-            cur.execute("""
-                INSERT INTO characters (code, name_ko, rarity, profession_id, sub_profession_id, position, description, nation_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (code) DO UPDATE SET name_ko = EXCLUDED.name_ko
-                RETURNING character_id
-            """, (
-                char_code, info.get('name'), rarity_int, prof_id, subprof_id,
-                info.get('position'), info.get('itemDesc'), info.get('nationId')
-            ))
-            
-            char_id = cur.fetchone()[0]
-            ID_MAP["character"][char_code] = char_id
-            
-            # 2. Potential
-            pot_ranks = info.get('potentialRanks') or []
-            for idx, pot in enumerate(pot_ranks):
-                if pot.get('type') == 0:
-                    cur.execute("""
-                        INSERT INTO character_potentials (character_id, potential_rank, buff_type, buff_value)
-                        VALUES (%s, %s, %s, %s) ON CONFLICT (character_id, potential_rank) DO NOTHING
-                    """, (char_id, idx, pot.get('type', 0), pot.get('description', '')))
-            
-            # 3. Stats & Promotion Costs
-            phases = info.get('phases') or []
-            for idx, phase in enumerate(phases):
-                keyframes = phase.get('attributesKeyFrames') or []
-                if not keyframes:
-                    continue
-                
-                # Base stats (레벨 1)
-                base_data = keyframes[0].get('data', {})
-                base_hp = int(base_data.get('maxHp', 0))
-                base_atk = int(base_data.get('atk', 0))
-                base_def = int(base_data.get('def', 0))
-                
-                # Max stats (최대 레벨)
-                attr = keyframes[-1].get('data', {})
-                range_id = phase.get('rangeId')
-                
-                cur.execute("""
-                    INSERT INTO character_stats (character_id, phase, max_level, range_id, 
-                                                base_hp, base_atk, base_def,
-                                                max_hp, max_atk, max_def, 
-                                                magic_resistance, cost, block_count, attack_speed)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (character_id, phase) DO UPDATE SET
-                        base_hp = EXCLUDED.base_hp,
-                        base_atk = EXCLUDED.base_atk,
-                        base_def = EXCLUDED.base_def
-                """, (
-                    char_id, idx, phase.get('maxLevel', 0), range_id,
-                    base_hp, base_atk, base_def,
-                    int(attr.get('maxHp', 0)), int(attr.get('atk', 0)), int(attr.get('def', 0)),
-                    int(attr.get('magicResistance', 0)), int(attr.get('cost', 0)), 
-                    int(attr.get('blockCnt', 0)), int(attr.get('attackSpeed', 0))
-                ))
-                
-                # Promotion Costs
-                evolve_costs = phase.get('evolveCost') or []
-                for req in evolve_costs:
-                    item_db_id = ID_MAP["item"].get(req['id'])
-                    if item_db_id:
-                        cur.execute("""
-                            INSERT INTO character_promotion_costs (character_id, target_phase, item_id, count) 
-                            VALUES (%s, %s, %s, %s)
-                            ON CONFLICT DO NOTHING
-                        """, (char_id, idx, item_db_id, req['count']))
-
-            # 4. Skill Codes
-            skills_data = info.get('skills') or []
-            safe_skills = [s for s in skills_data if isinstance(s, dict)]
-            s_codes = [None, None, None]
-            
-            for i in range(min(len(safe_skills), 3)):
-                s_codes[i] = safe_skills[i].get('skillId')
-            
-            cur.execute("""
-                INSERT INTO character_skill (character_id, phase_0_code, phase_1_code, phase_2_code)
-                VALUES (%s, %s, %s, %s) ON CONFLICT (character_id) DO NOTHING
-            """, (char_id, s_codes[0], s_codes[1], s_codes[2]))
-            
-            # 5. Character Skill Costs (레벨 1-7)
-            skill_ups = info.get('allSkillLvlup') or []
-            for idx, lvl_data in enumerate(skill_ups):
-                target_level = idx + 2  # 레벨 2부터 시작
-                costs = lvl_data.get('lvlUpCost') or []
-                
-                for cost in costs:
-                    item_code = cost.get('id')
-                    qty = cost.get('count')
-                    item_db_id = ID_MAP["item"].get(item_code)
-                    
-                    if item_db_id:
-                        cur.execute("""
-                            INSERT INTO character_skill_costs (character_id, level, item_id, count)
-                            VALUES (%s, %s, %s, %s)
-                            ON CONFLICT DO NOTHING
-                        """, (char_id, target_level, item_db_id, qty))
-
-            # 6. Talents
-            talents = info.get('talents') or []
-            for t_idx, talent in enumerate(talents):
-                if not talent or 'candidates' not in talent:
-                    continue
-                
-                candidates = talent.get('candidates') or []
-                for c_idx, cand in enumerate(candidates):
-                    cond = cand.get('unlockCondition', {})
-                    raw_phase = cond.get('phase')
-                    phase_int = parse_phase(raw_phase)
-                    talent_name = cand.get('name') or "Unknown Talent"
-
-                    cur.execute("""
-                        INSERT INTO character_talents (character_id, talent_index, candidate_index, 
-                                                      unlock_phase, unlock_level, required_potential, 
-                                                      range_id, name, description, blackboard)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT DO NOTHING
-                    """, (
-                        char_id, t_idx+1, c_idx+1, phase_int,
-                        cond.get('level', 1), cand.get('requiredPotentialRank', 0),
-                        cand.get('rangeId'), talent_name, 
-                        cand.get('description'), json.dumps(cand.get('blackboard', []))
-                    ))
-            
-            # 7. Tags
-            tag_list = info.get('tagList') or []
-            for t in tag_list:
-                tag_db_id = ID_MAP["tag"].get(t)
-                if tag_db_id:
-                    cur.execute("""
-                        INSERT INTO character_tag (character_id, tag_id) 
-                        VALUES (%s, %s) ON CONFLICT DO NOTHING
-                    """, (char_id, tag_db_id))
-
-            # 8. Favor
-            favor_frames = info.get('favorKeyFrames') or []
-            if favor_frames:
-                favor = favor_frames[-1].get('data', {})
-                cur.execute("""
-                    INSERT INTO character_favor_templates (character_id, max_favor_level, bonus_hp, bonus_atk, bonus_def)
-                    VALUES (%s, 100, %s, %s, %s) ON CONFLICT (character_id) DO NOTHING
-                """, (char_id, int(favor.get('maxHp', 0)), int(favor.get('atk', 0)), int(favor.get('def', 0))))
-
-        except Exception as e:
-            print(f"Skipping char {char_code}: {e}")
-            conn.rollback()
-            continue
-            
     conn.commit()
+    print(f"   - Processed {len(batches['characters'])} characters.")
 
-def load_skills(conn, data):
+def load_skills(conn, batches):
     print(">> Loading Skills & Skill Levels...")
     cur = conn.cursor()
-    inserted_skills = 0
     
-    for skill_code, info in data.items():
-        try:
-            lvl0 = info.get('levels', [{}])[0]
-            
-            raw_skill_type = lvl0.get('skillType', 0)
-            raw_sp_type = lvl0.get('spData', {}).get('spType', 0)
-            
-            final_skill_type = parse_skill_type(raw_skill_type)
-            final_sp_type = parse_sp_type(raw_sp_type)
-
-            # 1. Skills 테이블
-            cur.execute("""
-                INSERT INTO skills (skill_code, name_ko, icon_id, skill_type, sp_type)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (skill_code) DO NOTHING
-                RETURNING skill_id
-            """, (
-                skill_code, lvl0.get('name'), info.get('iconId'), 
-                final_skill_type, final_sp_type
-            ))
-            
-            row = cur.fetchone()
-            if row:
-                skill_id = row[0]
-            else:
-                cur.execute("SELECT skill_id FROM skills WHERE skill_code = %s", (skill_code,))
-                row = cur.fetchone()
-                if not row: 
-                    continue
-                skill_id = row[0]
-            
-            ID_MAP["skill"][skill_code] = skill_id
-            
-            # 2. Skill Levels 테이블
-            for idx, lvl_info in enumerate(info.get('levels', [])):
-                level_val = idx + 1
-                
-                # Check Constraint 위반 방지: 레벨이 10을 넘으면 스킵
-                if level_val > 10:
-                    continue
-
-                sp = lvl_info.get('spData', {})
-                
-                # Numeric Overflow 방지: duration이 999.99를 넘으면 999.0으로 제한
-                raw_duration = lvl_info.get('duration', 0)
-                safe_duration = min(float(raw_duration), 999.0)
-
-                cur.execute("""
-                    INSERT INTO skill_levels (skill_id, level, sp_cost, initial_sp, duration, 
-                                            range_id, description, blackboard)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (skill_id, level) DO NOTHING
-                """, (
-                    skill_id, level_val, 
-                    sp.get('spCost', 0), sp.get('initSp', 0), 
-                    safe_duration, lvl_info.get('rangeId'), 
-                    lvl_info.get('description'), 
-                    json.dumps(lvl_info.get('blackboard', []))
-                ))
-            
-            inserted_skills += 1
-            
-        except Exception as e:
-            print(f"Skipping skill {skill_code}: {e}")
-            conn.rollback()
-            continue
-            
+    # 1. Skills 테이블 (일괄 삽입 후 ID 맵 1회 조회)
+    skills = batches["skills"]
+    ID_MAP["skill"].resolve(cur, skills, columns=("skill_code", "name_ko", "icon_id", "skill_type", "sp_type"))
+    
+    # 2. Skill Levels 테이블
+    skill_ids = ID_MAP["skill"]
+    bulk_insert(cur, "skill_levels", (
+        "skill_id", "level", "sp_cost", "initial_sp", "duration",
+        "range_id", "description", "blackboard"
+    ), [
+        (skill_ids[l.skill_code], *l[1:-1], json.dumps(l.blackboard))
+        for l in batches["skill_levels"] if l.skill_code in skill_ids
+    ], "ON CONFLICT (skill_id, level) DO NOTHING", total=len(batches["skill_levels"]))
+        
     conn.commit()
-    print(f"   - Processed {inserted_skills} skills.")
+    print(f"   - Processed {len(skills)} skills.")
 
-def load_skill_mastery_costs(conn, data):
+def load_skill_mastery_costs(conn, batches):
     """스킬 특화 비용 로드 (레벨 8-10)"""
     print(">> Loading Skill Mastery Costs (Lv 8-10)...")
     cur = conn.cursor()
-    count = 0
+    skill_ids = ID_MAP["skill"]
+    item_ids = ID_MAP["item"]
     
-    for char_code, char_info in data.items():
-        skills_list = char_info.get('skills', [])
-        
-        for skill_entry in skills_list:
-            skill_code = skill_entry.get('skillId')
-            skill_db_id = ID_MAP["skill"].get(skill_code)
-            if not skill_db_id: 
-                continue
-
-            # levelUpCostCond 파싱
-            # Index 0 -> Mastery 1 (Lv 8)
-            # Index 1 -> Mastery 2 (Lv 9)
-            # Index 2 -> Mastery 3 (Lv 10)
-            mastery_conds = skill_entry.get('levelUpCostCond') or []
-            
-            for idx, cond in enumerate(mastery_conds):
-                mastery_level = idx + 1  # 1, 2, 3
-                costs = cond.get('levelUpCost') or []
-                
-                for cost in costs:
-                    item_code = cost.get('id')
-                    qty = cost.get('count')
-                    item_db_id = ID_MAP["item"].get(item_code)
-                    
-                    if item_db_id:
-                        cur.execute("""
-                            INSERT INTO skill_mastery_costs (skill_id, mastery_level, item_id, count)
-                            VALUES (%s, %s, %s, %s)
-                            ON CONFLICT DO NOTHING
-                        """, (skill_db_id, mastery_level, item_db_id, qty))
-                        count += 1
+    count = bulk_insert(cur, "skill_mastery_costs", ("skill_id", "mastery_level", "item_id", "count"), [
+        (skill_ids[c.skill_code], c.mastery_level, item_ids[c.item_code], c.count)
+        for c in batches["skill_mastery_costs"] if c.skill_code in skill_ids and c.item_code in item_ids
+    ], total=len(batches["skill_mastery_costs"]))
                     
     conn.commit()
     print(f"   - Inserted {count} mastery cost records.")
 
-def load_modules(conn, data):
+def load_modules(conn, batches):
     print(">> Loading Modules & Costs...")
     cur = conn.cursor()
-    equip_dict = data.get('equipDict', {})
-    inserted_modules = 0
+    char_ids = ID_MAP["character"]
     
-    for mod_code, info in equip_dict.items():
-        char_db_id = ID_MAP["character"].get(info.get('charId'))
-        if not char_db_id: 
-            continue
-        
-        try:
-            # 1. Character Modules
-            cur.execute("""
-                INSERT INTO character_modules (module_code, character_id, name_ko, icon_id, description)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (module_code) DO NOTHING
-                RETURNING module_id
-            """, (
-                mod_code, char_db_id, info.get('uniEquipName'), 
-                info.get('uniEquipIcon'), info.get('uniEquipDesc')
-            ))
-            
-            row = cur.fetchone()
-            if row:
-                mod_id = row[0]
-            else:
-                cur.execute("SELECT module_id FROM character_modules WHERE module_code = %s", (mod_code,))
-                row = cur.fetchone()
-                if not row: 
-                    continue
-                mod_id = row[0]
-            
-            # 2. Module Costs
-            item_costs = info.get('itemCost') or {}
-            
-            for lvl_str, costs in item_costs.items():
-                for cost in costs:
-                    item_db_id = ID_MAP["item"].get(cost['id'])
-                    if item_db_id:
-                        cur.execute("""
-                            INSERT INTO character_module_costs (module_id, level, item_id, count) 
-                            VALUES (%s, %s, %s, %s)
-                            ON CONFLICT DO NOTHING
-                        """, (mod_id, int(lvl_str), item_db_id, cost['count']))
-                        
-            inserted_modules += 1
-            
-        except Exception as e:
-            print(f"Skipping module {mod_code}: {e}")
-            conn.rollback()
-            continue
+    # 1. Character Modules (일괄 삽입 후 ID 맵 1회 조회)
+    module_values = [
+        (m.module_code, char_ids[m.char_code], m.name_ko, m.icon_id, m.description)
+        for m in batches["character_modules"] if m.char_code in char_ids
+    ]
+    note_unresolved(conn, "character_modules", len(batches["character_modules"]), len(module_values))
+    ID_MAP["module"].resolve(cur, module_values, columns=("module_code", "character_id", "name_ko", "icon_id", "description"))
+    
+    # 2. Module Costs
+    module_ids = ID_MAP["module"]
+    item_ids = ID_MAP["item"]
+    bulk_insert(cur, "character_module_costs", ("module_id", "level", "item_id", "count"), [
+        (module_ids[c.module_code], c.level, item_ids[c.item_code], c.count)
+        for c in batches["character_module_costs"] if c.module_code in module_ids and c.item_code in item_ids
+    ], total=len(batches["character_module_costs"]))
             
     conn.commit()
-    print(f"   - Processed {inserted_modules} modules.")
+    print(f"   - Processed {len(module_values)} modules.")
 
-def load_stages(conn, data):
+def load_stages(conn, batches):
     print(">> Loading Stages...")
     cur = conn.cursor()
+    zone_ids = ID_MAP["zone"]
     
-    for stage_code, info in data.get('stages', {}).items():
-        zone_db_id = ID_MAP["zone"].get(info.get('zoneId'))
-        if not zone_db_id: 
-            continue
-        
-        try:
-            cur.execute("""
-                INSERT INTO stages (stage_code, zone_id, display_code, name_ko, description, ap_cost, danger_level)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (stage_code) DO NOTHING
-            """, (
-                stage_code, zone_db_id, info.get('code'), 
-                info.get('name'), info.get('description'), 
-                info.get('apCost', 0), info.get('dangerLevel')
-            ))
-        except Exception as e:
-            print(f"Skipping stage {stage_code}: {e}")
-            conn.rollback()
-            continue
+    bulk_insert(cur, "stages", ("stage_code", "zone_id", "display_code", "name_ko", "description", "ap_cost", "danger_level"), [
+        (s.stage_code, zone_ids[s.zone_code], *s[2:])
+        for s in batches["stages"] if s.zone_code in zone_ids
+    ], "ON CONFLICT (stage_code) DO NOTHING", total=len(batches["stages"]))
             
     conn.commit()
 
+def load_skins(conn, batches):
+    """스킨 그룹 / 스킨 / 스킨 상세를 각각 1회의 문장으로 일괄 적재"""
+    print(">> Loading Skins & Skin Details...")
+    cur = conn.cursor()
+    skins = batches["character_skins"]
+    
+    # 1. Skin Groups
+    ID_MAP["skin_group"].resolve(cur, batches["skin_groups"])
+    
+    # 2. Character Skins
+    skin_values = [
+        (s.skin_code, ID_MAP["character"][s.char_code], *s[2:])
+        for s in skins if s.char_code in ID_MAP["character"]
+    ]
+    note_unresolved(conn, "character_skins", len(skins), len(skin_values))
+    
+    if skin_values:
+        execute_values(cur, """
+            INSERT INTO character_skins (
+                skin_code, character_id, name_ko, series_name, 
+                illustrator, portrait_id, avatar_id, created_at, updated_at
+            ) VALUES %s
+            ON CONFLICT (skin_code) 
+            DO UPDATE SET
+                character_id = EXCLUDED.character_id,
+                name_ko = EXCLUDED.name_ko,
+                series_name = EXCLUDED.series_name,
+                illustrator = EXCLUDED.illustrator,
+                portrait_id = EXCLUDED.portrait_id,
+                avatar_id = EXCLUDED.avatar_id,
+                updated_at = EXCLUDED.updated_at
+        """, skin_values, template="(%s, %s, %s, %s, %s, %s, %s, NOW(), NOW())", page_size=len(skin_values))
+    
+    # 3. Character Skin Details (skin_code -> skin_id 1회 조회)
+    ID_MAP["skin"].load(cur)
+    detail_values = [
+        (ID_MAP["skin"][d.skin_code], ID_MAP["skin_group"].get(d.group_name), *d[2:])
+        for d in batches["character_skin_details"] if d.skin_code in ID_MAP["skin"]
+    ]
+    note_unresolved(conn, "character_skin_details", len(batches["character_skin_details"]), len(detail_values))
+    
+    if detail_values:
+        execute_values(cur, """
+            INSERT INTO character_skin_details (
+                skin_id, skin_group_id, content, dialog, 
+                description, usage_text, created_at, updated_at
+            ) VALUES %s
+            ON CONFLICT (skin_id) 
+            DO UPDATE SET
+                skin_group_id = EXCLUDED.skin_group_id,
+                content = EXCLUDED.content,
+                dialog = EXCLUDED.dialog,
+                description = EXCLUDED.description,
+                usage_text = EXCLUDED.usage_text,
+                updated_at = EXCLUDED.updated_at
+        """, detail_values, template="(%s, %s, %s, %s, %s, %s, NOW(), NOW())", page_size=len(detail_values))
+    
+    conn.commit()
+    print(f"   - Processed {len(batches['skin_groups'])} skin groups, {len(skin_values)} skins, {len(detail_values)} details.")
+    if len(skin_values) < len(skins):
+        print(f"   - Skipped {len(skins) - len(skin_values)} skins (character not found).")
+
+def store_dataset_version(conn, batches):
+    """
+    적재가 끝난 데이터셋의 버전을 기록 (마지막 stage)
+    - API 서버(DATASET_MODE=memory)는 이 값이 바뀌면 인메모리 스냅샷을 다시 만듭니다.
+    """
+    version = batches.fingerprint()
+    print(f">> Storing dataset version {version}...")
+    cur = conn.cursor()
+    cur.execute("""
+        INSERT INTO dataset_version (id, version, updated_at) VALUES (1, %s, NOW())
+        ON CONFLICT (id) DO UPDATE SET version = EXCLUDED.version, updated_at = EXCLUDED.updated_at
+    """, (version,))
+    conn.commit()
+
+    # 공유 응답 스토어 배포: 이전 버전 게시본을 내림 (로더 export --publish --watch가 새 버전으로 다시 게시)
+    store_dir = os.getenv("SHARED_STORE_DIR")
+    if store_dir:
+        from lib.api.shared_store import drop
+        if drop(store_dir):
+            print(f"   - Dropped shared response store {store_dir}")
+
+# (stage 이름, 적재 함수, 입력 테이블) - 의존 순서대로
+LOAD_STAGES = [
+    # Level 0: 독립 마스터
+    ("ranges", load_ranges, ("ranges",)),
+    ("items", load_items, ("items",)),
+    ("zones", load_zones, ("zones",)),
+    # Level 1: 캐릭터 의존 마스터
+    ("professions_tags", load_professions_tags, ("professions", "sub_professions", "tags")),
+    # Level 2: 메인 엔티티
+    ("characters", load_characters, (
+        "characters", "character_potentials", "character_stats", "character_promotion_costs",
+        "character_skill", "character_skill_costs", "character_talents", "character_tag",
+        "character_favor_templates"
+    )),
+    # ID 매핑 갱신 (스킬/모듈 참조를 위해)
+    ("pre_load_ids", pre_load_ids, ()),
+    ("skills", load_skills, ("skills", "skill_levels")),
+    ("skill_mastery_costs", load_skill_mastery_costs, ("skill_mastery_costs",)),
+    # Level 3: 종속 엔티티
+    ("modules", load_modules, ("character_modules", "character_module_costs")),
+    ("stages", load_stages, ("stages",)),
+    ("skins", load_skins, ("skin_groups", "character_skins", "character_skin_details")),
+    ("dataset_version", store_dataset_version, ()),
+]
+
+def load_all(conn, batches: RowBatches, report: RunReport):
+    """
+    RowBatches 전체를 의존 순서대로 DB에 적재
+    - stage마다 commit하므로 실패 시 해당 stage만 rollback되고 이전 stage 결과는 보존됩니다.
+    - 실패한 stage는 리포트에 오류로 남기고 실행을 중단합니다. (이후 stage는 외래키를 해석할 수 없음)
+    """
+    for step, (name, loader, tables) in enumerate(LOAD_STAGES, start=3):
+        print("\n" + "=" * 50)
+        print(f"STEP {step}: Loading {name}")
+        print("=" * 50)
+        
+        # 변환 단계에서 걸러진 행은 transform(또는 read_snapshot) stage에만 집계하고,
+        # 여기서는 적재 중 해석하지 못해 버린 행(note_unresolved)만 집계
+        with report.stage(name, rows_read=sum(len(batches[t]) for t in tables)) as stage:
+            try:
+                loader(conn, batches)
+            except Exception:
+                conn.rollback()
+                raise
+        print(stage.summary())
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Arknights 게임 데이터 ETL")
+    parser.add_argument("--offline", action="store_true",
+                        help="DB 없이 변환만 수행하고 결과를 스냅샷으로 기록")
+    parser.add_argument("--from-snapshot", metavar="DIR",
+                        help="변환을 건너뛰고 기존 스냅샷을 DB에 일괄 적재")
+    parser.add_argument("--snapshot-dir", metavar="DIR",
+                        help="변환 결과를 기록할 디렉터리 (--offline 기본값: snapshot)")
+    parser.add_argument("--format", choices=("auto", "ndjson", "parquet"), default="auto",
+                        help="스냅샷 포맷 (auto: pyarrow가 있으면 parquet)")
+    parser.add_argument("--data-dir", metavar="DIR",
+                        help="로컬 원본 JSON 디렉터리 (--offline 기본값: data)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="character_table 변환 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--no-download", action="store_true",
+                        help="로컬에 없는 원본은 다운로드하지 않고 건너뜀")
+    parser.add_argument("--report", metavar="PATH",
+                        help="실행 리포트(JSON) 경로 (기본값: reports/etl-<UTC 시각>.json)")
+    parser.add_argument("--top-statements", type=int, default=20,
+                        help="리포트에 남길 가장 느린 SQL 문장 수")
+    args = parser.parse_args()
+
+    if args.offline:
+        args.snapshot_dir = args.snapshot_dir or "snapshot"
+        args.data_dir = args.data_dir or DATA_DIR
+    if not args.report:
+        args.report = os.path.join("reports", f"etl-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json")
+    return args
+
 # ==========================================
 # 4. 실행 진입점
 # ==========================================
 if __name__ == "__main__":
+    args = parse_args()
+    mode = "offline" if args.offline else "snapshot" if args.from_snapshot else "full"
+    report = RunReport(mode, top_n=args.top_statements)
     conn = None
     try:
-        conn = connect_db()
-        print("✅ DB Connected Successfully.\n")
-        
-        # 1. JSON 다운로드
-        print("=" * 50)
-        print("STEP 1: Downloading JSON files")
-        print("=" * 50)
-        jsons = {}
-        for key, url in URLS.items():
-            jsons[key] = get_json(url)
-        
-        print("\n" + "=" * 50)
-        print("STEP 2: Loading Base Data (Ranges, Items, Zones)")
-        print("=" * 50)
-        # Level 0: 독립 마스터
-        load_ranges(conn, jsons["range"])
-        load_items(conn, jsons["item"])
-        load_zones(conn, jsons["zone"])
-        
-        print("\n" + "=" * 50)
-        print("STEP 3: Loading Professions & Tags")
-        print("=" * 50)
-        # Level 1: 캐릭터 의존 마스터
-        load_professions_tags(conn, jsons["character"])
-        
-        print("\n" + "=" * 50)
-        print("STEP 4: Loading Characters (with Stats & Skill Costs)")
-        print("=" * 50)
-        # Level 2: 메인 엔티티
-        load_characters(conn, jsons["character"])
-        
-        print("\n" + "=" * 50)
-        print("STEP 5: Pre-loading IDs for Cross-references")
-        print("=" * 50)
-        # ID 매핑 갱신 (스킬/모듈 참조를 위해)
-        pre_load_ids(conn)
-        
-        print("\n" + "=" * 50)
-        print("STEP 6: Loading Skills & Skill Levels")
-        print("=" * 50)
-        load_skills(conn, jsons["skill"])
-        
-        print("\n" + "=" * 50)
-        print("STEP 7: Loading Skill Mastery Costs")
-        print("=" * 50)
-        load_skill_mastery_costs(conn, jsons["character"])
-        
-        print("\n" + "=" * 50)
-        print("STEP 8: Loading Modules")
-        print("=" * 50)
-        # Level 3: 종속 엔티티
-        load_modules(conn, jsons["module"])
-        
-        print("\n" + "=" * 50)
-        print("STEP 9: Loading Stages")
-        print("=" * 50)
-        load_stages(conn, jsons["map"])
+        if args.from_snapshot:
+            print(f">> Reading snapshot {args.from_snapshot}...")
+            with report.stage("read_snapshot") as stage:
+                batches = read_snapshot(args.from_snapshot)
+                stage.rows_read = sum(batches.counts().values())
+                # 스냅샷을 만든 변환 단계의 스킵 (이 실행에는 transform stage가 없으므로 여기에 1회 집계)
+                stage.skipped.update(batches.skipped)
+        else:
+            # 1. JSON 수집
+            print("=" * 50)
+            print("STEP 1: Collecting JSON files")
+            print("=" * 50)
+            jsons = load_sources(args.data_dir, download=not args.no_download)
+            
+            # 2. 변환 (순수 함수, DB 미사용)
+            print("\n" + "=" * 50)
+            print("STEP 2: Transforming")
+            print("=" * 50)
+            with report.stage("transform") as stage:
+                batches = transform_all(jsons, workers=args.workers)
+                stage.rows_written = sum(batches.counts().values())
+                stage.skipped.update(batches.skipped)
+                stage.rows_read = stage.rows_written + sum(batches.skipped.values())
+            for table, count in batches.counts().items():
+                print(f"   - {table}: {count} rows")
+            print(stage.summary())
+            
+            if args.snapshot_dir:
+                manifest = write_snapshot(batches, args.snapshot_dir, args.format)
+                print(f">> Snapshot written to {args.snapshot_dir} ({manifest['format']})")
         
-        print("\n" + "=" * 50)
-        print("✅ ALL DATA IMPORTED SUCCESSFULLY!")
-        print("=" * 50)
+        if args.offline:
+            print("\n✅ Offline transform finished (DB not touched).")
+        else:
+            conn = connect_db(report)
+            print("✅ DB Connected Successfully.\n")
+            load_all(conn, batches, report)
+            
+            print("\n" + "=" * 50)
+            print("✅ ALL DATA IMPORTED SUCCESSFULLY!")
+            print("=" * 50)
         
     except Exception as e:
         print(f"\n❌ Critical Error: {e}")
@@ -734,4 +532,5 @@ if __name__ == "__main__":
     finally:
         if conn: 
             conn.close()
-            print("\nDB connection closed.")
\ No newline at end of file
+            print("\nDB connection closed.")
+        print(f">> Run report written to {report.write(args.report)}")
@@ -67,6 +67,7 @@ CREATE TABLE characters (
     name_ko VARCHAR(64) NOT NULL,
     class_description VARCHAR(255),
     rarity SMALLINT CHECK (rarity BETWEEN 1 AND 6),
+    position VARCHAR(16), -- MELEE / RANGED
     profession_id INT REFERENCES profession(profession_id),
     sub_profession_id INT REFERENCES sub_profession(sub_profession_id),
     created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
@@ -91,6 +92,7 @@ CREATE TABLE character_stats (
     cost SMALLINT NOT NULL,
     block_cnt SMALLINT NOT NULL,
     attack_speed SMALLINT NOT NULL,
+    keyframes JSONB, -- attributesKeyFrames 원본 ([{level, max_hp, atk, ...}], 레벨 보간용)
     UNIQUE (character_id, phase)
 );
 
@@ -113,6 +115,15 @@ CREATE TABLE character_favor_templates (
     extra_bonuses JSONB
 );
 
+CREATE TABLE character_potentials (
+    character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
+    potential_rank SMALLINT NOT NULL, -- 0 = 2잠 강화
+    buff_type SMALLINT NOT NULL,
+    buff_value TEXT,
+    attributes JSONB, -- [{attribute, value}] 스탯 보정
+    PRIMARY KEY (character_id, potential_rank)
+);
+
 CREATE TABLE character_talents (
     id SERIAL PRIMARY KEY,
     character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
@@ -202,6 +213,15 @@ CREATE TABLE character_tag (
     UNIQUE (tag_id, character_id)
 );
 
+-- ==========================================
+-- 8. 데이터셋 버전 (ETL 적재 완료 시 갱신, 단일 행)
+-- ==========================================
+CREATE TABLE dataset_version (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version VARCHAR(64) NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
 -- 인덱스 설정
 CREATE INDEX idx_characters_name_ko ON characters(name_ko);
 CREATE INDEX idx_talent_lookup ON character_talents (character_id, unlock_phase, required_potential);
@@ -1,8 +1,14 @@
 from fastapi import APIRouter
-from lib.api.endpoint import character, item, stage
+from lib.api.endpoint import character, item, stage, planner, ranges, recruit, blackboard, skin, search
 
 api_router = APIRouter()
 
 api_router.include_router(character.router, prefix="/characters", tags=["Characters"])
 api_router.include_router(item.router, prefix="/items", tags=["Items"])
-api_router.include_router(stage.router, prefix="/stages", tags=["Stages"])
\ No newline at end of file
+api_router.include_router(stage.router, prefix="/stages", tags=["Stages"])
+api_router.include_router(planner.router, prefix="/planner", tags=["Planner"])
+api_router.include_router(ranges.router, prefix="/ranges", tags=["Ranges"])
+api_router.include_router(recruit.router, prefix="/recruit", tags=["Recruit"])
+api_router.include_router(blackboard.router, prefix="/blackboard", tags=["Blackboard"])
+api_router.include_router(skin.router, prefix="/skins", tags=["Skins"])
+api_router.include_router(search.router, prefix="/search", tags=["Search"])
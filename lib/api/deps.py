@@ -1,19 +1,47 @@
-from fastapi import Depends
+from typing import List, Literal, Optional
+from fastapi import Depends, FastAPI, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
 from lib.core.database import get_db, get_redis
+from lib.core.dataset import Dataset, ensure_indexes, get_dataset
+from lib.core.planner import get_planner_index
+from lib.core.stats import get_stat_index
+from lib.core.ranges import get_range_index
+from lib.core.facets import ORDERINGS, FacetQuery, get_facet_index
+from lib.core.recruit import get_recruit_index
+from lib.core.blackboard import get_blackboard_index
+from lib.core.search import get_search_index
+from lib.api.shared_store import SHARED_STORE_DIR
 
 # Repositories
 from lib.repositories.character import CharacterRepository
 from lib.repositories.item import ItemRepository
-from lib.repositories.stage import ZoneRepository
+from lib.repositories.stage import ZoneRepository, StageRepository
+from lib.repositories.skin import SkinRepository
 from lib.repositories.skill import SkillRepository
+from lib.repositories.memory import (
+    MemoryCharacterRepository,
+    MemoryItemRepository,
+    MemorySkillRepository,
+    MemoryZoneRepository,
+    MemoryStageRepository,
+    MemorySkinRepository
+)
 
 # Services
 from lib.service.character import CharacterService
 from lib.service.item import ItemService
 from lib.service.stage import StageService
+from lib.service.skin import SkinService
+from lib.service.planner import PlannerService
+from lib.service.stats import StatService
+from lib.service.ranges import RangeService
+from lib.service.usages import ItemUsageService
+from lib.service.facets import CharacterFacetService
+from lib.service.recruit import RecruitService
+from lib.service.blackboard import BlackboardService
+from lib.service.search import SearchService
 
 # --- Character DI ---
 async def get_character_repo(db: AsyncSession = Depends(get_db)) -> CharacterRepository:
@@ -43,8 +71,146 @@ async def get_item_service(
 async def get_zone_repo(db: AsyncSession = Depends(get_db)) -> ZoneRepository:
     return ZoneRepository(db)
 
+async def get_stage_repo(db: AsyncSession = Depends(get_db)) -> StageRepository:
+    return StageRepository(db)
+
 async def get_stage_service(
     repo: ZoneRepository = Depends(get_zone_repo),
-    redis: Redis = Depends(get_redis)
+    redis: Redis = Depends(get_redis),
+    stage_repo: StageRepository = Depends(get_stage_repo)
 ) -> StageService:
-    return StageService(repo, redis)
\ No newline at end of file
+    return StageService(repo, redis, stage_repo)
+
+# --- Skin Gallery DI ---
+async def get_skin_repo(db: AsyncSession = Depends(get_db)) -> SkinRepository:
+    return SkinRepository(db)
+
+async def get_skin_detail_repo(db: AsyncSession = Depends(get_db)) -> SkinRepository:
+    """상세 텍스트는 스냅샷에 없으므로 인메모리 모드에서도 DB에서 읽음 (use_memory_dataset의 교체 대상 아님)"""
+    return SkinRepository(db)
+
+async def get_skin_service(
+    repo: SkinRepository = Depends(get_skin_repo),
+    redis: Redis = Depends(get_redis),
+    detail_repo: SkinRepository = Depends(get_skin_detail_repo)
+) -> SkinService:
+    return SkinService(repo, redis, detail_repo)
+
+# --- Snapshot Index DI ---
+def snapshot(*index_names: str):
+    """
+    스냅샷 기반 색인 라우트용 의존성 (모드와 관계없이 스냅샷 사용, db 모드에서는 첫 요청 때 스냅샷 + 필요한 색인만 생성)
+    - SHARED_STORE_DIR 워커는 스냅샷을 두지 않음: 로더가 게시한 응답(export_paths)은 미들웨어가 스토어에서 응답하고,
+      게시 대상이 아닌 요청(쿼리 파라미터가 있는 계산 / 검색)은 501 -> DATASET_MODE=memory 서버로 라우팅해야 함
+    """
+    ensure = ensure_indexes(*index_names)
+
+    async def dependency() -> Dataset:
+        if SHARED_STORE_DIR:
+            raise HTTPException(
+                status_code=501,
+                detail="공유 스토어 워커는 이 요청을 계산하지 않습니다. DATASET_MODE=memory 서버로 요청하세요."
+            )
+        return await ensure()
+    return dependency
+
+# --- Planner DI ---
+async def get_planner_service(dataset: Dataset = Depends(snapshot("planner"))) -> PlannerService:
+    return PlannerService(get_planner_index(dataset))
+
+# --- Stat Engine DI ---
+async def get_stat_service(dataset: Dataset = Depends(snapshot("stats"))) -> StatService:
+    return StatService(get_stat_index(dataset), dataset)
+
+# --- Range Index DI ---
+async def get_range_service(dataset: Dataset = Depends(snapshot("ranges"))) -> RangeService:
+    return RangeService(get_range_index(dataset))
+
+# --- Item Usage DI ---
+async def get_item_usage_service(dataset: Dataset = Depends(snapshot("usages"))) -> ItemUsageService:
+    return ItemUsageService(dataset)
+
+# --- Character Facet Filter DI ---
+def character_facet_query(
+    rarity: int = Query(None, ge=1, le=6, description="캐릭터 등급 (1~6)"),
+    profession: List[int] = Query(None, description="직군 ID (여러 번 지정하면 OR)"),
+    sub_profession: List[int] = Query(None, description="세부 직군 ID (여러 번 지정하면 OR)"),
+    tag: List[str] = Query(None, description="태그 이름 (여러 번 지정 가능, tag_mode로 결합)"),
+    tag_mode: Literal["and", "or"] = Query("and", description="태그 결합 방식"),
+    has_module: bool = Query(None, description="모듈 보유 여부")
+) -> FacetQuery:
+    return FacetQuery(
+        rarity=(rarity,) if rarity is not None else None,
+        profession=tuple(profession) if profession else None,
+        sub_profession=tuple(sub_profession) if sub_profession else None,
+        tag=tuple(tag) if tag else None,
+        module=has_module,
+        tag_mode=tag_mode
+    )
+
+facet_snapshot = snapshot("facets")
+
+async def get_character_facet_service(
+    query: FacetQuery = Depends(character_facet_query),
+    dataset: Dataset = Depends(facet_snapshot)
+) -> CharacterFacetService:
+    return CharacterFacetService(get_facet_index(dataset), query)
+
+async def get_character_filter_service(
+    query: FacetQuery = Depends(character_facet_query),
+    sort: Literal[tuple(ORDERINGS)] = Query(None, description="정렬 (rarity, -rarity, name, code)")
+) -> Optional[CharacterFacetService]:
+    """
+    /characters 목록용: 희귀도 외 패싯 조건이나 정렬이 있을 때만 패싯 색인 사용
+    (조건이 없거나 희귀도뿐이면 None -> 기존 Repository + Redis 경로 유지)
+    """
+    if sort is None and query._replace(rarity=None).is_empty():
+        return None
+    dataset = await facet_snapshot()
+    return CharacterFacetService(get_facet_index(dataset), query, sort)
+
+# --- Recruitment Calculator DI ---
+async def get_recruit_service(dataset: Dataset = Depends(snapshot("recruit"))) -> RecruitService:
+    return RecruitService(get_recruit_index(dataset))
+
+# --- Blackboard Query DI ---
+async def get_blackboard_service(dataset: Dataset = Depends(snapshot("blackboard"))) -> BlackboardService:
+    return BlackboardService(get_blackboard_index(dataset))
+
+# --- Unified Search DI ---
+async def get_search_service(dataset: Dataset = Depends(snapshot("search"))) -> SearchService:
+    return SearchService(get_search_index(dataset))
+
+# --- In-Memory Dataset DI (DATASET_MODE=memory) ---
+# 요청마다 DB 세션 / Redis 클라이언트를 만들지 않도록 Repository와 Redis 의존성을 통째로 교체합니다.
+async def get_memory_character_repo(dataset: Dataset = Depends(get_dataset)) -> MemoryCharacterRepository:
+    return MemoryCharacterRepository(dataset)
+
+async def get_memory_skill_repo(dataset: Dataset = Depends(get_dataset)) -> MemorySkillRepository:
+    return MemorySkillRepository(dataset)
+
+async def get_memory_item_repo(dataset: Dataset = Depends(get_dataset)) -> MemoryItemRepository:
+    return MemoryItemRepository(dataset)
+
+async def get_memory_zone_repo(dataset: Dataset = Depends(get_dataset)) -> MemoryZoneRepository:
+    return MemoryZoneRepository(dataset)
+
+async def get_memory_stage_repo(dataset: Dataset = Depends(get_dataset)) -> MemoryStageRepository:
+    return MemoryStageRepository(dataset)
+
+async def get_memory_skin_repo(dataset: Dataset = Depends(get_dataset)) -> MemorySkinRepository:
+    return MemorySkinRepository(dataset)
+
+async def get_no_redis() -> None:
+    return None
+
+def use_memory_dataset(app: FastAPI):
+    app.dependency_overrides.update({
+        get_character_repo: get_memory_character_repo,
+        get_skill_repo: get_memory_skill_repo,
+        get_item_repo: get_memory_item_repo,
+        get_zone_repo: get_memory_zone_repo,
+        get_stage_repo: get_memory_stage_repo,
+        get_skin_repo: get_memory_skin_repo,
+        get_redis: get_no_redis,
+    })
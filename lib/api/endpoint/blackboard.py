@@ -0,0 +1,60 @@
+from typing import List, Literal
+from fastapi import APIRouter, Depends, Query
+from lib.core.blackboard import SOURCES
+from lib.schemas.character import BaseResponse
+from lib.schemas.blackboard import (
+    BlackboardKeyListResponse, BlackboardSkillQueryResponse, BlackboardTalentQueryResponse
+)
+from lib.service.blackboard import BlackboardService
+from lib.api import deps
+from lib.api.http_cache import cache_control
+
+router = APIRouter()
+
+WHERE_DESCRIPTION = "조건식 (여러 번 지정하면 AND): key(존재), key>=1.0, key<0, key=2 ..."
+
+@router.get("/keys", response_model=BaseResponse[BlackboardKeyListResponse], dependencies=[Depends(cache_control(86400))])
+async def read_blackboard_keys(
+    source: Literal[SOURCES] = Query("skill", description="skill / talent"),
+    service: BlackboardService = Depends(deps.get_blackboard_service)
+):
+    """
+    **blackboard 키 목록 (키별 행 수, 최솟값, 최댓값)**
+    """
+    return BaseResponse(
+        success=True,
+        data=service.get_keys(source)
+    )
+
+@router.get("/skills", response_model=BaseResponse[BlackboardSkillQueryResponse], dependencies=[Depends(cache_control(3600))])
+async def read_blackboard_skills(
+    where: List[str] = Query([], description=WHERE_DESCRIPTION),
+    level: int = Query(None, ge=1, le=10, description="스킬 레벨 (8~10 = 특화 1~3)"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    service: BlackboardService = Depends(deps.get_blackboard_service)
+):
+    """
+    **blackboard 조건을 만족하는 스킬 레벨**
+    - 예: where=atk>=1.0&level=10 (특화 3에서 공격력 계수 1.0 이상)
+    """
+    return BaseResponse(
+        success=True,
+        data=service.query_skills(where, level, skip, limit)
+    )
+
+@router.get("/talents", response_model=BaseResponse[BlackboardTalentQueryResponse], dependencies=[Depends(cache_control(3600))])
+async def read_blackboard_talents(
+    where: List[str] = Query([], description=WHERE_DESCRIPTION),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    service: BlackboardService = Depends(deps.get_blackboard_service)
+):
+    """
+    **blackboard 조건을 만족하는 재능 후보**
+    - 예: where=sp_recovery_per_sec
+    """
+    return BaseResponse(
+        success=True,
+        data=service.query_talents(where, skip, limit)
+    )
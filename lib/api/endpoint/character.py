@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Literal
 from fastapi import APIRouter, Depends, Query
 from lib.schemas.character import (
     BaseResponse,
@@ -7,36 +7,66 @@ from lib.schemas.character import (
     CharacterProfileResponse,
     CharacterSkillDetailResponse,
     CharacterGrowthResponse,
-    CharacterModuleResponse
+    CharacterModuleResponse,
+    CharacterFacetResponse
 )
+from lib.schemas.stats import OperatorStatsResponse
 from lib.service.character import CharacterService
+from lib.service.stats import StatService
+from lib.service.facets import CharacterFacetService
+from lib.core.facets import FacetQuery
+from lib.core.stats import ATTRIBUTES
 from lib.api import deps
+from lib.api.http_cache import cache_control
+from lib.api.fields import Projection, field_projection
 
 # 라우터 경로 및 태그 설정
 router = APIRouter()
 
-@router.get("", response_model=BaseResponse[List[CharacterListResponse]])
+@router.get("", response_model=BaseResponse[List[CharacterListResponse]], dependencies=[Depends(cache_control(300))])
 async def read_characters(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    rarity: int = Query(None, ge=1, le=6, description="캐릭터 등급 (1~6)"),
+    facets: FacetQuery = Depends(deps.character_facet_query),
+    projection: Projection = Depends(field_projection),
+    filter_service: CharacterFacetService = Depends(deps.get_character_filter_service),
     service: CharacterService = Depends(deps.get_character_service)
 ):
     """
     **캐릭터 목록 조회 (Paging)**
     - Redis Cache: 5분
     - 가벼운 List용 스키마를 반환하여 검색/목록 성능 최적화
+    - 패싯 필터: `profession`, `sub_profession`, `tag`(반복 지정)는 같은 패싯 안에서 OR, 패싯끼리는 AND
+      (태그는 `tag_mode=and|or`), `has_module`, `sort=rarity|-rarity|name|code`
+    - 패싯 조건/정렬이 있으면 데이터셋 버전별 비트셋 색인에서 응답
     """
-    character_list =  await service.get_character_list(skip=skip, limit=limit, rarity=rarity)
+    if filter_service is not None:
+        character_list = filter_service.get_character_list(skip=skip, limit=limit)
+    else:
+        rarity = facets.rarity[0] if facets.rarity else None
+        character_list = await service.get_character_list(skip=skip, limit=limit, rarity=rarity)
+
+    return projection.respond(character_list)
 
+@router.get("/facets", response_model=BaseResponse[CharacterFacetResponse], dependencies=[Depends(cache_control(300))])
+async def read_character_facets(
+    service: CharacterFacetService = Depends(deps.get_character_facet_service)
+):
+    """
+    **캐릭터 목록 패싯별 개수**
+    - `/characters`와 같은 조건 파라미터를 받아 전체 결과 수와 패싯 값별 개수를 반환합니다.
+    - 개수 = 해당 패싯의 선택만 바꿨을 때의 결과 수 (AND 모드 태그는 현재 결과 중 해당 태그 보유 수)
+    - 비트셋 popcount로 계산 (DB/Redis 조회 없음)
+    """
     return BaseResponse(
         success=True,
-        data = character_list,
+        data=service.get_facets()
     )
     
-@router.get("/{code}/profile", response_model=BaseResponse[CharacterProfileResponse])
+@router.get("/{code}/profile", response_model=BaseResponse[CharacterProfileResponse], dependencies=[Depends(cache_control(3600))])
 async def read_character_profile(
     code: str,
+    projection: Projection = Depends(field_projection),
     service: CharacterService = Depends(deps.get_character_service)
 ):
     """
@@ -47,14 +77,12 @@ async def read_character_profile(
     """
     character_profile = await service.get_character_profile(code)
 
-    return BaseResponse(
-        success=True,
-        data = character_profile
-    )
+    return projection.respond(character_profile)
 
-@router.get("/{code}/skills", response_model=BaseResponse[CharacterSkillDetailResponse])
+@router.get("/{code}/skills", response_model=BaseResponse[CharacterSkillDetailResponse], dependencies=[Depends(cache_control(3600))])
 async def read_character_skills(
     code: str,
+    projection: Projection = Depends(field_projection),
     service: CharacterService = Depends(deps.get_character_service)
 ):
     """
@@ -64,14 +92,12 @@ async def read_character_skills(
     """
     character_skill = await service.get_character_skills(code)
 
-    return BaseResponse(
-        success=True,
-        data = character_skill
-    )
+    return projection.respond(character_skill)
 
-@router.get("/{code}/growth", response_model=BaseResponse[CharacterGrowthResponse])
+@router.get("/{code}/growth", response_model=BaseResponse[CharacterGrowthResponse], dependencies=[Depends(cache_control(3600))])
 async def read_character_growth(
     code: str,
+    projection: Projection = Depends(field_projection),
     service: CharacterService = Depends(deps.get_character_service)
 ):
     """
@@ -80,14 +106,12 @@ async def read_character_growth(
     - Redis Cache: 1시간
     """
     character_grouth = await service.get_character_growth(code)
-    return BaseResponse(
-        success=True,
-        data = character_grouth
-    )
+    return projection.respond(character_grouth)
 
-@router.get("/{code}/modules", response_model=BaseResponse[CharacterModuleResponse])
+@router.get("/{code}/modules", response_model=BaseResponse[CharacterModuleResponse], dependencies=[Depends(cache_control(3600))])
 async def read_character_modules(
     code: str,
+    projection: Projection = Depends(field_projection),
     service: CharacterService = Depends(deps.get_character_service)
 ):
     """
@@ -96,25 +120,66 @@ async def read_character_modules(
     - Redis Cache: 1시간
     """
     character_module = await service.get_character_modules(code)
-    return BaseResponse(
-        success=True,
-        data = character_module
-    )
+    return projection.respond(character_module)
 
-@router.get("/{code}/full-detail", response_model=BaseResponse[CharacterFullDetailResponse])
+@router.get("/{code}/full-detail", response_model=BaseResponse[CharacterFullDetailResponse], dependencies=[Depends(cache_control(3600))])
 async def read_character_full_detail(
     code: str,
+    projection: Projection = Depends(field_projection),
     service: CharacterService = Depends(deps.get_character_service)
 ):
     """
     **[Aggregator] 캐릭터 모든 상세 정보 통합 조회**
     - Profile, Skills, Growth, Modules를 한 번에 반환합니다.
     - 내부적으로 Redis Pipelining을 사용하여 네트워크 성능을 극대화했습니다.
+    - `include=profile,skills` / `fields=profile.name_ko,skills.skills.levels.level`로 필요한 부분만 받을 수 있습니다.
     """
     # 서비스 레이어에서 1회의 RTT로 모든 데이터를 가져옵니다.
     character_detail = await service.get_character_full_detail(code)
 
+    return projection.respond(character_detail)
+
+@router.get("/stats", response_model=BaseResponse[List[OperatorStatsResponse]], dependencies=[Depends(cache_control(3600))])
+async def compare_character_stats(
+    phase: int = Query(2, ge=0, le=2, description="정예화 단계"),
+    level: int = Query(None, ge=1, le=90, description="레벨 (생략하면 오퍼레이터별 최대 레벨)"),
+    trust: int = Query(0, ge=0, le=200, description="신뢰도 (%)"),
+    potential: int = Query(1, ge=1, le=6, description="잠재 (1~6)"),
+    codes: str = Query(None, description="비교할 캐릭터 코드 (쉼표 구분, 생략하면 전체)"),
+    rarity: int = Query(None, ge=1, le=6, description="캐릭터 등급 (1~6)"),
+    sort: Literal[ATTRIBUTES] = Query(None, description="정렬 기준 스탯 (내림차순)"),
+    limit: int = Query(50, ge=1, le=500),
+    service: StatService = Depends(deps.get_stat_service)
+):
+    """
+    **스탯 일괄 비교**
+    - 같은 조건(정예화 / 레벨 / 신뢰도 / 잠재)으로 여러 오퍼레이터의 스탯을 한 번에 계산합니다.
+    - 해당 정예화 단계가 없거나 레벨이 최대 레벨을 넘는 오퍼레이터는 제외됩니다.
+    - 데이터셋 버전별 스탯 배열에서 벡터 연산 1회로 계산 (DB/Redis 조회 없음)
+    """
+    code_list = [code.strip() for code in codes.split(",") if code.strip()] if codes else None
+    stats = service.compare_stats(code_list, phase, level, trust, potential, rarity=rarity, sort=sort, limit=limit)
     return BaseResponse(
         success=True,
-        data = character_detail
-    )
\ No newline at end of file
+        data=stats
+    )
+
+@router.get("/{code}/stats", response_model=BaseResponse[OperatorStatsResponse], dependencies=[Depends(cache_control(3600))])
+async def read_character_stats(
+    code: str,
+    phase: int = Query(None, ge=0, le=2, description="정예화 단계 (생략하면 최고 단계)"),
+    level: int = Query(None, ge=1, le=90, description="레벨 (생략하면 해당 단계 최대 레벨)"),
+    trust: int = Query(0, ge=0, le=200, description="신뢰도 (%)"),
+    potential: int = Query(1, ge=1, le=6, description="잠재 (1~6)"),
+    service: StatService = Depends(deps.get_stat_service)
+):
+    """
+    **레벨 / 신뢰도 / 잠재 반영 스탯**
+    - 예) 정예화 2 Lv.60, 신뢰도 100%, 잠재 5: `?phase=2&level=60&trust=100&potential=5`
+    - 키프레임 선형 보간 + 신뢰도 보너스 + 잠재 보정
+    """
+    stats = service.get_stats(code, phase, level, trust, potential)
+    return BaseResponse(
+        success=True,
+        data=stats
+    )
@@ -1,13 +1,15 @@
 from typing import List
 from fastapi import APIRouter, Depends, Query
 from lib.schemas.character import BaseResponse
-from lib.schemas.item import ItemResponse, ItemDetailResponse
+from lib.schemas.item import ItemResponse, ItemDetailResponse, ItemUsageResponse
 from lib.service.item import ItemService
+from lib.service.usages import ItemUsageService
 from lib.api import deps
+from lib.api.http_cache import cache_control
 
 router = APIRouter()
 
-@router.get("/search", response_model=BaseResponse[List[ItemResponse]])
+@router.get("/search", response_model=BaseResponse[List[ItemResponse]], dependencies=[Depends(cache_control(600))])
 async def search_items(
     q: str = Query(..., min_length=1, description="아이템 이름 검색어"),
     service: ItemService = Depends(deps.get_item_service)
@@ -22,7 +24,7 @@ async def search_items(
         data= items
     )
 
-@router.get("/{item_code}", response_model=BaseResponse[ItemDetailResponse])
+@router.get("/{item_code}", response_model=BaseResponse[ItemDetailResponse], dependencies=[Depends(cache_control(86400))])
 async def read_item_detail(
     item_code: str,
     service: ItemService = Depends(deps.get_item_service)
@@ -34,4 +36,19 @@ async def read_item_detail(
     return BaseResponse(
         success=True,
         data=item_detail
-    )
\ No newline at end of file
+    )
+
+@router.get("/{item_code}/usages", response_model=BaseResponse[ItemUsageResponse], dependencies=[Depends(cache_control(86400))])
+async def read_item_usages(
+    item_code: str,
+    service: ItemUsageService = Depends(deps.get_item_usage_service)
+):
+    """
+    아이템 소비처 조회 (정예화 / 스킬 레벨 / 특화 / 모듈)
+    - 데이터셋 버전별 역색인에서 응답 (비용 테이블 조인 없음)
+    """
+    usages = service.get_item_usages(item_code)
+    return BaseResponse(
+        success=True,
+        data=usages
+    )
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+from lib.schemas.character import BaseResponse
+from lib.schemas.planner import PlannerRequest, PlannerResponse
+from lib.service.planner import PlannerService
+from lib.api import deps
+
+router = APIRouter()
+
+@router.post("", response_model=BaseResponse[PlannerResponse])
+async def plan_materials(
+    request: PlannerRequest,
+    service: PlannerService = Depends(deps.get_planner_service)
+):
+    """
+    **로스터 육성 재료 합계**
+    - 오퍼레이터별 현재 상태 -> 목표 상태(정예화 / 스킬 레벨 / 특화 / 모듈)에 필요한 재료를 한 번에 합산합니다.
+    - /characters/{code}/growth를 오퍼레이터마다 호출해 더하는 대신 사용
+    - 데이터셋 버전별로 미리 펼친 비용 행렬의 행 합산이므로 DB/Redis 조회 없음
+    """
+    return BaseResponse(
+        success=True,
+        data=service.plan(request)
+    )
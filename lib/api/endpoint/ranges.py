@@ -0,0 +1,64 @@
+from typing import List, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query
+from lib.schemas.character import BaseResponse
+from lib.schemas.ranges import RangeQueryResponse, RangeTableResponse
+from lib.service.ranges import RangeService
+from lib.api import deps
+from lib.api.http_cache import cache_control
+
+router = APIRouter()
+
+def parse_tiles(tiles: str) -> List[Tuple[int, int]]:
+    """'0,1;1,1' -> [(0, 1), (1, 1)]"""
+    try:
+        return [
+            (int(row), int(col))
+            for row, col in (tile.split(",") for tile in tiles.split(";") if tile.strip())
+        ]
+    except ValueError:
+        raise HTTPException(status_code=422, detail="tiles 형식: row,col;row,col")
+
+@router.get("", response_model=BaseResponse[RangeTableResponse], dependencies=[Depends(cache_control(86400))])
+async def read_range_table(
+    service: RangeService = Depends(deps.get_range_service)
+):
+    """
+    **모든 공격 범위 (비트마스크 압축 형태)**
+    - grids 목록 대신 공통 격자 + range별 16진수 마스크로 전송합니다.
+    - 비트 번호 = (row - row_min) * cols + (col - col_min)
+    """
+    return BaseResponse(
+        success=True,
+        data=service.get_table()
+    )
+
+@router.get("/coverage", response_model=BaseResponse[RangeQueryResponse], dependencies=[Depends(cache_control(3600))])
+async def read_range_coverage(
+    row: int = Query(..., description="타일 행 (오퍼레이터 위치 = 0)"),
+    col: int = Query(..., description="타일 열 (오퍼레이터 위치 = 0, 바라보는 방향이 +)"),
+    phase: int = Query(None, ge=0, le=2, description="정예화 단계 (생략하면 오퍼레이터별 최고 단계)"),
+    service: RangeService = Depends(deps.get_range_service)
+):
+    """
+    **타일 (row, col)을 공격 범위에 포함하는 오퍼레이터 / 스킬**
+    """
+    return BaseResponse(
+        success=True,
+        data=service.get_coverage(row, col, phase)
+    )
+
+@router.get("/superset", response_model=BaseResponse[RangeQueryResponse], dependencies=[Depends(cache_control(3600))])
+async def read_range_supersets(
+    range_id: str = Query(None, description="기준 범위 ID (예: 3-1)"),
+    tiles: str = Query(None, description="기준 타일 목록 (예: 0,1;0,2;1,1)"),
+    phase: int = Query(None, ge=0, le=2, description="정예화 단계 (생략하면 오퍼레이터별 최고 단계)"),
+    service: RangeService = Depends(deps.get_range_service)
+):
+    """
+    **기준 범위를 모두 포함하는 범위를 가진 오퍼레이터 / 스킬**
+    - range_id 또는 tiles 중 하나를 지정합니다.
+    """
+    return BaseResponse(
+        success=True,
+        data=service.get_supersets(range_id, parse_tiles(tiles) if tiles else None, phase)
+    )
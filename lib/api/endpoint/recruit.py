@@ -0,0 +1,36 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query
+from lib.schemas.character import BaseResponse
+from lib.schemas.recruit import RecruitResponse, RecruitTagListResponse
+from lib.service.recruit import RecruitService
+from lib.api import deps
+from lib.api.http_cache import cache_control
+
+router = APIRouter()
+
+@router.get("", response_model=BaseResponse[RecruitResponse], dependencies=[Depends(cache_control(3600))])
+async def read_recruit_combinations(
+    tags: List[str] = Query(..., description="모집 태그 (최대 5개, 여러 번 지정하거나 쉼표로 구분)"),
+    service: RecruitService = Depends(deps.get_recruit_service)
+):
+    """
+    **공개모집 태그 계산**
+    - 선택한 태그의 1~3개 조합마다 나올 수 있는 오퍼레이터와 보장 최소 희귀도를 반환합니다.
+    - 최고 희귀도 오퍼레이터는 고급특별채용 태그가 들어간 조합에만 포함됩니다.
+    """
+    return BaseResponse(
+        success=True,
+        data=service.calculate([tag.strip() for raw in tags for tag in raw.split(",") if tag.strip()])
+    )
+
+@router.get("/tags", response_model=BaseResponse[RecruitTagListResponse], dependencies=[Depends(cache_control(86400))])
+async def read_recruit_tags(
+    service: RecruitService = Depends(deps.get_recruit_service)
+):
+    """
+    **선택 가능한 모집 태그 목록**
+    """
+    return BaseResponse(
+        success=True,
+        data=service.get_tags()
+    )
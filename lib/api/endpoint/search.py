@@ -0,0 +1,27 @@
+from typing import List, Literal
+from fastapi import APIRouter, Depends, Query
+from lib.core.search import DOC_TYPES
+from lib.schemas.character import BaseResponse
+from lib.schemas.search import SearchResponse
+from lib.service.search import SearchService
+from lib.api import deps
+from lib.api.http_cache import cache_control
+
+router = APIRouter()
+
+@router.get("", response_model=BaseResponse[SearchResponse], dependencies=[Depends(cache_control(3600))])
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (이름 / 설명)"),
+    type: List[Literal[DOC_TYPES]] = Query(None, description="결과 종류 (operator, skill, module, item / 여러 번 지정 가능)"),
+    limit: int = Query(20, ge=1, le=100),
+    service: SearchService = Depends(deps.get_search_service)
+):
+    """
+    **통합 검색 (오퍼레이터 / 스킬 / 모듈 / 아이템)**
+    - 한국어 bigram 역색인 + BM25 점수 순 (이름 일치가 설명 일치보다 우선)
+    - counts는 type 필터와 관계없이 종류별 일치 수입니다.
+    """
+    return BaseResponse(
+        success=True,
+        data=service.search(q, type, limit)
+    )
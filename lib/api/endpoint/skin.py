@@ -0,0 +1,56 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query
+from lib.schemas.character import BaseResponse
+from lib.schemas.skin import SkinDetailResponse, SkinGroupResponse, SkinPageResponse
+from lib.service.skin import SkinService
+from lib.api import deps
+from lib.api.http_cache import cache_control
+
+router = APIRouter()
+
+@router.get("", response_model=BaseResponse[SkinPageResponse], dependencies=[Depends(cache_control(3600))])
+async def read_skins(
+    character: str = Query(None, description="캐릭터 코드 (예: char_002_amiya)"),
+    group: str = Query(None, description="스킨 그룹 이름 (/skins/groups의 name_ko)"),
+    cursor: int = Query(None, ge=0, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=200),
+    service: SkinService = Depends(deps.get_skin_service)
+):
+    """
+    **스킨 갤러리 (커서 페이지네이션, skin_id 순)**
+    - 오퍼레이터 또는 스킨 그룹으로 필터링합니다.
+    - 상세 텍스트는 포함하지 않습니다. (/skins/{skin_code})
+    """
+    page = await service.get_skins(character, group, cursor, limit)
+    return BaseResponse(
+        success=True,
+        data=page
+    )
+
+@router.get("/groups", response_model=BaseResponse[List[SkinGroupResponse]], dependencies=[Depends(cache_control(86400))])
+async def read_skin_groups(
+    service: SkinService = Depends(deps.get_skin_service)
+):
+    """
+    **스킨 그룹 목록 (그룹별 스킨 수)**
+    """
+    groups = await service.get_groups()
+    return BaseResponse(
+        success=True,
+        data=groups
+    )
+
+@router.get("/{skin_code}", response_model=BaseResponse[SkinDetailResponse], dependencies=[Depends(cache_control(86400))])
+async def read_skin(
+    skin_code: str,
+    service: SkinService = Depends(deps.get_skin_service)
+):
+    """
+    **스킨 상세 (설명 / 대사 등 텍스트 포함)**
+    - 예: char_002_amiya@test%231 ('#'은 %23으로 인코딩)
+    """
+    skin = await service.get_skin(skin_code)
+    return BaseResponse(
+        success=True,
+        data=skin
+    )
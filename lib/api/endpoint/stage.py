@@ -1,23 +1,90 @@
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from lib.schemas.character import BaseResponse
-from lib.schemas.stage import ZoneDetailResponse
+from lib.schemas.stage import StageDetailResponse, ZoneDetailResponse, ZoneResponse
 from lib.service.stage import StageService
 from lib.api import deps
+from lib.api.http_cache import cache_control
 
 router = APIRouter()
 
-@router.get("/zones", response_model=BaseResponse[List[ZoneDetailResponse]])
+@router.get("", response_model=BaseResponse[List[StageDetailResponse]], dependencies=[Depends(cache_control(3600))])
+async def read_stages(
+    zone_type: str = Query(None, description="구역 종류 (MAINLINE, WEEKLY 등)"),
+    min_ap_cost: int = Query(None, ge=0, description="최소 이성 소모량"),
+    max_ap_cost: int = Query(None, ge=0, description="최대 이성 소모량"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    service: StageService = Depends(deps.get_stage_service)
+):
+    """
+    **스테이지 필터 조회 (구역을 가로질러 검색)**
+    - 예: zone_type=WEEKLY&min_ap_cost=18
+    """
+    stages = await service.get_stages(zone_type, min_ap_cost, max_ap_cost, skip, limit)
+    return BaseResponse(
+        success=True,
+        data=stages
+    )
+
+@router.get("/zones", response_model=BaseResponse[List[ZoneDetailResponse]], dependencies=[Depends(cache_control(86400 * 7))])
 async def read_all_zones(
     service: StageService = Depends(deps.get_stage_service)
 ):
     """
     모든 작전 구역(Zone) 및 스테이지(Stage) 계층 목록 조회
-    - 메인 화면 진입 시 호출 권장
+    - 전체 트리가 필요할 때만 사용 (모바일 등은 /zones/index + /zones/{zone_code} 권장)
     - Redis Cache 적용됨 (1주일) -> 매우 빠름
     """
     zone = await service.get_all_zones()
     return BaseResponse(
         success=True,
         data=zone
-    )
\ No newline at end of file
+    )
+
+@router.get("/zones/index", response_model=BaseResponse[List[ZoneResponse]], dependencies=[Depends(cache_control(86400))])
+async def read_zone_index(
+    zone_type: str = Query(None, description="구역 종류 (MAINLINE, WEEKLY 등)"),
+    service: StageService = Depends(deps.get_stage_service)
+):
+    """
+    **작전 구역 목록 (스테이지 제외, 가벼움)**
+    - 메인 화면 진입 시 호출하고, 스테이지는 구역을 열 때 /zones/{zone_code}로 불러옵니다.
+    """
+    zones = await service.get_zone_index(zone_type)
+    return BaseResponse(
+        success=True,
+        data=zones
+    )
+
+@router.get("/zones/{zone_code}", response_model=BaseResponse[ZoneDetailResponse], dependencies=[Depends(cache_control(86400 * 7))])
+async def read_zone_stages(
+    zone_code: str,
+    min_ap_cost: int = Query(None, ge=0, description="최소 이성 소모량"),
+    max_ap_cost: int = Query(None, ge=0, description="최대 이성 소모량"),
+    service: StageService = Depends(deps.get_stage_service)
+):
+    """
+    **작전 구역 1개의 스테이지 목록**
+    - 구역마다 따로 캐시 / ETag 되므로 바뀐 구역만 다시 받습니다.
+    """
+    zone = await service.get_zone_stages(zone_code, min_ap_cost, max_ap_cost)
+    return BaseResponse(
+        success=True,
+        data=zone
+    )
+
+@router.get("/{stage_code}", response_model=BaseResponse[StageDetailResponse], dependencies=[Depends(cache_control(86400 * 7))])
+async def read_stage(
+    stage_code: str,
+    service: StageService = Depends(deps.get_stage_service)
+):
+    """
+    **스테이지 상세 조회**
+    - 예: main_01-07
+    """
+    stage = await service.get_stage(stage_code)
+    return BaseResponse(
+        success=True,
+        data=stage
+    )
@@ -0,0 +1,243 @@
+# lib/api/export.py
+"""
+정적 스냅샷 내보내기 (CDN / 오브젝트 스토리지 업로드용)
+- 현재 dataset version 기준으로 코드 단위 GET 응답을 전부 렌더링해 URL 경로 그대로 파일로 저장합니다.
+  (캐릭터 4개 도메인 + full-detail, 아이템 상세, 구역 트리 / 구역 목록 / 구역별 스테이지, 스테이지 상세,
+   스냅샷 색인 문서: 캐릭터별 스탯 / 아이템별 소비처 / 사거리 표 / 모집 태그 / 패싯 개수 / 블랙보드 키)
+- 렌더링은 실제 FastAPI 앱을 프로세스 안에서 ASGI로 직접 호출하므로 API 응답과 바이트 단위로 같습니다.
+- 압축본(.zst / .gz / .zz)과 파일별 sha256 / ETag를 담은 manifest.json을 함께 기록합니다.
+- --publish DIR: 같은 응답들을 멀티 워커 공유 스토어(mmap 파일)로 게시하고 버전을 원자적으로 교체합니다.
+  --watch를 함께 주면 로더로 상주하며 dataset_version이 바뀌거나 게시본의 max-age가 절반 지날 때마다 다시 게시합니다.
+- 검색/목록처럼 쿼리 파라미터가 있는 요청은 대상이 아닙니다. (FastAPI 앱이 계속 응답)
+
+실행:
+    python -m lib.api.export --out static --concurrency 32
+    python -m lib.api.export --publish /dev/shm/arknights --watch   # 워커들은 SHARED_STORE_DIR=/dev/shm/arknights
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from lib.api import deps
+from lib.api.http_cache import CachedPayload, parse_max_age
+from lib.api.shared_store import publish
+from lib.core.dataset import DATASET_POLL_SECONDS, Dataset, refresh_dataset, get_dataset
+from lib.main import app, include_api_routers
+
+API_PREFIX = "/api/v1"
+MANIFEST_FILE = "manifest.json"
+
+# Content-Encoding -> 파일 확장자
+ENCODING_SUFFIX = {"zstd": ".zst", "gzip": ".gz", "deflate": ".zz"}
+
+# 캐릭터 1명당 내보낼 문서
+CHARACTER_DOCUMENTS = ("profile", "skills", "growth", "modules", "full-detail")
+
+
+def export_paths(dataset: Dataset) -> List[str]:
+    """내보낼 GET 경로 목록 (API_PREFIX 이하)"""
+    paths = ["/stages/zones", "/stages/zones/index"]
+    for zone in dataset.zones:
+        paths.append(f"/stages/zones/{zone.zone_code}")
+        paths.extend(f"/stages/{stage.stage_code}" for stage in zone.stages)
+    for code in dataset.characters:
+        paths.extend(f"/characters/{code}/{doc}" for doc in CHARACTER_DOCUMENTS)
+    paths.extend(f"/items/{item_code}" for item_code in dataset.items)
+    # 스냅샷 색인 라우트 중 쿼리 파라미터 없는 문서 (SHARED_STORE_DIR 워커는 스냅샷이 없으므로 스토어에서만 응답)
+    paths.extend(["/ranges", "/recruit/tags", "/characters/facets", "/blackboard/keys"])
+    paths.extend(f"/characters/{code}/stats" for code in dataset.characters)
+    paths.extend(f"/items/{item_code}/usages" for item_code in dataset.items)
+    return paths
+
+
+async def render(path: str) -> Tuple[int, Dict[str, str], bytes]:
+    """앱을 ASGI로 직접 호출해 (status, headers, body) 반환 (네트워크/HTTP 클라이언트 불필요)"""
+    raw_path = quote(API_PREFIX + path)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("static-export", 80),
+        "client": ("127.0.0.1", 0),
+        "root_path": "",
+        "path": API_PREFIX + path,
+        "raw_path": raw_path.encode(),
+        "query_string": b"",
+        # 응답 캐시에 쌓이지 않도록 no-store (압축/해시는 여기서 직접 수행)
+        "headers": [(b"host", b"static-export"), (b"accept-encoding", b"identity"), (b"cache-control", b"no-store")],
+    }
+    status = 0
+    headers: Dict[str, str] = {}
+    chunks: List[bytes] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            headers.update((k.decode("latin-1"), v.decode("latin-1")) for k, v in message["headers"])
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, headers, b"".join(chunks)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_payload(body: bytes, headers: Dict[str, str]) -> CachedPayload:
+    """응답 1건 -> 압축본/ETag까지 계산된 CachedPayload (스레드에서 실행)"""
+    cache_control = headers.get("cache-control", "public, max-age=0")
+    return CachedPayload(
+        body, headers.get("content-type", "application/json"), cache_control, parse_max_age(cache_control)
+    )
+
+
+def write_document(out_dir: str, path: str, payload: CachedPayload) -> Dict:
+    """본문 + 압축본 기록 후 manifest 항목 반환 (스레드에서 실행)"""
+    body = payload.body
+    file_name = path.lstrip("/") + ".json"
+    target = os.path.join(out_dir, file_name)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, 'wb') as f:
+        f.write(body)
+
+    entry = {
+        "file": file_name,
+        "bytes": len(body),
+        "sha256": _sha256(body),
+        "etag": payload.etag,
+        "variants": {},
+    }
+    for encoding, compressed in payload.variants.items():
+        variant_name = file_name + ENCODING_SUFFIX[encoding]
+        with open(os.path.join(out_dir, variant_name), 'wb') as f:
+            f.write(compressed)
+        entry["variants"][encoding] = {
+            "file": variant_name,
+            "bytes": len(compressed),
+            "sha256": _sha256(compressed),
+        }
+    return entry
+
+
+async def export_static(
+    out_dir: Optional[str],
+    concurrency: int = 32,
+    publish_dir: Optional[str] = None,
+    reload: bool = True
+) -> Dict:
+    if reload:
+        await refresh_dataset(force=True)
+    include_api_routers(app)
+    deps.use_memory_dataset(app)
+    dataset = get_dataset()
+
+    paths = export_paths(dataset)
+    semaphore = asyncio.Semaphore(concurrency)
+    documents: Dict[str, Dict] = {}
+    payloads: Dict[str, CachedPayload] = {}
+    failures: Dict[str, int] = {}
+
+    async def export_one(path: str):
+        url = API_PREFIX + path
+        async with semaphore:
+            status, headers, body = await render(path)
+            if status != 200:
+                failures[url] = status
+                return
+            # 압축 / 파일 쓰기는 GIL을 놓는 구간이 많아 스레드로 병렬 처리
+            payload = await asyncio.to_thread(build_payload, body, headers)
+            if publish_dir:
+                payloads[url + "?"] = payload  # http_cache.cache_key()와 같은 형식 (쿼리 없음)
+            if out_dir:
+                documents[url] = await asyncio.to_thread(write_document, out_dir, url, payload)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(export_one(path) for path in paths))
+
+    if publish_dir:
+        store_path = await asyncio.to_thread(publish, publish_dir, dataset.version, dict(sorted(payloads.items())))
+        print(f">> Published {len(payloads)} responses to {store_path}")
+
+    manifest = {
+        "dataset_version": dataset.version,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        # 가장 짧은 Cache-Control max-age (--watch 재게시 주기 계산용)
+        "min_max_age": min((parse_max_age(payload.cache_control) for payload in payloads.values()), default=0),
+        "documents": dict(sorted(documents.items())),
+        "failures": dict(sorted(failures.items())),
+    }
+    if out_dir:
+        with open(os.path.join(out_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+async def watch_publish(
+    out_dir: Optional[str],
+    concurrency: int,
+    publish_dir: str,
+    interval: int = DATASET_POLL_SECONDS
+):
+    """
+    --publish --watch: 게시 후 상주하며 dataset_version이 바뀌거나 게시본 max-age의 절반이 지나면 다시 렌더링/게시
+    (워커는 버전이 다르거나 만료된 게시본을 건너뛰므로 그동안에도 이전 본문은 나가지 않음)
+    """
+    manifest = await export_static(out_dir, concurrency, publish_dir)
+    while True:
+        republish_at = time.monotonic() + manifest["min_max_age"] / 2
+        changed = False
+        while not changed and time.monotonic() < republish_at:
+            await asyncio.sleep(interval)
+            try:
+                changed = await refresh_dataset()
+            except Exception as e:
+                # 갱신 실패 시 기존 게시본 유지 (만료되면 워커가 알아서 건너뜀)
+                print(f"⚠️ Dataset refresh failed: {e}")
+        manifest = await export_static(out_dir, concurrency, publish_dir, reload=False)
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="API 응답 정적 스냅샷 내보내기")
+    parser.add_argument("--out", metavar="DIR", help="정적 파일 출력 디렉터리 (--publish가 없으면 기본값: static)")
+    parser.add_argument("--publish", metavar="DIR", help="멀티 워커 공유 스토어 디렉터리 (예: /dev/shm/arknights)")
+    parser.add_argument("--watch", action="store_true", help="--publish 후 상주하며 버전이 바뀌거나 만료 전에 다시 게시")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 렌더링 수")
+    args = parser.parse_args(argv)
+    if args.watch and not args.publish:
+        parser.error("--watch는 --publish와 함께 사용합니다.")
+    if not args.out and not args.publish:
+        args.out = "static"
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+    if args.watch:
+        # 종료 신호를 받을 때까지 상주
+        asyncio.run(watch_publish(args.out, args.concurrency, args.publish))
+    else:
+        manifest = asyncio.run(export_static(args.out, args.concurrency, args.publish))
+        if args.out:
+            print(
+                f"✅ Exported {len(manifest['documents'])} documents for dataset {manifest['dataset_version']} "
+                f"to {args.out} in {manifest['elapsed_s']}s"
+            )
+        if manifest["failures"]:
+            print(f"⚠️ {len(manifest['failures'])} paths failed (see {MANIFEST_FILE})")
@@ -0,0 +1,89 @@
+# lib/api/fields.py
+"""
+Sparse fieldset (fields= / include=)
+- include: 최상위 섹션 선택 (예: include=profile,skills)
+- fields : 점(.)으로 이어진 경로 선택 (예: fields=profile.name_ko,profile.stats.max_hp,skills.skills.levels.level)
+- 리스트는 원소마다 같은 경로를 적용하고, 존재하지 않는 경로는 무시합니다.
+- 가지치기는 이미 캐시된 전체 문서(Redis / 인메모리 스냅샷)를 dump한 dict에서 수행하므로 재조회가 없고,
+  투영 결과는 URL 단위 응답 캐시(http_cache)에 따로 보관됩니다.
+"""
+from typing import Any, Dict, Optional
+
+from fastapi import Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from lib.core.timing import span
+from lib.schemas.character import BaseResponse
+
+# 경로 트리: 값이 None이면 해당 노드 하위 전체 선택
+FieldTree = Dict[str, Optional["FieldTree"]]
+
+
+def parse_fields(*specs: Optional[str]) -> Optional[FieldTree]:
+    """'a.b,a.c,d' -> {'a': {'b': None, 'c': None}, 'd': None} (지정이 없으면 None = 전체)"""
+    tree: FieldTree = {}
+    for spec in specs:
+        if not spec:
+            continue
+        for path in spec.split(","):
+            parts = [part for part in path.strip().split(".") if part]
+            if not parts:
+                continue
+            node = tree
+            for part in parts[:-1]:
+                child = node.get(part, {})
+                if child is None:  # 상위 노드가 이미 전체 선택됨
+                    break
+                node[part] = child
+                node = child
+            else:
+                node[parts[-1]] = None
+    return tree or None
+
+
+def project(data: Any, tree: Optional[FieldTree]) -> Any:
+    if tree is None:
+        return data
+    if isinstance(data, list):
+        return [project(element, tree) for element in data]
+    if isinstance(data, dict):
+        return {key: project(data[key], sub) for key, sub in tree.items() if key in data}
+    return data
+
+
+class Projection:
+    """요청 1건의 투영 정보 (라우트 의존성으로 주입)"""
+
+    __slots__ = ("tree", "response")
+
+    def __init__(self, tree: Optional[FieldTree], response: Response):
+        self.tree = tree
+        self.response = response
+
+    def respond(self, data: Any):
+        """
+        투영이 없으면 기존과 같은 BaseResponse, 있으면 가지친 data를 같은 봉투(envelope)에 담아 반환
+        - 가지친 문서는 response_model 검증을 통과할 수 없으므로 JSONResponse로 직접 반환하고,
+          이때는 FastAPI가 의존성에서 지정한 헤더(Cache-Control 등)를 합치지 않으므로 직접 옮겨 담음
+        """
+        if self.tree is None:
+            return BaseResponse(success=True, data=data)
+        with span("serialize"):
+            return JSONResponse(
+                content={
+                    "success": True,
+                    "data": project(jsonable_encoder(data), self.tree),
+                    "status": 200,
+                    "message": "OK",
+                },
+                headers=dict(self.response.headers),
+            )
+
+
+def field_projection(
+    response: Response,
+    fields: Optional[str] = Query(None, description="선택할 필드 경로 (쉼표 구분, 예: profile.name_ko,skills.skills.levels.level)"),
+    include: Optional[str] = Query(None, description="선택할 최상위 섹션 (쉼표 구분, 예: profile,skills)")
+) -> Projection:
+    return Projection(parse_fields(include, fields), response)
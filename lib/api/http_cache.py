@@ -0,0 +1,400 @@
+# lib/api/http_cache.py
+"""
+GET 응답 캐시 + 조건부 요청(ETag / If-None-Match)
+- 라우트가 cache_control(max_age) 의존성으로 Cache-Control을 지정하면, 첫 200 응답 본문을
+  캐시 채움 시점에 1회만 해시해 강한 ETag와 함께 보관합니다.
+- 이후 같은 URL 요청은 엔드포인트(DB/Redis)를 거치지 않고 보관된 본문 또는 304로 응답합니다.
+- 캐시 키는 경로 + 라우트가 선언한 쿼리 파라미터만 정규화한 것이며, 선언되지 않은 파라미터가 붙은 요청은 캐시하지 않습니다.
+  (임의 파라미터로 키를 무한히 늘려 메모리를 채우는 요청 방지) 보관량은 항목 수와 총 바이트 수로 제한합니다.
+- 압축본(zstd / gzip / deflate)도 캐시 채움 시점에 1회만 만들어 두고 Accept-Encoding에 따라 골라 보냅니다.
+  (히트 경로에서는 압축 CPU 비용 0) 압축은 키당 1개의 백그라운드 작업이 스레드에서 수행하며,
+  끝나기 전까지는 원본(identity) 본문으로 응답합니다. (이벤트 루프 블로킹 / 동시 미스의 중복 압축 방지)
+- dataset version이 바뀌면 캐시 전체를 비우고, db 모드에서는 그 전에도 max-age가 지나면 만료됩니다.
+  (Redis 캐시 TTL과 같은 값 사용)
+- 공유 스토어(lib.api.shared_store)는 게시 버전이 현재 dataset version과 같을 때만 조회합니다.
+- 캐시 대상 응답에는 X-Cache: HIT / MISS를 붙입니다. (부하 테스트에서 히트 여부 확인용)
+"""
+import asyncio
+import gzip
+import hashlib
+import os
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, FrozenSet, List, Optional
+from urllib.parse import parse_qsl, urlencode
+
+try:
+    from compression import zstd  # Python 3.14+ 표준 라이브러리
+except ImportError:
+    zstd = None
+
+from fastapi import Response
+from fastapi.dependencies.utils import get_flat_dependant
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from lib.core.dataset import DATASET_MODE, current_version
+
+# 워커당 보관할 최대 응답 수
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "4096"))
+# 워커당 보관할 최대 바이트 수 (본문 + 압축본 합계)
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# 이보다 작은 본문은 압축 이득보다 헤더/CPU 비용이 커서 원본만 보관
+MIN_COMPRESS_SIZE = 1024
+# 캐시 대상 응답의 히트 여부 헤더
+CACHE_STATUS_HEADER = "X-Cache"
+
+# Content-Encoding -> 압축 함수 (우선순위 순). 1회만 수행하므로 높은 압축 레벨 사용
+# gzip은 mtime=0으로 고정해 같은 본문이면 항상 같은 바이트(= 같은 ETag)가 나오도록 함
+ENCODERS: Dict[str, Callable[[bytes], bytes]] = {}
+if zstd is not None:
+    ENCODERS["zstd"] = lambda body: zstd.compress(body, level=10)
+ENCODERS["gzip"] = lambda body: gzip.compress(body, compresslevel=9, mtime=0)
+ENCODERS["deflate"] = lambda body: zlib.compress(body, 9)
+
+
+def cache_control(max_age: int):
+    """
+    라우트별 Cache-Control 지정용 의존성
+    예) @router.get("/zones", dependencies=[Depends(cache_control(86400))])
+    """
+    header = f"public, max-age={max_age}"
+
+    async def set_cache_control(response: Response):
+        response.headers["Cache-Control"] = header
+
+    return set_cache_control
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (RFC 9110: 약한 비교, '*' 허용). etag: 이번에 보낼 표현(인코딩)의 ETag"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def compress_variants(body: bytes) -> Dict[str, bytes]:
+    """본문 -> {encoding: 압축본} (원본보다 작아지는 것만)"""
+    if len(body) < MIN_COMPRESS_SIZE:
+        return {}
+    variants = {}
+    for encoding, encode in ENCODERS.items():
+        compressed = encode(body)
+        if len(compressed) < len(body):
+            variants[encoding] = compressed
+    return variants
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available) -> Optional[str]:
+    """
+    Accept-Encoding에서 보낼 인코딩 선택 (없으면 None = identity)
+    - q=0으로 명시된 인코딩은 제외, 나머지는 q 값이 높은 순 -> 서버 우선순위(ENCODERS 순서) 순
+    """
+    if not accept_encoding or not available:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, *params = part.strip().split(";")
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CachedPayload:
+    """캐시 채움 시점에 확정되는 응답 1건 (본문 + 압축본 + 표현별 ETag + 헤더)"""
+
+    __slots__ = ("body", "variants", "etags", "media_type", "cache_control", "expires_at")
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str,
+        cache_control: str,
+        max_age: int,
+        variants: Optional[Dict[str, bytes]] = None,
+        etag: Optional[str] = None
+    ):
+        # variants / etag를 넘기면 그대로 사용 (공유 메모리 스토어처럼 미리 계산된 경우)
+        self.body = body
+        self.variants = compress_variants(body) if variants is None else variants
+        # 강한 ETag는 표현(인코딩)마다 달라야 하므로 압축본에는 접미사를 붙임
+        etag = etag or make_etag(body)
+        self.etags: Dict[Optional[str], str] = {None: etag}
+        for encoding in self.variants:
+            self.etags[encoding] = f'{etag[:-1]}-{encoding}"'
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.expires_at = time.monotonic() + max_age
+
+    @property
+    def etag(self) -> str:
+        return self.etags[None]
+
+    def with_variants(self, variants: Dict[str, bytes]) -> "CachedPayload":
+        """같은 본문/ETag/만료 시각에 압축본만 채운 사본"""
+        payload = CachedPayload(self.body, self.media_type, self.cache_control, 0, variants=variants, etag=self.etag)
+        payload.expires_at = self.expires_at
+        return payload
+
+    @property
+    def size(self) -> int:
+        """캐시 용량 계산용 바이트 수 (본문 + 압축본)"""
+        return len(self.body) + sum(len(data) for data in self.variants.values())
+
+    def headers(self, encoding: Optional[str] = None) -> Dict[str, str]:
+        headers = {"ETag": self.etags[encoding], "Cache-Control": self.cache_control}
+        if self.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return headers
+
+    def response(self, if_none_match: Optional[str], accept_encoding: Optional[str] = None) -> Response:
+        encoding = negotiate_encoding(accept_encoding, self.variants)
+        # 304는 클라이언트가 가진 본문을 그대로 쓰라는 뜻이므로 보낼 표현의 ETag와만 비교
+        # (다른 인코딩의 ETag가 오면 그 클라이언트는 이 표현을 가진 적이 없으므로 200 + 전체 본문)
+        if etag_matches(if_none_match, self.etags[encoding]):
+            return Response(status_code=304, headers=self.headers(encoding))
+        content = self.variants[encoding] if encoding else self.body
+        return Response(content=content, media_type=self.media_type, headers=self.headers(encoding))
+
+
+class ResponseCache:
+    """URL -> CachedPayload (LRU, 항목 수 + 총 바이트 수 제한, dataset version 단위로 무효화)"""
+
+    def __init__(self, max_entries: int = HTTP_CACHE_MAX_ENTRIES, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, CachedPayload]" = OrderedDict()
+        self.size = 0
+        self.version: Optional[str] = None
+
+    def _check_version(self):
+        version = current_version()
+        if version != self.version:
+            self.entries.clear()
+            self.size = 0
+            self.version = version
+
+    def _remove(self, key: str):
+        self.size -= self.entries.pop(key).size
+
+    def clear(self) -> int:
+        """전체 비우기 -> 비운 항목 수"""
+        count = len(self.entries)
+        self.entries.clear()
+        self.size = 0
+        return count
+
+    def get(self, key: str) -> Optional[CachedPayload]:
+        self._check_version()
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        # 인메모리 모드는 버전이 곧 유효기간이므로 max-age 만료를 보지 않음
+        if DATASET_MODE != "memory" and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedPayload):
+        self._check_version()
+        if key in self.entries:
+            self._remove(key)
+        # 한 항목이 전체 한도를 넘으면 보관하지 않음 (다른 항목을 모두 밀어내지 않도록)
+        if entry.size > self.max_bytes:
+            return
+        self.entries[key] = entry
+        self.size += entry.size
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self.entries)))
+
+
+def declared_query_params(route) -> Optional[FrozenSet[str]]:
+    """라우트(하위 의존성 포함)가 선언한 쿼리 파라미터 이름 (FastAPI 라우트가 아니면 None)"""
+    dependant = getattr(route, "dependant", None)
+    if dependant is None:
+        return None
+    return frozenset(param.alias for param in get_flat_dependant(dependant).query_params)
+
+
+def cache_key(scope: Scope, declared: Optional[FrozenSet[str]] = None) -> Optional[str]:
+    """
+    경로 + 정규화한 쿼리 문자열 (디코딩 후 이름 순 정렬, 같은 이름은 원래 순서 유지)
+    - 쿼리가 없으면 항상 '경로?'
+    - declared에 없는 파라미터가 있거나, 선언 목록을 아직 모르면 None (캐시하지 않음)
+    """
+    query = scope.get("query_string", b"")
+    if not query:
+        return f"{scope['path']}?"
+    if declared is None:
+        return None
+    params = parse_qsl(query.decode("latin-1"), keep_blank_values=True)
+    if any(name not in declared for name, _ in params):
+        return None
+    return f"{scope['path']}?{urlencode(sorted(params, key=lambda param: param[0]))}"
+
+
+def parse_max_age(cache_control: str) -> int:
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "max-age" and value.isdigit():
+            return int(value)
+    return 0
+
+
+# 프로세스 안의 미들웨어 인스턴스 (clear_response_caches용)
+_middlewares: "weakref.WeakSet[HTTPCacheMiddleware]" = weakref.WeakSet()
+
+
+def clear_response_caches() -> int:
+    """현재 워커의 응답 캐시를 모두 비움 -> 비운 항목 수 (공유 스토어는 대상 아님)"""
+    return sum(middleware.cache.clear() for middleware in _middlewares)
+
+
+class HTTPCacheMiddleware:
+    """cache_control()이 지정된 GET 라우트의 200 응답을 보관하고 ETag / 304로 응답하는 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_entries: int = HTTP_CACHE_MAX_ENTRIES,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+        shared=None
+    ):
+        self.app = app
+        self.cache = ResponseCache(max_entries, max_bytes)
+        # 경로 -> 라우트가 선언한 쿼리 파라미터 (첫 캐시 채움 때 알게 됨, 캐시와 같은 항목 수로 제한)
+        self.query_params: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        self.max_entries = max_entries
+        # 키 -> 진행 중인 압축 작업 (키당 1개)
+        self.compressing: Dict[str, asyncio.Task] = {}
+        # 멀티 워커 공유 스토어 (lib.api.shared_store.SharedResponseStore, 선택)
+        self.shared = shared
+        _middlewares.add(self)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        # 요청의 Cache-Control: no-store -> 캐시를 읽지도 저장하지도 않음 (정적 내보내기 등 일괄 렌더링용)
+        if "no-store" in request_headers.get("cache-control", ""):
+            await self.app(scope, receive, send)
+            return
+
+        key = cache_key(scope, self.query_params.get(scope["path"]))
+        if_none_match = request_headers.get("if-none-match")
+        accept_encoding = request_headers.get("accept-encoding")
+
+        # 1. Hit: 엔드포인트를 호출하지 않음 (DB/Redis 미접근, 압축도 하지 않음)
+        entry = None
+        if key is not None:
+            # 게시 버전이 현재 버전과 다르면(ETL 직후 재게시 전 등) 공유 스토어를 건너뜀
+            entry = self.shared.get(key, current_version()) if self.shared is not None else None
+            if entry is None:
+                entry = self.cache.get(key)
+        if entry is not None:
+            scope["http_cache"] = "hit"  # 지연 시간 집계(lib.api.timing)에서 라벨로 사용
+            response = entry.response(if_none_match, accept_encoding)
+            response.headers[CACHE_STATUS_HEADER] = "HIT"
+            await response(scope, receive, send)
+            return
+
+        # 2. Miss: 응답을 버퍼링해 두었다가 캐시 대상이면 보관
+        messages: List[Message] = []
+        start: Optional[Message] = None
+
+        async def capture(message: Message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            else:
+                messages.append(message)
+
+        await self.app(scope, receive, capture)
+
+        headers = Headers(raw=start["headers"]) if start else Headers()
+        cache_control = headers.get("cache-control")
+        if start is None or start["status"] != 200 or not cache_control:
+            if start is not None:
+                await send(start)
+            for message in messages:
+                await send(message)
+            return
+
+        # 라우팅이 끝났으므로 선언된 쿼리 파라미터로 키를 다시 계산 (모르는 파라미터가 있으면 캐시하지 않음)
+        declared = declared_query_params(scope.get("route"))
+        key = cache_key(scope, declared)
+        if key is None:
+            await send(start)
+            for message in messages:
+                await send(message)
+            return
+        self._remember_params(scope["path"], declared)
+
+        body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+        # 압축본 없이 먼저 보관 (해시만 계산). 동시 미스가 같은 본문을 이미 채웠으면 그 항목을 그대로 사용
+        entry = CachedPayload(
+            body, headers.get("content-type", "application/json"), cache_control, parse_max_age(cache_control),
+            variants={}
+        )
+        existing = self.cache.get(key)
+        if existing is not None and existing.etag == entry.etag:
+            entry = existing
+        else:
+            self.cache.put(key, entry)
+            if len(body) >= MIN_COMPRESS_SIZE and key not in self.compressing:
+                self.compressing[key] = asyncio.create_task(self._compress(key))
+        response = entry.response(if_none_match, accept_encoding)
+        response.headers[CACHE_STATUS_HEADER] = "MISS"
+        await response(scope, receive, send)
+
+    async def _compress(self, key: str):
+        """
+        압축본 생성(스레드) 후 캐시 항목 교체
+        - 그 사이 항목이 다른 본문으로 바뀌었으면 새 항목으로 다시 시도하고, 비워졌으면 끝냄
+        """
+        try:
+            while True:
+                entry = self.cache.entries.get(key)
+                if entry is None or entry.variants:
+                    return
+                variants = await asyncio.to_thread(compress_variants, entry.body)
+                if self.cache.entries.get(key) is entry:
+                    if variants:
+                        self.cache.put(key, entry.with_variants(variants))
+                    return
+        finally:
+            self.compressing.pop(key, None)
+
+    def _remember_params(self, path: str, declared: FrozenSet[str]):
+        self.query_params[path] = declared
+        self.query_params.move_to_end(path)
+        while len(self.query_params) > self.max_entries:
+            self.query_params.popitem(last=False)
@@ -0,0 +1,164 @@
+# lib/api/shared_store.py
+"""
+멀티 워커 공유 응답 스토어 (mmap)
+- 로더 1개(python -m lib.api.export --publish DIR)가 dataset version 단위로 직렬화된 응답 파일을 만들고,
+  모든 uvicorn 워커가 같은 파일을 mmap으로 열어 페이지 캐시를 공유합니다.
+  (본문은 memoryview 슬라이스로 바로 전송 -> 워커 수가 늘어도 본문 메모리는 1벌)
+- 버전 교체: 새 파일을 다 쓴 뒤 CURRENT 포인터 파일을 os.replace로 원자적으로 바꾸고,
+  각 워커는 요청마다 CURRENT의 inode를 확인해 바뀐 즉시 새 파일로 넘어갑니다.
+- 유효성: 워커는 게시 버전이 자신이 아는 현재 dataset version과 같고, 항목의 max-age가 지나지 않았을 때만
+  스토어 본문을 씁니다. 아니면 로컬 캐시 / 앱으로 넘깁니다. (ETL 후 재게시 전까지 이전 본문을 내보내지 않음)
+  ETL은 버전 기록 후 스토어를 내리고(drop), 로더(--publish --watch)는 버전이 바뀌거나 만료 전에 다시 게시합니다.
+- 본문의 유일한 사본은 이 파일이므로 SHARED_STORE_DIR 워커는 DATASET_MODE=db로 실행합니다.
+  (워커마다 인메모리 스냅샷을 두지 않음. 스토어에 없는 요청은 공용 Redis 캐시 -> DB 경로로 응답,
+   스냅샷 색인 라우트의 계산 / 검색 요청은 501 -> DATASET_MODE=memory 서버로 라우팅, deps.snapshot 참고)
+
+파일 형식:
+    MAGIC(8) | index offset(uint64 LE) | index 길이(uint64 LE) | 본문/압축본 바이트들 | index(JSON)
+    index = {"version": ...,
+             "entries": {cache_key: {"media_type", "cache_control", "etag", "expires_at": epoch 초,
+                                     "body": [offset, length], "variants": {encoding: [offset, length]}}}}
+"""
+import glob
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Dict, Optional
+
+from lib.api.http_cache import CachedPayload, parse_max_age
+
+MAGIC = b"AKRESP01"
+HEADER = struct.Struct("<8sQQ")
+POINTER_FILE = "CURRENT"
+
+# 설정 시 HTTPCacheMiddleware가 로컬 캐시보다 먼저 이 디렉터리의 공유 스토어를 조회
+SHARED_STORE_DIR = os.getenv("SHARED_STORE_DIR")
+
+
+def publish(store_dir: str, version: str, payloads: Dict[str, CachedPayload]) -> str:
+    """
+    cache_key -> CachedPayload 묶음을 스토어 파일로 기록하고 CURRENT를 원자적으로 교체
+    - 이전 버전 파일은 교체 후 삭제 (이미 mmap한 워커는 Linux에서 매핑이 유지되므로 안전)
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    file_name = f"responses-{version}.bin"
+    path = os.path.join(store_dir, file_name)
+
+    # 1. 본문/압축본을 먼저 쓰고, offset을 모은 index를 끝에 기록한 뒤 헤더를 채움
+    entries = {}
+    published_at = time.time()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, 0, 0))
+        for key, payload in payloads.items():
+            spans = {}
+            for encoding, data in [(None, payload.body), *payload.variants.items()]:
+                spans[encoding] = [f.tell(), len(data)]
+                f.write(data)
+            entries[key] = {
+                "media_type": payload.media_type,
+                "cache_control": payload.cache_control,
+                "etag": payload.etag,
+                "expires_at": published_at + parse_max_age(payload.cache_control),
+                "body": spans.pop(None),
+                "variants": spans,
+            }
+
+        index = json.dumps({"version": version, "entries": entries}, ensure_ascii=False, separators=(",", ":")).encode()
+        index_offset = f.tell()
+        f.write(index)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, index_offset, len(index)))
+        f.flush()
+        os.fsync(f.fileno())
+
+    # 2. 완성된 파일만 정식 이름으로 노출
+    os.replace(tmp_path, path)
+
+    # 3. 포인터 교체 (모든 워커가 다음 요청부터 새 버전을 봄)
+    pointer_tmp = os.path.join(store_dir, POINTER_FILE + ".tmp")
+    with open(pointer_tmp, 'w', encoding='utf-8') as f:
+        f.write(file_name)
+    os.replace(pointer_tmp, os.path.join(store_dir, POINTER_FILE))
+
+    for old in glob.glob(os.path.join(store_dir, "responses-*.bin")):
+        if os.path.basename(old) != file_name:
+            os.remove(old)
+    return path
+
+
+def drop(store_dir: str) -> bool:
+    """CURRENT 포인터와 게시 파일 삭제 (데이터 교체 직후 다음 게시 전까지 워커가 스토어를 건너뛰도록). 삭제 여부 반환"""
+    try:
+        os.remove(os.path.join(store_dir, POINTER_FILE))
+    except FileNotFoundError:
+        return False
+    for old in glob.glob(os.path.join(store_dir, "responses-*.bin")):
+        os.remove(old)
+    return True
+
+
+class SharedResponseStore:
+    """워커 측 읽기 전용 뷰 (CURRENT가 바뀌면 새 파일로 다시 mmap)"""
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self.pointer = os.path.join(store_dir, POINTER_FILE)
+        self.pointer_id = None
+        self.version: Optional[str] = None
+        self.view: Optional[memoryview] = None
+        self.entries: Dict[str, dict] = {}
+
+    def _refresh(self):
+        try:
+            stat = os.stat(self.pointer)
+        except FileNotFoundError:
+            self.pointer_id, self.view, self.entries, self.version = None, None, {}, None
+            return
+        pointer_id = (stat.st_ino, stat.st_mtime_ns)
+        if pointer_id == self.pointer_id:
+            return
+
+        try:
+            with open(self.pointer, 'r', encoding='utf-8') as f:
+                file_name = f.read().strip()
+            with open(os.path.join(self.store_dir, file_name), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            # 읽는 사이 다음 버전이 게시됨 -> 기존 매핑으로 응답하고 다음 요청에서 다시 시도
+            return
+
+        magic, index_offset, index_length = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{file_name}: 공유 응답 스토어 파일이 아닙니다.")
+        index = json.loads(mapped[index_offset:index_offset + index_length])
+
+        # 이전 매핑은 닫지 않고 참조만 놓음 (전송 중인 memoryview가 있을 수 있으므로 GC에 맡김)
+        self.view = memoryview(mapped)
+        self.entries = index["entries"]
+        self.version = index["version"]
+        self.pointer_id = pointer_id
+
+    def get(self, key: str, version: Optional[str]) -> Optional[CachedPayload]:
+        """게시 버전이 version과 같고 max-age가 남은 항목만 반환 (버전을 모르면 None)"""
+        self._refresh()
+        if version is None or self.version != version:
+            return None
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry["expires_at"] - time.time()
+        if remaining <= 0:
+            return None
+        view = self.view
+        offset, length = entry["body"]
+        variants = {
+            encoding: view[start:start + size]
+            for encoding, (start, size) in entry["variants"].items()
+        }
+        return CachedPayload(
+            view[offset:offset + length], entry["media_type"], entry["cache_control"], int(remaining),
+            variants=variants, etag=entry["etag"]
+        )
@@ -0,0 +1,65 @@
+# lib/api/timing.py
+"""
+요청별 지연 시간 분해를 Server-Timing 헤더로 내보내고 라우트별 히스토그램에 합산하는 ASGI 미들웨어
+- 구간 측정은 lib.core.timing.span()을 쓰는 서비스/리포지토리 쪽에서 하고, 여기서는 요청 시작/끝만 다룹니다.
+- HTTP 응답 캐시 히트는 라우팅 전에 끝나므로 "(http-cache)", 매칭되는 라우트가 없으면 "(unmatched)" 라벨로 모읍니다.
+"""
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from lib.core.timing import route_stats, span, start_request
+
+CACHE_HIT_ROUTE = "(http-cache)"
+UNMATCHED_ROUTE = "(unmatched)"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    매칭된 라우트의 경로 템플릿 (예: /api/v1/characters/{code}/skills)
+    - FastAPI 버전에 따라 include_router(prefix=...)의 route.path에 prefix가 빠져 있을 수 있어 실제 경로에서 보충
+    """
+    route = scope["route"]
+    path = scope["path"]
+    if route.path_regex.match(path):
+        return route.path
+    for index, char in enumerate(path):
+        if char == "/" and route.path_regex.match(path[index:]):
+            return path[:index] + route.path
+    return route.path
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSON 인코딩 시간을 serialize 구간으로 기록하는 기본 응답 클래스"""
+
+    def render(self, content) -> bytes:
+        with span("serialize"):
+            return super().render(content)
+
+
+class RequestTimingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = start_request()
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                values = timing.finish()
+                # 라우터가 scope에 매칭된 라우트를 기록 (경로 파라미터 대신 템플릿으로 묶어 카디널리티 제한)
+                if scope.get("route") is not None:
+                    label = route_template(scope)
+                elif scope.get("http_cache") == "hit":
+                    label = CACHE_HIT_ROUTE
+                else:
+                    label = UNMATCHED_ROUTE
+                route_stats.observe(f"{scope['method']} {label}", values, timing.db_statements)
+                MutableHeaders(scope=message).append("Server-Timing", timing.server_timing(values))
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
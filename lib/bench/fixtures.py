@@ -0,0 +1,477 @@
+# lib/bench/fixtures.py
+"""
+벤치마크 / 테스트용 데이터셋 픽스처 (DB 없이 data/ 원본, ETL 스냅샷 또는 합성 원본에서 생성)
+- ETL 변환 결과(RowBatches)에 KeyResolver 대신 순번 ID를 붙여 DB 테이블 행(dict) 형태로 바꾼 뒤
+  인메모리 서빙과 같은 build_dataset()으로 Dataset을 만듭니다.
+- synthetic_sources(): 시드 고정 합성 원본 (게임 데이터 JSON과 같은 형태, data/ 없이 모든 변환/색인 경로를 거침)
+- to_orm(): Dataset 레코드 -> 세션에 붙지 않은 ORM 객체 (ORM -> 스키마 변환 측정용)
+"""
+import json
+import os
+import random
+from typing import Dict, List, Optional
+
+import requests
+from sqlalchemy import inspect
+
+from lib.core.dataset import SOURCE_TABLES, Dataset, build_dataset
+from lib.etl.rows import RowBatches
+from lib.etl.snapshot import read_snapshot
+from lib.etl.transform import transform_all
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_DIR = os.path.join(ROOT_DIR, "data")
+
+# data/에 없는 원본을 받을 주소 (ETL.URLS와 같은 위치: SOURCE_URL + 파일명)
+SOURCE_URL = "https://raw.githubusercontent.com/ArknightsAssets/ArknightsGamedata/refs/heads/master/kr/gamedata/excel/"
+
+# ETL 원본 키 -> data/ 파일명 (ETL.URLS와 같은 파일)
+SOURCE_FILES = {
+    "character": "character_table.json",
+    "skill": "skill_table.json",
+    "range": "range_table.json",
+    "module": "uniequip_table.json",
+    "item": "item_table.json",
+    "map": "stage_table.json",
+    "zone": "zone_table.json",
+    "skin": "skin_table.json",
+}
+
+
+def read_sources(data_dir: str = DATA_DIR, download: bool = False) -> Dict[str, Dict]:
+    """
+    data/의 원본 읽기 (ETL.load_sources와 같은 규칙)
+    - 없는 소스는 download=True면 SOURCE_URL에서 받고, 아니면 빈 dict (해당 변환 건너뜀 -> missing_sources로 확인)
+    """
+    jsons = {}
+    for key, file_name in SOURCE_FILES.items():
+        path = os.path.join(data_dir, file_name)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                jsons[key] = json.load(f)
+        elif download:
+            print(f"Downloading {SOURCE_URL + file_name}...")
+            response = requests.get(SOURCE_URL + file_name, timeout=60)
+            response.raise_for_status()
+            jsons[key] = response.json()
+        else:
+            jsons[key] = {}
+    return jsons
+
+
+def missing_sources(jsons: Dict[str, Dict]) -> List[str]:
+    """비어 있는(읽지 못한) 원본의 파일명 목록"""
+    return [SOURCE_FILES[key] for key, data in jsons.items() if not data]
+
+
+def _ids(rows, key: str) -> Dict[str, int]:
+    """자연키 -> 순번 ID (먼저 나온 행 우선, KeyResolver의 ON CONFLICT DO NOTHING과 같음)"""
+    ids: Dict[str, int] = {}
+    for row in rows:
+        ids.setdefault(getattr(row, key), len(ids) + 1)
+    return ids
+
+
+def _first(rows, key: str) -> List:
+    seen = set()
+    unique = []
+    for row in rows:
+        if getattr(row, key) not in seen:
+            seen.add(getattr(row, key))
+            unique.append(row)
+    return unique
+
+
+def tables_from_batches(batches: RowBatches) -> Dict[str, List[dict]]:
+    """RowBatches -> build_dataset 입력 (ETL.py의 적재 규칙과 같이 해석 불가 참조는 제외)"""
+    items = _first(batches["items"], "item_code")
+    item_ids = _ids(items, "item_code")
+    zones = _first(batches["zones"], "zone_code")
+    zone_ids = _ids(zones, "zone_code")
+    professions = _ids(batches["professions"], "code")
+    sub_professions = _ids(batches["sub_professions"], "code")
+    tag_ids = _ids(batches["tags"], "name")
+    characters = _first(batches["characters"], "code")
+    char_ids = _ids(characters, "code")
+    skills = _first(batches["skills"], "skill_code")
+    skill_ids = _ids(skills, "skill_code")
+    modules = [m for m in _first(batches["character_modules"], "module_code") if m.char_code in char_ids]
+    module_ids = _ids(modules, "module_code")
+    skins = [s for s in _first(batches["character_skins"], "skin_code") if s.char_code in char_ids]
+    skin_group_ids = _ids(batches["skin_groups"], "name_ko")
+
+    def costs(rows, owner_ids, owner_key, owner_column, level_key):
+        return [
+            {
+                "id": index, owner_column: owner_ids[getattr(r, owner_key)], level_key: getattr(r, level_key),
+                "item_id": item_ids[r.item_code], "count": r.count,
+            }
+            for index, r in enumerate(rows, start=1)
+            if getattr(r, owner_key) in owner_ids and r.item_code in item_ids
+        ]
+
+    return {
+        "ranges": [r._asdict() for r in _first(batches["ranges"], "range_id")],
+        "items": [{"item_id": item_ids[r.item_code], **r._asdict()} for r in items],
+        "zones": [{"zone_id": zone_ids[r.zone_code], **r._asdict()} for r in zones],
+        "stages": [
+            {
+                "stage_id": index, "stage_code": r.stage_code, "zone_id": zone_ids[r.zone_code],
+                "display_code": r.display_code, "name_ko": r.name_ko, "description": r.description,
+                "ap_cost": r.ap_cost, "danger_level": r.danger_level,
+            }
+            for index, r in enumerate(_first(batches["stages"], "stage_code"), start=1)
+            if r.zone_code in zone_ids
+        ],
+        "profession": [
+            {"profession_id": pid, "name_ko": r.name_ko}
+            for r in _first(batches["professions"], "code") for pid in [professions[r.code]]
+        ],
+        "sub_profession": [
+            {"sub_profession_id": sid, "name_ko": r.name_ko}
+            for r in _first(batches["sub_professions"], "code") for sid in [sub_professions[r.code]]
+        ],
+        "tag": [{"tag_id": tag_id, "tag_name": name} for name, tag_id in tag_ids.items()],
+        "characters": [
+            {
+                "character_id": char_ids[r.code], "code": r.code, "name_ko": r.name_ko,
+                "class_description": r.description, "rarity": r.rarity, "position": r.position,
+                "profession_id": professions.get(r.profession_code),
+                "sub_profession_id": sub_professions.get(r.sub_profession_code),
+            }
+            for r in characters
+        ],
+        # 캐릭터 상세 텍스트는 ETL 변환 대상이 아님
+        "characters_detail": [],
+        "character_stats": [
+            {
+                "character_id": char_ids[s.char_code], "phase": s.phase, "max_level": s.max_level,
+                "range_id": s.range_id, "base_hp": s.base_hp, "base_atk": s.base_atk, "base_def": s.base_def,
+                "max_hp": s.max_hp, "max_atk": s.max_atk, "max_def": s.max_def,
+                "magic_resistance": s.magic_resistance, "cost": s.cost, "block_cnt": s.block_count,
+                "attack_speed": s.attack_speed, "keyframes": s.keyframes,
+            }
+            for s in batches["character_stats"] if s.char_code in char_ids
+        ],
+        "character_talents": [
+            {"character_id": char_ids[t.char_code], **t._asdict()}
+            for t in batches["character_talents"] if t.char_code in char_ids
+        ],
+        "character_skill": [
+            {"character_id": char_ids[s.char_code], **s._asdict()}
+            for s in _first(batches["character_skill"], "char_code") if s.char_code in char_ids
+        ],
+        "character_favor_templates": [
+            {"character_id": char_ids[f.char_code], **f._asdict()}
+            for f in _first(batches["character_favor_templates"], "char_code") if f.char_code in char_ids
+        ],
+        "character_potentials": [
+            {"character_id": char_ids[p.char_code], **p._asdict()}
+            for p in batches["character_potentials"] if p.char_code in char_ids
+        ],
+        "character_promotion_costs": costs(
+            batches["character_promotion_costs"], char_ids, "char_code", "character_id", "target_phase"
+        ),
+        "character_skill_costs": costs(batches["character_skill_costs"], char_ids, "char_code", "character_id", "level"),
+        "character_tag": [
+            {"character_id": char_ids[t.char_code], "tag_id": tag_ids[t.tag_name]}
+            for t in batches["character_tag"] if t.char_code in char_ids and t.tag_name in tag_ids
+        ],
+        "character_modules": [
+            {
+                "module_id": module_ids[m.module_code], "module_code": m.module_code,
+                "character_id": char_ids[m.char_code], "name_ko": m.name_ko, "icon_id": m.icon_id,
+                "description": m.description,
+            }
+            for m in modules
+        ],
+        "character_module_costs": costs(batches["character_module_costs"], module_ids, "module_code", "module_id", "level"),
+        "character_skins": [
+            {"skin_id": index, "character_id": char_ids[s.char_code], **s._asdict()}
+            for index, s in enumerate(skins, start=1)
+        ],
+        "skin_groups": [{"skin_group_id": group_id, "name_ko": name} for name, group_id in skin_group_ids.items()],
+        "skills": [{"skill_id": skill_ids[r.skill_code], **r._asdict()} for r in skills],
+        "skill_levels": [
+            {"skill_id": skill_ids[l.skill_code], **l._asdict()}
+            for l in batches["skill_levels"] if l.skill_code in skill_ids
+        ],
+        "skill_mastery_costs": costs(batches["skill_mastery_costs"], skill_ids, "skill_code", "skill_id", "mastery_level"),
+    }
+
+
+def coerce_to_columns(tables: Dict[str, List[dict]]) -> Dict[str, List[dict]]:
+    """
+    문자열 컬럼에 들어갈 숫자 값 등을 DB를 거친 것과 같은 타입으로 맞춤
+    (예: item_type 85 -> '85', Postgres가 INSERT 시 VARCHAR로 변환하는 것과 동일)
+    """
+    for name, table in SOURCE_TABLES.items():
+        string_columns = []
+        for column in table.columns:
+            try:
+                if column.type.python_type is str:
+                    string_columns.append(column.name)
+            except NotImplementedError:
+                continue
+        for row in tables.get(name, []):
+            for column_name in string_columns:
+                value = row.get(column_name)
+                if value is not None and not isinstance(value, str):
+                    row[column_name] = str(value)
+    return tables
+
+
+def dataset_from_batches(batches: RowBatches) -> Dataset:
+    return build_dataset(coerce_to_columns(tables_from_batches(batches)), batches.fingerprint())
+
+
+def load_fixture_dataset(
+    data_dir: str = DATA_DIR,
+    snapshot_dir: Optional[str] = None,
+    download: bool = False
+) -> Dataset:
+    """스냅샷(ETL.py --offline 결과)이 있으면 그것을, 없으면 data/ 원본을 변환해 Dataset 생성"""
+    if snapshot_dir:
+        batches = read_snapshot(snapshot_dir)
+    else:
+        jsons = read_sources(data_dir, download)
+        missing = missing_sources(jsons)
+        if missing:
+            print(f"⚠️ {data_dir}에 없는 원본: {', '.join(missing)} (해당 픽스처는 비어 있음, --download로 받을 수 있음)")
+        batches = transform_all(jsons, workers=1)
+    return dataset_from_batches(batches)
+
+
+# ==========================================
+# 합성 원본 (시드 고정)
+# ==========================================
+SYNTHETIC_OPERATORS = 120
+
+SYNTHETIC_PROFESSIONS = ("PIONEER", "WARRIOR", "TANK", "SNIPER", "CASTER", "MEDIC", "SUPPORT", "SPECIAL")
+SYNTHETIC_MELEE = ("PIONEER", "WARRIOR", "TANK", "SPECIAL")
+SYNTHETIC_TAGS = (
+    "딜러", "방어형", "힐링", "지원", "감속", "범위공격", "생존형", "제어형",
+    "강제이동", "소환", "쾌속부활", "디버프", "누커", "폭발력", "코스트+",
+)
+SYNTHETIC_ITEM_GRADES = ("초급", "중급", "고급", "정제")
+SYNTHETIC_ITEM_NAMES = ("원암", "당원", "폴리에스테르", "망간", "연마석", "메모리칩", "장치", "용매")
+SYNTHETIC_SKIN_GROUPS = ("에피소드", "하이라인", "코러스")
+# 희귀도(0~5) -> 정예화 단계별 최대 레벨
+SYNTHETIC_MAX_LEVELS = {0: (30,), 1: (30,), 2: (40, 55), 3: (45, 60, 70), 4: (50, 70, 80), 5: (50, 80, 90)}
+
+
+def _synthetic_ranges() -> Dict[str, Dict]:
+    """사각형 범위 (0-1: 자기 칸 ~ 5-1: 3행 x 5열, 전방 방향 = col 증가)"""
+    ranges = {}
+    for size in range(6):
+        half = size // 2
+        ranges[f"{size}-1"] = {
+            "id": f"{size}-1",
+            "grids": [{"row": row, "col": col} for row in range(-half, half + 1) for col in range(size)] or [{"row": 0, "col": 0}],
+        }
+    ranges["x-1"] = {"id": "x-1", "grids": [{"row": 0, "col": 0}, {"row": -1, "col": 1}, {"row": 1, "col": 1}]}
+    return ranges
+
+
+def _costs(rng: random.Random, items: List[str], kinds: int) -> List[Dict]:
+    return [{"id": code, "count": rng.randint(1, 20), "type": "MATERIAL"} for code in rng.sample(items, kinds)]
+
+
+def _blackboard(rng: random.Random, keys) -> List[Dict]:
+    return [{"key": key, "value": round(rng.uniform(0.05, 3.0), 2)} for key in keys]
+
+
+def synthetic_sources(operators: int = SYNTHETIC_OPERATORS, seed: int = 0) -> Dict[str, Dict]:
+    """
+    read_sources()와 같은 형태의 합성 원본 (같은 인자면 항상 같은 결과)
+    - 모든 희귀도 / 8개 직군, 스킬 특화 / 모듈 / 재능 / 잠재 / 신뢰도 / 스킨을 가진 오퍼레이터를 만들고,
+      변환 단계가 건너뛰는 행(삭제된 아이템, 획득 불가 캐릭터, 캐릭터 없는 모듈, 구역 없는 스테이지)도 1개씩 섞습니다.
+    """
+    rng = random.Random(seed)
+    ranges = _synthetic_ranges()
+    range_ids = sorted(ranges)
+
+    items = {}
+    for index, (grade, name) in enumerate((g, n) for n in SYNTHETIC_ITEM_NAMES for g in SYNTHETIC_ITEM_GRADES):
+        code = f"syn_{3000 + index}"
+        items[code] = {
+            "itemId": code, "name": f"{grade} {name}", "rarity": f"TIER_{SYNTHETIC_ITEM_GRADES.index(grade) + 2}",
+            "iconId": code, "itemType": "MATERIAL", "classifyType": "MATERIAL",
+            "usage": f"{name}을(를) 가공해 만든 육성 재료", "description": f"{grade} 등급의 {name}", "obtainApproach": None,
+        }
+    items["syn_deleted"] = {"itemId": "syn_deleted", "name": "삭제된 재료", "rarity": 0, "isDeleted": True}
+    materials = [code for code in items if code != "syn_deleted"]
+
+    characters = {}
+    skills = {}
+    modules = {}
+    skins = {}
+    for index in range(operators):
+        code = f"char_{index:03d}_syn"
+        rarity = index % 6 if index < 12 else rng.randint(0, 5)
+        profession = SYNTHETIC_PROFESSIONS[index % len(SYNTHETIC_PROFESSIONS)]
+        max_levels = SYNTHETIC_MAX_LEVELS[rarity]
+
+        phases = []
+        for phase, max_level in enumerate(max_levels):
+            base = {"maxHp": rng.randint(600, 1500), "atk": rng.randint(150, 500), "def": rng.randint(50, 300)}
+            top = {key: value * 2 + phase * 100 for key, value in base.items()}
+            constant = {
+                "magicResistance": rng.choice((0, 10, 15)), "cost": 8 + rarity + rng.randint(0, 6),
+                "blockCnt": 3 if profession == "TANK" else 1 + (profession in SYNTHETIC_MELEE),
+                "attackSpeed": 100, "baseAttackTime": rng.choice((1.0, 1.2, 1.6, 2.85)), "respawnTime": 70,
+            }
+            frames = [{"level": 1, "data": {**base, **constant}}, {"level": max_level, "data": {**top, **constant}}]
+            if index % 5 == 0:
+                # 3개 키프레임 (구간별 기울기가 다른 보간 확인용)
+                middle = {key: value + (top[key] - value) // 4 for key, value in base.items()}
+                frames.insert(1, {"level": max_level // 2, "data": {**middle, **constant}})
+            phases.append({
+                "characterPrefabKey": code, "rangeId": rng.choice(range_ids), "maxLevel": max_level,
+                "attributesKeyFrames": frames,
+                "evolveCost": _costs(rng, materials, 2 + phase) if phase else None,
+            })
+
+        skill_entries = []
+        for slot in range(min(max(rarity - 2, 0), 3)):
+            skill_code = f"skchr_{index:03d}_{slot + 1}"
+            skill_entries.append({
+                "skillId": skill_code,
+                "levelUpCostCond": [{"unlockCond": {"phase": "PHASE_2"}, "levelUpCost": _costs(rng, materials, 2)} for _ in range(3)],
+            })
+            level_range = rng.choice(range_ids + [None])
+            skills[skill_code] = {
+                "skillId": skill_code, "iconId": None,
+                "levels": [
+                    {
+                        "name": f"{SYNTHETIC_TAGS[(index + slot) % len(SYNTHETIC_TAGS)]} 전술 {slot + 1}",
+                        "rangeId": level_range,
+                        "description": "<@ba.vup>{atk:0%}</> 공격력이 증가하고 적을 <$ba.stun>기절</>시킨다",
+                        "skillType": "MANUAL" if slot else "AUTO",
+                        "spData": {"spType": "INCREASE_WITH_TIME", "spCost": 40 - level, "initSp": 10},
+                        "duration": 10 + level,
+                        "blackboard": [
+                            {"key": "atk", "value": round(0.1 * (level + 1) + 0.01 * slot, 2)},
+                            {"key": "attack@max_target", "value": 1 + slot},
+                        ] + ([{"key": "stun", "value": 1.5}] if slot == 1 else []),
+                    }
+                    for level in range(10)
+                ],
+            }
+
+        talents = [{
+            "candidates": [
+                {
+                    "unlockCondition": {"phase": "PHASE_0" if candidate == 0 else "PHASE_1", "level": 1},
+                    "requiredPotentialRank": 0 if candidate == 0 else 4,
+                    "name": f"재능 {index}", "description": "공격 시 일정 확률로 추가 피해", "rangeId": None,
+                    "blackboard": _blackboard(rng, ("atk", "prob")) if index % 2 else _blackboard(rng, ("heal_scale",)),
+                }
+                for candidate in range(2)
+            ]
+        }] if rarity >= 2 else []
+
+        characters[code] = {
+            "name": f"합성 오퍼레이터 {index}", "description": "합성 데이터", "rarity": f"TIER_{rarity + 1}",
+            "position": "MELEE" if profession in SYNTHETIC_MELEE else "RANGED",
+            "tagList": rng.sample(SYNTHETIC_TAGS, rng.randint(1, 3)),
+            "isNotObtainable": False,
+            "profession": profession, "subProfessionId": f"{profession.lower()}{index % 3}",
+            "itemUsage": None, "itemDesc": None, "nationId": None,
+            "phases": phases,
+            "skills": skill_entries,
+            "talents": talents,
+            "potentialRanks": [
+                {"type": 0, "description": "배치 코스트 -1", "buff": {"attributes": {"attributeModifiers": [{"attributeType": "COST", "value": -1}]}}},
+                {"type": 0, "description": "재배치 시간 -4", "buff": {"attributes": {"attributeModifiers": [{"attributeType": "RESPAWN_TIME", "value": -4}]}}},
+                {"type": 0, "description": "공격력 +25", "buff": {"attributes": {"attributeModifiers": [{"attributeType": "ATK", "value": 25}]}}},
+                {"type": 1, "description": "재능 강화", "buff": None},
+                {"type": 0, "description": "배치 코스트 -1", "buff": {"attributes": {"attributeModifiers": [{"attributeType": "COST", "value": -1}]}}},
+            ],
+            "favorKeyFrames": [
+                {"level": 0, "data": {"maxHp": 0, "atk": 0, "def": 0}},
+                {"level": 50, "data": {"maxHp": rng.choice((0, 200, 300)), "atk": rng.choice((0, 40, 60)), "def": rng.choice((0, 30, 50))}},
+            ],
+            "allSkillLvlup": [{"unlockCond": {"phase": "PHASE_0", "level": 1}, "lvlUpCost": _costs(rng, materials, 1 + level % 2)} for level in range(6)] if rarity >= 2 else [],
+        }
+
+        if rarity >= 3 and index % 2 == 0:
+            module_code = f"uniequip_002_{index:03d}"
+            modules[module_code] = {
+                "uniEquipId": module_code, "uniEquipName": f"{SYNTHETIC_ITEM_NAMES[index % len(SYNTHETIC_ITEM_NAMES)]} 강화 장비",
+                "uniEquipIcon": module_code, "uniEquipDesc": "오래된 작전 기록에서 발견된 장비. 공격력이 증가한다.",
+                "charId": code,
+                "itemCost": {str(level): _costs(rng, materials, 2) for level in range(1, 4)},
+            }
+        if index % 4 == 0:
+            skin_code = f"{code}@syn#1"
+            skins[skin_code] = {
+                "skinId": skin_code, "charId": code, "portraitId": skin_code, "avatarId": skin_code,
+                "displaySkin": {
+                    "skinName": f"합성 의상 {index}", "skinGroupName": SYNTHETIC_SKIN_GROUPS[index % len(SYNTHETIC_SKIN_GROUPS)],
+                    "drawerList": [f"작가 {index % 7}"], "content": None, "dialog": None, "description": None, "usage": None,
+                },
+            }
+
+    characters["token_syn_device"] = {"name": "합성 장치", "rarity": "TIER_1", "profession": "TRAP", "isNotObtainable": True}
+    modules["uniequip_001_orphan"] = {"uniEquipId": "uniequip_001_orphan", "uniEquipName": "기본 장비", "charId": None}
+
+    zones = {
+        f"syn_zone_{zone}": {"zoneID": f"syn_zone_{zone}", "zoneNameFirst": f"합성 {zone}장", "type": "MAINLINE", "zoneIndex": zone}
+        for zone in range(3)
+    }
+    stages = {
+        f"syn_{zone}-{stage}": {
+            "stageId": f"syn_{zone}-{stage}", "zoneId": f"syn_zone_{zone}", "code": f"{zone}-{stage}",
+            "name": f"합성 스테이지 {zone}-{stage}", "description": None, "apCost": 6 + zone * 3, "dangerLevel": "정예 1 LV.1",
+        }
+        for zone in range(3) for stage in range(1, 5)
+    }
+    stages["syn_orphan"] = {"stageId": "syn_orphan", "zoneId": None, "code": "X-1", "name": "구역 없음"}
+
+    return {
+        "character": characters,
+        "skill": skills,
+        "range": ranges,
+        "module": {"equipDict": modules},
+        "item": {"items": items},
+        "map": {"stages": stages},
+        "zone": {"zones": zones},
+        "skin": {"charSkins": skins},
+    }
+
+
+def synthetic_dataset(operators: int = SYNTHETIC_OPERATORS, seed: int = 0) -> Dataset:
+    """합성 원본 -> ETL 변환 -> Dataset (load_fixture_dataset과 같은 경로)"""
+    return dataset_from_batches(transform_all(synthetic_sources(operators, seed), workers=1))
+
+
+# ORM 속성명 -> 레코드 필드명 (이름이 다른 것만). CostRecord는 특화 단계 / 정예화 단계를 모두 level로 보관
+ORM_FIELD_ALIASES = {
+    "mastery_level": "level",
+    "target_phase": "level",
+}
+
+
+def to_orm(record, model):
+    """
+    Dataset 레코드 -> 컬럼/관계를 채운 ORM 객체 (세션 없음)
+    - ORM 매퍼의 컬럼/관계마다 같은 이름(없으면 ORM_FIELD_ALIASES의 이름)의 레코드 필드를 읽습니다.
+    - 레코드에 없는 속성(id, created_at 등)은 비워 둡니다.
+    """
+    mapper = inspect(model)
+    fields = record._fields
+    values = {}
+    for key in [attr.key for attr in mapper.column_attrs] + [rel.key for rel in mapper.relationships]:
+        name = key if key in fields else ORM_FIELD_ALIASES.get(key)
+        if name not in fields:
+            continue
+        value = getattr(record, name)
+        if key in mapper.relationships:
+            target = mapper.relationships[key].mapper.class_
+            if isinstance(value, tuple) and not hasattr(value, "_fields"):
+                value = [to_orm(element, target) for element in value]
+            elif value is not None:
+                value = to_orm(value, target)
+        values[key] = value
+    return model(**values)
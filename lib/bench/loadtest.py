@@ -0,0 +1,396 @@
+# lib/bench/loadtest.py
+"""
+HTTP 부하 테스트 (로컬 대체 환경 + 재현 가능한 워크로드)
+- 대상 앱: 기본은 프로세스 안에서 lib.main 앱을 기동해 httpx ASGI 트랜스포트로 호출 (네트워크/uvicorn 제외)
+           --url을 주면 이미 떠 있는 서버(uvicorn 멀티 워커 등)를 호출
+- 대체 환경: --local이면 docker-compose의 로컬 Postgres(5433) / Redis(6379)를 사용하도록 접속 정보를 덮어쓰고,
+           --redis fake면 Redis 대신 프로세스 안 fakeredis를 주입합니다. (--seed-db: ETL.py로 data/ 적재)
+- 워크로드: 캐릭터 인기도를 Zipf 분포로 두고 종류별 비중(MIX)에 따라 요청 목록을 시드 고정으로 생성
+- 시나리오:
+    cold : Redis를 비운 뒤 요청 목록의 고유 URL을 1번씩 (전부 캐시 미스)
+    warm : 고유 URL을 한 번씩 미리 호출한 뒤(측정 제외) 요청 목록 전체 (전부 캐시 히트)
+    mixed: Redis를 비운 뒤 요청 목록 전체 (Zipf에 따른 자연스러운 히트율)
+  HTTP 응답 캐시는 시나리오마다 비우고 시작합니다. (프로세스 안 대상: 직접 비움 /
+  --url 대상: POST /debug/cache/clear, 서버를 DEBUG_TIMINGS=1로 실행. 이 요청은 워커 1개에만 닿으므로
+  멀티 워커 서버는 실행 전에 재시작하세요)
+  응답의 X-Cache 헤더로 HTTP 캐시 히트 수를 세어 cold에 히트가 있거나 warm에 미스가 있으면 실패로 끝냅니다.
+- 결과는 reports/loadtest-<커밋>-<UTC 시각>.json으로 저장하고, --compare로 이전 결과와 비교합니다.
+
+실행:
+    docker compose up -d postgres redis
+    python -m lib.bench.loadtest --local --seed-db               # 최초 1회 적재
+    python -m lib.bench.loadtest --local --concurrency 64 --requests 5000
+    python -m lib.bench.loadtest --local --redis fake --compare reports/loadtest-<이전>.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_DIR = os.path.join(ROOT_DIR, "data")
+API_PREFIX = "/api/v1"
+
+# docker-compose.yml의 로컬 서비스 접속 정보 (lib.core.database / ETL.py가 읽는 환경 변수)
+LOCAL_ENV = {
+    "host": "localhost",
+    "port": "5433",
+    "dbname": "arknights",
+    "user": "postgres",
+    "password": "localdevpassword",
+    "DB_SSL": "disable",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_PASSWORD": "localdevpassword",
+}
+
+# 캐릭터 상세 도메인
+DOMAINS = ("profile", "skills", "growth", "modules", "full-detail")
+
+# 요청 종류별 비중
+MIX = {"detail": 0.70, "list": 0.10, "search": 0.10, "zones": 0.10}
+
+SCENARIOS = ("cold", "warm", "mixed")
+
+Request = Tuple[str, str]  # (종류, API_PREFIX 이하 경로)
+
+
+class Workload:
+    """시드 고정 요청 생성기 (캐릭터 인기도 = Zipf(s), 순위는 시드로 섞은 캐릭터 순서)"""
+
+    def __init__(self, codes: List[str], search_terms: List[str], seed: int, zipf_s: float):
+        self.rng = random.Random(seed)
+        self.codes = list(codes)
+        self.rng.shuffle(self.codes)
+        self.cum_weights = list(accumulate(1 / rank ** zipf_s for rank in range(1, len(self.codes) + 1)))
+        self.search_terms = search_terms
+        self.kinds = list(MIX)
+        self.kind_weights = list(accumulate(MIX.values()))
+
+    def _operator(self) -> str:
+        point = self.rng.random() * self.cum_weights[-1]
+        return self.codes[bisect_left(self.cum_weights, point)]
+
+    def next(self) -> Request:
+        kind = self.rng.choices(self.kinds, cum_weights=self.kind_weights)[0]
+        if kind == "detail":
+            return kind, f"/characters/{self._operator()}/{self.rng.choice(DOMAINS)}"
+        if kind == "list":
+            return kind, f"/characters?skip={self.rng.randrange(0, max(len(self.codes), 1), 20)}&limit=20"
+        if kind == "search":
+            return kind, f"/items/search?q={self.rng.choice(self.search_terms)}"
+        return kind, "/stages/zones"
+
+    def sample(self, count: int) -> List[Request]:
+        return [self.next() for _ in range(count)]
+
+
+def load_search_terms(limit: int = 200) -> List[str]:
+    """data/item_table.json의 아이템 이름 앞 2글자 (실제 부분 검색과 비슷한 검색어)"""
+    with open(os.path.join(DATA_DIR, "item_table.json"), 'r', encoding='utf-8') as f:
+        items = json.load(f)["items"]
+    terms = sorted({item["name"][:2] for item in items.values() if item.get("name")})
+    return terms[:limit]
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return round(sorted_values[index], 3)
+
+
+def summarize_latencies(latencies: List[float]) -> Dict:
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 3) if values else None,
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+        "max": round(values[-1], 3) if values else None,
+    }
+
+
+def seed_database():
+    """로컬 Postgres에 ETL.py로 data/ 적재 (스키마는 docker-compose가 lib/bench/schema.sql로 생성)"""
+    print(">> Seeding local Postgres with ETL.py...")
+    subprocess.run([sys.executable, os.path.join(ROOT_DIR, "ETL.py"), "--data-dir", DATA_DIR], check=True, cwd=ROOT_DIR)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=ROOT_DIR, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Target:
+    """부하 대상 (프로세스 내 앱 또는 외부 URL) + 캐시 초기화 수단"""
+
+    def __init__(self, url: Optional[str], redis_mode: str):
+        self.url = url
+        self.redis_mode = redis_mode
+        self.app = None
+        self.redis = None
+        self.lifespan = None
+        self.client = None
+
+    async def __aenter__(self):
+        import httpx
+
+        if self.url:
+            self.client = httpx.AsyncClient(base_url=self.url, timeout=30)
+        else:
+            # 접속 정보 환경 변수를 반영한 뒤 import해야 하므로 여기서 import
+            from lib.main import app, include_api_routers
+
+            self.app = app
+            include_api_routers(app)
+            if self.redis_mode == "fake":
+                try:
+                    from fakeredis import FakeAsyncRedis
+                except ImportError:
+                    raise SystemExit("--redis fake에는 fakeredis 패키지가 필요합니다. (pip install fakeredis)")
+                from lib.core.database import get_redis
+
+                self.redis = FakeAsyncRedis(decode_responses=True)
+                app.dependency_overrides[get_redis] = lambda: self.redis
+            self.lifespan = app.router.lifespan_context(app)
+            await self.lifespan.__aenter__()
+            self.client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=30
+            )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+        if self.lifespan is not None:
+            await self.lifespan.__aexit__(*exc_info)
+
+    async def flush_redis(self):
+        """Redis 캐시 비우기 (로컬 대체 Redis만 허용)"""
+        if self.redis is not None:
+            await self.redis.flushdb()
+            return
+        from lib.core.database import REDIS_HOST, REDIS_URL
+        from lib.core.dataset import DATASET_MODE
+
+        if DATASET_MODE == "memory":
+            return
+        if REDIS_HOST not in ("localhost", "127.0.0.1"):
+            raise SystemExit(f"로컬이 아닌 Redis({REDIS_HOST})는 비우지 않습니다. --local 또는 --redis fake를 사용하세요.")
+        from redis import asyncio as aioredis
+
+        client = aioredis.from_url(REDIS_URL)
+        try:
+            await client.flushdb()
+        finally:
+            await client.aclose()
+
+    async def clear_http_cache(self):
+        """HTTP 응답 캐시 비우기 (시나리오마다 빈 캐시에서 시작)"""
+        if self.url is None:
+            from lib.api.http_cache import clear_response_caches
+
+            clear_response_caches()
+            return
+        response = await self.client.post("/debug/cache/clear")
+        if response.status_code == 404:
+            raise SystemExit("대상 서버의 응답 캐시를 비울 수 없습니다. 서버를 DEBUG_TIMINGS=1로 실행하세요.")
+        response.raise_for_status()
+
+    async def discover_codes(self) -> List[str]:
+        """목록 API로 전체 캐릭터 코드 수집"""
+        codes, skip = [], 0
+        while True:
+            response = await self.client.get(f"{API_PREFIX}/characters", params={"skip": skip, "limit": 100})
+            response.raise_for_status()
+            page = response.json()["data"]
+            codes.extend(character["code"] for character in page)
+            if len(page) < 100:
+                return codes
+            skip += 100
+
+
+async def drive(target: Target, requests: List[Request], concurrency: int) -> Dict:
+    """요청 목록을 concurrency개 작업자로 소진하며 요청별 지연 시간 측정"""
+    latencies: List[float] = []
+    by_kind: Dict[str, List[float]] = defaultdict(list)
+    statuses: Counter = Counter()
+    # X-Cache 헤더 값 (HIT / MISS, 캐시 대상이 아닌 응답은 없음)
+    http_cache: Counter = Counter()
+    errors = 0
+    position = 0
+
+    async def worker():
+        nonlocal errors, position
+        while position < len(requests):
+            kind, path = requests[position]
+            position += 1
+            started = time.perf_counter()
+            try:
+                response = await target.client.get(API_PREFIX + path)
+                statuses[response.status_code] += 1
+                http_cache[response.headers.get("x-cache", "none").lower()] += 1
+            except Exception:
+                errors += 1
+                continue
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            latencies.append(elapsed_ms)
+            by_kind[kind].append(elapsed_ms)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    seen = set()
+    repeats = 0
+    for _, path in requests:
+        repeats += path in seen
+        seen.add(path)
+
+    return {
+        "requests": len(requests),
+        "errors": errors,
+        "status": {str(code): count for code, count in sorted(statuses.items())},
+        "http_cache": dict(sorted(http_cache.items())),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        # 같은 실행 안에서 이미 요청된 URL 비율 (= 캐시 히트율 상한)
+        "repeat_ratio": round(repeats / len(requests), 3) if requests else None,
+        "latency_ms": summarize_latencies(latencies),
+        "by_kind": {kind: summarize_latencies(values) for kind, values in sorted(by_kind.items())},
+    }
+
+
+def check_http_cache(scenario: str, result: Dict):
+    """시나리오 전제 확인: cold는 HTTP 캐시 히트 0, warm은 미스 0 (아니면 측정값이 시나리오를 대표하지 않음)"""
+    counts = result["http_cache"]
+    if scenario == "cold" and counts.get("hit"):
+        raise SystemExit(f"cold 시나리오에 HTTP 캐시 히트 {counts['hit']}건: 응답 캐시가 비어 있지 않았습니다. (멀티 워커면 서버 재시작)")
+    if scenario == "warm" and (counts.get("miss") or counts.get("none")):
+        raise SystemExit(f"warm 시나리오가 HTTP 캐시에 모두 히트하지 않았습니다: {counts}")
+
+
+def unique(requests: List[Request]) -> List[Request]:
+    return list(dict.fromkeys(requests))
+
+
+async def run_scenarios(args) -> Dict:
+    async with Target(args.url, args.redis) as target:
+        codes = await target.discover_codes()
+        if not codes:
+            raise SystemExit("캐릭터 데이터가 없습니다. --seed로 먼저 적재하세요.")
+        workload = Workload(codes, load_search_terms(), args.seed, args.zipf_s)
+        requests = workload.sample(args.requests)
+        print(f">> {len(codes)} operators, {len(requests)} requests ({len(unique(requests))} unique), concurrency {args.concurrency}")
+
+        results = {}
+        for scenario in args.scenarios:
+            await target.clear_http_cache()
+            if scenario == "cold":
+                await target.flush_redis()
+                result = await drive(target, unique(requests), args.concurrency)
+            elif scenario == "warm":
+                await drive(target, unique(requests), args.concurrency)
+                result = await drive(target, requests, args.concurrency)
+            else:
+                await target.flush_redis()
+                result = await drive(target, requests, args.concurrency)
+            results[scenario] = result
+            latency = result["latency_ms"]
+            print(
+                f"   {scenario:<6} {result['throughput_rps']:>9} req/s | "
+                f"p50 {latency['p50']} ms | p95 {latency['p95']} ms | p99 {latency['p99']} ms | "
+                f"errors {result['errors']} | http-cache {result['http_cache']}"
+            )
+            check_http_cache(scenario, result)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "target": args.url or "in-process",
+            "redis": args.redis,
+            "dataset_mode": os.getenv("DATASET_MODE", "db"),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "seed": args.seed,
+            "zipf_s": args.zipf_s,
+            "mix": MIX,
+        },
+        "scenarios": results,
+    }
+
+
+def compare(previous: Dict, current: Dict):
+    """시나리오별 처리량 / 지연 시간 변화율 출력"""
+    print(f">> Compare {previous['meta'].get('commit')} -> {current['meta'].get('commit')}")
+    for scenario, result in current["scenarios"].items():
+        before = previous["scenarios"].get(scenario)
+        if before is None:
+            continue
+        rows = [("throughput_rps", before["throughput_rps"], result["throughput_rps"])]
+        rows += [(q, before["latency_ms"][q], result["latency_ms"][q]) for q in ("p50", "p95", "p99")]
+        parts = []
+        for name, old, new in rows:
+            change = f"{(new - old) / old * 100:+.1f}%" if old and new is not None else "n/a"
+            parts.append(f"{name} {old} -> {new} ({change})")
+        print(f"   {scenario:<6} " + " | ".join(parts))
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="API 부하 테스트")
+    parser.add_argument("--url", help="외부 서버 주소 (예: http://127.0.0.1:8000). 없으면 프로세스 안에서 앱 기동")
+    parser.add_argument("--local", action="store_true", help="docker-compose 로컬 Postgres/Redis 접속 정보 사용")
+    parser.add_argument("--redis", choices=("server", "fake"), default="server", help="fake: 프로세스 안 fakeredis 사용")
+    parser.add_argument("--seed-db", dest="seed_db", action="store_true", help="실행 전 ETL.py로 로컬 Postgres 적재")
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--zipf-s", type=float, default=1.1, help="캐릭터 인기도 Zipf 지수")
+    parser.add_argument("--seed", type=int, default=42, help="워크로드 난수 시드")
+    parser.add_argument("--out", metavar="PATH", help="결과 JSON 경로 (기본값: reports/loadtest-<커밋>-<UTC 시각>.json)")
+    parser.add_argument("--compare", metavar="PATH", help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+    if args.url and args.redis == "fake":
+        parser.error("--redis fake는 프로세스 내 대상에서만 사용할 수 있습니다.")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.local:
+        # lib.core.database가 import 시점에 환경 변수를 읽으므로 앱 import 전에 반영
+        os.environ.update(LOCAL_ENV)
+    if args.seed_db:
+        seed_database()
+
+    report = asyncio.run(run_scenarios(args))
+
+    out = args.out or os.path.join(
+        ROOT_DIR, "reports", f"loadtest-{report['meta']['commit'] or 'unknown'}-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    )
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"📝 Load test results written to {out}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(json.load(f), report)
@@ -0,0 +1,296 @@
+-- lib/bench/schema.sql
+-- ==========================================
+-- 로컬 Postgres 스키마 (docker-compose / 부하 테스트 시드용)
+-- - ETL.py가 쓰는 테이블/컬럼/ON CONFLICT 대상과 lib/models가 읽는 테이블/컬럼을 모두 만족하도록 맞춘 스키마입니다.
+--   (lib/ERD.sql은 설계 문서로, ETL.py와 테이블 이름/컬럼이 다름)
+-- - ETL 이름과 모델 이름이 다른 곳은 ETL 테이블을 원본으로 두고 모델 쪽 이름을 뷰 / 생성 컬럼으로 노출합니다.
+--     professions / sub_professions / tags (ETL) -> profession / sub_profession / tag (모델, 읽기 전용 뷰)
+--     character_stats.block_count (ETL)          -> block_cnt (모델, 생성 컬럼)
+-- - 코드/이름 길이와 NOT NULL은 원본 JSON 값을 그대로 받을 수 있도록 넉넉하게 둡니다. (토큰/장치 코드, 이름 없는 행)
+-- - ETL.py 또는 lib/models를 바꾸면 이 파일도 함께 맞춰야 합니다.
+-- ==========================================
+
+CREATE OR REPLACE FUNCTION update_timestamp()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ==========================================
+-- 1. 독립 마스터 테이블
+-- ==========================================
+CREATE TABLE professions (
+    profession_id SERIAL PRIMARY KEY,
+    code VARCHAR(32) NOT NULL UNIQUE,
+    name_ko VARCHAR(32),
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE sub_professions (
+    sub_profession_id SERIAL PRIMARY KEY,
+    code VARCHAR(32) NOT NULL UNIQUE,
+    name_ko VARCHAR(32),
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE tags (
+    tag_id SERIAL PRIMARY KEY,
+    name VARCHAR(32) NOT NULL UNIQUE
+);
+
+-- 모델(Profession / SubProfession / Tag)이 읽는 이름
+CREATE VIEW profession AS SELECT profession_id, name_ko, created_at FROM professions;
+CREATE VIEW sub_profession AS SELECT sub_profession_id, name_ko, created_at FROM sub_professions;
+CREATE VIEW tag AS SELECT tag_id, name AS tag_name FROM tags;
+
+CREATE TABLE items (
+    item_id SERIAL PRIMARY KEY,
+    item_code VARCHAR(64) NOT NULL UNIQUE,
+    name_ko VARCHAR(128),
+    rarity SMALLINT DEFAULT 0,
+    icon_id VARCHAR(128),
+    item_type VARCHAR(32),
+    classify_type VARCHAR(32),
+    usage_text TEXT,
+    description TEXT,
+    obtain_approach TEXT,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE ranges (
+    range_id VARCHAR(32) PRIMARY KEY,
+    grids JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE zones (
+    zone_id SERIAL PRIMARY KEY,
+    zone_code VARCHAR(64) NOT NULL UNIQUE,
+    name_ko VARCHAR(128),
+    zone_type VARCHAR(20),
+    zone_index INT DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ==========================================
+-- 2. 캐릭터 및 관련 테이블
+-- ==========================================
+CREATE TABLE characters (
+    character_id SERIAL PRIMARY KEY,
+    code VARCHAR(64) NOT NULL UNIQUE,
+    name_ko VARCHAR(64),
+    class_description VARCHAR(255),
+    rarity SMALLINT, -- ETL parse_rarity: 0~5
+    position VARCHAR(16), -- MELEE / RANGED / NONE
+    profession_id INT REFERENCES professions(profession_id),
+    sub_profession_id INT REFERENCES sub_professions(sub_profession_id),
+    description TEXT, -- ETL: itemDesc
+    nation_id VARCHAR(32), -- ETL 전용
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE characters_detail (
+    character_id INT PRIMARY KEY REFERENCES characters(character_id) ON DELETE CASCADE,
+    item_usage TEXT,
+    item_desc TEXT
+);
+
+CREATE TABLE character_stats (
+    character_stat_id SERIAL PRIMARY KEY,
+    character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
+    phase SMALLINT NOT NULL,
+    max_level SMALLINT NOT NULL,
+    range_id VARCHAR(32) REFERENCES ranges(range_id),
+    base_hp INT NOT NULL, base_atk INT NOT NULL, base_def INT NOT NULL,
+    max_hp INT NOT NULL, max_atk INT NOT NULL, max_def INT NOT NULL,
+    magic_resistance SMALLINT NOT NULL,
+    cost SMALLINT NOT NULL,
+    block_count SMALLINT NOT NULL,
+    block_cnt SMALLINT GENERATED ALWAYS AS (block_count) STORED,
+    attack_speed SMALLINT NOT NULL,
+    keyframes JSONB,
+    UNIQUE (character_id, phase)
+);
+
+CREATE TABLE character_skill (
+    character_id INT PRIMARY KEY REFERENCES characters(character_id) ON DELETE CASCADE,
+    phase_0_code VARCHAR(64),
+    phase_1_code VARCHAR(64),
+    phase_2_code VARCHAR(64)
+);
+
+CREATE TABLE character_favor_templates (
+    character_id INT PRIMARY KEY REFERENCES characters(character_id) ON DELETE CASCADE,
+    max_favor_level SMALLINT NOT NULL DEFAULT 50,
+    bonus_hp INT DEFAULT 0,
+    bonus_atk INT DEFAULT 0,
+    bonus_def INT DEFAULT 0,
+    extra_bonuses JSONB
+);
+
+CREATE TABLE character_potentials (
+    character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
+    potential_rank SMALLINT NOT NULL,
+    buff_type SMALLINT NOT NULL,
+    buff_value TEXT,
+    attributes JSONB,
+    PRIMARY KEY (character_id, potential_rank)
+);
+
+CREATE TABLE character_talents (
+    id SERIAL PRIMARY KEY,
+    character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
+    talent_index SMALLINT NOT NULL,
+    candidate_index SMALLINT NOT NULL,
+    unlock_phase SMALLINT NOT NULL,
+    unlock_level SMALLINT NOT NULL,
+    required_potential SMALLINT NOT NULL,
+    range_id VARCHAR(32) REFERENCES ranges(range_id),
+    name VARCHAR(128),
+    description TEXT,
+    blackboard JSONB
+);
+
+CREATE TABLE character_tag (
+    character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
+    tag_id INT NOT NULL REFERENCES tags(tag_id) ON DELETE CASCADE,
+    PRIMARY KEY (character_id, tag_id)
+);
+
+-- ==========================================
+-- 3. 스킬 및 모듈 테이블
+-- ==========================================
+CREATE TABLE skills (
+    skill_id SERIAL PRIMARY KEY,
+    skill_code VARCHAR(64) NOT NULL UNIQUE,
+    name_ko VARCHAR(128),
+    icon_id VARCHAR(128),
+    skill_type SMALLINT,
+    sp_type SMALLINT,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE skill_levels (
+    id SERIAL PRIMARY KEY,
+    skill_id INT NOT NULL REFERENCES skills(skill_id) ON DELETE CASCADE,
+    level SMALLINT NOT NULL,
+    sp_cost SMALLINT NOT NULL,
+    initial_sp SMALLINT DEFAULT 0,
+    duration NUMERIC(7,2) DEFAULT 0,
+    range_id VARCHAR(32) REFERENCES ranges(range_id),
+    description TEXT,
+    blackboard JSONB,
+    UNIQUE (skill_id, level)
+);
+
+CREATE TABLE character_modules (
+    module_id SERIAL PRIMARY KEY,
+    module_code VARCHAR(64) NOT NULL UNIQUE,
+    character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
+    name_ko VARCHAR(128),
+    icon_id VARCHAR(128),
+    description TEXT
+);
+
+-- ==========================================
+-- 4. 비용 테이블 (level = 스킬 레벨 / 특화 단계 / 모듈 단계)
+-- ==========================================
+CREATE TABLE character_promotion_costs (
+    id SERIAL PRIMARY KEY,
+    character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
+    target_phase SMALLINT NOT NULL,
+    item_id INT NOT NULL REFERENCES items(item_id),
+    count INT NOT NULL
+);
+
+CREATE TABLE character_skill_costs (
+    id SERIAL PRIMARY KEY,
+    character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
+    level SMALLINT NOT NULL,
+    item_id INT NOT NULL REFERENCES items(item_id),
+    count INT NOT NULL
+);
+
+CREATE TABLE skill_mastery_costs (
+    id SERIAL PRIMARY KEY,
+    skill_id INT NOT NULL REFERENCES skills(skill_id) ON DELETE CASCADE,
+    mastery_level SMALLINT NOT NULL,
+    item_id INT NOT NULL REFERENCES items(item_id),
+    count INT NOT NULL
+);
+
+CREATE TABLE character_module_costs (
+    id SERIAL PRIMARY KEY,
+    module_id INT NOT NULL REFERENCES character_modules(module_id) ON DELETE CASCADE,
+    level SMALLINT NOT NULL,
+    item_id INT NOT NULL REFERENCES items(item_id),
+    count INT NOT NULL
+);
+
+-- ==========================================
+-- 5. 스테이지
+-- ==========================================
+CREATE TABLE stages (
+    stage_id SERIAL PRIMARY KEY,
+    stage_code VARCHAR(64) NOT NULL UNIQUE,
+    zone_id INT NOT NULL REFERENCES zones(zone_id) ON DELETE CASCADE,
+    display_code VARCHAR(64),
+    name_ko VARCHAR(128),
+    description TEXT,
+    ap_cost SMALLINT DEFAULT 0,
+    danger_level VARCHAR(32)
+);
+
+-- ==========================================
+-- 6. 스킨
+-- ==========================================
+CREATE TABLE skin_groups (
+    skin_group_id SERIAL PRIMARY KEY,
+    name_ko VARCHAR(128) NOT NULL UNIQUE,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE character_skins (
+    skin_id SERIAL PRIMARY KEY,
+    skin_code VARCHAR(128) NOT NULL UNIQUE,
+    character_id INT NOT NULL REFERENCES characters(character_id) ON DELETE CASCADE,
+    name_ko VARCHAR(128),
+    series_name VARCHAR(128),
+    illustrator VARCHAR(128),
+    portrait_id VARCHAR(128),
+    avatar_id VARCHAR(128),
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE character_skin_details (
+    skin_id INT PRIMARY KEY REFERENCES character_skins(skin_id) ON DELETE CASCADE,
+    skin_group_id INT REFERENCES skin_groups(skin_group_id),
+    content TEXT,
+    dialog TEXT,
+    description TEXT,
+    usage_text TEXT,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ==========================================
+-- 7. 데이터셋 버전 (ETL 적재 완료 시 갱신, 단일 행)
+-- ==========================================
+CREATE TABLE dataset_version (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version VARCHAR(64) NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 인덱스 / 트리거
+CREATE INDEX idx_characters_name_ko ON characters(name_ko);
+CREATE INDEX idx_talent_lookup ON character_talents (character_id, unlock_phase, required_potential);
+CREATE INDEX idx_skins_character ON character_skins(character_id);
+
+CREATE TRIGGER trg_characters_updated_at
+BEFORE UPDATE ON characters
+FOR EACH ROW EXECUTE PROCEDURE update_timestamp();
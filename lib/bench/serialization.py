@@ -0,0 +1,278 @@
+# lib/bench/serialization.py
+"""
+응답 스키마 직렬화 마이크로 벤치마크
+- 픽스처: lib.bench.fixtures로 data/ 원본(또는 ETL 스냅샷)에서 만든 실제 캐릭터/스킬/구역/아이템
+- 경로별 객체 1개당 소요 시간 (모든 요청에서 실제로 도는 경로들)
+    orm        : ORM 객체 -> 스키마 (db 모드 캐시 미스, from_attributes)
+    records    : 인메모리 데이터셋 레코드 -> 스키마 (DATASET_MODE=memory)
+    dict       : dict -> 스키마 (Redis 히트: orjson.loads 후 model_validate)
+    json       : JSON bytes -> 스키마 (model_validate_json, full-detail 파이프라인 히트)
+    dump_json  : 스키마 -> JSON bytes (model_dump_json)
+    encode     : 스키마 -> JSON bytes (jsonable_encoder + orjson, Redis 저장 경로)
+- 결과는 reports/serialization-<커밋>-<UTC 시각>.json으로 저장하고,
+  --baseline으로 이전 결과와 비교해 threshold 이상 느려진 항목을 회귀로 표시합니다.
+
+실행:
+    python -m lib.bench.serialization
+    python -m lib.bench.serialization --snapshot snapshot --baseline reports/serialization-<이전>.json --fail-on-regression
+    python -m lib.bench.serialization --check --download   # 모든 케이스의 ORM 변환(orm 경로)만 검증
+                                                          # (픽스처가 빈 케이스는 실패, data/에 없는 원본은 --download로 받음)
+    python -m lib.bench.serialization --check --synthetic 120  # data/ 없이 합성 원본(lib.bench.fixtures)으로 검증
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Mapping, Optional
+
+import orjson
+import pydantic
+from fastapi.encoders import jsonable_encoder
+
+from lib.bench.fixtures import DATA_DIR, ROOT_DIR, SOURCE_FILES, load_fixture_dataset, synthetic_dataset, to_orm
+from lib.bench.loadtest import git_commit
+
+# 케이스 이름 -> (스키마, 픽스처(Dataset 속성), ORM 모델)
+CASES = {
+    "CharacterListResponse": ("lib.schemas.character:CharacterListResponse", "characters", "lib.models.character:Character"),
+    "CharacterProfileResponse": ("lib.schemas.character:CharacterProfileResponse", "characters", "lib.models.character:Character"),
+    "SkillResponse": ("lib.schemas.skill:SkillResponse", "skills", "lib.models.skill:Skill"),
+    "ZoneDetailResponse": ("lib.schemas.stage:ZoneDetailResponse", "zones", "lib.models.common:Zone"),
+    "ItemDetailResponse": ("lib.schemas.item:ItemDetailResponse", "items", "lib.models.item:Item"),
+}
+
+PATHS = ("orm", "records", "dict", "json", "dump_json", "encode")
+
+# 픽스처(Dataset 속성) -> 만드는 데 필요한 원본 (lib.bench.fixtures.SOURCE_FILES 키)
+FIXTURE_SOURCES = {
+    "characters": ("character",),
+    "skills": ("skill",),
+    "zones": ("zone", "map"),
+    "items": ("item",),
+}
+
+
+def resolve(target: str):
+    """'모듈:이름' -> 객체 (필요한 스키마만 import)"""
+    module_name, name = target.split(":")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def fixture_records(dataset, attribute: str) -> List:
+    records = getattr(dataset, attribute)
+    return list(records.values()) if isinstance(records, Mapping) else list(records)
+
+
+def measure(func: Callable, inputs: List, repeat: int, min_time: float) -> Dict:
+    """
+    inputs 전체를 한 번 처리하는 루프를 min_time 이상이 되도록 늘려 repeat번 측정
+    -> 객체 1개당 중앙값/최솟값 (µs)
+    """
+    def run(loops: int) -> float:
+        started = time.perf_counter()
+        for _ in range(loops):
+            for value in inputs:
+                func(value)
+        return time.perf_counter() - started
+
+    loops = 1
+    while run(loops) < min_time:
+        loops *= 2
+    samples = [run(loops) / (loops * len(inputs)) * 1e6 for _ in range(repeat)]
+    median = statistics.median(samples)
+    return {
+        "median_us": round(median, 3),
+        "min_us": round(min(samples), 3),
+        "ops_per_s": round(1e6 / median, 1) if median else None,
+    }
+
+
+def check_orm_conversion(name: str, dataset, limit: int = 5) -> List[str]:
+    """
+    픽스처 전체를 to_orm -> 스키마로 검증하고 레코드 경로 결과와 비교 -> 오류 목록 (최대 limit개)
+    (orm 경로가 다른 경로와 같은 응답을 만드는지 확인. 필드명 대응이 어긋나면 여기서 드러남)
+    """
+    schema_target, attribute, model_target = CASES[name]
+    records = fixture_records(dataset, attribute)
+    if not records:
+        # 검증할 것이 없으면 통과가 아님 (원본이 없어 변환이 건너뛰어진 경우)
+        sources = ", ".join(SOURCE_FILES[key] for key in FIXTURE_SOURCES[attribute])
+        return [f"픽스처 없음 ({attribute}): 필요한 원본 {sources}"]
+    schema, model = resolve(schema_target), resolve(model_target)
+    errors = []
+    for record in records:
+        label = getattr(record, "code", None) or next(iter(record), None)
+        try:
+            converted = schema.model_validate(to_orm(record, model))
+        except Exception as e:
+            errors.append(f"{label}: {type(e).__name__}: {e}")
+        else:
+            if converted.model_dump() != schema.model_validate(record).model_dump():
+                errors.append(f"{label}: ORM 경로 결과가 레코드 경로와 다름")
+        if len(errors) >= limit:
+            break
+    return errors
+
+
+def bench_case(name: str, dataset, repeat: int, min_time: float) -> Dict:
+    schema_target, attribute, model_target = CASES[name]
+    records = fixture_records(dataset, attribute)
+    if not records:
+        return {"skipped": f"픽스처 없음 ({attribute})"}
+
+    schema = resolve(schema_target)
+    validated = [schema.model_validate(record) for record in records]
+    payloads = [model.model_dump_json().encode() for model in validated]
+
+    inputs: Dict[str, List] = {
+        "records": records,
+        "dict": [orjson.loads(payload) for payload in payloads],
+        "json": payloads,
+        "dump_json": validated,
+        "encode": validated,
+    }
+    funcs: Dict[str, Callable] = {
+        "orm": schema.model_validate,
+        "records": schema.model_validate,
+        "dict": schema.model_validate,
+        "json": schema.model_validate_json,
+        "dump_json": lambda model: model.model_dump_json(),
+        "encode": lambda model: orjson.dumps(jsonable_encoder(model)),
+    }
+
+    result = {
+        "fixtures": len(records),
+        "avg_json_bytes": round(sum(map(len, payloads)) / len(payloads), 1),
+        "paths": {},
+    }
+    try:
+        errors = check_orm_conversion(name, dataset, limit=1)
+        if errors:
+            raise ValueError(errors[0])
+        model = resolve(model_target)
+        inputs["orm"] = [to_orm(record, model) for record in records]
+    except Exception as e:
+        result["paths"]["orm"] = {"error": f"{type(e).__name__}: {e}"}
+
+    for path in PATHS:
+        if path not in inputs:
+            continue
+        try:
+            result["paths"][path] = measure(funcs[path], inputs[path], repeat, min_time)
+        except Exception as e:
+            # 스키마 변경으로 특정 경로가 깨져도 나머지 측정은 계속
+            result["paths"][path] = {"error": f"{type(e).__name__}: {e}"}
+    return result
+
+
+def find_regressions(baseline: Dict, current: Dict, threshold: float) -> List[Dict]:
+    """같은 케이스/경로의 median_us가 (1 + threshold)배를 넘으면 회귀"""
+    regressions = []
+    for name, result in current["cases"].items():
+        before_paths = baseline.get("cases", {}).get(name, {}).get("paths", {})
+        for path, timing in result.get("paths", {}).items():
+            before = before_paths.get(path, {})
+            if "median_us" not in timing or not before.get("median_us"):
+                continue
+            ratio = timing["median_us"] / before["median_us"]
+            if ratio > 1 + threshold:
+                regressions.append({
+                    "case": name, "path": path,
+                    "before_us": before["median_us"], "after_us": timing["median_us"], "ratio": round(ratio, 3),
+                })
+    return regressions
+
+
+def print_results(report: Dict, baseline: Optional[Dict]):
+    header = f"{'case':<26}" + "".join(f"{path:>12}" for path in PATHS)
+    print(header)
+    print("-" * len(header))
+    for name, result in report["cases"].items():
+        if "skipped" in result:
+            print(f"{name:<26} skipped: {result['skipped']}")
+            continue
+        cells = []
+        for path in PATHS:
+            timing = result["paths"].get(path, {})
+            cell = f"{timing['median_us']:.1f}" if "median_us" in timing else "err"
+            before = (baseline or {}).get("cases", {}).get(name, {}).get("paths", {}).get(path, {})
+            if before.get("median_us") and "median_us" in timing:
+                cell += f"({(timing['median_us'] / before['median_us'] - 1) * 100:+.0f}%)"
+            cells.append(f"{cell:>12}")
+        print(f"{name:<26}" + "".join(cells))
+    print("(µs per object, median)")
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="응답 스키마 직렬화 마이크로 벤치마크")
+    parser.add_argument("--data-dir", default=DATA_DIR, metavar="DIR", help="원본 JSON 디렉터리 (기본값: data)")
+    parser.add_argument("--snapshot", metavar="DIR", help="ETL.py --offline 스냅샷 디렉터리 (있으면 원본 대신 사용)")
+    parser.add_argument("--download", action="store_true", help="data/에 없는 원본을 ETL.py와 같은 주소에서 받음")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="data/ 대신 오퍼레이터 N명의 합성 원본 사용 (시드 고정)")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5, help="경로별 측정 반복 횟수")
+    parser.add_argument("--min-time", type=float, default=0.2, help="측정 1회의 최소 시간(초)")
+    parser.add_argument("--out", metavar="PATH", help="결과 JSON 경로 (기본값: reports/serialization-<커밋>-<UTC 시각>.json)")
+    parser.add_argument("--baseline", metavar="PATH", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀 판정 기준 (0.10 = 10%% 느려짐)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 종료 코드 1")
+    parser.add_argument("--check", action="store_true", help="측정 없이 모든 케이스의 ORM 변환만 검증 (실패 시 종료 코드 1)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    started = time.perf_counter()
+    if args.synthetic:
+        dataset = synthetic_dataset(args.synthetic)
+    else:
+        dataset = load_fixture_dataset(args.data_dir, args.snapshot, args.download)
+    print(f">> Fixtures {dataset.version}: {len(dataset.characters)} characters, {len(dataset.skills)} skills, "
+          f"{len(dataset.zones)} zones, {len(dataset.items)} items ({time.perf_counter() - started:.1f}s)")
+
+    if args.check:
+        failed = False
+        for name in args.cases:
+            errors = check_orm_conversion(name, dataset)
+            failed = failed or bool(errors)
+            print(f"{'❌' if errors else '✅'} {name}: ORM 변환" + "".join(f"\n   - {error}" for error in errors))
+        sys.exit(1 if failed else 0)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "pydantic": pydantic.VERSION,
+            "fixture_version": dataset.version,
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+        },
+        "cases": {name: bench_case(name, dataset, args.repeat, args.min_time) for name in args.cases},
+    }
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        report["regressions"] = find_regressions(baseline, report, args.threshold)
+
+    print_results(report, baseline)
+
+    out = args.out or os.path.join(
+        ROOT_DIR, "reports", f"serialization-{report['meta']['commit'] or 'unknown'}-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    )
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"📝 Serialization benchmark written to {out}")
+
+    for regression in report.get("regressions", []):
+        print(f"⚠️ {regression['case']}.{regression['path']}: {regression['before_us']} -> {regression['after_us']} µs (x{regression['ratio']})")
+    if args.fail_on_regression and report.get("regressions"):
+        sys.exit(1)
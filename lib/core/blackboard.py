@@ -0,0 +1,189 @@
+# lib/core/blackboard.py
+"""
+스킬 / 재능 blackboard 열 저장소 (스냅샷 버전마다 1회 생성)
+- SkillLevel.blackboard / CharacterTalent.blackboard([{"key": ..., "value": ...}, ...])를
+  키 -> (행 번호 배열, 값 배열) 열로 펼칩니다. 키는 소문자로 통일.
+    행 = 스킬 레벨 1개 (skill_code, level) 또는 재능 후보 1개 (캐릭터 코드, talent_index, candidate_index)
+- 키마다 두 벌을 보관합니다.
+    exists : 키를 가진 행 번호 (정렬, 중복 없음)          -> 존재 조건
+    values : 숫자 값 오름차순 + 같은 순서의 행 번호       -> 범위 조건은 searchsorted 2회
+- 조건 여러 개는 행 번호 배열 교집합(AND)으로 결합합니다.
+"""
+import math
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lib.core.dataset import Dataset, register_index
+
+SOURCES = ("skill", "talent")
+
+# 'atk>=1.0', 'attack@atk_scale', 'sp_recovery_per_sec > 0'
+PREDICATE_PATTERN = re.compile(r"^\s*([^<>=\s]+)\s*(?:(>=|<=|>|<|=)\s*(\S+))?\s*$")
+
+
+class BlackboardError(ValueError):
+    """조건식 형식 오류"""
+
+
+class Predicate(NamedTuple):
+    key: str
+    op: Optional[str] = None     # None = 존재 조건
+    value: Optional[float] = None
+
+
+def parse_predicate(text: str) -> Predicate:
+    """'atk>=1.0' -> Predicate('atk', '>=', 1.0), 'atk' -> Predicate('atk')"""
+    match = PREDICATE_PATTERN.match(text)
+    if match is None:
+        raise BlackboardError(f"조건 형식: key 또는 key>=값 ({text})")
+    key, op, value = match.groups()
+    if op is None:
+        return Predicate(key.lower())
+    try:
+        number = float(value)
+    except ValueError:
+        raise BlackboardError(f"숫자가 아닌 값: {value}")
+    if math.isnan(number):
+        raise BlackboardError(f"숫자가 아닌 값: {value}")
+    return Predicate(key.lower(), op, number)
+
+
+def _numeric(value) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+class BlackboardRow(NamedTuple):
+    """열 저장소의 행 1개"""
+    code: str                  # 스킬 코드 / 캐릭터 코드
+    name: str                  # 스킬 이름 / 재능 이름
+    level: int                 # 스킬 레벨(8~10 = 특화 1~3) / 재능 talent_index
+    candidate: Optional[int]   # 재능 candidate_index (스킬은 None)
+    values: Dict[str, object]  # 소문자 키 -> 원래 값
+
+
+class BlackboardKey(NamedTuple):
+    exists: np.ndarray  # int32 [n] 정렬된 행 번호
+    values: np.ndarray  # float64 [m] 오름차순
+    rows: np.ndarray    # int32 [m] values와 같은 순서의 행 번호
+
+
+class BlackboardStore:
+    """출처(skill / talent) 1개의 열 저장소"""
+    __slots__ = ("rows", "levels", "keys")
+
+    def __init__(self, rows: Sequence[BlackboardRow]):
+        self.rows: Tuple[BlackboardRow, ...] = tuple(rows)
+        self.levels = np.array([row.level for row in self.rows], dtype=np.int32)
+        self.levels.setflags(write=False)
+        exists: Dict[str, List[int]] = {}
+        numbers: Dict[str, List[Tuple[float, int]]] = {}
+        for index, row in enumerate(self.rows):
+            for key, value in row.values.items():
+                exists.setdefault(key, []).append(index)
+                number = _numeric(value)
+                if number is not None:
+                    numbers.setdefault(key, []).append((number, index))
+
+        self.keys: Dict[str, BlackboardKey] = {}
+        for key in sorted(exists):
+            pairs = sorted(numbers.get(key, ()))
+            entry = BlackboardKey(
+                np.array(exists[key], dtype=np.int32),
+                np.array([value for value, _ in pairs], dtype=np.float64),
+                np.array([index for _, index in pairs], dtype=np.int32),
+            )
+            for array in entry:
+                array.setflags(write=False)
+            self.keys[key] = entry
+
+    def match(self, predicate: Predicate) -> np.ndarray:
+        """조건 1개 -> 정렬된 행 번호 (모르는 키는 빈 배열)"""
+        entry = self.keys.get(predicate.key)
+        if entry is None:
+            return np.zeros(0, dtype=np.int32)
+        if predicate.op is None:
+            return entry.exists
+        values, value = entry.values, predicate.value
+        lo, hi = 0, len(values)
+        if predicate.op in (">=", "="):
+            lo = np.searchsorted(values, value, side="left")
+        elif predicate.op == ">":
+            lo = np.searchsorted(values, value, side="right")
+        if predicate.op in ("<=", "="):
+            hi = np.searchsorted(values, value, side="right")
+        elif predicate.op == "<":
+            hi = np.searchsorted(values, value, side="left")
+        return np.sort(entry.rows[lo:hi])
+
+    def query(self, predicates: Sequence[Predicate], level: Optional[int] = None) -> np.ndarray:
+        """조건 AND (+ 레벨) -> 정렬된 행 번호 (조건이 없으면 전체)"""
+        if predicates:
+            matched = sorted((self.match(predicate) for predicate in predicates), key=len)
+            result = matched[0]
+            for rows in matched[1:]:
+                if not len(result):
+                    break
+                result = np.intersect1d(result, rows, assume_unique=True)
+        else:
+            result = np.arange(len(self.rows), dtype=np.int32)
+        if level is not None:
+            result = result[self.levels[result] == level]
+        return result
+
+    def describe(self) -> List[Tuple[str, int, Optional[float], Optional[float]]]:
+        """키별 (키, 행 수, 최솟값, 최댓값)"""
+        return [
+            (
+                key, len(entry.exists),
+                float(entry.values[0]) if len(entry.values) else None,
+                float(entry.values[-1]) if len(entry.values) else None,
+            )
+            for key, entry in self.keys.items()
+        ]
+
+
+def _blackboard_values(blackboard) -> Dict[str, object]:
+    values = {}
+    for entry in blackboard or ():
+        if isinstance(entry, dict) and entry.get("key"):
+            value = entry.get("value")
+            if value is None:
+                value = entry.get("valueStr")
+            values[str(entry["key"]).lower()] = value
+    return values
+
+
+class BlackboardIndex:
+    __slots__ = ("version", "skill", "talent")
+
+    def __init__(self, dataset: Dataset):
+        self.version = dataset.version
+        self.skill = BlackboardStore([
+            BlackboardRow(skill.skill_code, skill.name_ko, level.level, None, _blackboard_values(level.blackboard))
+            for skill in sorted(dataset.skills.values(), key=lambda s: s.skill_code)
+            for level in skill.levels
+        ])
+        self.talent = BlackboardStore([
+            BlackboardRow(
+                char.code, talent.name, talent.talent_index, talent.candidate_index, _blackboard_values(talent.blackboard)
+            )
+            for char in dataset.character_order
+            for talent in char.talents
+        ])
+
+    def store(self, source: str) -> BlackboardStore:
+        return getattr(self, source)
+
+
+@register_index("blackboard")
+def build_blackboard_index(dataset: Dataset) -> BlackboardIndex:
+    return BlackboardIndex(dataset)
+
+
+def get_blackboard_index(dataset: Dataset) -> BlackboardIndex:
+    return dataset.index("blackboard")
@@ -14,7 +14,10 @@ HOST = os.getenv("host")
 PORT = os.getenv("port")
 DBNAME = os.getenv("dbname")
 
-DATABASE_URL = f"postgresql+asyncpg://{USER}:{PASSWORD}@{HOST}:{PORT}/{DBNAME}?ssl=require"
+# 로컬 Postgres(docker-compose, 부하 테스트 등)는 SSL이 없으므로 DB_SSL=disable로 지정
+DB_SSL = os.getenv("DB_SSL", "require")
+
+DATABASE_URL = f"postgresql+asyncpg://{USER}:{PASSWORD}@{HOST}:{PORT}/{DBNAME}?ssl={DB_SSL}"
 
 # 1. PostgreSQL Async Engine
 engine = create_async_engine(
@@ -33,6 +36,11 @@ Base = declarative_base()
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = os.getenv("REDIS_PORT", "6379")
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
+# uvicorn 워커 수 (uvicorn --workers의 기본값도 이 환경 변수)
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+# REDIS_MAX_CONNECTIONS = 전체 허용 연결 수. 워커(프로세스)마다 풀이 따로 생기므로 워커 수로 나눠서
+# 워커를 늘려도 Redis 연결 총량은 그대로 유지
+REDIS_MAX_CONNECTIONS = max(1, int(os.getenv("REDIS_MAX_CONNECTIONS", "100")) // WEB_CONCURRENCY)
 
 if REDIS_PASSWORD:
     REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/0"
@@ -49,7 +57,7 @@ def init_redis_pool():
     redis_pool = aioredis.ConnectionPool.from_url(
         REDIS_URL, 
         decode_responses=True, 
-        max_connections=100
+        max_connections=REDIS_MAX_CONNECTIONS
     )
 
 async def close_redis_pool():
@@ -0,0 +1,652 @@
+# lib/core/dataset.py
+"""
+인메모리 데이터셋 스냅샷 (읽기 전용 서빙 모드)
+- 기동 시 DB를 테이블당 SELECT 1회로 읽어 불변 레코드(NamedTuple / tuple)로 구성하고 code로 색인합니다.
+- DATASET_MODE=memory 이면 Repository가 DB/Redis 대신 이 스냅샷에서 바로 응답합니다.
+- dataset_version 값이 바뀌면 새 스냅샷을 백그라운드에서 만든 뒤 참조만 교체합니다.
+  (진행 중인 요청은 이전 스냅샷으로 끝까지 응답)
+"""
+import asyncio
+import hashlib
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import orjson
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+
+from lib.core.database import engine
+from lib.models.character import (
+    Character, CharacterDetail, CharacterStat, CharacterTalent, CharacterSkillSlot,
+    CharacterFavorTemplate, CharacterPotential, CharacterPromotionCost, CharacterSkillCost, CharacterSkin,
+    SkinGroup, character_tag
+)
+from lib.models.common import Profession, SubProfession, Tag, Range, Zone, DatasetVersion
+from lib.models.item import Item
+from lib.models.module import CharacterModule, CharacterModuleCost
+from lib.models.skill import Skill, SkillLevel, SkillMasteryCost
+from lib.models.stage import Stage
+
+# "db": 기존 Cache-Aside 경로 / "memory": 인메모리 스냅샷 경로
+DATASET_MODE = os.getenv("DATASET_MODE", "db")
+# dataset_version 확인 주기 (초)
+DATASET_POLL_SECONDS = int(os.getenv("DATASET_POLL_SECONDS", "60"))
+
+
+# ==========================================
+# 1. 불변 레코드 (필드명은 응답 스키마의 속성명과 동일 -> from_attributes 그대로 사용)
+# ==========================================
+class ProfessionRecord(NamedTuple):
+    profession_id: int
+    name_ko: str
+
+
+class SubProfessionRecord(NamedTuple):
+    sub_profession_id: int
+    name_ko: str
+
+
+class TagRecord(NamedTuple):
+    tag_id: int
+    tag_name: str
+
+
+class RangeRecord(NamedTuple):
+    range_id: str
+    grids: Tuple[dict, ...]
+
+
+class ItemRecord(NamedTuple):
+    item_id: int
+    item_code: str
+    name_ko: str
+    rarity: int
+    icon_id: Optional[str]
+    item_type: Optional[str]
+    classify_type: Optional[str]
+    usage_text: Optional[str]
+    description: Optional[str]
+    obtain_approach: Optional[str]
+
+
+class CostRecord(NamedTuple):
+    """재료 1종 (level = 스킬 레벨 / 정예화 단계 / 특화 단계 / 모듈 단계)"""
+    level: int
+    count: int
+    item: ItemRecord
+
+    @property
+    def mastery_level(self) -> int:
+        return self.level
+
+    @property
+    def target_phase(self) -> int:
+        return self.level
+
+
+class StatRecord(NamedTuple):
+    phase: int
+    max_level: int
+    range_id: Optional[str]
+    base_hp: int
+    base_atk: int
+    base_def: int
+    max_hp: int
+    max_atk: int
+    max_def: int
+    magic_resistance: int
+    cost: int
+    block_cnt: int
+    attack_speed: int
+    range_data: Optional[RangeRecord]
+    keyframes: Tuple[dict, ...]  # [{"level": 1, "max_hp": ...}, ...] (비어 있으면 base_* / max_*로 보간)
+
+
+class TalentRecord(NamedTuple):
+    talent_index: int
+    candidate_index: int
+    unlock_phase: int
+    unlock_level: int
+    required_potential: int
+    range_id: Optional[str]
+    name: str
+    description: Optional[str]
+    blackboard: Any
+
+
+class SkillSlotRecord(NamedTuple):
+    phase_0_code: Optional[str]
+    phase_1_code: Optional[str]
+    phase_2_code: Optional[str]
+
+
+class PotentialRecord(NamedTuple):
+    potential_rank: int  # 0 = 2잠
+    attributes: Tuple[dict, ...]  # [{"attribute": "cost", "value": -1.0}, ...]
+
+
+class FavorRecord(NamedTuple):
+    max_favor_level: int
+    bonus_hp: int
+    bonus_atk: int
+    bonus_def: int
+
+
+class SkinRecord(NamedTuple):
+    skin_id: int
+    skin_code: str
+    name_ko: Optional[str]
+    series_name: Optional[str]
+    illustrator: Optional[str]
+    portrait_id: Optional[str]
+    avatar_id: Optional[str]
+
+
+class SkinGroupRecord(NamedTuple):
+    skin_group_id: int
+    name_ko: str
+
+
+class ModuleRecord(NamedTuple):
+    module_id: int
+    module_code: str
+    name_ko: str
+    icon_id: Optional[str]
+    description: Optional[str]
+    costs: Tuple[CostRecord, ...]
+
+
+class CharacterRecord(NamedTuple):
+    character_id: int
+    code: str
+    name_ko: str
+    class_description: Optional[str]
+    rarity: int
+    profession: Optional[ProfessionRecord]
+    sub_profession: Optional[SubProfessionRecord]
+    tags: Tuple[TagRecord, ...]
+    stats: Tuple[StatRecord, ...]
+    talents: Tuple[TalentRecord, ...]
+    skill_slots: Optional[SkillSlotRecord]
+    favor: Optional[FavorRecord]
+    promotion_costs: Tuple[CostRecord, ...]
+    skill_costs: Tuple[CostRecord, ...]
+    modules: Tuple[ModuleRecord, ...]
+    skins: Tuple[SkinRecord, ...]
+    item_usage: Optional[str]
+    item_desc: Optional[str]
+    potentials: Tuple[PotentialRecord, ...]
+    position: Optional[str]
+
+
+class SkillLevelRecord(NamedTuple):
+    level: int
+    sp_cost: int
+    initial_sp: int
+    duration: float
+    range_id: Optional[str]
+    description: Optional[str]
+    blackboard: Any
+    range_data: Optional[RangeRecord]
+
+
+class SkillRecord(NamedTuple):
+    skill_id: int
+    skill_code: str
+    name_ko: str
+    icon_id: Optional[str]
+    skill_type: Optional[int]
+    sp_type: Optional[int]
+    levels: Tuple[SkillLevelRecord, ...]
+    mastery_costs: Tuple[CostRecord, ...]
+
+
+class StageRecord(NamedTuple):
+    stage_id: int
+    stage_code: str
+    zone_id: int
+    display_code: str
+    name_ko: str
+    description: Optional[str]
+    ap_cost: int
+    danger_level: Optional[str]
+
+
+class ZoneRecord(NamedTuple):
+    zone_id: int
+    zone_code: str
+    name_ko: str
+    zone_type: Optional[str]
+    zone_index: int
+    stages: Tuple[StageRecord, ...]
+
+
+# ==========================================
+# 2. 데이터셋 (읽기 전용 색인 묶음)
+# ==========================================
+# 파생 색인 이름 -> 빌더 (플래너 행렬 등, 스냅샷 버전마다 1회 생성)
+INDEX_BUILDERS: Dict[str, Callable[["Dataset"], Any]] = {}
+
+
+def register_index(name: str):
+    """
+    파생 색인 빌더 등록 데코레이터
+    - 등록된 색인은 스냅샷 교체 전에 미리 만들어 두고(warm_indexes), 요청 경로에서는 dataset.index(name)으로 꺼내 씁니다.
+    """
+    def decorator(build: Callable[["Dataset"], Any]):
+        INDEX_BUILDERS[name] = build
+        return build
+    return decorator
+
+
+class Dataset:
+    __slots__ = (
+        "version", "loaded_at",
+        "characters", "character_order", "characters_by_rarity",
+        "skills", "items", "item_order", "ranges", "zones", "stages", "skin_groups",
+        "indexes"
+    )
+
+    def __init__(
+        self,
+        version: str,
+        characters: Dict[str, CharacterRecord],
+        skills: Dict[str, SkillRecord],
+        items: Dict[str, ItemRecord],
+        ranges: Dict[str, RangeRecord],
+        zones: Tuple[ZoneRecord, ...],
+        skin_groups: Tuple[SkinGroupRecord, ...],
+    ):
+        self.version = version
+        self.loaded_at = datetime.now(timezone.utc)
+        self.characters: Mapping[str, CharacterRecord] = MappingProxyType(characters)
+        # 목록 API 정렬 기준: 희귀도 높은 순, 코드 순
+        self.character_order: Tuple[CharacterRecord, ...] = tuple(
+            sorted(characters.values(), key=lambda c: (-c.rarity, c.code))
+        )
+        by_rarity = defaultdict(list)
+        for char in self.character_order:
+            by_rarity[char.rarity].append(char)
+        self.characters_by_rarity: Mapping[int, Tuple[CharacterRecord, ...]] = MappingProxyType(
+            {rarity: tuple(chars) for rarity, chars in by_rarity.items()}
+        )
+        self.skills: Mapping[str, SkillRecord] = MappingProxyType(skills)
+        self.items: Mapping[str, ItemRecord] = MappingProxyType(items)
+        self.item_order: Tuple[ItemRecord, ...] = tuple(items.values())
+        self.ranges: Mapping[str, RangeRecord] = MappingProxyType(ranges)
+        self.zones: Tuple[ZoneRecord, ...] = zones
+        self.stages: Mapping[str, StageRecord] = MappingProxyType(
+            {stage.stage_code: stage for zone in zones for stage in zone.stages}
+        )
+        # 스킨 그룹 (이름 순, 스킨이 없는 그룹 포함)
+        self.skin_groups: Tuple[SkinGroupRecord, ...] = tuple(sorted(skin_groups, key=lambda g: g.name_ko))
+        # 파생 색인 캐시 (스냅샷과 수명이 같으므로 버전이 바뀌면 새 스냅샷과 함께 다시 만들어짐)
+        self.indexes: Dict[str, Any] = {}
+
+    def index(self, name: str):
+        """등록된 파생 색인 (없으면 지금 생성. 동시에 두 번 만들어져도 결과가 같으므로 잠금 없음)"""
+        value = self.indexes.get(name)
+        if value is None:
+            value = self.indexes[name] = INDEX_BUILDERS[name](self)
+        return value
+
+    def warm_indexes(self) -> Dict[str, float]:
+        """등록된 파생 색인을 모두 생성 -> 색인별 소요 시간(ms)"""
+        timings = {}
+        for name in list(INDEX_BUILDERS):
+            started = time.perf_counter()
+            self.index(name)
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+        return timings
+
+
+# 스냅샷에 포함하는 테이블 (character_skin_details 같은 무거운 텍스트는 제외)
+SOURCE_TABLES = {
+    "profession": Profession.__table__,
+    "sub_profession": SubProfession.__table__,
+    "tag": Tag.__table__,
+    "ranges": Range.__table__,
+    "items": Item.__table__,
+    "zones": Zone.__table__,
+    "stages": Stage.__table__,
+    "characters": Character.__table__,
+    "characters_detail": CharacterDetail.__table__,
+    "character_stats": CharacterStat.__table__,
+    "character_talents": CharacterTalent.__table__,
+    "character_skill": CharacterSkillSlot.__table__,
+    "character_favor_templates": CharacterFavorTemplate.__table__,
+    "character_potentials": CharacterPotential.__table__,
+    "character_promotion_costs": CharacterPromotionCost.__table__,
+    "character_skill_costs": CharacterSkillCost.__table__,
+    "character_tag": character_tag,
+    "character_modules": CharacterModule.__table__,
+    "character_module_costs": CharacterModuleCost.__table__,
+    "character_skins": CharacterSkin.__table__,
+    "skin_groups": SkinGroup.__table__,
+    "skills": Skill.__table__,
+    "skill_levels": SkillLevel.__table__,
+    "skill_mastery_costs": SkillMasteryCost.__table__,
+}
+
+
+def _group(rows: List[dict], key: str) -> Dict[Any, List[dict]]:
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row[key]].append(row)
+    return grouped
+
+
+def content_version(tables: Dict[str, List[dict]]) -> str:
+    """dataset_version 행이 없을 때 쓰는 대체 버전 (읽어 온 행 내용의 해시)"""
+    digest = hashlib.sha256()
+    for name in SOURCE_TABLES:
+        digest.update(name.encode())
+        digest.update(orjson.dumps(tables.get(name, []), default=str))
+    return "sha256:" + digest.hexdigest()[:16]
+
+
+def build_dataset(tables: Dict[str, List[dict]], version: Optional[str] = None) -> Dataset:
+    """테이블별 행(dict) -> Dataset (순수 함수, I/O 없음)"""
+    version = version or content_version(tables)
+
+    ranges = {
+        r["range_id"]: RangeRecord(r["range_id"], tuple(r["grids"] or ()))
+        for r in tables["ranges"]
+    }
+    items = {
+        r["item_code"]: ItemRecord(
+            r["item_id"], r["item_code"], r["name_ko"], r["rarity"], r["icon_id"], r["item_type"],
+            r["classify_type"], r["usage_text"], r["description"], r["obtain_approach"]
+        )
+        for r in tables["items"]
+    }
+    items_by_id = {item.item_id: item for item in items.values()}
+
+    def costs(rows, level_key):
+        return tuple(
+            CostRecord(r[level_key], r["count"], items_by_id[r["item_id"]])
+            for r in sorted(rows, key=lambda r: (r[level_key], r["id"]))
+            if r["item_id"] in items_by_id
+        )
+
+    # --- 스킬 ---
+    levels_by_skill = _group(tables["skill_levels"], "skill_id")
+    mastery_by_skill = _group(tables["skill_mastery_costs"], "skill_id")
+    skills = {}
+    for r in tables["skills"]:
+        levels = tuple(
+            SkillLevelRecord(
+                l["level"], l["sp_cost"], l["initial_sp"], float(l["duration"] or 0), l["range_id"],
+                l["description"], l["blackboard"], ranges.get(l["range_id"])
+            )
+            for l in sorted(levels_by_skill[r["skill_id"]], key=lambda l: l["level"])
+        )
+        skills[r["skill_code"]] = SkillRecord(
+            r["skill_id"], r["skill_code"], r["name_ko"], r["icon_id"], r["skill_type"], r["sp_type"],
+            levels, costs(mastery_by_skill[r["skill_id"]], "mastery_level")
+        )
+
+    # --- 캐릭터 ---
+    professions = {r["profession_id"]: ProfessionRecord(r["profession_id"], r["name_ko"]) for r in tables["profession"]}
+    sub_professions = {
+        r["sub_profession_id"]: SubProfessionRecord(r["sub_profession_id"], r["name_ko"])
+        for r in tables["sub_profession"]
+    }
+    tags = {r["tag_id"]: TagRecord(r["tag_id"], r["tag_name"]) for r in tables["tag"]}
+
+    details = {r["character_id"]: r for r in tables["characters_detail"]}
+    slots = {r["character_id"]: r for r in tables["character_skill"]}
+    favors = {r["character_id"]: r for r in tables["character_favor_templates"]}
+    potentials_by_char = _group(tables["character_potentials"], "character_id")
+    stats_by_char = _group(tables["character_stats"], "character_id")
+    talents_by_char = _group(tables["character_talents"], "character_id")
+    tags_by_char = _group(tables["character_tag"], "character_id")
+    promotion_by_char = _group(tables["character_promotion_costs"], "character_id")
+    skill_costs_by_char = _group(tables["character_skill_costs"], "character_id")
+    skins_by_char = _group(tables["character_skins"], "character_id")
+    module_costs = _group(tables["character_module_costs"], "module_id")
+    modules_by_char = _group(tables["character_modules"], "character_id")
+
+    characters = {}
+    for r in tables["characters"]:
+        char_id = r["character_id"]
+        detail = details.get(char_id)
+        slot = slots.get(char_id)
+        favor = favors.get(char_id)
+
+        characters[r["code"]] = CharacterRecord(
+            char_id, r["code"], r["name_ko"], r["class_description"], r["rarity"],
+            professions.get(r["profession_id"]),
+            sub_professions.get(r["sub_profession_id"]),
+            tuple(tags[t["tag_id"]] for t in sorted(tags_by_char[char_id], key=lambda t: t["tag_id"]) if t["tag_id"] in tags),
+            tuple(
+                StatRecord(
+                    s["phase"], s["max_level"], s["range_id"],
+                    s["base_hp"], s["base_atk"], s["base_def"], s["max_hp"], s["max_atk"], s["max_def"],
+                    s["magic_resistance"], s["cost"], s["block_cnt"], s["attack_speed"],
+                    ranges.get(s["range_id"]), tuple(s["keyframes"] or ())
+                )
+                for s in sorted(stats_by_char[char_id], key=lambda s: s["phase"])
+            ),
+            tuple(
+                TalentRecord(
+                    t["talent_index"], t["candidate_index"], t["unlock_phase"], t["unlock_level"],
+                    t["required_potential"], t["range_id"], t["name"], t["description"], t["blackboard"]
+                )
+                for t in sorted(talents_by_char[char_id], key=lambda t: (t["talent_index"], t["candidate_index"]))
+            ),
+            SkillSlotRecord(slot["phase_0_code"], slot["phase_1_code"], slot["phase_2_code"]) if slot else None,
+            FavorRecord(favor["max_favor_level"], favor["bonus_hp"], favor["bonus_atk"], favor["bonus_def"]) if favor else None,
+            costs(promotion_by_char[char_id], "target_phase"),
+            costs(skill_costs_by_char[char_id], "level"),
+            tuple(
+                ModuleRecord(
+                    m["module_id"], m["module_code"], m["name_ko"], m["icon_id"], m["description"],
+                    costs(module_costs[m["module_id"]], "level")
+                )
+                for m in sorted(modules_by_char[char_id], key=lambda m: m["module_id"])
+            ),
+            tuple(
+                SkinRecord(
+                    s["skin_id"], s["skin_code"], s["name_ko"], s["series_name"],
+                    s["illustrator"], s["portrait_id"], s["avatar_id"]
+                )
+                for s in sorted(skins_by_char[char_id], key=lambda s: s["skin_id"])
+            ),
+            detail["item_usage"] if detail else None,
+            detail["item_desc"] if detail else None,
+            tuple(
+                PotentialRecord(p["potential_rank"], tuple(p["attributes"] or ()))
+                for p in sorted(potentials_by_char[char_id], key=lambda p: p["potential_rank"])
+            ),
+            r["position"],
+        )
+
+    # --- 구역 / 스테이지 ---
+    stages_by_zone = _group(tables["stages"], "zone_id")
+    zones = tuple(
+        ZoneRecord(
+            z["zone_id"], z["zone_code"], z["name_ko"], z["zone_type"], z["zone_index"],
+            tuple(
+                StageRecord(
+                    s["stage_id"], s["stage_code"], s["zone_id"], s["display_code"], s["name_ko"],
+                    s["description"], s["ap_cost"], s["danger_level"]
+                )
+                for s in sorted(stages_by_zone[z["zone_id"]], key=lambda s: s["stage_id"])
+            )
+        )
+        for z in sorted(tables["zones"], key=lambda z: (z["zone_index"], z["zone_id"]))
+    )
+
+    # --- 스킨 그룹 ---
+    skin_groups = tuple(SkinGroupRecord(g["skin_group_id"], g["name_ko"]) for g in tables["skin_groups"])
+
+    return Dataset(version, characters, skills, items, ranges, zones, skin_groups)
+
+
+# ==========================================
+# 3. DB 읽기
+# ==========================================
+async def fetch_version(conn) -> Optional[str]:
+    """dataset_version 단일 행 조회 (테이블이 아직 없으면 None)"""
+    try:
+        result = await conn.execute(select(DatasetVersion.version).where(DatasetVersion.id == 1))
+        return result.scalar_one_or_none()
+    except DBAPIError:
+        await conn.rollback()
+        return None
+
+
+async def fetch_tables(conn) -> Dict[str, List[dict]]:
+    """스냅샷 대상 테이블 전체 조회 (테이블당 SELECT 1회)"""
+    tables = {}
+    for name, table in SOURCE_TABLES.items():
+        result = await conn.execute(select(table).order_by(*table.primary_key.columns))
+        tables[name] = [dict(row) for row in result.mappings()]
+    return tables
+
+
+async def load_dataset() -> Dataset:
+    async with engine.connect() as conn:
+        version = await fetch_version(conn)
+        tables = await fetch_tables(conn)
+    # 레코드 구성은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 수행
+    return await asyncio.to_thread(build_dataset, tables, version)
+
+
+# ==========================================
+# 4. 현재 스냅샷 보관 / 갱신
+# ==========================================
+_current: Optional[Dataset] = None
+_refresh_lock = asyncio.Lock()
+
+
+def get_dataset() -> Dataset:
+    """현재 스냅샷 (Dependency로도 사용)"""
+    if _current is None:
+        raise HTTPException(status_code=503, detail="데이터셋을 불러오는 중입니다.")
+    return _current
+
+
+# db 모드: 주기적으로 확인한 dataset_version (watch_version)
+_db_version: Optional[str] = None
+
+
+def current_version() -> Optional[str]:
+    """
+    현재 데이터 버전 (아직 모르면 None)
+    - memory 모드: 서빙 중인 스냅샷 버전
+    - db 모드: watch_version이 주기적으로 읽은 dataset_version (ensure_dataset의 색인용 스냅샷과 무관)
+    """
+    if DATASET_MODE != "memory":
+        return _db_version
+    return _current.version if _current is not None else None
+
+
+async def refresh_version():
+    """db 모드: dataset_version 단일 행만 다시 읽음 (스냅샷은 만들지 않음)"""
+    global _db_version
+    async with engine.connect() as conn:
+        _db_version = await fetch_version(conn)
+
+
+async def watch_version(interval: int = DATASET_POLL_SECONDS):
+    """db 모드 lifespan 백그라운드 태스크: 버전이 바뀌면 응답 캐시 / 공유 스토어가 이전 본문을 더 쓰지 않도록 함"""
+    while True:
+        try:
+            await refresh_version()
+        except Exception as e:
+            print(f"⚠️ Dataset version check failed: {e}")
+        await asyncio.sleep(interval)
+
+
+async def refresh_dataset(force: bool = False, warm: bool = True) -> bool:
+    """
+    dataset_version이 바뀌었으면(또는 force) 새 스냅샷으로 교체. 교체 여부 반환
+    - warm=False: 파생 색인을 미리 만들지 않음 (db 모드: 라우트가 쓰는 색인만 ensure_indexes가 생성)
+    """
+    global _current
+    async with _refresh_lock:
+        if not force and _current is not None:
+            async with engine.connect() as conn:
+                version = await fetch_version(conn)
+            if version is None or version == _current.version:
+                return False
+
+        dataset = await load_dataset()
+        # 파생 색인도 교체 전에 만들어 두어 새 버전의 첫 요청이 색인 생성을 기다리지 않도록 함
+        index_timings = await asyncio.to_thread(dataset.warm_indexes) if warm else {}
+        _current = dataset  # 참조 교체 1회 -> 요청 처리 중에도 항상 완전한 스냅샷만 보임
+        print(
+            f"📦 Dataset {dataset.version} loaded: {len(dataset.characters)} characters, "
+            f"{len(dataset.skills)} skills, {len(dataset.items)} items, {len(dataset.zones)} zones"
+            + (f" | indexes(ms) {index_timings}" if index_timings else "")
+        )
+        return True
+
+
+async def warm_current_indexes() -> Dict[str, float]:
+    """
+    현재 스냅샷에 아직 없는 파생 색인을 스레드에서 생성 -> 색인별 소요 시간(ms)
+    (LAZY_ROUTERS처럼 첫 refresh_dataset 이후에 register_index된 색인을 첫 요청 전에 만들어 둠)
+    """
+    dataset = _current
+    if dataset is None:
+        return {}
+    return await asyncio.to_thread(dataset.warm_indexes)
+
+
+_checked_at = 0.0
+
+
+async def ensure_dataset() -> Dataset:
+    """
+    스냅샷 기반 색인(플래너 등)을 쓰는 라우트용 의존성
+    - memory 모드: 현재 스냅샷 (watch_dataset이 갱신)
+    - db 모드: 첫 요청에서 스냅샷을 읽고, 이후 DATASET_POLL_SECONDS마다 요청 경로에서 버전 확인
+      (비용: 이 라우트를 받는 워커마다 스냅샷 1벌. 색인은 모두 만들지 않고 ensure_indexes로 필요한 것만)
+    """
+    global _checked_at
+    if DATASET_MODE == "memory":
+        return get_dataset()
+
+    now = time.monotonic()
+    if _current is None or now - _checked_at >= DATASET_POLL_SECONDS:
+        _checked_at = now
+        try:
+            # 스냅샷이 없으면 버전 확인 없이 적재 (동시에 들어온 첫 요청들은 잠금 뒤에서 버전만 비교하고 끝남)
+            await refresh_dataset(warm=False)
+        except Exception as e:
+            # 갱신 실패 시 기존 스냅샷으로 계속 서비스 (스냅샷이 없으면 get_dataset()이 503)
+            print(f"⚠️ Dataset refresh failed: {e}")
+    return get_dataset()
+
+
+def ensure_indexes(*names: str):
+    """
+    ensure_dataset + 라우트가 쓰는 파생 색인만 준비하는 의존성 생성
+    (memory 모드는 warm_indexes로 이미 있음. db 모드는 없는 색인만 스레드에서 생성해 이벤트 루프를 막지 않음)
+    """
+    async def dependency() -> Dataset:
+        dataset = await ensure_dataset()
+        missing = [name for name in names if name not in dataset.indexes]
+        if missing:
+            await asyncio.to_thread(lambda: [dataset.index(name) for name in missing])
+        return dataset
+    return dependency
+
+
+async def watch_dataset(interval: int = DATASET_POLL_SECONDS):
+    """lifespan에서 백그라운드 태스크로 실행: 주기적으로 버전 확인 후 재적재"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_dataset()
+        except Exception as e:
+            # 갱신 실패 시 기존 스냅샷으로 계속 서비스
+            print(f"⚠️ Dataset refresh failed: {e}")
@@ -0,0 +1,156 @@
+# lib/core/facets.py
+"""
+오퍼레이터 다중 패싯 필터 (스냅샷 버전마다 1회 생성)
+- 비트 i = dataset.character_order[i] (희귀도 높은 순, 코드 순)
+- 패싯 값마다 오퍼레이터 비트셋(파이썬 int) 1개
+    같은 패싯 안의 여러 값은 OR, 패싯끼리는 AND (태그는 tag_mode로 AND/OR 선택)
+- 정렬은 미리 계산한 순열(ordering)로, 패싯별 개수는 비트셋 popcount(int.bit_count)로 계산합니다.
+    개수 = 해당 패싯을 뺀 나머지 조건의 결과 ∩ 값 비트셋 (선택을 바꿨을 때 나올 결과 수)
+"""
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lib.core.dataset import CharacterRecord, Dataset, register_index
+
+FACETS = ("rarity", "profession", "sub_profession", "tag", "module")
+
+# 정렬 이름 -> 키 (모두 코드 순으로 동점 처리)
+ORDERINGS = {
+    "rarity": lambda c: (-c.rarity, c.code),
+    "-rarity": lambda c: (c.rarity, c.code),
+    "name": lambda c: (c.name_ko, c.code),
+    "code": lambda c: c.code,
+}
+
+
+class FacetQuery(NamedTuple):
+    """패싯별 선택 값 (None/빈 값 = 조건 없음)"""
+    rarity: Optional[Tuple[int, ...]] = None
+    profession: Optional[Tuple[int, ...]] = None
+    sub_profession: Optional[Tuple[int, ...]] = None
+    tag: Optional[Tuple[str, ...]] = None
+    module: Optional[bool] = None
+    tag_mode: str = "and"
+
+    def is_empty(self) -> bool:
+        return not (self.rarity or self.profession or self.sub_profession or self.tag) and self.module is None
+
+
+class FacetValue(NamedTuple):
+    value: Any
+    label: str
+    bits: int
+
+
+class FacetIndex:
+    __slots__ = ("version", "records", "size", "all_bits", "facets", "orderings")
+
+    def __init__(self, dataset: Dataset):
+        self.version = dataset.version
+        self.records: Tuple[CharacterRecord, ...] = dataset.character_order
+        self.size = len(self.records)
+        self.all_bits = (1 << self.size) - 1
+
+        facets: Dict[str, Dict[Any, List]] = {facet: {} for facet in FACETS}
+
+        def add(facet: str, value, label: str, bit: int):
+            entry = facets[facet].setdefault(value, [label, 0])
+            entry[1] |= 1 << bit
+
+        for bit, char in enumerate(self.records):
+            add("rarity", char.rarity, str(char.rarity), bit)
+            if char.profession is not None:
+                add("profession", char.profession.profession_id, char.profession.name_ko, bit)
+            if char.sub_profession is not None:
+                add("sub_profession", char.sub_profession.sub_profession_id, char.sub_profession.name_ko, bit)
+            for tag in char.tags:
+                add("tag", tag.tag_name, tag.tag_name, bit)
+            add("module", bool(char.modules), "모듈 보유" if char.modules else "모듈 없음", bit)
+
+        self.facets: Dict[str, Dict[Any, FacetValue]] = {
+            facet: {
+                value: FacetValue(value, label, bits)
+                for value, (label, bits) in sorted(values.items(), key=lambda item: item[0])
+            }
+            for facet, values in facets.items()
+        }
+        # 정렬 이름 -> 비트 번호 순열
+        self.orderings: Dict[str, np.ndarray] = {}
+        for name, key in ORDERINGS.items():
+            order = np.array(sorted(range(self.size), key=lambda bit: key(self.records[bit])), dtype=np.intp)
+            order.setflags(write=False)
+            self.orderings[name] = order
+
+    # --- 비트 연산 ---
+    def facet_bits(self, facet: str, values: Sequence, mode: str = "or") -> int:
+        """패싯 1개의 선택 값 -> 비트셋 (모르는 값은 빈 비트셋)"""
+        table = self.facets[facet]
+        sets = [table[value].bits if value in table else 0 for value in values]
+        if mode == "and":
+            bits = self.all_bits
+            for value_bits in sets:
+                bits &= value_bits
+            return bits
+        bits = 0
+        for value_bits in sets:
+            bits |= value_bits
+        return bits
+
+    def selections(self, query: FacetQuery) -> Dict[str, int]:
+        """조건이 있는 패싯만 -> 패싯별 비트셋"""
+        masks = {}
+        for facet in FACETS:
+            values = getattr(query, facet)
+            if facet == "module":
+                if values is not None:
+                    masks[facet] = self.facet_bits(facet, [values])
+            elif values:
+                masks[facet] = self.facet_bits(facet, values, query.tag_mode if facet == "tag" else "or")
+        return masks
+
+    def match(self, query: FacetQuery) -> int:
+        bits = self.all_bits
+        for mask in self.selections(query).values():
+            bits &= mask
+        return bits
+
+    # --- 결과 ---
+    def to_array(self, bits: int) -> np.ndarray:
+        """비트셋 -> bool 배열 [size]"""
+        raw = np.frombuffer(bits.to_bytes(-(-self.size // 8) or 1, "little"), dtype=np.uint8)
+        return np.unpackbits(raw, bitorder="little")[:self.size].astype(bool)
+
+    def select(self, bits: int, sort: str = "rarity", skip: int = 0, limit: int = 20) -> List[CharacterRecord]:
+        """비트셋 -> 정렬 순서대로 skip/limit 구간의 레코드"""
+        order = self.orderings[sort]
+        matched = order[self.to_array(bits)[order]]
+        return [self.records[bit] for bit in matched[skip:skip + limit].tolist()]
+
+    def counts(self, query: FacetQuery) -> Tuple[int, Dict[str, List[Tuple[FacetValue, int]]]]:
+        """(전체 결과 수, 패싯별 [(값, 개수)]) - 개수는 해당 패싯 조건을 뺀 결과 기준 (AND 모드 태그는 전체 결과 기준)"""
+        masks = self.selections(query)
+        total_bits = self.all_bits
+        for mask in masks.values():
+            total_bits &= mask
+
+        counts = {}
+        for facet in FACETS:
+            if facet == "tag" and query.tag_mode == "and":
+                base = total_bits
+            else:
+                base = self.all_bits
+                for other, mask in masks.items():
+                    if other != facet:
+                        base &= mask
+            counts[facet] = [(value, (value.bits & base).bit_count()) for value in self.facets[facet].values()]
+        return total_bits.bit_count(), counts
+
+
+@register_index("facets")
+def build_facet_index(dataset: Dataset) -> FacetIndex:
+    return FacetIndex(dataset)
+
+
+def get_facet_index(dataset: Dataset) -> FacetIndex:
+    return dataset.index("facets")
@@ -0,0 +1,162 @@
+# lib/core/planner.py
+"""
+육성 재료 플래너 색인 (스냅샷 버전마다 1회 생성)
+- 정예화(CharacterPromotionCost) / 스킬 레벨(CharacterSkillCost) / 특화(SkillMasteryCost) / 모듈(CharacterModuleCost)
+  비용을 오퍼레이터별 "단계 x 재료" 행렬로 펼쳐 하나의 int32 행렬에 이어 붙입니다.
+- 오퍼레이터 1명의 행 배치 (start 기준 오프셋, 한 행 = 해당 단계로 올리는 데 드는 재료)
+    0~1           : 정예화 1, 2
+    2~7           : 스킬 레벨 2~7
+    8 + 3*s + m-1 : s번째 스킬 슬롯 특화 m (1~3)
+    이후 3행씩     : 모듈(ModuleRecord 순서) 단계 1~3
+- 현재 -> 목표 상태는 연속 구간 몇 개로 바뀌므로, 로스터 조회는 행 번호를 모아 matrix[rows].sum(axis=0) 한 번으로 끝납니다.
+"""
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from lib.core.dataset import CharacterRecord, Dataset, ItemRecord, register_index
+
+MAX_PHASE = 2
+MAX_SKILL_LEVEL = 7
+MAX_MASTERY = 3
+MAX_MODULE_LEVEL = 3
+
+PROMOTION_OFFSET = 0
+SKILL_OFFSET = PROMOTION_OFFSET + MAX_PHASE
+MASTERY_OFFSET = SKILL_OFFSET + (MAX_SKILL_LEVEL - 1)
+
+
+class PlanState(NamedTuple):
+    """육성 상태 (masteries: 스킬 슬롯 순서, modules: module_code -> 단계)"""
+    phase: int = 0
+    skill_level: int = 1
+    masteries: Tuple[int, ...] = ()
+    modules: Tuple[Tuple[str, int], ...] = ()
+
+
+class OperatorLayout(NamedTuple):
+    start: int
+    skill_codes: Tuple[str, ...]
+    module_offsets: Dict[str, int]  # module_code -> start 기준 오프셋
+    rows: int
+
+
+class PlannerError(ValueError):
+    """알 수 없는 스킬 슬롯/모듈 등 요청 오류"""
+
+
+def _skill_codes(char: CharacterRecord) -> Tuple[str, ...]:
+    slot = char.skill_slots
+    if slot is None:
+        return ()
+    return tuple(code for code in (slot.phase_0_code, slot.phase_1_code, slot.phase_2_code) if code)
+
+
+def _span(offset: int, current: int, target: int, first_level: int) -> range:
+    """단계 current -> target 구간의 행 번호 (목표가 현재 이하면 빈 구간)"""
+    return range(offset + max(current, first_level - 1) - first_level + 1, offset + target - first_level + 1)
+
+
+class PlannerIndex:
+    __slots__ = ("version", "items", "layouts", "matrix")
+
+    def __init__(self, version: str, items: Tuple[ItemRecord, ...], layouts: Dict[str, OperatorLayout], matrix: np.ndarray):
+        self.version = version
+        self.items = items  # 열 순서 = 재료 아이템
+        self.layouts = layouts
+        self.matrix = matrix
+        self.matrix.setflags(write=False)
+
+    @classmethod
+    def build(cls, dataset: Dataset) -> "PlannerIndex":
+        # 1) 배치 계산 + 비용에 등장하는 아이템만 열로 사용
+        layouts: Dict[str, OperatorLayout] = {}
+        used: Dict[str, ItemRecord] = {}
+        start = 0
+        for char in dataset.character_order:
+            skill_codes = _skill_codes(char)
+            offset = MASTERY_OFFSET + MAX_MASTERY * len(skill_codes)
+            module_offsets = {}
+            for module in char.modules:
+                module_offsets[module.module_code] = offset
+                offset += MAX_MODULE_LEVEL
+            layouts[char.code] = OperatorLayout(start, skill_codes, module_offsets, offset)
+            start += offset
+
+            costs = [char.promotion_costs, char.skill_costs]
+            costs.extend(dataset.skills[code].mastery_costs for code in skill_codes if code in dataset.skills)
+            costs.extend(module.costs for module in char.modules)
+            for group in costs:
+                for cost in group:
+                    used.setdefault(cost.item.item_code, cost.item)
+
+        items = tuple(sorted(used.values(), key=lambda item: item.item_id))
+        columns = {item.item_code: column for column, item in enumerate(items)}
+
+        # 2) 밀집 행렬 채우기 (범위를 벗어난 단계 값은 무시)
+        matrix = np.zeros((start, len(items)), dtype=np.int32)
+
+        def fill(base: int, costs, max_level: int, first_level: int = 1):
+            for cost in costs:
+                if first_level <= cost.level <= max_level:
+                    matrix[base + cost.level - first_level, columns[cost.item.item_code]] += cost.count
+
+        for char in dataset.character_order:
+            layout = layouts[char.code]
+            fill(layout.start + PROMOTION_OFFSET, char.promotion_costs, MAX_PHASE)
+            fill(layout.start + SKILL_OFFSET, char.skill_costs, MAX_SKILL_LEVEL, first_level=2)
+            for slot, code in enumerate(layout.skill_codes):
+                skill = dataset.skills.get(code)
+                if skill is not None:
+                    fill(layout.start + MASTERY_OFFSET + MAX_MASTERY * slot, skill.mastery_costs, MAX_MASTERY)
+            for module in char.modules:
+                fill(layout.start + layout.module_offsets[module.module_code], module.costs, MAX_MODULE_LEVEL)
+
+        return cls(dataset.version, items, layouts, matrix)
+
+    def rows(self, code: str, current: PlanState, target: PlanState) -> List[range]:
+        """오퍼레이터 1명의 현재 -> 목표 행 구간들 (KeyError: 알 수 없는 오퍼레이터)"""
+        layout = self.layouts[code]
+        start = layout.start
+        spans = [
+            _span(start + PROMOTION_OFFSET, current.phase, target.phase, 1),
+            _span(start + SKILL_OFFSET, current.skill_level, target.skill_level, 2),
+        ]
+
+        slots = max(len(current.masteries), len(target.masteries))
+        if slots > len(layout.skill_codes):
+            raise PlannerError(f"{code}: 스킬 슬롯은 {len(layout.skill_codes)}개입니다.")
+        for slot in range(slots):
+            before = current.masteries[slot] if slot < len(current.masteries) else 0
+            after = target.masteries[slot] if slot < len(target.masteries) else 0
+            spans.append(_span(start + MASTERY_OFFSET + MAX_MASTERY * slot, before, after, 1))
+
+        current_modules = dict(current.modules)
+        target_modules = dict(target.modules)
+        for module_code in current_modules.keys() | target_modules.keys():
+            offset = layout.module_offsets.get(module_code)
+            if offset is None:
+                raise PlannerError(f"{code}: 모듈 {module_code}을(를) 찾을 수 없습니다.")
+            spans.append(_span(start + offset, current_modules.get(module_code, 0), target_modules.get(module_code, 0), 1))
+
+        return [span for span in spans if span]
+
+    def total(self, plans: Iterable[Sequence[range]]) -> np.ndarray:
+        """여러 오퍼레이터의 행 구간 -> 재료별 합계 (열 = self.items)"""
+        indices = [index for spans in plans for span in spans for index in span]
+        if not indices:
+            return np.zeros(len(self.items), dtype=np.int64)
+        return self.matrix[np.asarray(indices, dtype=np.intp)].sum(axis=0, dtype=np.int64)
+
+    def nonzero(self, totals: np.ndarray) -> List[Tuple[ItemRecord, int]]:
+        """합계 벡터 -> (아이템, 개수) 목록 (0개 제외, 열 순서 유지)"""
+        return [(self.items[column], int(totals[column])) for column in np.flatnonzero(totals)]
+
+
+@register_index("planner")
+def build_planner_index(dataset: Dataset) -> PlannerIndex:
+    return PlannerIndex.build(dataset)
+
+
+def get_planner_index(dataset: Dataset) -> PlannerIndex:
+    return dataset.index("planner")
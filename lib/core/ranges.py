@@ -0,0 +1,145 @@
+# lib/core/ranges.py
+"""
+공격 범위 비트마스크 색인 (스냅샷 버전마다 1회 생성)
+- 모든 Range.grids를 데이터셋 전체의 공통 경계 상자(row_min~row_max x col_min~col_max) 위 고정 길이 비트마스크로 변환합니다.
+    비트 번호 = (row - row_min) * cols + (col - col_min), 64비트 단어 배열(uint64)로 보관
+- 오퍼레이터(정예화 단계별 range_id)와 스킬(가장 높은 레벨의 range_id)은 range 행 번호만 참조하므로
+    "타일 (r, c)를 포함하는 범위"  -> 비트 1개 검사
+    "범위 X를 모두 포함하는 범위"   -> (mask & X) == X
+  가 전체 range에 대한 벡터 연산 1회 + 참조 행 인덱싱으로 끝납니다.
+- 클라이언트용 압축 형태: 경계 상자 + range별 16진수 마스크 문자열 (grids 목록 대신 전송 가능)
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from lib.core.dataset import Dataset, register_index
+
+WORD_BITS = 64
+
+
+class RangeEntry(NamedTuple):
+    """범위를 가진 대상 1개 (오퍼레이터 정예화 단계 / 스킬)"""
+    code: str
+    phase: Optional[int]  # 오퍼레이터: 정예화 단계, 스킬: None
+    range_id: str
+
+
+class RangeIndex:
+    __slots__ = (
+        "version", "row_min", "col_min", "rows", "cols", "words",
+        "range_ids", "range_rows", "masks",
+        "operators", "operator_ranges", "operator_top", "skills", "skill_ranges"
+    )
+
+    def __init__(self, dataset: Dataset):
+        self.version = dataset.version
+        tiles = [(grid["row"], grid["col"]) for record in dataset.ranges.values() for grid in record.grids]
+        rows = [row for row, _ in tiles] or [0]
+        cols = [col for _, col in tiles] or [0]
+        self.row_min, self.col_min = min(rows), min(cols)
+        self.rows = max(rows) - self.row_min + 1
+        self.cols = max(cols) - self.col_min + 1
+        self.words = -(-self.rows * self.cols // WORD_BITS)
+
+        self.range_ids: Tuple[str, ...] = tuple(dataset.ranges)
+        self.range_rows: Dict[str, int] = {range_id: row for row, range_id in enumerate(self.range_ids)}
+        self.masks = np.zeros((len(self.range_ids), self.words), dtype=np.uint64)
+        for row, record in enumerate(dataset.ranges.values()):
+            self.masks[row] = self.compile((grid["row"], grid["col"]) for grid in record.grids)
+
+        # 오퍼레이터: 정예화 단계별 1행 (operator_top = 오퍼레이터의 최고 단계 행)
+        operators: List[RangeEntry] = []
+        top: List[bool] = []
+        for char in dataset.character_order:
+            stats = [stat for stat in char.stats if stat.range_id in self.range_rows]
+            for stat in stats:
+                operators.append(RangeEntry(char.code, stat.phase, stat.range_id))
+                top.append(stat is stats[-1])
+        self.operators: Tuple[RangeEntry, ...] = tuple(operators)
+        self.operator_ranges = np.array([self.range_rows[entry.range_id] for entry in operators], dtype=np.intp)
+        self.operator_top = np.array(top, dtype=bool)
+
+        # 스킬: 가장 높은 레벨의 범위 (범위 없는 스킬은 제외)
+        skills: List[RangeEntry] = []
+        for skill in dataset.skills.values():
+            range_id = next(
+                (level.range_id for level in reversed(skill.levels) if level.range_id in self.range_rows), None
+            )
+            if range_id is not None:
+                skills.append(RangeEntry(skill.skill_code, None, range_id))
+        self.skills: Tuple[RangeEntry, ...] = tuple(skills)
+        self.skill_ranges = np.array([self.range_rows[entry.range_id] for entry in skills], dtype=np.intp)
+
+        for array in (self.masks, self.operator_ranges, self.operator_top, self.skill_ranges):
+            array.setflags(write=False)
+
+    # --- 비트 연산 ---
+    def bit(self, row: int, col: int) -> Optional[int]:
+        """타일 -> 비트 번호 (경계 상자 밖이면 None = 어떤 범위에도 없음)"""
+        r, c = row - self.row_min, col - self.col_min
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            return None
+        return r * self.cols + c
+
+    def compile(self, tiles: Iterable[Tuple[int, int]]) -> np.ndarray:
+        """타일 목록 -> 마스크 (경계 상자 밖 타일은 ValueError)"""
+        mask = np.zeros(self.words, dtype=np.uint64)
+        for row, col in tiles:
+            bit = self.bit(row, col)
+            if bit is None:
+                raise ValueError(f"타일 ({row}, {col})은 범위 격자 밖입니다.")
+            mask[bit // WORD_BITS] |= np.uint64(1) << np.uint64(bit % WORD_BITS)
+        return mask
+
+    def covering(self, row: int, col: int) -> np.ndarray:
+        """타일을 포함하는 range 여부 [R]"""
+        bit = self.bit(row, col)
+        if bit is None:
+            return np.zeros(len(self.range_ids), dtype=bool)
+        return ((self.masks[:, bit // WORD_BITS] >> np.uint64(bit % WORD_BITS)) & np.uint64(1)).astype(bool)
+
+    def supersets(self, mask: np.ndarray) -> np.ndarray:
+        """mask를 모두 포함하는 range 여부 [R]"""
+        return np.all((self.masks & mask) == mask, axis=1)
+
+    # --- 대상 선택 ---
+    def select(self, matched: np.ndarray, phase: Optional[int] = None) -> Tuple[List[RangeEntry], List[RangeEntry]]:
+        """range 여부 [R] -> (오퍼레이터, 스킬). phase 생략 시 오퍼레이터별 최고 정예화 단계만"""
+        hits = matched[self.operator_ranges]
+        if phase is None:
+            hits &= self.operator_top
+        else:
+            hits &= np.array([entry.phase == phase for entry in self.operators], dtype=bool)
+        operators = [self.operators[row] for row in np.flatnonzero(hits)]
+        skills = [self.skills[row] for row in np.flatnonzero(matched[self.skill_ranges])]
+        return operators, skills
+
+    # --- 압축 형태 ---
+    def to_hex(self, mask: np.ndarray) -> str:
+        """마스크 -> 16진수 문자열 (비트 0 = 최하위 비트)"""
+        value = 0
+        for index, word in enumerate(mask.tolist()):
+            value |= int(word) << (WORD_BITS * index)
+        return format(value, "x")
+
+    def compact(self) -> Dict:
+        return {
+            "row_min": self.row_min,
+            "col_min": self.col_min,
+            "rows": self.rows,
+            "cols": self.cols,
+            "ranges": [
+                {"range_id": range_id, "mask": self.to_hex(mask)}
+                for range_id, mask in zip(self.range_ids, self.masks)
+            ],
+        }
+
+
+@register_index("ranges")
+def build_range_index(dataset: Dataset) -> RangeIndex:
+    return RangeIndex(dataset)
+
+
+def get_range_index(dataset: Dataset) -> RangeIndex:
+    return dataset.index("ranges")
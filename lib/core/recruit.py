@@ -0,0 +1,156 @@
+# lib/core/recruit.py
+"""
+공개모집 태그 계산표 (스냅샷 버전마다 1회 생성)
+- 오퍼레이터별 모집 태그 = Tag(character_tag) + 직군 + 위치(근거리/원거리) + 희귀도 태그(고급특별채용/특별채용/신입)
+- 모든 오퍼레이터의 태그 중 크기 1~3인 부분집합마다 "그 태그를 모두 가진 오퍼레이터" 비트셋(파이썬 int)을 미리 모아 둡니다.
+    비트 i = pool[i] (character_order 순서 = 희귀도 높은 순)
+    최고 희귀도(6성)는 고급특별채용 태그가 들어간 조합에만 남깁니다.
+- 조회(태그 최대 5개)는 선택 태그의 1~3개 부분집합(최대 25개)을 표에서 찾아 합치는 것으로 끝납니다 (탐색 없음).
+- 희귀도 값은 데이터셋 최고 희귀도를 기준으로 상대적으로 해석합니다 (ETL parse_rarity는 TIER_6 -> 5).
+- 모집 풀 데이터가 없으므로 8개 직군에 속한 모든 오퍼레이터(토큰/장치 제외)를 모집 대상으로 봅니다.
+"""
+from itertools import combinations
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from lib.core.dataset import CharacterRecord, Dataset, register_index
+
+MAX_SELECTED_TAGS = 5
+MAX_COMBINATION_TAGS = 3
+
+TOP_OPERATOR_TAG = "고급특별채용"
+SENIOR_OPERATOR_TAG = "특별채용"
+STARTER_TAG = "신입"
+
+# 직군 코드(ETL은 코드를 name_ko로 적재) -> 모집 태그. DB에 한글 이름이 있으면 그대로 사용
+PROFESSION_TAGS = {
+    "PIONEER": "뱅가드",
+    "WARRIOR": "가드",
+    "TANK": "디펜더",
+    "SNIPER": "스나이퍼",
+    "CASTER": "캐스터",
+    "MEDIC": "메딕",
+    "SUPPORT": "서포터",
+    "SPECIAL": "스페셜리스트",
+}
+POSITION_TAGS = {"MELEE": "근거리", "RANGED": "원거리"}
+
+# 최고 희귀도 기준 차이 (6성 = 0)
+TOP_OFFSET = 0
+SENIOR_OFFSET = 1
+FLOOR_OFFSET = 3    # 3성: 7:40 이상 모집에서는 1~2성이 나오지 않음
+STARTER_OFFSET = 4
+
+
+class RecruitError(ValueError):
+    """태그 개수 초과 / 알 수 없는 태그"""
+
+
+class RecruitCombination(NamedTuple):
+    tags: Tuple[str, ...]
+    bits: int
+    members: Tuple[int, ...]  # 비트 번호 (희귀도 높은 순)
+    min_rarity: int           # 보장 최소 희귀도 (3성 미만은 다른 오퍼레이터가 있으면 제외)
+
+
+def _profession_tag(char: CharacterRecord) -> Optional[str]:
+    if char.profession is None:
+        return None
+    name = char.profession.name_ko
+    if name in PROFESSION_TAGS:
+        return PROFESSION_TAGS[name]
+    return name if name in PROFESSION_TAGS.values() else None
+
+
+class RecruitIndex:
+    __slots__ = ("version", "pool", "top_rarity", "floor_rarity", "tags", "tag_bits", "table")
+
+    def __init__(self, dataset: Dataset):
+        self.version = dataset.version
+        self.pool: Tuple[CharacterRecord, ...] = tuple(
+            char for char in dataset.character_order if _profession_tag(char) is not None
+        )
+        self.top_rarity = max((char.rarity for char in self.pool), default=0)
+        self.floor_rarity = self.top_rarity - FLOOR_OFFSET
+
+        # 1) 오퍼레이터별 태그 -> 1~3개 부분집합마다 비트 OR
+        tag_bits: Dict[str, int] = {}
+        raw: Dict[FrozenSet[str], int] = {}
+        for bit, char in enumerate(self.pool):
+            tags = self.operator_tags(char)
+            for tag in tags:
+                tag_bits[tag] = tag_bits.get(tag, 0) | (1 << bit)
+            for size in range(1, MAX_COMBINATION_TAGS + 1):
+                for subset in combinations(tags, size):
+                    key = frozenset(subset)
+                    raw[key] = raw.get(key, 0) | (1 << bit)
+        self.tag_bits = tag_bits
+        self.tags: Tuple[str, ...] = tuple(sorted(tag_bits))
+
+        # 2) 최고 희귀도 규칙 적용 + 보장 희귀도 계산 (남는 오퍼레이터가 없는 조합은 버림)
+        top_bits = sum(1 << bit for bit, char in enumerate(self.pool) if char.rarity == self.top_rarity)
+        self.table: Dict[FrozenSet[str], RecruitCombination] = {}
+        for key, bits in raw.items():
+            if TOP_OPERATOR_TAG not in key:
+                bits &= ~top_bits
+            if bits:
+                self.table[key] = self._combination(key, bits)
+
+    def operator_tags(self, char: CharacterRecord) -> Tuple[str, ...]:
+        tags = [tag.tag_name for tag in char.tags]
+        tags.append(_profession_tag(char))
+        if char.position in POSITION_TAGS:
+            tags.append(POSITION_TAGS[char.position])
+        rarity_tag = {
+            self.top_rarity - TOP_OFFSET: TOP_OPERATOR_TAG,
+            self.top_rarity - SENIOR_OFFSET: SENIOR_OPERATOR_TAG,
+            self.top_rarity - STARTER_OFFSET: STARTER_TAG,
+        }.get(char.rarity)
+        if rarity_tag is not None:
+            tags.append(rarity_tag)
+        return tuple(dict.fromkeys(tags))
+
+    def _combination(self, key: FrozenSet[str], bits: int) -> RecruitCombination:
+        members = []
+        rest = bits
+        while rest:
+            low = rest & -rest
+            members.append(low.bit_length() - 1)
+            rest ^= low
+        rarities = [self.pool[bit].rarity for bit in members]
+        guaranteed = [rarity for rarity in rarities if rarity >= self.floor_rarity] or rarities
+        return RecruitCombination(tuple(sorted(key)), bits, tuple(members), min(guaranteed))
+
+    def lookup(self, tags: Sequence[str]) -> List[RecruitCombination]:
+        """
+        선택 태그 -> 결과가 있는 1~3개 조합 목록
+        (보장 희귀도 높은 순 -> 후보 수 적은 순 -> 태그 수 적은 순)
+        """
+        selected = tuple(dict.fromkeys(tag for tag in tags if tag))
+        if not selected:
+            raise RecruitError("태그를 1개 이상 선택하세요.")
+        if len(selected) > MAX_SELECTED_TAGS:
+            raise RecruitError(f"태그는 최대 {MAX_SELECTED_TAGS}개까지 선택할 수 있습니다.")
+        unknown = [tag for tag in selected if tag not in self.tag_bits]
+        if unknown:
+            raise RecruitError(f"알 수 없는 태그: {', '.join(unknown)}")
+
+        found = []
+        for size in range(1, min(MAX_COMBINATION_TAGS, len(selected)) + 1):
+            for subset in combinations(selected, size):
+                combination = self.table.get(frozenset(subset))
+                if combination is not None:
+                    found.append(combination)
+        found.sort(key=lambda c: (-c.min_rarity, len(c.members), len(c.tags), c.tags))
+        return found
+
+    def operators(self, combination: RecruitCombination) -> List[CharacterRecord]:
+        return [self.pool[bit] for bit in combination.members]
+
+
+@register_index("recruit")
+def build_recruit_index(dataset: Dataset) -> RecruitIndex:
+    return RecruitIndex(dataset)
+
+
+def get_recruit_index(dataset: Dataset) -> RecruitIndex:
+    return dataset.index("recruit")
@@ -0,0 +1,191 @@
+# lib/core/search.py
+"""
+통합 전문 검색 색인 (스냅샷 버전마다 1회 생성, Postgres 미사용)
+- 문서 = 오퍼레이터 / 스킬 / 모듈 / 아이템 1개. 필드(이름, 설명 등)마다 가중치를 두고 토큰 빈도에 곱해 합산합니다. (BM25F 간소화)
+- 토큰화 (한국어용 n-gram)
+    NFKC + 소문자 -> 서식 태그(<@ba.vup>, </>)와 치환자({atk:0%}) 제거 -> 글자/숫자 외 문자로 단어 분리
+    색인: 글자 unigram + bigram / 질의: 2글자 이상 단어는 bigram, 1글자 단어는 unigram
+  조사/어미가 붙은 형태("공격력을")도 bigram이 겹치므로 형태소 분석기 없이 찾을 수 있고,
+  1글자 검색어("칩")는 복합어("메모리칩") 안의 글자와도 일치합니다.
+- 색인 구조 (CSR 형태의 압축 postings)
+    terms   : 토큰 -> 토큰 번호
+    offsets : int64 [T+1], 토큰 t의 postings = docs[offsets[t]:offsets[t+1]]
+    docs    : int32 [P] 문서 번호 (토큰별 오름차순)
+    freqs   : float32 [P] 필드 가중치를 곱한 토큰 빈도
+    idf     : float32 [T]
+- 조회는 질의 토큰마다 postings 구간 1개를 읽어 BM25 점수를 bincount로 누적하고 argpartition으로 상위 k개를 고릅니다.
+"""
+import re
+import unicodedata
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lib.core.dataset import Dataset, register_index
+
+DOC_TYPES = ("operator", "skill", "module", "item")
+
+# BM25 파라미터
+K1 = 1.2
+B = 0.75
+
+# 필드 가중치 (이름 일치를 설명 일치보다 우선)
+NAME_WEIGHT = 3.0
+TEXT_WEIGHT = 1.0
+# 모듈 설명은 긴 스토리 텍스트라 일치 1회의 의미가 작음
+STORY_WEIGHT = 0.5
+
+MARKUP_PATTERN = re.compile(r"<[^>]*>|\{[^}]*\}")
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", MARKUP_PATTERN.sub(" ", text)).lower()
+
+
+def tokenize(text: Optional[str], index: bool = False) -> List[str]:
+    """텍스트 -> n-gram 토큰 목록 (중복 포함). index=True면 2글자 이상 단어의 unigram도 포함"""
+    if not text:
+        return []
+    tokens = []
+    for word in WORD_PATTERN.findall(normalize(text)):
+        if len(word) == 1:
+            tokens.append(word)
+            continue
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        if index:
+            tokens.extend(word)
+    return tokens
+
+
+class SearchDocument(NamedTuple):
+    """검색 결과 1건의 표시 정보"""
+    doc_type: str
+    code: str
+    name_ko: str
+    character_code: Optional[str] = None  # 모듈: 소유 오퍼레이터
+
+
+def _documents(dataset: Dataset) -> Iterable[Tuple[SearchDocument, Sequence[Tuple[Optional[str], float]]]]:
+    """(문서, [(필드 텍스트, 가중치)])"""
+    for char in dataset.character_order:
+        yield SearchDocument("operator", char.code, char.name_ko), (
+            (char.name_ko, NAME_WEIGHT),
+            (char.class_description, TEXT_WEIGHT),
+            (char.item_usage, TEXT_WEIGHT),
+            (char.item_desc, TEXT_WEIGHT),
+        )
+    for skill in sorted(dataset.skills.values(), key=lambda s: s.skill_code):
+        # 레벨별 설명은 수치만 다르므로 가장 높은 레벨 1개만 사용
+        description = skill.levels[-1].description if skill.levels else None
+        yield SearchDocument("skill", skill.skill_code, skill.name_ko), (
+            (skill.name_ko, NAME_WEIGHT),
+            (description, TEXT_WEIGHT),
+        )
+    for char in dataset.character_order:
+        for module in char.modules:
+            yield SearchDocument("module", module.module_code, module.name_ko, char.code), (
+                (module.name_ko, NAME_WEIGHT),
+                (module.description, STORY_WEIGHT),
+            )
+    for item in dataset.item_order:
+        yield SearchDocument("item", item.item_code, item.name_ko), (
+            (item.name_ko, NAME_WEIGHT),
+            (item.description, TEXT_WEIGHT),
+            (item.usage_text, TEXT_WEIGHT),
+        )
+
+
+class SearchIndex:
+    __slots__ = ("version", "documents", "doc_types", "lengths", "terms", "offsets", "docs", "freqs", "idf")
+
+    def __init__(self, dataset: Dataset):
+        self.version = dataset.version
+        documents: List[SearchDocument] = []
+        postings: Dict[str, Dict[int, float]] = {}
+        lengths: List[float] = []
+        for doc, fields in _documents(dataset):
+            doc_id = len(documents)
+            documents.append(doc)
+            length = 0.0
+            for text, weight in fields:
+                tokens = tokenize(text, index=True)
+                length += weight * len(tokens)
+                for token in tokens:
+                    entry = postings.setdefault(token, {})
+                    entry[doc_id] = entry.get(doc_id, 0.0) + weight
+            lengths.append(length)
+
+        self.documents: Tuple[SearchDocument, ...] = tuple(documents)
+        self.doc_types = np.array([DOC_TYPES.index(doc.doc_type) for doc in documents], dtype=np.int8)
+        n = len(documents)
+        average = (sum(lengths) / n) if n else 1.0
+        # BM25 분모의 문서 길이 항을 미리 계산: K1 * (1 - B + B * len / avg)
+        self.lengths = (K1 * (1 - B + B * np.array(lengths, dtype=np.float64) / (average or 1.0))).astype(np.float32)
+
+        self.terms: Dict[str, int] = {}
+        offsets = [0]
+        docs: List[int] = []
+        freqs: List[float] = []
+        df = []
+        for term_id, (term, entry) in enumerate(sorted(postings.items())):
+            self.terms[term] = term_id
+            for doc_id in sorted(entry):
+                docs.append(doc_id)
+                freqs.append(entry[doc_id])
+            offsets.append(len(docs))
+            df.append(len(entry))
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.docs = np.array(docs, dtype=np.int32)
+        self.freqs = np.array(freqs, dtype=np.float32)
+        df = np.array(df, dtype=np.float64)
+        self.idf = np.log(1.0 + (n - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+        for array in (self.doc_types, self.lengths, self.offsets, self.docs, self.freqs, self.idf):
+            array.setflags(write=False)
+
+    def scores(self, query: str) -> np.ndarray:
+        """질의 -> 문서별 BM25 점수 [N] (질의 토큰 중복은 1회만 반영)"""
+        total = np.zeros(len(self.documents), dtype=np.float32)
+        for token in dict.fromkeys(tokenize(query)):
+            term_id = self.terms.get(token)
+            if term_id is None:
+                continue
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            docs = self.docs[start:end]
+            freqs = self.freqs[start:end]
+            contribution = self.idf[term_id] * freqs * (K1 + 1) / (freqs + self.lengths[docs])
+            total += np.bincount(docs, weights=contribution, minlength=len(self.documents)).astype(np.float32)
+        return total
+
+    def search(
+        self,
+        query: str,
+        types: Optional[Sequence[str]] = None,
+        limit: int = 20
+    ) -> Tuple[Dict[str, int], List[Tuple[SearchDocument, float]]]:
+        """질의 -> (종류별 일치 문서 수, 점수 높은 순 상위 limit개)"""
+        scores = self.scores(query)
+        matched = scores > 0
+        counts = {
+            doc_type: int(np.count_nonzero(matched & (self.doc_types == code)))
+            for code, doc_type in enumerate(DOC_TYPES)
+        }
+        if types:
+            matched &= np.isin(self.doc_types, [DOC_TYPES.index(doc_type) for doc_type in types])
+
+        candidates = np.flatnonzero(matched)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        # 점수 높은 순, 동점은 문서 번호(종류 -> 코드) 순
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return counts, [(self.documents[doc_id], float(scores[doc_id])) for doc_id in candidates.tolist()]
+
+
+@register_index("search")
+def build_search_index(dataset: Dataset) -> SearchIndex:
+    return SearchIndex(dataset)
+
+
+def get_search_index(dataset: Dataset) -> SearchIndex:
+    return dataset.index("search")
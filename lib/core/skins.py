@@ -0,0 +1,98 @@
+# lib/core/skins.py
+"""
+스킨 갤러리 색인 (스냅샷 버전마다 1회 생성, DATASET_MODE=memory 목록 조회용)
+- 모든 스킨을 skin_id 순으로 펼치고 오퍼레이터 / 스킨 그룹(series_name)별 목록을 미리 나눠 둡니다.
+- 커서(마지막 skin_id) 이후 위치는 skin_id 배열 이진 탐색(bisect) 1회로 찾습니다.
+- 그룹 목록은 skin_groups 전체(스킨이 없는 그룹 포함)를 DB 경로와 같은 ID / 이름 순으로 제공합니다.
+- 스킨 상세 텍스트(character_skin_details)는 스냅샷에 없으며 상세 조회 때만 DB에서 읽습니다.
+"""
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from lib.core.dataset import Dataset, register_index
+
+
+class SkinEntry(NamedTuple):
+    """갤러리 목록 1행 (SkinRepository의 컬럼 조회 결과와 같은 속성명)"""
+    skin_id: int
+    skin_code: str
+    character_id: int
+    character_code: str
+    name_ko: Optional[str]
+    series_name: Optional[str]
+    illustrator: Optional[str]
+    portrait_id: Optional[str]
+    avatar_id: Optional[str]
+
+
+class SkinPageList(NamedTuple):
+    entries: Tuple[SkinEntry, ...]
+    ids: Tuple[int, ...]  # entries의 skin_id (오름차순, bisect용)
+
+
+def _page_list(entries: List[SkinEntry]) -> SkinPageList:
+    entries = sorted(entries, key=lambda entry: entry.skin_id)
+    return SkinPageList(tuple(entries), tuple(entry.skin_id for entry in entries))
+
+
+class SkinIndex:
+    __slots__ = ("version", "all", "by_character", "by_group", "group_counts")
+
+    def __init__(self, dataset: Dataset):
+        self.version = dataset.version
+        entries = [
+            SkinEntry(
+                skin.skin_id, skin.skin_code, char.character_id, char.code, skin.name_ko,
+                skin.series_name, skin.illustrator, skin.portrait_id, skin.avatar_id
+            )
+            for char in dataset.character_order for skin in char.skins
+        ]
+        by_character: Dict[str, List[SkinEntry]] = {}
+        by_group: Dict[str, List[SkinEntry]] = {}
+        for entry in entries:
+            by_character.setdefault(entry.character_code, []).append(entry)
+            if entry.series_name:
+                by_group.setdefault(entry.series_name, []).append(entry)
+
+        self.all = _page_list(entries)
+        self.by_character = {code: _page_list(group) for code, group in by_character.items()}
+        self.by_group = {name: _page_list(group) for name, group in sorted(by_group.items())}
+        # SkinRepository.get_groups와 같이 skin_groups 기준 (series_name이 그룹에 없는 스킨은 집계 제외)
+        self.group_counts: Tuple[Tuple[int, str, int], ...] = tuple(
+            (group.skin_group_id, group.name_ko, len(by_group.get(group.name_ko, ())))
+            for group in dataset.skin_groups
+        )
+
+    def page(
+        self,
+        character_code: Optional[str] = None,
+        group: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 50
+    ) -> List[SkinEntry]:
+        """조건에 맞는 스킨 중 skin_id > cursor인 것을 limit개"""
+        if character_code is not None:
+            pages = self.by_character.get(character_code)
+            if pages is not None and group is not None:
+                pages = _page_list([entry for entry in pages.entries if entry.series_name == group])
+        elif group is not None:
+            pages = self.by_group.get(group)
+        else:
+            pages = self.all
+        if pages is None:
+            return []
+        start = bisect_right(pages.ids, cursor) if cursor is not None else 0
+        return list(pages.entries[start:start + limit])
+
+    def groups(self) -> List[Tuple[int, str, int]]:
+        """(스킨 그룹 ID, 이름, 스킨 수) 이름 순"""
+        return list(self.group_counts)
+
+
+@register_index("skins")
+def build_skin_index(dataset: Dataset) -> SkinIndex:
+    return SkinIndex(dataset)
+
+
+def get_skin_index(dataset: Dataset) -> SkinIndex:
+    return dataset.index("skins")
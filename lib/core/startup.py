@@ -0,0 +1,172 @@
+# lib/core/startup.py
+"""
+기동 시간 설정 + 프로파일러
+- LAZY_ROUTERS=1      : lib.main import 시 라우터(엔드포인트/서비스/리포지토리/스키마)를 불러오지 않고,
+                        기동 직후 백그라운드에서 등록합니다. 그 전까지 /health는 바로 응답하고 /api/v1/*는 503.
+- DEFER_SCHEMA_BUILD=1: 응답 스키마(BaseSchema)의 pydantic 코어 스키마 생성을 첫 사용 시점으로 미룹니다.
+- OPENAPI_MODE        : lazy(기본, 첫 /openapi.json 요청 시 생성) / warm(라우터 등록 후 백그라운드 생성) / off(문서 비활성화)
+
+프로파일러 실행:
+    python -m lib.core.startup --top 25 --json reports/startup.json
+    -> 모듈별 import 시간(-X importtime), 스키마별 빌드 시간, OpenAPI 생성 시간
+"""
+import argparse
+import importlib
+import inspect
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+LAZY_ROUTERS = os.getenv("LAZY_ROUTERS", "0") == "1"
+DEFER_SCHEMA_BUILD = os.getenv("DEFER_SCHEMA_BUILD", "0") == "1"
+OPENAPI_MODE = os.getenv("OPENAPI_MODE", "lazy")
+
+# 프로파일 대상 스키마 모듈
+SCHEMA_MODULES = (
+    "lib.schemas.common",
+    "lib.schemas.item",
+    "lib.schemas.skill",
+    "lib.schemas.module",
+    "lib.schemas.stage",
+    "lib.schemas.character",
+)
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """
+    -X importtime 출력 파싱
+    형식: 'import time: self [us] | cumulative | imported package' (들여쓰기 = import 깊이)
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append({
+            "module": name.strip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return modules
+
+
+def profile_imports(target: str = "lib.main") -> List[Dict]:
+    """새 인터프리터에서 target을 import하며 모듈별 import 시간 측정 (현재 프로세스의 import 캐시 영향 없음)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, env=os.environ.copy()
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {target} 실패:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def summarize_imports(modules: List[Dict], top: int) -> Dict:
+    """최상위 패키지별 self 시간 합계 + lib.* 모듈 누적 시간 상위 + 전체 self 시간 상위"""
+    by_package: Dict[str, float] = defaultdict(float)
+    for module in modules:
+        by_package[module["module"].split(".")[0]] += module["self_ms"]
+
+    total_ms = sum(module["self_ms"] for module in modules)
+    own = [module for module in modules if module["module"].startswith("lib.")]
+    return {
+        "total_ms": round(total_ms, 3),
+        "packages": {
+            name: round(ms, 3)
+            for name, ms in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        },
+        "lib_modules": sorted(own, key=lambda module: module["cumulative_ms"], reverse=True)[:top],
+        "slowest_self": sorted(modules, key=lambda module: module["self_ms"], reverse=True)[:top],
+    }
+
+
+def profile_schema_builds() -> List[Dict]:
+    """스키마 모듈 import 후 모델별 코어 스키마 재생성 시간 측정 (defer_build 효과 비교용)"""
+    from pydantic import BaseModel
+
+    timings = []
+    seen = set()
+    for module_name in SCHEMA_MODULES:
+        module = importlib.import_module(module_name)
+        for name, model in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(model, BaseModel) or model.__module__ != module_name or model in seen:
+                continue
+            seen.add(model)
+            started = time.perf_counter()
+            model.model_rebuild(force=True)
+            timings.append({"model": f"{module_name}.{name}", "build_ms": (time.perf_counter() - started) * 1000})
+    return sorted(timings, key=lambda timing: timing["build_ms"], reverse=True)
+
+
+def profile_app() -> Dict:
+    """lib.main import / 라우터 등록 / OpenAPI 생성 시간 (현재 프로세스)"""
+    started = time.perf_counter()
+    main = importlib.import_module("lib.main")
+    imported = time.perf_counter()
+    main.include_api_routers(main.app)
+    routed = time.perf_counter()
+    main.app.openapi_schema = None
+    main.app.openapi()
+    documented = time.perf_counter()
+    return {
+        "import_main_ms": (imported - started) * 1000,
+        "include_routers_ms": (routed - imported) * 1000,
+        "openapi_ms": (documented - routed) * 1000,
+    }
+
+
+def run_profile(top: int = 25) -> Dict:
+    imports = summarize_imports(profile_imports(), top)
+    schemas = profile_schema_builds()
+    app = profile_app()
+    return {
+        "settings": {
+            "lazy_routers": LAZY_ROUTERS,
+            "defer_schema_build": DEFER_SCHEMA_BUILD,
+            "openapi_mode": OPENAPI_MODE,
+        },
+        "imports": imports,
+        "schema_build_total_ms": round(sum(timing["build_ms"] for timing in schemas), 3),
+        "schema_builds": schemas[:top],
+        "app": app,
+    }
+
+
+def print_profile(report: Dict):
+    imports = report["imports"]
+    print(f"📦 import lib.main (fresh interpreter): {imports['total_ms']:.1f} ms")
+    for name, ms in imports["packages"].items():
+        print(f"   {name:<24} {ms:>9.1f} ms")
+    print("📦 lib.* modules (cumulative)")
+    for module in imports["lib_modules"]:
+        print(f"   {module['module']:<40} {module['cumulative_ms']:>9.1f} ms")
+    print(f"🧩 schema build total: {report['schema_build_total_ms']:.1f} ms")
+    for timing in report["schema_builds"]:
+        print(f"   {timing['model']:<56} {timing['build_ms']:>8.2f} ms")
+    app = report["app"]
+    print(
+        f"🚀 import main {app['import_main_ms']:.1f} ms | include routers {app['include_routers_ms']:.1f} ms "
+        f"| openapi {app['openapi_ms']:.1f} ms"
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="API 서버 기동 시간 프로파일러")
+    parser.add_argument("--top", type=int, default=25, help="항목별 상위 N개만 출력")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장할 경로")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = run_profile(args.top)
+    print_profile(report)
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📝 Startup profile written to {args.json}")
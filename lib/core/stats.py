@@ -0,0 +1,156 @@
+# lib/core/stats.py
+"""
+오퍼레이터 스탯 보간 엔진 (스냅샷 버전마다 1회 생성)
+- 정예화 단계별 attributesKeyFrames(character_stats.keyframes)를 [오퍼레이터, 단계, 키프레임, 스탯] 배열로 펼쳐 두고
+  (phase, level, trust, potential) 조회를 오퍼레이터 1명이든 전체든 같은 벡터 연산으로 계산합니다.
+    스탯 = 키프레임 선형 보간(level) + 신뢰도 보너스 x min(trust, max_favor_level) / max_favor_level + 잠재 보정 누적
+- keyframes가 없는 이전 적재분은 (레벨 1 = base_*, 최대 레벨 = max_*) 두 키프레임으로 대신하고,
+  값을 알 수 없는 스탯(공격 간격 / 재배치 시간)은 NaN -> 응답에서 null.
+"""
+import math
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lib.core.dataset import CharacterRecord, Dataset, register_index
+
+# 응답 / 키프레임 / 잠재 보정에서 같은 이름 사용
+ATTRIBUTES = (
+    "max_hp", "atk", "def", "magic_resistance", "cost", "block_cnt",
+    "attack_speed", "base_attack_time", "respawn_time",
+)
+COLUMNS = {name: index for index, name in enumerate(ATTRIBUTES)}
+# 정수로 반올림해 응답하는 스탯 (나머지는 소수)
+INTEGER_ATTRIBUTES = ("max_hp", "atk", "def", "cost", "block_cnt", "attack_speed")
+INTEGER_MASK = np.array([name in INTEGER_ATTRIBUTES for name in ATTRIBUTES])
+
+PHASES = 3
+MAX_POTENTIAL = 6
+DEFAULT_MAX_FAVOR = 100
+
+
+class StatQuery(NamedTuple):
+    phase: int
+    level: Optional[int] = None  # None = 해당 단계 최대 레벨
+    trust: int = 0               # 신뢰도(%) 0~200, 보너스는 max_favor_level에서 멈춤
+    potential: int = 1           # 잠재 1~6
+
+
+def _stat_keyframes(stat) -> List[dict]:
+    if stat.keyframes:
+        return list(stat.keyframes)
+    constant = {
+        "magic_resistance": stat.magic_resistance, "cost": stat.cost,
+        "block_cnt": stat.block_cnt, "attack_speed": stat.attack_speed,
+    }
+    return [
+        {"level": 1, "max_hp": stat.base_hp, "atk": stat.base_atk, "def": stat.base_def, **constant},
+        {"level": stat.max_level, "max_hp": stat.max_hp, "atk": stat.max_atk, "def": stat.max_def, **constant},
+    ]
+
+
+class StatIndex:
+    __slots__ = ("version", "codes", "rows", "rarities", "levels", "values", "max_levels", "favor", "favor_max", "potentials")
+
+    def __init__(self, dataset: Dataset):
+        self.version = dataset.version
+        chars: Tuple[CharacterRecord, ...] = dataset.character_order
+        self.codes = tuple(char.code for char in chars)
+        self.rows: Dict[str, int] = {code: row for row, code in enumerate(self.codes)}
+        self.rarities = np.array([char.rarity for char in chars], dtype=np.int8)
+
+        frames = {
+            (row, stat.phase): _stat_keyframes(stat)
+            for row, char in enumerate(chars) for stat in char.stats if 0 <= stat.phase < PHASES
+        }
+        width = max([len(kf) for kf in frames.values()] + [2])
+        n, a = len(chars), len(ATTRIBUTES)
+
+        # 키프레임이 width보다 적으면 마지막 키프레임을 반복 (구간 길이 0 -> 보간 비율 0)
+        self.levels = np.zeros((n, PHASES, width), dtype=np.float64)
+        self.values = np.full((n, PHASES, width, a), np.nan, dtype=np.float64)
+        self.max_levels = np.zeros((n, PHASES), dtype=np.int32)  # 0 = 해당 정예화 단계 없음
+        for (row, phase), keyframes in frames.items():
+            keyframes = sorted(keyframes, key=lambda kf: kf["level"])
+            for slot in range(width):
+                kf = keyframes[min(slot, len(keyframes) - 1)]
+                self.levels[row, phase, slot] = kf["level"]
+                for name, value in kf.items():
+                    if name in COLUMNS and value is not None:
+                        self.values[row, phase, slot, COLUMNS[name]] = value
+        for row, char in enumerate(chars):
+            for stat in char.stats:
+                if 0 <= stat.phase < PHASES:
+                    self.max_levels[row, stat.phase] = stat.max_level
+
+        # 신뢰도 보너스 (최대치 기준) / 잠재 보정 (잠재 p까지 누적, p-1 인덱스)
+        self.favor = np.zeros((n, a), dtype=np.float64)
+        self.favor_max = np.full(n, DEFAULT_MAX_FAVOR, dtype=np.float64)
+        self.potentials = np.zeros((n, MAX_POTENTIAL, a), dtype=np.float64)
+        for row, char in enumerate(chars):
+            if char.favor is not None:
+                self.favor[row, [COLUMNS["max_hp"], COLUMNS["atk"], COLUMNS["def"]]] = (
+                    char.favor.bonus_hp, char.favor.bonus_atk, char.favor.bonus_def
+                )
+                self.favor_max[row] = char.favor.max_favor_level or DEFAULT_MAX_FAVOR
+            for potential in char.potentials:
+                if 0 <= potential.potential_rank < MAX_POTENTIAL - 1:
+                    for attribute in potential.attributes:
+                        if attribute.get("attribute") in COLUMNS:
+                            # potential_rank 0(2잠) 효과는 잠재 2 이상에 모두 적용
+                            self.potentials[row, potential.potential_rank + 1:, COLUMNS[attribute["attribute"]]] += attribute["value"]
+
+        for array in (self.rarities, self.levels, self.values, self.max_levels, self.favor, self.favor_max, self.potentials):
+            array.setflags(write=False)
+
+    def compute(self, rows: np.ndarray, query: StatQuery) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        rows(오퍼레이터 행 번호 배열) x query -> (스탯 [m, A], 적용 레벨 [m], 유효 여부 [m])
+        - 유효하지 않음: 해당 정예화 단계가 없거나 level이 최대 레벨을 넘는 오퍼레이터
+        """
+        max_levels = self.max_levels[rows, query.phase]
+        levels = max_levels.astype(np.float64) if query.level is None else np.full(len(rows), float(query.level))
+        valid = (max_levels > 0) & (levels >= 1) & (levels <= max_levels)
+
+        frame_levels = self.levels[rows, query.phase]  # [m, K]
+        frame_values = self.values[rows, query.phase]  # [m, K, A]
+        width = frame_levels.shape[1]
+        segment = np.clip((frame_levels <= levels[:, None]).sum(axis=1) - 1, 0, width - 2)
+        lower = np.take_along_axis(frame_levels, segment[:, None], axis=1)[:, 0]
+        upper = np.take_along_axis(frame_levels, segment[:, None] + 1, axis=1)[:, 0]
+        span = upper - lower
+        ratio = np.clip(np.divide(levels - lower, span, out=np.zeros_like(span), where=span > 0), 0.0, 1.0)
+        start = np.take_along_axis(frame_values, segment[:, None, None], axis=1)[:, 0]
+        end = np.take_along_axis(frame_values, segment[:, None, None] + 1, axis=1)[:, 0]
+        stats = start + (end - start) * ratio[:, None]
+
+        favor_max = self.favor_max[rows]
+        trust = np.minimum(float(query.trust), favor_max) / favor_max
+        stats = stats + self.favor[rows] * trust[:, None]
+        stats = stats + self.potentials[rows, query.potential - 1]
+
+        stats[:, INTEGER_MASK] = np.rint(stats[:, INTEGER_MASK])
+        return stats, levels.astype(np.int32), valid
+
+    def rows_for(self, codes: Optional[Sequence[str]] = None) -> np.ndarray:
+        """코드 목록 -> 행 번호 (None이면 전체, 모르는 코드는 KeyError)"""
+        if codes is None:
+            return np.arange(len(self.codes), dtype=np.intp)
+        return np.array([self.rows[code] for code in codes], dtype=np.intp)
+
+    @staticmethod
+    def to_dict(values: np.ndarray) -> Dict[str, Optional[float]]:
+        """스탯 1행 -> {이름: 값} (NaN = 알 수 없음 -> None)"""
+        return {
+            name: None if math.isnan(value) else (int(value) if integer else round(float(value), 3))
+            for name, value, integer in zip(ATTRIBUTES, values.tolist(), INTEGER_MASK.tolist())
+        }
+
+
+@register_index("stats")
+def build_stat_index(dataset: Dataset) -> StatIndex:
+    return StatIndex(dataset)
+
+
+def get_stat_index(dataset: Dataset) -> StatIndex:
+    return dataset.index("stats")
@@ -0,0 +1,175 @@
+# lib/core/timing.py
+"""
+요청 단위 지연 시간 분해 (redis / db / orm / validate / serialize)
+- 요청마다 RequestTiming 1개를 contextvar에 두고, 서비스/리포지토리/응답 클래스가 구간별 시간을 더합니다.
+  (asyncio.gather로 갈라진 태스크와 SQLAlchemy greenlet도 같은 컨텍스트를 물려받으므로 같은 객체에 누적)
+- db_ms / db_statements는 SQLAlchemy 커서 이벤트로, orm_ms는 리포지토리 execute() 전체(쿼리 + 객체 조립)로 잽니다.
+- 구간 값은 누적 시간이므로 병렬(gather)로 겹친 구간은 합이 total보다 클 수 있습니다.
+- 요청이 끝나면 라우트 템플릿(/api/v1/characters/{code}/skills 등) 단위 히스토그램에 합산합니다.
+"""
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# "0"이면 수집/헤더 모두 끔
+REQUEST_TIMING = os.getenv("REQUEST_TIMING", "1") != "0"
+# "1"이면 /debug/timings 조회(GET) / 초기화(POST), /debug/cache/clear(POST) 라우트 등록 (운영 공개 서버에서는 켜지 않음)
+DEBUG_TIMINGS = os.getenv("DEBUG_TIMINGS", "0") == "1"
+
+# Server-Timing / 히스토그램에 쓰는 구간 이름 (출력 순서)
+PHASES = ("redis", "db", "orm", "validate", "serialize", "total")
+
+# 히스토그램 버킷 상한 (ms). 마지막 버킷은 +Inf
+BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class RequestTiming:
+    """요청 1건의 구간별 누적 시간 (ms)"""
+
+    __slots__ = ("started", "phases", "db_statements")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.db_statements = 0
+
+    def add(self, phase: str, elapsed_ms: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + elapsed_ms
+
+    def finish(self) -> Dict[str, float]:
+        """최종 측정값 (PHASES 순서, 0인 구간 제외 / total은 항상 포함)"""
+        self.phases["total"] = (time.perf_counter() - self.started) * 1000
+        return {phase: self.phases[phase] for phase in PHASES if phase in self.phases}
+
+    def server_timing(self, values: Dict[str, float]) -> str:
+        """Server-Timing 헤더 값 (예: redis;dur=0.41, db;dur=12.3;desc="3 statements", total;dur=15.2)"""
+        parts = []
+        for phase, elapsed_ms in values.items():
+            part = f"{phase};dur={elapsed_ms:.2f}"
+            if phase == "db":
+                part += f';desc="{self.db_statements} statements"'
+            parts.append(part)
+        return ", ".join(parts)
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def start_request() -> RequestTiming:
+    timing = RequestTiming()
+    _current.set(timing)
+    return timing
+
+
+def current_timing() -> Optional[RequestTiming]:
+    return _current.get()
+
+
+@contextmanager
+def span(phase: str):
+    """
+    구간 시간 측정. 요청 밖(ETL, 정적 내보내기 등)에서는 아무것도 하지 않음
+    예) with span("redis"): cached = await self.redis.get(key)
+    """
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(phase, (time.perf_counter() - started) * 1000)
+
+
+def install_db_hooks(engine: AsyncEngine):
+    """커서 실행 이벤트로 db_ms / db_statements 수집 (selectinload가 만드는 추가 쿼리까지 포함)"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            context._timing_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        timing = _current.get()
+        started = getattr(context, "_timing_started", None)
+        if timing is None or started is None:
+            return
+        timing.add("db", (time.perf_counter() - started) * 1000)
+        timing.db_statements += 1
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (분위수는 버킷 상한으로 근사)"""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value_ms: float):
+        self.counts[bisect_left(BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.sum += value_ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return BUCKETS_MS[index] if index < len(BUCKETS_MS) else float("inf")
+        return float("inf")
+
+    def to_dict(self, unit: str = "_ms") -> Dict:
+        labels = [str(bound) for bound in BUCKETS_MS] + ["+Inf"]
+        return {
+            "count": self.count,
+            "mean" + unit: round(self.sum / self.count, 3) if self.count else None,
+            "p50" + unit: self.quantile(0.50),
+            "p95" + unit: self.quantile(0.95),
+            "p99" + unit: self.quantile(0.99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class RouteStats:
+    """라우트 템플릿 -> 구간별 히스토그램 (워커 프로세스 단위)"""
+
+    def __init__(self):
+        self.routes: Dict[str, Dict[str, Histogram]] = {}
+        self.statements: Dict[str, Histogram] = {}
+
+    def observe(self, route: str, values: Dict[str, float], db_statements: int):
+        histograms = self.routes.setdefault(route, {})
+        for phase, elapsed_ms in values.items():
+            histograms.setdefault(phase, Histogram()).observe(elapsed_ms)
+        # 쿼리 수는 ms가 아니지만 같은 버킷으로 분포를 봄 (N+1 탐지용)
+        self.statements.setdefault(route, Histogram()).observe(db_statements)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        result = {}
+        for route in sorted(self.routes):
+            phases = self.routes[route]
+            result[route] = {phase: phases[phase].to_dict() for phase in PHASES if phase in phases}
+            result[route]["db_statements"] = self.statements[route].to_dict(unit="")
+        return result
+
+    def reset(self):
+        self.routes.clear()
+        self.statements.clear()
+
+
+route_stats = RouteStats()
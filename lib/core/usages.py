@@ -0,0 +1,85 @@
+# lib/core/usages.py
+"""
+아이템 -> 소비처 역색인 (스냅샷 버전마다 1회 생성)
+- 정예화 / 스킬 레벨 / 특화 / 모듈 비용 4종을 한 번 훑어 item_code별 (소비처 종류, 코드, 단계, 개수) 목록과 합계를 만듭니다.
+- 요청 경로에서는 dict 조회 1회 (비용 테이블 4개 조인 없음)
+"""
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from lib.core.dataset import Dataset, register_index
+
+# 소비처 종류 (응답 정렬 순서)
+CONSUMER_TYPES = ("promotion", "skill", "mastery", "module")
+
+
+def empty_totals() -> Dict[str, int]:
+    """종류별 합계 + "all"을 모두 0으로 채운 dict (소비처가 없는 아이템도 같은 키를 가짐)"""
+    return dict.fromkeys(CONSUMER_TYPES + ("all",), 0)
+
+
+class UsageRecord(NamedTuple):
+    consumer_type: str             # promotion / skill / mastery / module
+    consumer_code: str             # 캐릭터 코드 (promotion, skill) / 스킬 코드 (mastery) / 모듈 코드 (module)
+    name_ko: Optional[str]
+    character_code: Optional[str]  # 소비처를 보유한 캐릭터 (특화는 스킬을 가진 첫 캐릭터)
+    level: int                     # 정예화 단계 / 스킬 레벨 / 특화 단계 / 모듈 단계
+    count: int
+
+
+class ItemUsage(NamedTuple):
+    usages: Tuple[UsageRecord, ...]
+    totals: Dict[str, int]  # 종류별 합계 + "all"
+    consumers: int          # 서로 다른 소비처 수
+
+
+def build_usages(dataset: Dataset) -> Dict[str, ItemUsage]:
+    by_item: Dict[str, List[UsageRecord]] = defaultdict(list)
+    skill_owners: Dict[str, str] = {}
+
+    for char in dataset.character_order:
+        for cost in char.promotion_costs:
+            by_item[cost.item.item_code].append(
+                UsageRecord("promotion", char.code, char.name_ko, char.code, cost.level, cost.count)
+            )
+        for cost in char.skill_costs:
+            by_item[cost.item.item_code].append(
+                UsageRecord("skill", char.code, char.name_ko, char.code, cost.level, cost.count)
+            )
+        for module in char.modules:
+            for cost in module.costs:
+                by_item[cost.item.item_code].append(
+                    UsageRecord("module", module.module_code, module.name_ko, char.code, cost.level, cost.count)
+                )
+        if char.skill_slots is not None:
+            for code in (char.skill_slots.phase_0_code, char.skill_slots.phase_1_code, char.skill_slots.phase_2_code):
+                if code:
+                    skill_owners.setdefault(code, char.code)
+
+    for skill in dataset.skills.values():
+        for cost in skill.mastery_costs:
+            by_item[cost.item.item_code].append(
+                UsageRecord("mastery", skill.skill_code, skill.name_ko, skill_owners.get(skill.skill_code), cost.level, cost.count)
+            )
+
+    order = {consumer_type: index for index, consumer_type in enumerate(CONSUMER_TYPES)}
+    usages = {}
+    for item_code, records in by_item.items():
+        records.sort(key=lambda r: (order[r.consumer_type], r.consumer_code, r.level))
+        totals = empty_totals()
+        for record in records:
+            totals[record.consumer_type] += record.count
+            totals["all"] += record.count
+        usages[item_code] = ItemUsage(
+            tuple(records), totals, len({(r.consumer_type, r.consumer_code) for r in records})
+        )
+    return usages
+
+
+@register_index("usages")
+def build_usage_index(dataset: Dataset) -> Dict[str, ItemUsage]:
+    return build_usages(dataset)
+
+
+def get_usage_index(dataset: Dataset) -> Dict[str, ItemUsage]:
+    return dataset.index("usages")
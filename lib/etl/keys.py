@@ -0,0 +1,86 @@
+"""
+ETL 공용 키 해석기
+- JSON의 자연키(code) <-> DB의 Serial ID 매핑을 테이블 단위로 일괄 처리
+"""
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+from psycopg2.extras import execute_values
+
+
+class KeyResolver:
+    """
+    테이블 하나의 `자연키 -> id` 매핑 저장소
+
+    1. insert(): 신규 자연키를 한 번의 INSERT 문으로 일괄 삽입 (ON CONFLICT)
+    2. load(): 테이블 전체의 `code -> id` 맵을 한 번의 SELECT로 적재
+    행 단위 RETURNING / SELECT 폴백 없이 테이블당 2회의 쿼리로 끝납니다.
+    """
+
+    __slots__ = ("table", "key_column", "id_column", "ids")
+
+    def __init__(self, table: str, key_column: str, id_column: str):
+        self.table = table
+        self.key_column = key_column
+        self.id_column = id_column
+        self.ids: Dict[str, int] = {}
+
+    def insert(
+        self,
+        cur,
+        rows: Iterable[Sequence],
+        columns: Optional[Sequence[str]] = None,
+        update_columns: Sequence[str] = ()
+    ) -> int:
+        """
+        rows의 첫 번째 값은 반드시 자연키(key_column)여야 합니다.
+        - update_columns가 없으면 DO NOTHING, 있으면 해당 컬럼만 DO UPDATE
+        """
+        # 같은 문장 안에서 같은 키가 두 번 나오면 DO UPDATE가 실패하므로 키 기준 중복 제거
+        unique_rows = list({row[0]: tuple(row) for row in rows}.values())
+        if not unique_rows:
+            return 0
+
+        columns = columns or (self.key_column,)
+        if update_columns:
+            conflict = "DO UPDATE SET " + ", ".join(f"{c} = EXCLUDED.{c}" for c in update_columns)
+        else:
+            conflict = "DO NOTHING"
+
+        query = (
+            f"INSERT INTO {self.table} ({', '.join(columns)}) VALUES %s "
+            f"ON CONFLICT ({self.key_column}) {conflict}"
+        )
+        execute_values(cur, query, unique_rows, page_size=len(unique_rows))
+        return len(unique_rows)
+
+    def load(self, cur) -> "KeyResolver":
+        """테이블 전체 매핑을 1회 조회로 갱신"""
+        cur.execute(f"SELECT {self.key_column}, {self.id_column} FROM {self.table}")
+        self.ids = dict(cur.fetchall())
+        return self
+
+    def resolve(
+        self,
+        cur,
+        rows: Iterable[Sequence],
+        columns: Optional[Sequence[str]] = None,
+        update_columns: Sequence[str] = ()
+    ) -> "KeyResolver":
+        """insert + load: 신규 키 생성 후 전체 매핑 확보"""
+        self.insert(cur, rows, columns, update_columns)
+        return self.load(cur)
+
+    def get(self, key, default: Optional[int] = None) -> Optional[int]:
+        return self.ids.get(key, default)
+
+    def __getitem__(self, key) -> int:
+        return self.ids[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self.ids
+
+    def __iter__(self) -> Iterator:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
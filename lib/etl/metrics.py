@@ -0,0 +1,174 @@
+"""
+ETL 실행 계측
+- 단계(stage)별: 읽은 행 / 기록한 행 / 스킵 행(사유별) / 벽시계 시간 / DB 시간 / rows/s
+- 실행 전체: 가장 느린 SQL 문장 Top-N
+- 결과는 JSON 실행 리포트로 저장해 패치일마다 적재 시간을 비교할 수 있게 합니다.
+"""
+import heapq
+import itertools
+import json
+import os
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from psycopg2.extensions import connection, cursor
+
+# 리포트에 남길 SQL 미리보기 길이
+SQL_PREVIEW_CHARS = 200
+
+
+class StageMetrics:
+    __slots__ = (
+        "name", "rows_read", "rows_written", "skipped",
+        "wall_time", "db_time", "statements", "error"
+    )
+
+    def __init__(self, name: str, rows_read: int = 0):
+        self.name = name
+        self.rows_read = rows_read
+        self.rows_written = 0
+        self.skipped: Counter = Counter()
+        self.wall_time = 0.0
+        self.db_time = 0.0
+        self.statements = 0
+        self.error: Optional[str] = None
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows_written / self.wall_time if self.wall_time else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "rows_read": self.rows_read,
+            "rows_written": self.rows_written,
+            "rows_skipped": sum(self.skipped.values()),
+            "skipped": [
+                {"table": table, "reason": reason, "count": count}
+                for (table, reason), count in sorted(self.skipped.items())
+            ],
+            "wall_time_s": round(self.wall_time, 4),
+            "db_time_s": round(self.db_time, 4),
+            "statements": self.statements,
+            "rows_per_sec": round(self.rows_per_sec, 1),
+            "error": self.error,
+        }
+
+    def summary(self) -> str:
+        return (
+            f"   - [{self.name}] read {self.rows_read} / written {self.rows_written} / "
+            f"skipped {sum(self.skipped.values())} / {self.wall_time:.2f}s "
+            f"(db {self.db_time:.2f}s, {self.statements} stmts) / {self.rows_per_sec:.0f} rows/s"
+        )
+
+
+class RunReport:
+    """ETL 1회 실행 리포트"""
+
+    def __init__(self, mode: str, top_n: int = 20):
+        self.mode = mode
+        self.top_n = top_n
+        self.started_at = datetime.now(timezone.utc)
+        self.stages: List[StageMetrics] = []
+        self.current: Optional[StageMetrics] = None
+        self._slowest: List[tuple] = []  # (seconds, seq, stage, rowcount, sql) 최소 힙
+        self._seq = itertools.count()
+
+    @contextmanager
+    def stage(self, name: str, rows_read: int = 0):
+        metrics = StageMetrics(name, rows_read)
+        self.stages.append(metrics)
+        previous, self.current = self.current, metrics
+        start = perf_counter()
+        try:
+            yield metrics
+        except Exception as e:
+            metrics.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            metrics.wall_time = perf_counter() - start
+            self.current = previous
+
+    def skip(self, table: str, reason: str, count: int = 1):
+        if self.current is not None and count:
+            self.current.skipped[(table, reason)] += count
+
+    def record_statement(self, sql, seconds: float, rowcount: int):
+        stage = self.current
+        if stage is not None:
+            stage.db_time += seconds
+            stage.statements += 1
+            if rowcount > 0 and _is_write(sql):
+                stage.rows_written += rowcount
+
+        entry = (seconds, next(self._seq), stage.name if stage else None, rowcount, sql)
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, entry)
+        elif seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def to_dict(self) -> Dict:
+        finished_at = datetime.now(timezone.utc)
+        return {
+            "mode": self.mode,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "wall_time_s": round((finished_at - self.started_at).total_seconds(), 4),
+            "totals": {
+                "rows_read": sum(s.rows_read for s in self.stages),
+                "rows_written": sum(s.rows_written for s in self.stages),
+                "rows_skipped": sum(sum(s.skipped.values()) for s in self.stages),
+                "db_time_s": round(sum(s.db_time for s in self.stages), 4),
+            },
+            "stages": [s.to_dict() for s in self.stages],
+            "slowest_statements": [
+                {"stage": stage, "seconds": round(seconds, 4), "rowcount": rowcount, "sql": _preview(sql)}
+                for seconds, _, stage, rowcount, sql in sorted(self._slowest, reverse=True)
+            ],
+        }
+
+    def write(self, path: str) -> str:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+
+
+def _sql_text(sql) -> str:
+    if isinstance(sql, bytes):
+        return sql.decode('utf-8', errors='replace')
+    return str(sql)
+
+def _is_write(sql) -> bool:
+    return _sql_text(sql).lstrip()[:6].upper() in ("INSERT", "UPDATE", "DELETE")
+
+def _preview(sql) -> str:
+    # execute_values가 만든 거대한 VALUES 목록은 앞부분만 남김
+    text = " ".join(_sql_text(sql).split())
+    return text if len(text) <= SQL_PREVIEW_CHARS else text[:SQL_PREVIEW_CHARS] + "..."
+
+
+class InstrumentedCursor(cursor):
+    """execute()마다 소요 시간 / 영향 행 수를 연결된 RunReport에 기록"""
+
+    def execute(self, query, vars=None):
+        start = perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            report = getattr(self.connection, "report", None)
+            if report is not None:
+                report.record_statement(query, perf_counter() - start, self.rowcount)
+
+
+class InstrumentedConnection(connection):
+    """psycopg2.connect(connection_factory=InstrumentedConnection) 용"""
+
+    report: Optional[RunReport] = None
+
+    def cursor(self, *args, **kwargs):
+        kwargs.setdefault("cursor_factory", InstrumentedCursor)
+        return super().cursor(*args, **kwargs)
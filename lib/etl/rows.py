@@ -0,0 +1,292 @@
+"""
+ETL 변환 결과 행 타입
+- 대상 테이블 1개당 NamedTuple 1개
+- 외래키는 DB Serial ID가 아닌 자연키(code)로 보관하고, 적재 시 KeyResolver로 일괄 해석합니다.
+"""
+import hashlib
+import json
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Type
+
+
+# ==========================================
+# 독립 마스터
+# ==========================================
+class RangeRow(NamedTuple):
+    range_id: str
+    grids: List[dict]
+
+
+class ItemRow(NamedTuple):
+    item_code: str
+    name_ko: Optional[str]
+    rarity: int
+    icon_id: Optional[str]
+    item_type: Optional[str]
+    classify_type: Optional[str]
+    usage_text: Optional[str]
+    description: Optional[str]
+    obtain_approach: Optional[str]
+
+
+class ZoneRow(NamedTuple):
+    zone_code: str
+    name_ko: str
+    zone_type: Optional[str]
+    zone_index: Optional[int]
+
+
+class ProfessionRow(NamedTuple):
+    code: str
+    name_ko: str
+
+
+class SubProfessionRow(NamedTuple):
+    code: str
+    name_ko: str
+
+
+class TagRow(NamedTuple):
+    name: str
+
+
+# ==========================================
+# 캐릭터 및 종속 테이블
+# ==========================================
+class CharacterRow(NamedTuple):
+    code: str
+    name_ko: Optional[str]
+    rarity: int
+    profession_code: Optional[str]
+    sub_profession_code: Optional[str]
+    position: Optional[str]
+    description: Optional[str]
+    nation_id: Optional[str]
+
+
+class PotentialRow(NamedTuple):
+    char_code: str
+    potential_rank: int
+    buff_type: int
+    buff_value: str
+    attributes: List[dict]  # [{"attribute": "cost", "value": -1.0}, ...] (스탯 엔진용)
+
+
+class StatRow(NamedTuple):
+    char_code: str
+    phase: int
+    max_level: int
+    range_id: Optional[str]
+    base_hp: int
+    base_atk: int
+    base_def: int
+    max_hp: int
+    max_atk: int
+    max_def: int
+    magic_resistance: int
+    cost: int
+    block_count: int
+    attack_speed: int
+    keyframes: List[dict]  # [{"level": 1, "max_hp": ..., "atk": ...}, ...] (레벨 보간용 원본 키프레임)
+
+
+class PromotionCostRow(NamedTuple):
+    char_code: str
+    target_phase: int
+    item_code: str
+    count: int
+
+
+class SkillSlotRow(NamedTuple):
+    char_code: str
+    phase_0_code: Optional[str]
+    phase_1_code: Optional[str]
+    phase_2_code: Optional[str]
+
+
+class SkillCostRow(NamedTuple):
+    char_code: str
+    level: int
+    item_code: str
+    count: int
+
+
+class TalentRow(NamedTuple):
+    char_code: str
+    talent_index: int
+    candidate_index: int
+    unlock_phase: int
+    unlock_level: int
+    required_potential: int
+    range_id: Optional[str]
+    name: str
+    description: Optional[str]
+    blackboard: List[dict]
+
+
+class CharacterTagRow(NamedTuple):
+    char_code: str
+    tag_name: str
+
+
+class FavorRow(NamedTuple):
+    char_code: str
+    max_favor_level: int
+    bonus_hp: int
+    bonus_atk: int
+    bonus_def: int
+
+
+# ==========================================
+# 스킬 / 모듈 / 스테이지 / 스킨
+# ==========================================
+class SkillRow(NamedTuple):
+    skill_code: str
+    name_ko: Optional[str]
+    icon_id: Optional[str]
+    skill_type: int
+    sp_type: int
+
+
+class SkillLevelRow(NamedTuple):
+    skill_code: str
+    level: int
+    sp_cost: int
+    initial_sp: int
+    duration: float
+    range_id: Optional[str]
+    description: Optional[str]
+    blackboard: List[dict]
+
+
+class MasteryCostRow(NamedTuple):
+    skill_code: str
+    mastery_level: int
+    item_code: str
+    count: int
+
+
+class ModuleRow(NamedTuple):
+    module_code: str
+    char_code: str
+    name_ko: Optional[str]
+    icon_id: Optional[str]
+    description: Optional[str]
+
+
+class ModuleCostRow(NamedTuple):
+    module_code: str
+    level: int
+    item_code: str
+    count: int
+
+
+class StageRow(NamedTuple):
+    stage_code: str
+    zone_code: str
+    display_code: Optional[str]
+    name_ko: Optional[str]
+    description: Optional[str]
+    ap_cost: int
+    danger_level: Optional[str]
+
+
+class SkinGroupRow(NamedTuple):
+    name_ko: str
+
+
+class SkinRow(NamedTuple):
+    skin_code: str
+    char_code: str
+    name_ko: Optional[str]
+    series_name: Optional[str]
+    illustrator: Optional[str]
+    portrait_id: Optional[str]
+    avatar_id: Optional[str]
+
+
+class SkinDetailRow(NamedTuple):
+    skin_code: str
+    group_name: Optional[str]
+    content: Optional[str]
+    dialog: Optional[str]
+    description: Optional[str]
+    usage_text: Optional[str]
+
+
+# 대상 테이블명 -> 행 타입 (적재 순서대로)
+ROW_TYPES: Dict[str, Type[NamedTuple]] = {
+    "ranges": RangeRow,
+    "items": ItemRow,
+    "zones": ZoneRow,
+    "professions": ProfessionRow,
+    "sub_professions": SubProfessionRow,
+    "tags": TagRow,
+    "characters": CharacterRow,
+    "character_potentials": PotentialRow,
+    "character_stats": StatRow,
+    "character_promotion_costs": PromotionCostRow,
+    "character_skill": SkillSlotRow,
+    "character_skill_costs": SkillCostRow,
+    "character_talents": TalentRow,
+    "character_tag": CharacterTagRow,
+    "character_favor_templates": FavorRow,
+    "skills": SkillRow,
+    "skill_levels": SkillLevelRow,
+    "skill_mastery_costs": MasteryCostRow,
+    "character_modules": ModuleRow,
+    "character_module_costs": ModuleCostRow,
+    "stages": StageRow,
+    "skin_groups": SkinGroupRow,
+    "character_skins": SkinRow,
+    "character_skin_details": SkinDetailRow,
+}
+
+
+class RowBatches:
+    """
+    테이블별 행 묶음 + 스킵 사유 집계
+    - 변환(transform) 단계의 유일한 산출물이며, 스냅샷/DB 적재의 공통 입력입니다.
+    """
+
+    __slots__ = ("tables", "skipped")
+
+    def __init__(self):
+        self.tables: Dict[str, List[Any]] = defaultdict(list)
+        self.skipped: Counter = Counter()
+
+    def add(self, table: str, row: Any):
+        self.tables[table].append(row)
+
+    def extend(self, table: str, rows: Iterable[Any]):
+        self.tables[table].extend(rows)
+
+    def skip(self, table: str, reason: str, count: int = 1):
+        self.skipped[(table, reason)] += count
+
+    def merge(self, other: "RowBatches") -> "RowBatches":
+        for table, rows in other.tables.items():
+            self.tables[table].extend(rows)
+        self.skipped.update(other.skipped)
+        return self
+
+    def __getitem__(self, table: str) -> List[Any]:
+        return self.tables.get(table, [])
+
+    def __contains__(self, table: str) -> bool:
+        return table in self.tables
+
+    def counts(self) -> Dict[str, int]:
+        return {table: len(rows) for table, rows in self.tables.items()}
+
+    def fingerprint(self) -> str:
+        """
+        데이터셋 버전 (전체 행 내용의 sha256 앞 16자리)
+        - 같은 원본이면 항상 같은 값이므로 API 서버가 재적재 여부 판단 / 캐시 키로 사용합니다.
+        """
+        digest = hashlib.sha256()
+        for table in ROW_TYPES:
+            digest.update(table.encode())
+            for row in self[table]:
+                digest.update(json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode())
+        return digest.hexdigest()[:16]
@@ -0,0 +1,64 @@
+"""
+skin_table.json 변환 (DB 비의존)
+- skin_groups / character_skins / character_skin_details 세 테이블용 행을 한 번의 순회로 추출
+- 외래키는 자연키(char_code, skin_code, group_name)로 남겨두고 적재 시점에 일괄 해석합니다.
+
+오프라인 실행:
+    python -m lib.etl.skins data/skin_table.json
+"""
+import json
+import sys
+from typing import Dict, List, Tuple
+
+from lib.etl.rows import SkinDetailRow, SkinRow
+
+
+def extract_skins(char_skins: Dict[str, Dict]) -> Tuple[List[str], List[SkinRow], List[SkinDetailRow]]:
+    """charSkins -> (스킨 그룹 이름 목록, 스킨 행, 스킨 상세 행)"""
+    groups = set()
+    skins: List[SkinRow] = []
+    details: List[SkinDetailRow] = []
+
+    for skin_code, skin_data in char_skins.items():
+        char_code = skin_data.get('charId')
+        if not char_code:
+            continue
+
+        display_skin = skin_data.get('displaySkin') or {}
+        group_name = display_skin.get('skinGroupName')
+        if group_name:
+            groups.add(group_name)
+
+        # drawerList에서 첫 번째 일러스트레이터 가져오기
+        drawer_list = display_skin.get('drawerList') or []
+
+        skins.append(SkinRow(
+            skin_code,
+            char_code,
+            display_skin.get('skinName'),
+            group_name,
+            drawer_list[0] if drawer_list else None,
+            skin_data.get('portraitId'),
+            skin_data.get('avatarId')
+        ))
+        details.append(SkinDetailRow(
+            skin_code,
+            group_name,
+            display_skin.get('content'),
+            display_skin.get('dialog'),
+            display_skin.get('description'),
+            display_skin.get('usage')
+        ))
+
+    return sorted(groups), skins, details
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "data/skin_table.json"
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    groups, skins, details = extract_skins(data.get('charSkins', {}))
+    print(f"skin_groups: {len(groups)}")
+    print(f"character_skins: {len(skins)}")
+    print(f"character_skin_details: {len(details)}")
@@ -0,0 +1,119 @@
+"""
+변환 결과 로컬 스냅샷
+- 테이블당 파일 1개 (NDJSON 기본, pyarrow가 설치되어 있으면 Parquet 선택 가능)
+- manifest.json에 테이블별 행 수 / 해시 / 스킵 사유를 기록해 실행 간 비교(diff)가 가능합니다.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Dict
+
+from lib.etl.rows import ROW_TYPES, RowBatches
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성
+    pa = None
+    pq = None
+
+MANIFEST_FILE = "manifest.json"
+
+
+def resolve_format(fmt: str) -> str:
+    """'auto' -> pyarrow 설치 여부에 따라 parquet / ndjson"""
+    if fmt == "auto":
+        return "parquet" if pa is not None else "ndjson"
+    if fmt == "parquet" and pa is None:
+        raise RuntimeError("Parquet 스냅샷에는 pyarrow가 필요합니다. (pip install pyarrow)")
+    return fmt
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_ndjson(path: str, rows):
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row._asdict(), ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+
+
+def _write_parquet(path: str, table: str, rows):
+    # blackboard / grids 같은 비정형 중첩 값은 JSON 문자열 컬럼으로 저장
+    columns = {field: [] for field in ROW_TYPES[table]._fields}
+    for row in rows:
+        for field, value in zip(row._fields, row):
+            if isinstance(value, (list, dict)):
+                value = json.dumps(value, ensure_ascii=False)
+            columns[field].append(value)
+    pq.write_table(pa.table(columns), path)
+
+
+def write_snapshot(batches: RowBatches, out_dir: str, fmt: str = "auto") -> Dict:
+    """RowBatches -> out_dir/<table>.<ext> + manifest.json"""
+    fmt = resolve_format(fmt)
+    os.makedirs(out_dir, exist_ok=True)
+
+    tables = {}
+    for table in ROW_TYPES:
+        if table not in batches:
+            continue
+        rows = batches[table]
+
+        file_name = f"{table}.{fmt}"
+        path = os.path.join(out_dir, file_name)
+        if fmt == "parquet":
+            _write_parquet(path, table, rows)
+        else:
+            _write_ndjson(path, rows)
+
+        tables[table] = {"file": file_name, "rows": len(rows), "sha256": _file_sha256(path)}
+
+    manifest = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "format": fmt,
+        "dataset_version": batches.fingerprint(),
+        "tables": tables,
+        "skipped": [
+            {"table": table, "reason": reason, "count": count}
+            for (table, reason), count in sorted(batches.skipped.items())
+        ],
+    }
+    with open(os.path.join(out_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def read_snapshot(snapshot_dir: str) -> RowBatches:
+    """write_snapshot()으로 만든 디렉터리 -> RowBatches (행 타입 복원)"""
+    with open(os.path.join(snapshot_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    batches = RowBatches()
+    for table, meta in manifest["tables"].items():
+        row_type = ROW_TYPES[table]
+        path = os.path.join(snapshot_dir, meta["file"])
+
+        if manifest["format"] == "parquet":
+            if pq is None:
+                raise RuntimeError("Parquet 스냅샷을 읽으려면 pyarrow가 필요합니다.")
+            json_fields = {"grids", "blackboard", "keyframes", "attributes"}
+            for record in pq.read_table(path).to_pylist():
+                for field in json_fields & record.keys():
+                    if record[field] is not None:
+                        record[field] = json.loads(record[field])
+                batches.add(table, row_type(**record))
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                batches.extend(table, (row_type(**json.loads(line)) for line in f if line.strip()))
+
+    for entry in manifest.get("skipped", []):
+        batches.skip(entry["table"], entry["reason"], entry["count"])
+    return batches
@@ -0,0 +1,399 @@
+"""
+ETL 변환 단계 (순수 함수, DB 비의존)
+- 원본 게임 데이터(JSON dict) -> 대상 테이블별 행 묶음(RowBatches)
+- cur.execute 없이 동작하므로 오프라인 실행 / 프로파일링 / 스냅샷 비교가 가능합니다.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from lib.etl.rows import (
+    CharacterRow, CharacterTagRow, FavorRow, ItemRow, MasteryCostRow,
+    ModuleCostRow, ModuleRow, PotentialRow, ProfessionRow, PromotionCostRow,
+    RangeRow, RowBatches, SkillCostRow, SkillLevelRow, SkillRow, SkillSlotRow,
+    SkinGroupRow, StageRow, StatRow, SubProfessionRow, TagRow, TalentRow, ZoneRow
+)
+from lib.etl.skins import extract_skins
+
+# 이보다 작은 조각은 프로세스 생성/직렬화 비용이 더 커서 병렬화하지 않음
+MIN_SHARD_SIZE = 64
+
+# attributesKeyFrames의 data 키 -> 저장 키 (lib.core.stats.ATTRIBUTES와 같은 이름)
+KEYFRAME_ATTRIBUTES = {
+    "maxHp": "max_hp",
+    "atk": "atk",
+    "def": "def",
+    "magicResistance": "magic_resistance",
+    "cost": "cost",
+    "blockCnt": "block_cnt",
+    "attackSpeed": "attack_speed",
+    "baseAttackTime": "base_attack_time",
+    "respawnTime": "respawn_time",
+}
+
+# 잠재 강화 attributeModifiers의 attributeType (문자열 / 구버전 정수 enum) -> 저장 키
+POTENTIAL_ATTRIBUTES = {
+    "MAX_HP": "max_hp",
+    "ATK": "atk",
+    "DEF": "def",
+    "MAGIC_RESISTANCE": "magic_resistance",
+    "COST": "cost",
+    "BLOCK_CNT": "block_cnt",
+    "ATTACK_SPEED": "attack_speed",
+    "BASE_ATTACK_TIME": "base_attack_time",
+    "RESPAWN_TIME": "respawn_time",
+    0: "max_hp", 1: "atk", 2: "def", 3: "magic_resistance", 4: "cost", 5: "block_cnt", 7: "attack_speed",
+}
+
+
+# ==========================================
+# 1. 파싱 헬퍼
+# ==========================================
+def parse_phase(phase_val):
+    """PHASE_1 같은 문자열을 정수 1로 변환"""
+    if phase_val is None:
+        return 0
+    if isinstance(phase_val, int):
+        return phase_val
+    if isinstance(phase_val, str):
+        if phase_val.startswith("PHASE_"):
+            try:
+                return int(phase_val.split('_')[1])
+            except:
+                return 0
+        elif phase_val.isdigit():
+            return int(phase_val)
+    return 0
+
+def parse_rarity(rarity_value):
+    """JSON의 rarity 값이 정수일 수도 있고, 'TIER_5' 같은 문자열일 수도 있음을 처리"""
+    if rarity_value is None:
+        return 0
+    if isinstance(rarity_value, int):
+        return rarity_value
+    if isinstance(rarity_value, str):
+        if rarity_value.startswith("TIER_"):
+            try:
+                return int(rarity_value.split('_')[1]) - 1
+            except:
+                return 0
+        elif rarity_value.isdigit():
+            return int(rarity_value)
+    return 0
+
+def parse_skill_type(val):
+    """스킬 타입 파싱"""
+    if isinstance(val, int):
+        return val
+    if val == "PASSIVE":
+        return 0
+    if val == "MANUAL":
+        return 1
+    if val == "AUTO":
+        return 2
+    return 0
+
+def parse_sp_type(val):
+    """SP 타입 파싱"""
+    if isinstance(val, int):
+        return val
+    if val == "INCREASE_WITH_TIME":
+        return 1
+    if val == "INCREASE_WHEN_ATTACK":
+        return 2
+    if val == "INCREASE_WHEN_TAKEN_DAMAGE":
+        return 4
+    return 8
+
+def flatten_costs(costs) -> List[Tuple[str, int]]:
+    """[{id, count, type}, ...] -> [(item_code, count), ...]"""
+    return [(cost['id'], cost['count']) for cost in costs or [] if cost and cost.get('id')]
+
+def extract_keyframe_stats(phase: Dict) -> Tuple[Dict, Dict]:
+    """phase의 attributesKeyFrames에서 (레벨 1, 최대 레벨) 스탯 데이터 추출"""
+    keyframes = phase.get('attributesKeyFrames') or []
+    if not keyframes:
+        return {}, {}
+    return keyframes[0].get('data', {}), keyframes[-1].get('data', {})
+
+def extract_keyframes(phase: Dict) -> List[Dict]:
+    """phase의 attributesKeyFrames 전체 -> [{"level": 1, "max_hp": ..., ...}, ...] (보간 대상 스탯만)"""
+    frames = []
+    for frame in phase.get('attributesKeyFrames') or []:
+        data = frame.get('data') or {}
+        values = {name: data[key] for key, name in KEYFRAME_ATTRIBUTES.items() if data.get(key) is not None}
+        frames.append({"level": frame.get('level', 1), **values})
+    return frames
+
+def extract_potential_attributes(pot: Dict) -> List[Dict]:
+    """잠재 강화 1단계의 스탯 보정 -> [{"attribute": "cost", "value": -1.0}, ...] (알 수 없는 스탯은 제외)"""
+    attributes = ((pot.get('buff') or {}).get('attributes') or {}).get('attributeModifiers') or []
+    return [
+        {"attribute": POTENTIAL_ATTRIBUTES[mod.get('attributeType')], "value": float(mod.get('value', 0))}
+        for mod in attributes
+        if mod and mod.get('attributeType') in POTENTIAL_ATTRIBUTES
+    ]
+
+
+# ==========================================
+# 2. 테이블별 변환 함수
+# ==========================================
+def transform_ranges(data: Dict, out: RowBatches):
+    for range_id, info in data.items():
+        out.add("ranges", RangeRow(range_id, info.get('grids', [])))
+
+def transform_items(data: Dict, out: RowBatches):
+    for item_code, info in data.get("items", {}).items():
+        if info.get('isDeleted', False):
+            out.skip("items", "deleted")
+            continue
+
+        out.add("items", ItemRow(
+            item_code,
+            info.get('name'),
+            parse_rarity(info.get('rarity')),
+            info.get('iconId'),
+            info.get('itemType'),
+            info.get('classifyType'),
+            info.get('usage'),
+            info.get('description'),
+            info.get('obtainApproach')
+        ))
+
+def transform_zones(data: Dict, out: RowBatches):
+    for zone_code, info in data.get("zones", {}).items():
+        name_ko = info.get('zoneNameSecond') or info.get('zoneNameFirst') or zone_code
+        out.add("zones", ZoneRow(zone_code, name_ko, info.get('type'), info.get('zoneIndex')))
+
+def transform_character(char_code: str, info: Dict, out: RowBatches):
+    """캐릭터 1명 -> characters 및 모든 종속 테이블 행"""
+    # 1. Character
+    out.add("characters", CharacterRow(
+        char_code, info.get('name'), parse_rarity(info.get('rarity')),
+        info.get('profession'), info.get('subProfessionId'),
+        info.get('position'), info.get('itemDesc'), info.get('nationId')
+    ))
+
+    # 2. Potential
+    for idx, pot in enumerate(info.get('potentialRanks') or []):
+        if pot.get('type') == 0:
+            out.add("character_potentials", PotentialRow(
+                char_code, idx, pot.get('type', 0), pot.get('description', ''), extract_potential_attributes(pot)
+            ))
+
+    # 3. Stats & Promotion Costs
+    for idx, phase in enumerate(info.get('phases') or []):
+        base_data, attr = extract_keyframe_stats(phase)
+        if not attr:
+            continue
+
+        out.add("character_stats", StatRow(
+            char_code, idx, phase.get('maxLevel', 0), phase.get('rangeId'),
+            int(base_data.get('maxHp', 0)), int(base_data.get('atk', 0)), int(base_data.get('def', 0)),
+            int(attr.get('maxHp', 0)), int(attr.get('atk', 0)), int(attr.get('def', 0)),
+            int(attr.get('magicResistance', 0)), int(attr.get('cost', 0)),
+            int(attr.get('blockCnt', 0)), int(attr.get('attackSpeed', 0)),
+            extract_keyframes(phase)
+        ))
+
+        for item_code, count in flatten_costs(phase.get('evolveCost')):
+            out.add("character_promotion_costs", PromotionCostRow(char_code, idx, item_code, count))
+
+    # 4. Skill Codes
+    safe_skills = [s for s in info.get('skills') or [] if isinstance(s, dict)]
+    s_codes = [None, None, None]
+    for i in range(min(len(safe_skills), 3)):
+        s_codes[i] = safe_skills[i].get('skillId')
+    out.add("character_skill", SkillSlotRow(char_code, *s_codes))
+
+    # 5. Character Skill Costs (레벨 2-7)
+    for idx, lvl_data in enumerate(info.get('allSkillLvlup') or []):
+        target_level = idx + 2  # 레벨 2부터 시작
+        for item_code, count in flatten_costs(lvl_data.get('lvlUpCost')):
+            out.add("character_skill_costs", SkillCostRow(char_code, target_level, item_code, count))
+
+    # 6. Talents
+    for t_idx, talent in enumerate(info.get('talents') or []):
+        if not talent or 'candidates' not in talent:
+            continue
+
+        for c_idx, cand in enumerate(talent.get('candidates') or []):
+            cond = cand.get('unlockCondition', {})
+            out.add("character_talents", TalentRow(
+                char_code, t_idx+1, c_idx+1, parse_phase(cond.get('phase')),
+                cond.get('level', 1), cand.get('requiredPotentialRank', 0),
+                cand.get('rangeId'), cand.get('name') or "Unknown Talent",
+                cand.get('description'), cand.get('blackboard', [])
+            ))
+
+    # 7. Tags
+    for t in info.get('tagList') or []:
+        if t:
+            out.add("character_tag", CharacterTagRow(char_code, t))
+
+    # 8. Favor
+    favor_frames = info.get('favorKeyFrames') or []
+    if favor_frames:
+        favor = favor_frames[-1].get('data', {})
+        out.add("character_favor_templates", FavorRow(
+            char_code, 100, int(favor.get('maxHp', 0)), int(favor.get('atk', 0)), int(favor.get('def', 0))
+        ))
+
+def transform_character_shard(shard: List[Tuple[str, Dict]]) -> RowBatches:
+    """
+    character_table 조각 1회 순회로 모든 캐릭터 파생 테이블 추출
+    - professions / sub_professions / tags, characters 및 종속 테이블, skill_mastery_costs
+    - 프로세스 풀 워커에서 실행되므로 모듈 최상위 함수로 둡니다.
+    """
+    out = RowBatches()
+    profs = {}
+    sub_profs = {}
+    tags = {}
+
+    for char_code, info in shard:
+        # 1. 직군 / 태그 마스터 (획득 불가 캐릭터 포함)
+        prof = info.get('profession')
+        subprof = info.get('subProfessionId')
+        if prof:
+            profs[prof] = info.get('professionName', prof)
+        if subprof:
+            sub_profs[subprof] = subprof
+        for t in info.get('tagList') or []:
+            if t:
+                tags[t] = None
+
+        # 2. 스킬 특화 비용 (레벨 8-10): Index 0/1/2 -> Mastery 1/2/3
+        for skill_entry in info.get('skills') or []:
+            skill_code = skill_entry.get('skillId') if isinstance(skill_entry, dict) else None
+            if not skill_code:
+                continue
+            for idx, cond in enumerate(skill_entry.get('levelUpCostCond') or []):
+                for item_code, count in flatten_costs(cond.get('levelUpCost')):
+                    out.add("skill_mastery_costs", MasteryCostRow(skill_code, idx + 1, item_code, count))
+
+        # 3. 캐릭터 및 종속 테이블
+        if info.get('isNotObtainable', False):
+            out.skip("characters", "not_obtainable")
+            continue
+        transform_character(char_code, info, out)
+
+    out.extend("professions", (ProfessionRow(code, name) for code, name in profs.items()))
+    out.extend("sub_professions", (SubProfessionRow(code, name) for code, name in sub_profs.items()))
+    out.extend("tags", (TagRow(t) for t in tags))
+    return out
+
+def transform_character_table(data: Dict, out: RowBatches, workers: Optional[int] = None):
+    """
+    character_table 단일 패스 변환
+    - 캐릭터 키 순서대로 연속 구간(shard)으로 나눠 프로세스 풀에서 병렬 변환
+    - shard 순서대로 병합하므로 결과는 단일 프로세스 실행과 동일합니다.
+    """
+    records = list(data.items())
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, max(1, len(records) // MIN_SHARD_SIZE))
+
+    if workers <= 1:
+        shard_results = [transform_character_shard(records)]
+    else:
+        # 워커 수보다 잘게 나눠 처리 시간이 다른 shard 간 부하를 분산
+        shard_count = workers * 4
+        shard_size = -(-len(records) // shard_count)
+        shards = [records[i:i + shard_size] for i in range(0, len(records), shard_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shard_results = list(executor.map(transform_character_shard, shards))
+
+    merged = RowBatches()
+    for result in shard_results:
+        merged.merge(result)
+
+    # shard마다 중복 수집된 마스터 행 정리 (최초 등장 순서 유지)
+    for table in ("professions", "sub_professions", "tags"):
+        merged.tables[table] = list({row[0]: row for row in merged[table]}.values())
+
+    out.merge(merged)
+
+def transform_skills(data: Dict, out: RowBatches):
+    for skill_code, info in data.items():
+        levels = info.get('levels') or [{}]
+        lvl0 = levels[0]
+
+        out.add("skills", SkillRow(
+            skill_code, lvl0.get('name'), info.get('iconId'),
+            parse_skill_type(lvl0.get('skillType', 0)),
+            parse_sp_type(lvl0.get('spData', {}).get('spType', 0))
+        ))
+
+        for idx, lvl_info in enumerate(info.get('levels') or []):
+            level_val = idx + 1
+            # Check Constraint 위반 방지: 레벨이 10을 넘으면 스킵
+            if level_val > 10:
+                out.skip("skill_levels", "level_over_10")
+                continue
+
+            sp = lvl_info.get('spData', {})
+            out.add("skill_levels", SkillLevelRow(
+                skill_code, level_val,
+                sp.get('spCost', 0), sp.get('initSp', 0),
+                # Numeric Overflow 방지: duration이 999.99를 넘으면 999.0으로 제한
+                min(float(lvl_info.get('duration', 0)), 999.0),
+                lvl_info.get('rangeId'),
+                lvl_info.get('description'),
+                lvl_info.get('blackboard', [])
+            ))
+
+def transform_modules(data: Dict, out: RowBatches):
+    for mod_code, info in data.get('equipDict', {}).items():
+        char_code = info.get('charId')
+        if not char_code:
+            out.skip("character_modules", "missing_character")
+            continue
+
+        out.add("character_modules", ModuleRow(
+            mod_code, char_code, info.get('uniEquipName'),
+            info.get('uniEquipIcon'), info.get('uniEquipDesc')
+        ))
+        for lvl_str, costs in (info.get('itemCost') or {}).items():
+            for item_code, count in flatten_costs(costs):
+                out.add("character_module_costs", ModuleCostRow(mod_code, int(lvl_str), item_code, count))
+
+def transform_stages(data: Dict, out: RowBatches):
+    for stage_code, info in data.get('stages', {}).items():
+        zone_code = info.get('zoneId')
+        if not zone_code:
+            out.skip("stages", "missing_zone")
+            continue
+        out.add("stages", StageRow(
+            stage_code, zone_code, info.get('code'),
+            info.get('name'), info.get('description'),
+            info.get('apCost', 0), info.get('dangerLevel')
+        ))
+
+def transform_skins(data: Dict, out: RowBatches):
+    groups, skins, details = extract_skins(data.get('charSkins', {}))
+    out.extend("skin_groups", (SkinGroupRow(name) for name in groups))
+    out.extend("character_skins", skins)
+    out.extend("character_skin_details", details)
+
+
+def build_transforms(workers: Optional[int] = None) -> List[Tuple[str, Callable[[Dict, RowBatches], None]]]:
+    """원본 소스 키 -> 변환 함수 (적재 순서대로)"""
+    return [
+        ("range", transform_ranges),
+        ("item", transform_items),
+        ("zone", transform_zones),
+        ("character", partial(transform_character_table, workers=workers)),
+        ("skill", transform_skills),
+        ("module", transform_modules),
+        ("map", transform_stages),
+        ("skin", transform_skins),
+    ]
+
+def transform_all(jsons: Dict[str, Dict], workers: Optional[int] = None) -> RowBatches:
+    """다운로드/로컬 원본 전체 -> 테이블별 행 묶음 (없는 소스는 건너뜀)"""
+    out = RowBatches()
+    for source, func in build_transforms(workers):
+        data = jsons.get(source)
+        if data:
+            func(data, out)
+    return out
@@ -3,27 +3,113 @@ from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
+import asyncio
+import importlib
+import time
 from fastapi.middleware.cors import CORSMiddleware
 
-from lib.core.database import init_redis_pool, close_redis_pool
-from lib.api.api import api_router
+from lib.core.database import engine, init_redis_pool, close_redis_pool
+from lib.core.dataset import DATASET_MODE, refresh_dataset, warm_current_indexes, watch_dataset, watch_version
+from lib.core.startup import LAZY_ROUTERS, OPENAPI_MODE
+from lib.api.http_cache import HTTPCacheMiddleware, clear_response_caches
+from lib.api.shared_store import SHARED_STORE_DIR, SharedResponseStore
+from lib.api.timing import RequestTimingMiddleware, TimedJSONResponse
+from lib.core.timing import DEBUG_TIMINGS, REQUEST_TIMING, install_db_hooks, route_stats
 from starlette.exceptions import HTTPException as StarletteHttpException
 
 
+API_PREFIX = "/api/v1"
+
+
+def include_api_routers(app: FastAPI):
+    """
+    엔드포인트 라우터 등록 (여러 번 호출해도 1회만 수행)
+    - 엔드포인트 -> 서비스 -> 리포지토리 -> 스키마까지 import되며 응답 모델의 pydantic 스키마가 이때 만들어짐
+    """
+    if getattr(app.state, "routers_ready", False):
+        return
+    from lib.api import deps
+    from lib.api.api import api_router
+
+    if DATASET_MODE == "memory":
+        # 인메모리 데이터셋 모드: DB는 기동/갱신 시에만 읽고, 요청은 스냅샷에서 응답
+        deps.use_memory_dataset(app)
+    app.include_router(api_router, prefix=API_PREFIX)
+    # 로딩 중 503 응답용 라우트 제거 + 라우트가 바뀌었으므로 OpenAPI 문서 재생성
+    app.router.routes = [route for route in app.router.routes if getattr(route, "endpoint", None) is not routers_loading]
+    app.openapi_schema = None
+    app.state.routers_ready = True
+
+
+async def load_api_routers(app: FastAPI):
+    """LAZY_ROUTERS 모드: 기동 직후 백그라운드에서 라우터 등록"""
+    started = time.perf_counter()
+    # import(스키마 생성 포함)는 스레드에서 수행해 그동안에도 이벤트 루프가 /health에 응답
+    await asyncio.to_thread(importlib.import_module, "lib.api.api")
+    await asyncio.to_thread(importlib.import_module, "lib.api.deps")
+    # import 중에 등록된 파생 색인(검색 / 플래너 등)은 기동 시 스냅샷 색인 생성에서 빠졌으므로,
+    # 라우트를 열기 전에 스레드에서 만들어 첫 요청이 이벤트 루프에서 색인을 만들지 않도록 함
+    index_timings = await warm_current_indexes()
+    include_api_routers(app)
+    print(
+        f"✅ API routers ready in {(time.perf_counter() - started) * 1000:.0f} ms"
+        + (f" | indexes(ms) {index_timings}" if index_timings else "")
+    )
+
+    if OPENAPI_MODE == "warm":
+        await asyncio.to_thread(app.openapi)
+
+
+async def routers_loading(path: str):
+    """라우터 등록 전 /api/v1/* 요청 -> 503 + Retry-After (로드밸런서가 재시도하도록)"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": 503,
+            "success": False,
+            "message": "서버가 시작 중입니다. 잠시 후 다시 시도해 주세요.",
+            "data": None
+        },
+        headers={"Retry-After": "1"}
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    init_redis_pool()
+    tasks = []
+    if SHARED_STORE_DIR and DATASET_MODE == "memory":
+        # 공유 스토어가 본문의 유일한 사본 -> 워커마다 전체 스냅샷을 또 만들지 않음
+        raise RuntimeError("SHARED_STORE_DIR를 쓰는 워커는 DATASET_MODE=db로 실행하세요. (스냅샷은 로더 1곳에만 둠)")
+    if DATASET_MODE == "memory":
+        await refresh_dataset(force=True)
+        tasks.append(asyncio.create_task(watch_dataset()))
+    else:
+        init_redis_pool()
+        # 응답 캐시 / 공유 스토어의 버전 비교용 (dataset_version 1행만 주기적으로 조회)
+        tasks.append(asyncio.create_task(watch_version()))
+
+    if LAZY_ROUTERS:
+        tasks.append(asyncio.create_task(load_api_routers(app)))
     yield
     # Shutdown
-    await close_redis_pool()
+    for task in tasks:
+        task.cancel()
+    if DATASET_MODE != "memory":
+        await close_redis_pool()
+
+# OPENAPI_MODE=off: 운영 배포에서 문서 생성/노출 자체를 끔
+DOCS_ENABLED = OPENAPI_MODE != "off"
 
 app = FastAPI(
     title="Game Info API",
     version="1.0.0",
     lifespan=lifespan,
-    docs_url="/docs", # Swagger UI
-    redoc_url="/redoc"
+    docs_url="/docs" if DOCS_ENABLED else None, # Swagger UI
+    redoc_url="/redoc" if DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if DOCS_ENABLED else None,
+    # JSON 인코딩 시간을 Server-Timing의 serialize 구간으로 기록
+    default_response_class=TimedJSONResponse
 )
 
 @app.exception_handler(StarletteHttpException)
@@ -64,6 +150,18 @@ async def generic_exception_handler(request: Request, exc: Exception):
     )
 
 
+# GET 응답 캐시 + ETag/304 (CORS보다 안쪽에 두어 304 응답에도 CORS 헤더가 붙도록 먼저 등록)
+# SHARED_STORE_DIR가 있으면 모든 워커가 로더가 게시한 mmap 스토어를 먼저 조회
+app.add_middleware(
+    HTTPCacheMiddleware,
+    shared=SharedResponseStore(SHARED_STORE_DIR) if SHARED_STORE_DIR else None
+)
+
+# 요청별 지연 시간 분해 (Server-Timing 헤더 + 라우트별 히스토그램). 캐시 히트까지 재도록 응답 캐시보다 바깥에 둠
+if REQUEST_TIMING:
+    install_db_hooks(engine)
+    app.add_middleware(RequestTimingMiddleware)
+
 # CORS 설정 (프론트엔드 연동 시 필수)
 app.add_middleware(
     CORSMiddleware,
@@ -73,9 +171,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 라우터 등록
-app.include_router(api_router, prefix="/api/v1")
+# 라우터 등록 (LAZY_ROUTERS=1이면 기동 후 백그라운드에서 등록하고, 그동안은 503)
+if LAZY_ROUTERS:
+    app.add_api_route(
+        API_PREFIX + "/{path:path}", routers_loading,
+        methods=["GET", "POST", "PUT", "PATCH", "DELETE"], include_in_schema=False
+    )
+else:
+    include_api_routers(app)
 
 @app.get("/health")
 async def health_check():
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok", "ready": getattr(app.state, "routers_ready", False)}
+
+# 라우트별 지연 시간 히스토그램 / 응답 캐시 비우기 (DEBUG_TIMINGS=1일 때만 노출, 문서에서 제외)
+if DEBUG_TIMINGS:
+    @app.get("/debug/timings", include_in_schema=False)
+    async def read_route_timings():
+        """라우트별 구간(redis / db / orm / validate / serialize / total) 지연 시간 히스토그램 (현재 워커 기준)"""
+        return route_stats.snapshot()
+
+    @app.post("/debug/timings/reset", include_in_schema=False)
+    async def reset_route_timings():
+        """히스토그램 초기화 (초기화 직전 값 반환)"""
+        snapshot = route_stats.snapshot()
+        route_stats.reset()
+        return snapshot
+
+    @app.post("/debug/cache/clear", include_in_schema=False)
+    async def clear_http_cache():
+        """HTTP 응답 캐시 비우기 (현재 워커 기준, 부하 테스트 시나리오 시작용)"""
+        return {"cleared": clear_response_caches()}
@@ -22,6 +22,7 @@ class Character(Base):
     name_ko: Mapped[str] = mapped_column(String(64))
     class_description: Mapped[str | None] = mapped_column(String(255))
     rarity: Mapped[int] = mapped_column(SmallInteger)
+    position: Mapped[str | None] = mapped_column(String(16)) # MELEE / RANGED (공개모집 근거리/원거리 태그)
     
     profession_id: Mapped[int | None] = mapped_column(ForeignKey("profession.profession_id"))
     sub_profession_id: Mapped[int | None] = mapped_column(ForeignKey("sub_profession.sub_profession_id"))
@@ -64,7 +65,7 @@ class Character(Base):
     skins: Mapped[List["CharacterSkin"]] = relationship(
         "CharacterSkin", 
         back_populates="character", 
-        lazy="selectin",             # Async 환경에서 비동기 로딩 최적화
+        lazy="raise",                # 목록/프로필(skin_url)에서만 selectinload로 명시 로딩
         cascade="all, delete-orphan" # 캐릭터 삭제 시 스킨 데이터도 정리
     )
 
@@ -106,6 +107,7 @@ class CharacterStat(Base):
     cost: Mapped[int] = mapped_column(SmallInteger)
     block_cnt: Mapped[int] = mapped_column(SmallInteger)
     attack_speed: Mapped[int] = mapped_column(SmallInteger)
+    keyframes: Mapped[list | None] = mapped_column(JSONB) # attributesKeyFrames 원본 (레벨 보간용)
 
     character = relationship("Character", back_populates="stats")
     range_data = relationship("Range", lazy="joined")
@@ -147,6 +149,15 @@ class CharacterFavorTemplate(Base):
 
     character = relationship("Character", back_populates="favor")
 
+class CharacterPotential(Base):
+    """잠재 강화 단계별 효과 (potential_rank 0 = 2잠)"""
+    __tablename__ = "character_potentials"
+    character_id: Mapped[int] = mapped_column(ForeignKey("characters.character_id", ondelete="CASCADE"), primary_key=True)
+    potential_rank: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    buff_type: Mapped[int] = mapped_column(SmallInteger)
+    buff_value: Mapped[str | None] = mapped_column(Text)
+    attributes: Mapped[list | None] = mapped_column(JSONB) # [{attribute, value}] 스탯 보정
+
 class CharacterPromotionCost(Base):
     __tablename__ = "character_promotion_costs"
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -213,12 +224,12 @@ class CharacterSkin(Base):
     character = relationship("Character", back_populates="skins")
     
     # 1:1 Relationship (Detail)
-    # 목록 조회 시에는 로딩하지 않도록 lazy="selectin" 또는 필요시 명시적 join을 사용합니다.
+    # 목록 조회 시에는 절대 로딩하지 않도록 lazy="raise" (상세 조회에서만 명시적 join)
     # uselist=False로 1:1 관계임을 명시
     detail: Mapped["CharacterSkinDetail"] = relationship(
         back_populates="skin", 
         uselist=False, 
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan"
     )
 
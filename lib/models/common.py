@@ -1,4 +1,4 @@
-from sqlalchemy import String, Integer, DateTime, func
+from sqlalchemy import String, Integer, SmallInteger, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from lib.core.database import Base
@@ -48,4 +48,12 @@ class Zone(Base):
         back_populates="zone",
         lazy="selectin",
         cascade="all, delete-orphan" 
-    )
\ No newline at end of file
+    )
+
+class DatasetVersion(Base):
+    """ETL이 적재를 마칠 때마다 갱신하는 데이터셋 버전 (단일 행)"""
+    __tablename__ = "dataset_version"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=1)
+    version: Mapped[str] = mapped_column(String(64))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
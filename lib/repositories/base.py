@@ -2,6 +2,7 @@ from typing import Generic, TypeVar, Type, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
 from lib.core.database import Base
+from lib.core.timing import span
 
 # 제네릭 타입 정의 (어떤 모델이든 들어올 수 있음)
 ModelType = TypeVar("ModelType", bound=Base)
@@ -11,12 +12,20 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
 
+    async def execute(self, query):
+        """
+        모든 리포지토리 쿼리의 공통 실행 경로
+        - orm 구간: 쿼리 + selectinload 후속 쿼리 + ORM 객체 조립까지 (순수 DB 시간은 커서 이벤트가 db 구간으로 따로 기록)
+        """
+        with span("orm"):
+            return await self.db.execute(query)
+
     async def get_by_id(self, id: int) -> Optional[ModelType]:
         query = select(self.model).where(self.model.id == id) # PK가 'id'라고 가정
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().first()
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
         query = select(self.model).offset(skip).limit(limit)
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().all()
\ No newline at end of file
@@ -34,7 +34,7 @@ class CharacterRepository(BaseRepository[Character]):
         query = query.order_by(Character.rarity.desc(), Character.code.asc())
         query = query.offset(skip).limit(limit)
 
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().all()
 
     # 2. 프로필 정보 (Profile Domain)
@@ -48,10 +48,11 @@ class CharacterRepository(BaseRepository[Character]):
                 # 스탯과 그에 딸린 사거리 데이터 로드
                 selectinload(Character.stats).selectinload(CharacterStat.range_data),
                 selectinload(Character.talents),
-                selectinload(Character.tags)
+                selectinload(Character.tags),
+                selectinload(Character.skins) # skin_url (스킨 상세 텍스트는 로드하지 않음)
             )
         )
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().first()
 
     # 3. 스킬 슬롯 정보 (Skill Domain - 코드만 추출하기 위함)
@@ -61,7 +62,7 @@ class CharacterRepository(BaseRepository[Character]):
             .where(Character.code == code)
             .options(selectinload(Character.skill_slots))
         )
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().first()
 
     # 4. 성장 및 재료 정보 (Growth Domain)
@@ -76,7 +77,7 @@ class CharacterRepository(BaseRepository[Character]):
                     .selectinload(CharacterSkillCost.item)
             )
         )
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().first()
 
     # 5. 모듈 및 상세 스토리 (Module Domain)
@@ -92,5 +93,5 @@ class CharacterRepository(BaseRepository[Character]):
                     .selectinload(CharacterModuleCost.item)
             )
         )
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().first()
\ No newline at end of file
@@ -12,7 +12,7 @@ class ItemRepository(BaseRepository[Item]):
     async def get_by_code(self, item_code: str) -> Optional[Item]:
         """고유 코드로 아이템 조회 (예: 'p_char_286_cast3')"""
         query = select(Item).where(Item.item_code == item_code)
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().first()
 
     async def search_by_name(self, keyword: str, limit: int = 20) -> List[Item]:
@@ -26,7 +26,7 @@ class ItemRepository(BaseRepository[Item]):
             .where(Item.name_ko.ilike(f"%{keyword}%"))
             .limit(limit)
         )
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().all()
 
     async def get_items_by_filter(
@@ -50,5 +50,5 @@ class ItemRepository(BaseRepository[Item]):
             
         stmt = stmt.offset(skip).limit(limit).order_by(Item.rarity.desc()) # 높은 등급부터
         
-        result = await self.db.execute(stmt)
+        result = await self.execute(stmt)
         return result.scalars().all()
\ No newline at end of file
@@ -0,0 +1,126 @@
+from typing import List, Optional
+
+from lib.core.dataset import (
+    Dataset, CharacterRecord, SkillRecord, ItemRecord, ZoneRecord, StageRecord
+)
+from lib.core.skins import SkinEntry, get_skin_index
+
+# DATASET_MODE=memory 용 Repository
+# - 기존 Repository와 같은 메서드 시그니처를 제공하고, DB 대신 인메모리 스냅샷(Dataset)에서 응답합니다.
+# - 반환 레코드는 ORM 객체와 같은 속성명을 가지므로 Service/Schema 코드는 그대로 사용합니다.
+
+class BaseMemoryRepository:
+    def __init__(self, dataset: Dataset):
+        self.dataset = dataset
+
+
+class MemoryCharacterRepository(BaseMemoryRepository):
+    async def get_list(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        rarity: Optional[int] = None
+    ) -> List[CharacterRecord]:
+        # 희귀도 높은 순, 코드 순으로 미리 정렬되어 있음
+        if rarity is not None:
+            chars = self.dataset.characters_by_rarity.get(rarity, ())
+        else:
+            chars = self.dataset.character_order
+        return list(chars[skip:skip + limit])
+
+    async def get_by_code(self, code: str) -> Optional[CharacterRecord]:
+        return self.dataset.characters.get(code)
+
+    # 도메인별 조회도 모두 같은 레코드 1개로 응답 (관계가 이미 채워져 있음)
+    get_profile = get_by_code
+    get_skill_slots = get_by_code
+    get_growth_info = get_by_code
+    get_module_info = get_by_code
+
+
+class MemorySkillRepository(BaseMemoryRepository):
+    async def get_by_codes(self, codes: List[str]) -> List[SkillRecord]:
+        skills = self.dataset.skills
+        return [skills[code] for code in codes if code in skills]
+
+
+class MemoryItemRepository(BaseMemoryRepository):
+    async def get_by_code(self, item_code: str) -> Optional[ItemRecord]:
+        return self.dataset.items.get(item_code)
+
+    async def search_by_name(self, keyword: str, limit: int = 20) -> List[ItemRecord]:
+        """이름 부분 일치 (대소문자 무시, DB의 ilike와 동일)"""
+        keyword = keyword.lower()
+        result = []
+        for item in self.dataset.item_order:
+            if item.name_ko and keyword in item.name_ko.lower():
+                result.append(item)
+                if len(result) >= limit:
+                    break
+        return result
+
+    async def get_items_by_filter(
+        self,
+        rarity: Optional[int] = None,
+        item_type: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 50
+    ) -> List[ItemRecord]:
+        items = [
+            item for item in self.dataset.item_order
+            if (rarity is None or item.rarity == rarity) and (not item_type or item.item_type == item_type)
+        ]
+        items.sort(key=lambda item: -item.rarity) # 높은 등급부터 (안정 정렬)
+        return items[skip:skip + limit]
+
+
+class MemoryZoneRepository(BaseMemoryRepository):
+    async def get_all_zones_with_stages(self) -> List[ZoneRecord]:
+        return list(self.dataset.zones)
+
+    async def get_all_zones(self, zone_type: Optional[str] = None) -> List[ZoneRecord]:
+        # 응답 스키마(ZoneResponse)가 stages를 읽지 않으므로 레코드를 그대로 반환
+        return [zone for zone in self.dataset.zones if not zone_type or zone.zone_type == zone_type]
+
+    async def get_by_code(self, zone_code: str) -> Optional[ZoneRecord]:
+        return next((zone for zone in self.dataset.zones if zone.zone_code == zone_code), None)
+
+
+class MemoryStageRepository(BaseMemoryRepository):
+    async def get_by_code(self, code: str) -> Optional[StageRecord]:
+        return self.dataset.stages.get(code)
+
+    async def get_stages_by_filter(
+        self,
+        zone_type: Optional[str] = None,
+        min_ap_cost: Optional[int] = None,
+        max_ap_cost: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 50
+    ) -> List[StageRecord]:
+        stages = [
+            stage
+            for zone in self.dataset.zones if not zone_type or zone.zone_type == zone_type
+            for stage in zone.stages
+            if (min_ap_cost is None or stage.ap_cost >= min_ap_cost)
+            and (max_ap_cost is None or stage.ap_cost <= max_ap_cost)
+        ]
+        return stages[skip:skip + limit]
+
+
+class MemorySkinRepository(BaseMemoryRepository):
+    """스킨 갤러리 목록 / 그룹만 제공 (상세 텍스트는 스냅샷에 없으므로 SkinRepository.get_detail이 DB에서 읽음)"""
+    async def get_page(
+        self,
+        character_code: Optional[str] = None,
+        group: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 50
+    ) -> List[SkinEntry]:
+        return get_skin_index(self.dataset).page(character_code, group, cursor, limit)
+
+    async def get_groups(self) -> List[dict]:
+        return [
+            {"skin_group_id": group_id, "name_ko": name, "skin_count": count}
+            for group_id, name, count in get_skin_index(self.dataset).groups()
+        ]
@@ -25,6 +25,6 @@ class SkillRepository(BaseRepository[Skill]):
             )
         )
         
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         # 리스트 순서를 유지하기 위해 맵핑 처리 고려 가능
         return result.scalars().all()
\ No newline at end of file
@@ -0,0 +1,80 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+
+from lib.models.character import Character, CharacterSkin, CharacterSkinDetail, SkinGroup
+from lib.repositories.base import BaseRepository
+
+# 갤러리 목록 컬럼 (ORM 엔티티 대신 컬럼만 조회 -> 관계 로딩 / 스킨 상세 텍스트 로딩이 원천적으로 없음)
+SKIN_COLUMNS = (
+    CharacterSkin.skin_id,
+    CharacterSkin.skin_code,
+    CharacterSkin.character_id,
+    Character.code.label("character_code"),
+    CharacterSkin.name_ko,
+    CharacterSkin.series_name,
+    CharacterSkin.illustrator,
+    CharacterSkin.portrait_id,
+    CharacterSkin.avatar_id,
+)
+
+class SkinRepository(BaseRepository[CharacterSkin]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(CharacterSkin, db)
+
+    async def get_page(
+        self,
+        character_code: Optional[str] = None,
+        group: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 50
+    ) -> List:
+        """
+        스킨 갤러리 목록 (skin_id 커서 페이지네이션)
+        - series_name은 ETL에서 스킨 그룹 이름(skin_groups.name_ko)과 같은 값으로 적재되므로
+          그룹 필터도 character_skins만으로 처리합니다. (character_skin_details 미접근)
+        """
+        query = select(*SKIN_COLUMNS).join(Character, Character.character_id == CharacterSkin.character_id)
+
+        if character_code is not None:
+            query = query.where(Character.code == character_code)
+        if group is not None:
+            query = query.where(CharacterSkin.series_name == group)
+        if cursor is not None:
+            query = query.where(CharacterSkin.skin_id > cursor)
+
+        query = query.order_by(CharacterSkin.skin_id).limit(limit)
+        result = await self.execute(query)
+        return result.all()
+
+    async def get_groups(self) -> List:
+        """스킨 그룹 목록 + 그룹별 스킨 수 (이름 순)"""
+        query = (
+            select(
+                SkinGroup.skin_group_id,
+                SkinGroup.name_ko,
+                func.count(CharacterSkin.skin_id).label("skin_count")
+            )
+            .outerjoin(CharacterSkin, CharacterSkin.series_name == SkinGroup.name_ko)
+            .group_by(SkinGroup.skin_group_id, SkinGroup.name_ko)
+            .order_by(SkinGroup.name_ko)
+        )
+        result = await self.execute(query)
+        return result.all()
+
+    async def get_detail(self, skin_code: str) -> Optional[object]:
+        """스킨 상세: 목록 컬럼 + 무거운 텍스트 (이 조회에서만 character_skin_details를 읽음)"""
+        query = (
+            select(
+                *SKIN_COLUMNS,
+                CharacterSkinDetail.content,
+                CharacterSkinDetail.dialog,
+                CharacterSkinDetail.description,
+                CharacterSkinDetail.usage_text
+            )
+            .join(Character, Character.character_id == CharacterSkin.character_id)
+            .outerjoin(CharacterSkinDetail, CharacterSkinDetail.skin_id == CharacterSkin.skin_id)
+            .where(CharacterSkin.skin_code == skin_code)
+        )
+        result = await self.execute(query)
+        return result.first()
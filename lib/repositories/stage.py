@@ -1,7 +1,7 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from lib.models.common import Zone
 from lib.models.stage import Stage
@@ -21,9 +21,30 @@ class ZoneRepository(BaseRepository[Zone]):
             .options(selectinload(Zone.stages)) # Zone 안의 stages 리스트 채우기
             .order_by(Zone.zone_index)
         )
-        result = await self.db.execute(query)
+        result = await self.execute(query)
         return result.scalars().all()
 
+    async def get_all_zones(self, zone_type: Optional[str] = None) -> List[Zone]:
+        """
+        Zone 목록만 조회 (스테이지 제외)
+        - Zone.stages는 기본이 selectin이므로 raiseload로 후속 쿼리를 막습니다.
+        """
+        query = select(Zone).options(raiseload(Zone.stages)).order_by(Zone.zone_index)
+        if zone_type:
+            query = query.where(Zone.zone_type == zone_type)
+        result = await self.execute(query)
+        return result.scalars().all()
+
+    async def get_by_code(self, zone_code: str) -> Optional[Zone]:
+        """Zone 1개 + 소속 스테이지"""
+        query = (
+            select(Zone)
+            .where(Zone.zone_code == zone_code)
+            .options(selectinload(Zone.stages))
+        )
+        result = await self.execute(query)
+        return result.scalars().first()
+
 class StageRepository(BaseRepository[Stage]):
     def __init__(self, db: AsyncSession):
         super().__init__(Stage, db)
@@ -34,5 +55,31 @@ class StageRepository(BaseRepository[Stage]):
             .where(Stage.stage_code == code)
             .options(selectinload(Stage.zone)) # 스테이지 조회 시 소속 챕터 정보도 필요
         )
-        result = await self.db.execute(query)
-        return result.scalars().first()
\ No newline at end of file
+        result = await self.execute(query)
+        return result.scalars().first()
+
+    async def get_stages_by_filter(
+        self,
+        zone_type: Optional[str] = None,
+        min_ap_cost: Optional[int] = None,
+        max_ap_cost: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 50
+    ) -> List[Stage]:
+        """
+        구역 종류 / 이성 소모량으로 스테이지 필터링 (Zone 순서 -> 스테이지 순서)
+        - 예: 주간 스테이지(WEEKLY) 중 이성 18 이상
+        """
+        stmt = select(Stage).join(Stage.zone)
+
+        if zone_type:
+            stmt = stmt.where(Zone.zone_type == zone_type)
+        if min_ap_cost is not None:
+            stmt = stmt.where(Stage.ap_cost >= min_ap_cost)
+        if max_ap_cost is not None:
+            stmt = stmt.where(Stage.ap_cost <= max_ap_cost)
+
+        stmt = stmt.order_by(Zone.zone_index, Stage.stage_id).offset(skip).limit(limit)
+
+        result = await self.execute(stmt)
+        return result.scalars().all()
@@ -0,0 +1,34 @@
+from typing import Any, Dict, List, Optional
+from lib.schemas.common import BaseSchema
+
+class BlackboardKeyResponse(BaseSchema):
+    """blackboard 키 1개의 분포 (조건식 작성용)"""
+    key: str
+    count: int                 # 키를 가진 행 수
+    min: Optional[float] = None  # 숫자 값이 없으면 None
+    max: Optional[float] = None
+
+class BlackboardKeyListResponse(BaseSchema):
+    source: str # skill / talent
+    keys: List[BlackboardKeyResponse] = []
+
+class BlackboardSkillMatchResponse(BaseSchema):
+    skill_code: str
+    name_ko: str
+    level: int # 1~7, 8~10 = 특화 1~3
+    blackboard: Dict[str, Any] = {}
+
+class BlackboardTalentMatchResponse(BaseSchema):
+    character_code: str
+    name: str
+    talent_index: int
+    candidate_index: int
+    blackboard: Dict[str, Any] = {}
+
+class BlackboardSkillQueryResponse(BaseSchema):
+    total: int
+    results: List[BlackboardSkillMatchResponse] = []
+
+class BlackboardTalentQueryResponse(BaseSchema):
+    total: int
+    results: List[BlackboardTalentMatchResponse] = []
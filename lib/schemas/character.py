@@ -1,4 +1,4 @@
-from typing import List, Optional, Generic, TypeVar
+from typing import List, Optional, Generic, TypeVar, Union
 from pydantic import Field, computed_field, ConfigDict
 from lib.schemas.common import (
     BaseSchema, ProfessionResponse, SubProfessionResponse, 
@@ -114,4 +114,17 @@ class CharacterSkinResponse(BaseSchema):
     avatar_id: Optional[str] = None
     name_ko: Optional[str] = None
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+# 7. 패싯 필터 (목록 조건별 개수)
+class CharacterFacetValueResponse(BaseSchema):
+    value: Union[int, bool, str]
+    label: str
+    count: int # 이 값을 선택했을 때의 결과 수
+
+class CharacterFacetResponse(BaseSchema):
+    total: int # 현재 조건의 결과 수
+    rarity: List[CharacterFacetValueResponse] = []
+    profession: List[CharacterFacetValueResponse] = []
+    sub_profession: List[CharacterFacetValueResponse] = []
+    tag: List[CharacterFacetValueResponse] = []
+    module: List[CharacterFacetValueResponse] = []
@@ -1,9 +1,14 @@
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, Any, List
 
+from lib.core.startup import DEFER_SCHEMA_BUILD
+
 class BaseSchema(BaseModel):
     """모든 스키마의 공통 부모"""
-    model_config = ConfigDict(from_attributes=True) # ORM 객체를 Pydantic으로 자동 변환 (구 orm_mode)
+    model_config = ConfigDict(
+        from_attributes=True, # ORM 객체를 Pydantic으로 자동 변환 (구 orm_mode)
+        defer_build=DEFER_SCHEMA_BUILD # DEFER_SCHEMA_BUILD=1이면 코어 스키마를 첫 검증 시점에 생성
+    )
 
 class GridElement(BaseModel):
     row: int
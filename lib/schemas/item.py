@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from lib.schemas.common import BaseSchema
 
 class ItemResponse(BaseSchema):
@@ -14,4 +14,27 @@ class ItemResponse(BaseSchema):
 class ItemDetailResponse(ItemResponse):
     """상세 조회용 (무거운 텍스트 포함)"""
     usage_text: Optional[str] = None
-    obtain_approach: Optional[str] = None
\ No newline at end of file
+    obtain_approach: Optional[str] = None
+
+class ItemConsumerResponse(BaseSchema):
+    """아이템을 소비하는 육성 단계 1개"""
+    consumer_type: str # promotion / skill / mastery / module
+    consumer_code: str # 캐릭터 코드 / 스킬 코드 / 모듈 코드
+    name_ko: Optional[str] = None
+    character_code: Optional[str] = None
+    level: int
+    count: int
+
+class ItemUsageTotalsResponse(BaseSchema):
+    promotion: int = 0
+    skill: int = 0
+    mastery: int = 0
+    module: int = 0
+    all: int = 0
+
+class ItemUsageResponse(BaseSchema):
+    """아이템 소비처 (역색인)"""
+    item: ItemResponse
+    totals: ItemUsageTotalsResponse
+    consumer_count: int = 0 # 서로 다른 소비처 수
+    usages: List[ItemConsumerResponse] = []
@@ -0,0 +1,43 @@
+from typing import Annotated, Dict, List
+from pydantic import BaseModel, Field
+from lib.schemas.common import BaseSchema
+from lib.schemas.item import ItemResponse
+
+# ==========================
+# 1. 요청 (로스터)
+# ==========================
+class PlannerState(BaseModel):
+    """오퍼레이터 육성 상태"""
+    phase: int = Field(0, ge=0, le=2, description="정예화 단계 (0~2)")
+    skill_level: int = Field(1, ge=1, le=7, description="스킬 레벨 (1~7)")
+    masteries: List[Annotated[int, Field(ge=0, le=3)]] = Field(
+        [], max_length=3, description="스킬 슬롯 순서대로 특화 단계 (0~3), 생략한 슬롯은 0"
+    )
+    modules: Dict[str, Annotated[int, Field(ge=0, le=3)]] = Field(
+        {}, description="module_code -> 모듈 단계 (0~3), 생략한 모듈은 0"
+    )
+
+class PlannerOperator(BaseModel):
+    code: str = Field(..., description="캐릭터 코드 (예: char_002_amiya)")
+    current: PlannerState = PlannerState()
+    target: PlannerState
+
+class PlannerRequest(BaseModel):
+    operators: List[PlannerOperator] = Field(..., min_length=1, max_length=500)
+    breakdown: bool = Field(False, description="오퍼레이터별 재료도 함께 반환")
+
+# ==========================
+# 2. 응답
+# ==========================
+class PlannerItemResponse(BaseSchema):
+    count: int
+    item: ItemResponse
+
+class PlannerOperatorResponse(BaseSchema):
+    code: str
+    items: List[PlannerItemResponse] = []
+
+class PlannerResponse(BaseSchema):
+    dataset_version: str
+    items: List[PlannerItemResponse] = []  # 로스터 전체 합계
+    operators: List[PlannerOperatorResponse] = []  # breakdown=true일 때만
@@ -0,0 +1,29 @@
+from typing import List, Optional
+from lib.schemas.common import BaseSchema
+
+# ==========================
+# 1. 압축 형태 (grids 목록 대신 전송)
+# ==========================
+class CompactRangeResponse(BaseSchema):
+    range_id: str
+    mask: str # 16진수, 비트 번호 = (row - row_min) * cols + (col - col_min)
+
+class RangeTableResponse(BaseSchema):
+    """모든 범위의 비트마스크 + 공통 격자 (클라이언트에서 mask 비트로 타일 복원)"""
+    row_min: int
+    col_min: int
+    rows: int
+    cols: int
+    ranges: List[CompactRangeResponse] = []
+
+# ==========================
+# 2. 범위 조회 결과
+# ==========================
+class RangeMatchResponse(BaseSchema):
+    code: str                    # 캐릭터 코드 또는 스킬 코드
+    phase: Optional[int] = None  # 오퍼레이터일 때 정예화 단계
+    range_id: str
+
+class RangeQueryResponse(BaseSchema):
+    operators: List[RangeMatchResponse] = []
+    skills: List[RangeMatchResponse] = []
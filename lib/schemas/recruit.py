@@ -0,0 +1,21 @@
+from typing import List
+from lib.schemas.common import BaseSchema
+
+class RecruitOperatorResponse(BaseSchema):
+    code: str
+    name_ko: str
+    rarity: int
+
+class RecruitCombinationResponse(BaseSchema):
+    """선택 태그 중 1~3개 조합 1개와 나올 수 있는 오퍼레이터"""
+    tags: List[str]
+    min_rarity: int # 보장 최소 희귀도 (7:40 이상 모집 기준)
+    operators: List[RecruitOperatorResponse] = []
+
+class RecruitResponse(BaseSchema):
+    tags: List[str]
+    combinations: List[RecruitCombinationResponse] = []
+
+class RecruitTagListResponse(BaseSchema):
+    """선택 가능한 모집 태그 전체"""
+    tags: List[str] = []
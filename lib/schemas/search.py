@@ -0,0 +1,21 @@
+from typing import List, Optional
+from lib.schemas.common import BaseSchema
+
+class SearchHitResponse(BaseSchema):
+    type: str # operator / skill / module / item
+    code: str # 캐릭터 코드 / 스킬 코드 / 모듈 코드 / 아이템 코드
+    name_ko: str
+    character_code: Optional[str] = None # 모듈일 때 소유 오퍼레이터
+    score: float
+
+class SearchCountResponse(BaseSchema):
+    """종류별 일치 문서 수 (type 필터와 무관)"""
+    operator: int = 0
+    skill: int = 0
+    module: int = 0
+    item: int = 0
+
+class SearchResponse(BaseSchema):
+    query: str
+    counts: SearchCountResponse
+    results: List[SearchHitResponse] = []
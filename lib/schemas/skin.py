@@ -0,0 +1,34 @@
+from typing import List, Optional
+from lib.schemas.common import BaseSchema
+
+# ==========================
+# 1. 갤러리 목록 (가벼움: 스킨 상세 텍스트 제외)
+# ==========================
+class SkinResponse(BaseSchema):
+    skin_id: int
+    skin_code: str
+    character_id: int
+    character_code: str
+    name_ko: Optional[str] = None
+    series_name: Optional[str] = None # 스킨 그룹 이름
+    illustrator: Optional[str] = None
+    portrait_id: Optional[str] = None
+    avatar_id: Optional[str] = None
+
+class SkinPageResponse(BaseSchema):
+    skins: List[SkinResponse] = []
+    next_cursor: Optional[int] = None # 다음 페이지 요청 시 cursor로 전달 (None = 마지막 페이지)
+
+class SkinGroupResponse(BaseSchema):
+    skin_group_id: int
+    name_ko: str
+    skin_count: int
+
+# ==========================
+# 2. 상세 (무거운 텍스트 포함)
+# ==========================
+class SkinDetailResponse(SkinResponse):
+    content: Optional[str] = None
+    dialog: Optional[str] = None
+    description: Optional[str] = None
+    usage_text: Optional[str] = None
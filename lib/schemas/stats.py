@@ -0,0 +1,28 @@
+from typing import Optional
+from pydantic import ConfigDict, Field
+from lib.schemas.common import BaseSchema
+
+class StatValues(BaseSchema):
+    """보간된 스탯 (원본에 없는 값은 null)"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    max_hp: Optional[int] = None
+    atk: Optional[int] = None
+    def_: Optional[int] = Field(None, alias="def")
+    magic_resistance: Optional[float] = None
+    cost: Optional[int] = None
+    block_cnt: Optional[int] = None
+    attack_speed: Optional[int] = None
+    base_attack_time: Optional[float] = None # 공격 간격 (초)
+    respawn_time: Optional[float] = None     # 재배치 시간 (초)
+
+class OperatorStatsResponse(BaseSchema):
+    code: str
+    name_ko: str
+    rarity: int
+    phase: int
+    level: int
+    max_level: int
+    trust: int
+    potential: int
+    stats: StatValues
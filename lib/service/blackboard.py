@@ -0,0 +1,61 @@
+from typing import List, Optional
+from fastapi import HTTPException
+from lib.core.blackboard import BlackboardError, BlackboardIndex, parse_predicate
+from lib.core.timing import span
+from lib.schemas.blackboard import (
+    BlackboardKeyListResponse, BlackboardSkillQueryResponse, BlackboardTalentQueryResponse
+)
+
+class BlackboardService:
+    """
+    스킬 / 재능 blackboard 조건 조회
+    - 조건식(key, key>=값 ...)을 스냅샷 버전별 열 저장소의 정렬 배열 이진 탐색 + 행 번호 교집합으로 처리 (DB 조회 없음)
+    """
+    def __init__(self, index: BlackboardIndex):
+        self.index = index
+
+    def _query(self, source: str, where: List[str], level: Optional[int], skip: int, limit: int):
+        try:
+            predicates = [parse_predicate(text) for text in where]
+        except BlackboardError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        store = self.index.store(source)
+        matched = store.query(predicates, level)
+        return len(matched), [store.rows[row] for row in matched[skip:skip + limit].tolist()]
+
+    def get_keys(self, source: str) -> BlackboardKeyListResponse:
+        with span("validate"):
+            return BlackboardKeyListResponse(
+                source=source,
+                keys=[
+                    {"key": key, "count": count, "min": low, "max": high}
+                    for key, count, low, high in self.index.store(source).describe()
+                ]
+            )
+
+    def query_skills(
+        self, where: List[str], level: Optional[int] = None, skip: int = 0, limit: int = 50
+    ) -> BlackboardSkillQueryResponse:
+        total, rows = self._query("skill", where, level, skip, limit)
+        with span("validate"):
+            return BlackboardSkillQueryResponse(
+                total=total,
+                results=[
+                    {"skill_code": row.code, "name_ko": row.name, "level": row.level, "blackboard": row.values}
+                    for row in rows
+                ]
+            )
+
+    def query_talents(self, where: List[str], skip: int = 0, limit: int = 50) -> BlackboardTalentQueryResponse:
+        total, rows = self._query("talent", where, None, skip, limit)
+        with span("validate"):
+            return BlackboardTalentQueryResponse(
+                total=total,
+                results=[
+                    {
+                        "character_code": row.code, "name": row.name, "talent_index": row.level,
+                        "candidate_index": row.candidate, "blackboard": row.values,
+                    }
+                    for row in rows
+                ]
+            )
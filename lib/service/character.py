@@ -1,6 +1,7 @@
 import asyncio
 from typing import Optional, List
 from fastapi import HTTPException
+from lib.core.timing import span
 from lib.service.base import BaseService
 from lib.repositories.character import CharacterRepository
 from lib.repositories.skill import SkillRepository
@@ -130,6 +131,15 @@ class CharacterService(BaseService):
         """
         Redis Pipelining을 사용하여 4개 도메인 데이터를 1회의 RTT로 조회합니다.
         """
+        if self.redis is None:
+            # 인메모리 데이터셋 모드: 왕복 자체가 없으므로 도메인별로 바로 조립
+            return CharacterFullDetailResponse(
+                profile=await self.get_character_profile(code),
+                skills=await self.get_character_skills(code),
+                growth=await self.get_character_growth(code),
+                modules=await self.get_character_modules(code)
+            )
+
         keys = [
             f"char:profile:{code}",
             f"char:skills:{code}",
@@ -138,11 +148,12 @@ class CharacterService(BaseService):
         ]
 
         # 1. Redis Pipeline 실행 (네트워크 왕복 1회)
-        async with self.redis.pipeline(transaction=False) as pipe:
-            for key in keys:
-                pipe.get(key)
-            # redis-py(aioredis) 기준 execute()는 리스트를 반환합니다.
-            cached_data = await pipe.execute()
+        with span("redis"):
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(key)
+                # redis-py(aioredis) 기준 execute()는 리스트를 반환합니다.
+                cached_data = await pipe.execute()
 
         # 2. 결과 매핑 및 캐시 미스 확인
         # cached_data의 인덱스는 keys의 순서와 동일합니다.
@@ -160,7 +171,8 @@ class CharacterService(BaseService):
         for i, data in enumerate(cached_data):
             if data:
                 # 캐시 히트: JSON 역직렬화
-                results.append(domains[i]["model"].model_validate_json(data))
+                with span("validate"):
+                    results.append(domains[i]["model"].model_validate_json(data))
             else:
                 # 캐시 미스: DB에서 가져오기 위한 태스크 예약
                 fetch_tasks.append(self._fetch_and_store(code, domains[i]))
@@ -0,0 +1,33 @@
+from typing import List, Optional
+from lib.core.facets import FACETS, FacetIndex, FacetQuery
+from lib.core.timing import span
+from lib.schemas.character import CharacterFacetResponse, CharacterListResponse
+
+class CharacterFacetService:
+    """
+    다중 패싯 캐릭터 목록 / 패싯별 개수
+    - 스냅샷 버전별 FacetIndex의 비트셋 AND/OR + 미리 계산한 정렬 순열로 응답 (DB/Redis 조회 없음)
+    """
+    def __init__(self, index: FacetIndex, query: FacetQuery, sort: Optional[str] = None):
+        self.index = index
+        self.query = query
+        self.sort = sort or "rarity"
+
+    def get_character_list(self, skip: int = 0, limit: int = 20) -> List[CharacterListResponse]:
+        records = self.index.select(self.index.match(self.query), self.sort, skip, limit)
+        with span("validate"):
+            return [CharacterListResponse.model_validate(record) for record in records]
+
+    def get_facets(self) -> CharacterFacetResponse:
+        total, counts = self.index.counts(self.query)
+        with span("validate"):
+            return CharacterFacetResponse(
+                total=total,
+                **{
+                    facet: [
+                        {"value": value.value, "label": value.label, "count": count}
+                        for value, count in counts[facet]
+                    ]
+                    for facet in FACETS
+                }
+            )
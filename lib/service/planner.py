@@ -0,0 +1,47 @@
+from typing import List
+from fastapi import HTTPException
+from lib.core.planner import PlannerError, PlannerIndex, PlanState
+from lib.core.timing import span
+from lib.schemas.planner import (
+    PlannerItemResponse, PlannerOperatorResponse, PlannerRequest, PlannerResponse, PlannerState
+)
+
+def to_plan_state(state: PlannerState) -> PlanState:
+    return PlanState(state.phase, state.skill_level, tuple(state.masteries), tuple(state.modules.items()))
+
+class PlannerService:
+    """
+    로스터 육성 재료 계산
+    - 요청마다 DB/Redis를 거치지 않고, 스냅샷 버전별로 미리 만든 PlannerIndex 행렬에서 슬라이스 합산만 합니다.
+    """
+    def __init__(self, index: PlannerIndex):
+        self.index = index
+
+    def _items(self, pairs) -> List[PlannerItemResponse]:
+        return [PlannerItemResponse(count=count, item=item) for item, count in pairs]
+
+    def plan(self, request: PlannerRequest) -> PlannerResponse:
+        plans = []
+        for operator in request.operators:
+            try:
+                plans.append(self.index.rows(operator.code, to_plan_state(operator.current), to_plan_state(operator.target)))
+            except KeyError:
+                raise HTTPException(status_code=404, detail=f"Character not found: {operator.code}")
+            except PlannerError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+
+        totals = self.index.total(plans)
+        with span("validate"):
+            response = PlannerResponse(
+                dataset_version=self.index.version,
+                items=self._items(self.index.nonzero(totals))
+            )
+            if request.breakdown:
+                response.operators = [
+                    PlannerOperatorResponse(
+                        code=operator.code,
+                        items=self._items(self.index.nonzero(self.index.total([rows])))
+                    )
+                    for operator, rows in zip(request.operators, plans)
+                ]
+        return response
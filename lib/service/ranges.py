@@ -0,0 +1,51 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from fastapi import HTTPException
+from lib.core.ranges import RangeIndex
+from lib.core.timing import span
+from lib.schemas.ranges import RangeQueryResponse, RangeTableResponse
+
+class RangeService:
+    """
+    공격 범위 비트마스크 조회
+    - 스냅샷 버전별로 미리 만든 RangeIndex의 비트 연산으로 응답 (DB/Redis 조회 없음)
+    """
+    def __init__(self, index: RangeIndex):
+        self.index = index
+
+    def _respond(self, matched: np.ndarray, phase: Optional[int]) -> RangeQueryResponse:
+        operators, skills = self.index.select(matched, phase)
+        with span("validate"):
+            return RangeQueryResponse(
+                operators=[entry._asdict() for entry in operators],
+                skills=[entry._asdict() for entry in skills]
+            )
+
+    def get_table(self) -> RangeTableResponse:
+        with span("validate"):
+            return RangeTableResponse.model_validate(self.index.compact())
+
+    def get_coverage(self, row: int, col: int, phase: Optional[int] = None) -> RangeQueryResponse:
+        """타일 (row, col)을 공격 범위에 포함하는 오퍼레이터 / 스킬"""
+        return self._respond(self.index.covering(row, col), phase)
+
+    def get_supersets(
+        self,
+        range_id: Optional[str] = None,
+        tiles: Optional[List[Tuple[int, int]]] = None,
+        phase: Optional[int] = None
+    ) -> RangeQueryResponse:
+        """range_id의 범위(또는 tiles)를 모두 포함하는 범위를 가진 오퍼레이터 / 스킬"""
+        if range_id is not None:
+            if range_id not in self.index.range_rows:
+                raise HTTPException(status_code=404, detail="Range not found")
+            mask = self.index.masks[self.index.range_rows[range_id]]
+        elif tiles:
+            try:
+                mask = self.index.compile(tiles)
+            except ValueError:
+                # 격자 밖 타일을 포함하는 범위는 없음
+                return RangeQueryResponse()
+        else:
+            raise HTTPException(status_code=422, detail="range_id 또는 tiles가 필요합니다.")
+        return self._respond(self.index.supersets(mask), phase)
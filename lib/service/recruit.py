@@ -0,0 +1,38 @@
+from typing import List
+from fastapi import HTTPException
+from lib.core.recruit import RecruitError, RecruitIndex
+from lib.core.timing import span
+from lib.schemas.recruit import RecruitResponse, RecruitTagListResponse
+
+class RecruitService:
+    """
+    공개모집 태그 계산
+    - 스냅샷 버전별로 미리 만든 "태그 1~3개 조합 -> 오퍼레이터 비트셋" 표를 찾아 합치는 것으로 응답 (탐색 없음)
+    """
+    def __init__(self, index: RecruitIndex):
+        self.index = index
+
+    def get_tags(self) -> RecruitTagListResponse:
+        return RecruitTagListResponse(tags=list(self.index.tags))
+
+    def calculate(self, tags: List[str]) -> RecruitResponse:
+        try:
+            found = self.index.lookup(tags)
+        except RecruitError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+        with span("validate"):
+            return RecruitResponse(
+                tags=list(dict.fromkeys(tag for tag in tags if tag)),
+                combinations=[
+                    {
+                        "tags": list(combination.tags),
+                        "min_rarity": combination.min_rarity,
+                        "operators": [
+                            {"code": char.code, "name_ko": char.name_ko, "rarity": char.rarity}
+                            for char in self.index.operators(combination)
+                        ],
+                    }
+                    for combination in found
+                ]
+            )
@@ -0,0 +1,27 @@
+from typing import List, Optional
+from lib.core.search import SearchIndex
+from lib.core.timing import span
+from lib.schemas.search import SearchResponse
+
+class SearchService:
+    """
+    오퍼레이터 / 스킬 / 모듈 / 아이템 통합 검색
+    - 스냅샷 버전별 n-gram 역색인 + BM25 점수로 응답 (DB/Redis 조회 없음)
+    """
+    def __init__(self, index: SearchIndex):
+        self.index = index
+
+    def search(self, query: str, types: Optional[List[str]] = None, limit: int = 20) -> SearchResponse:
+        counts, hits = self.index.search(query, types, limit)
+        with span("validate"):
+            return SearchResponse(
+                query=query,
+                counts=counts,
+                results=[
+                    {
+                        "type": doc.doc_type, "code": doc.code, "name_ko": doc.name_ko,
+                        "character_code": doc.character_code, "score": round(score, 4),
+                    }
+                    for doc, score in hits
+                ]
+            )
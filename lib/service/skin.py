@@ -0,0 +1,61 @@
+from typing import List, Optional
+from fastapi import HTTPException
+from lib.service.base import BaseService
+from lib.repositories.skin import SkinRepository
+from lib.schemas.skin import SkinDetailResponse, SkinGroupResponse, SkinPageResponse, SkinResponse
+
+# 스킨 데이터는 패치 때만 바뀜
+SKIN_CACHE_TTL = 86400
+
+class SkinService(BaseService):
+    """
+    스킨 갤러리
+    - 목록(오퍼레이터 / 스킨 그룹별, 커서 페이지)은 character_skins 컬럼만 사용
+    - 상세 텍스트(content / dialog / description)는 상세 조회에서만 읽음
+    """
+    def __init__(self, repo: SkinRepository, redis, detail_repo: Optional[SkinRepository] = None):
+        super().__init__(redis)
+        self.repo = repo
+        # 인메모리 모드에서는 repo(목록 / 그룹)가 스냅샷 기반이고 상세만 DB Repository 사용
+        self.detail_repo = detail_repo or repo
+
+    async def get_skins(
+        self,
+        character_code: Optional[str] = None,
+        group: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 50
+    ) -> SkinPageResponse:
+        # limit + 1개를 읽어 다음 페이지 존재 여부 판단
+        cache_key = f"skin:list:{character_code or 'all'}:{group or 'all'}:{cursor or 0}:{limit}"
+        skins: List[SkinResponse] = await self.get_list_with_cache(
+            key=cache_key,
+            fetch_func=lambda: self.repo.get_page(character_code, group, cursor, limit + 1),
+            schema_model=SkinResponse,
+            ttl=SKIN_CACHE_TTL
+        )
+        has_next = len(skins) > limit
+        skins = skins[:limit]
+        return SkinPageResponse(
+            skins=skins,
+            next_cursor=skins[-1].skin_id if has_next else None
+        )
+
+    async def get_groups(self) -> List[SkinGroupResponse]:
+        return await self.get_list_with_cache(
+            key="skin:groups",
+            fetch_func=lambda: self.repo.get_groups(),
+            schema_model=SkinGroupResponse,
+            ttl=SKIN_CACHE_TTL
+        )
+
+    async def get_skin(self, skin_code: str) -> SkinDetailResponse:
+        skin = await self.get_with_cache(
+            key=f"skin:detail:{skin_code}",
+            fetch_func=lambda: self.detail_repo.get_detail(skin_code),
+            schema_model=SkinDetailResponse,
+            ttl=SKIN_CACHE_TTL
+        )
+        if not skin:
+            raise HTTPException(status_code=404, detail="Skin not found")
+        return skin
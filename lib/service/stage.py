@@ -1,11 +1,17 @@
+from typing import List, Optional
+from fastapi import HTTPException
 from lib.service.base import BaseService
-from lib.repositories.stage import ZoneRepository
-from lib.schemas.stage import ZoneDetailResponse
+from lib.repositories.stage import ZoneRepository, StageRepository
+from lib.schemas.stage import StageDetailResponse, ZoneDetailResponse, ZoneResponse
+
+# 스테이지 데이터는 패치 때만 바뀜
+STAGE_CACHE_TTL = 86400 * 7
 
 class StageService(BaseService):
-    def __init__(self, zone_repo: ZoneRepository, redis):
+    def __init__(self, zone_repo: ZoneRepository, redis, stage_repo: Optional[StageRepository] = None):
         super().__init__(redis)
         self.zone_repo = zone_repo
+        self.stage_repo = stage_repo
 
     async def get_all_zones(self) -> list[ZoneDetailResponse]:
         """
@@ -18,5 +24,82 @@ class StageService(BaseService):
             key=cache_key,
             fetch_func=lambda: self.zone_repo.get_all_zones_with_stages(),
             schema_model=ZoneDetailResponse,
-            ttl=86400 * 7 # 1주일 캐시 (패치 때만 갱신되면 됨)
-        )
\ No newline at end of file
+            ttl=STAGE_CACHE_TTL # 1주일 캐시 (패치 때만 갱신되면 됨)
+        )
+
+    async def get_zone_index(self, zone_type: Optional[str] = None) -> List[ZoneResponse]:
+        """
+        Zone 목록만 (스테이지 제외, 가벼움)
+        - 전체 목록 1개만 캐시하고 zone_type은 메모리에서 거름 (Zone 수는 수백 개 수준)
+        """
+        zones = await self.get_list_with_cache(
+            key="zone:index",
+            fetch_func=lambda: self.zone_repo.get_all_zones(),
+            schema_model=ZoneResponse,
+            ttl=STAGE_CACHE_TTL
+        )
+        if zone_type:
+            zones = [zone for zone in zones if zone.zone_type == zone_type]
+        return zones
+
+    async def get_zone_stages(
+        self,
+        zone_code: str,
+        min_ap_cost: Optional[int] = None,
+        max_ap_cost: Optional[int] = None
+    ) -> ZoneDetailResponse:
+        """
+        Zone 1개의 스테이지 목록
+        - Zone마다 캐시 키가 따로 있어, 한 챕터가 바뀌어도 다른 챕터 캐시는 그대로 유지됩니다.
+        - 이성 소모량 필터는 캐시된 목록에서 거름
+        """
+        zone = await self.get_with_cache(
+            key=f"zone:stages:{zone_code}",
+            fetch_func=lambda: self.zone_repo.get_by_code(zone_code),
+            schema_model=ZoneDetailResponse,
+            ttl=STAGE_CACHE_TTL
+        )
+        if not zone:
+            raise HTTPException(status_code=404, detail="Zone not found")
+
+        if min_ap_cost is not None or max_ap_cost is not None:
+            stages = [
+                stage for stage in zone.stages
+                if (min_ap_cost is None or stage.ap_cost >= min_ap_cost)
+                and (max_ap_cost is None or stage.ap_cost <= max_ap_cost)
+            ]
+            zone = zone.model_copy(update={"stages": stages})
+        return zone
+
+    async def get_stage(self, stage_code: str) -> StageDetailResponse:
+        stage = await self.get_with_cache(
+            key=f"stage:detail:{stage_code}",
+            fetch_func=lambda: self.stage_repo.get_by_code(stage_code),
+            schema_model=StageDetailResponse,
+            ttl=STAGE_CACHE_TTL
+        )
+        if not stage:
+            raise HTTPException(status_code=404, detail="Stage not found")
+        return stage
+
+    async def get_stages(
+        self,
+        zone_type: Optional[str] = None,
+        min_ap_cost: Optional[int] = None,
+        max_ap_cost: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 50
+    ) -> List[StageDetailResponse]:
+        """구역 종류 / 이성 소모량 필터 (Zone을 가로지르는 검색용)"""
+        def key_part(value):
+            return value if value is not None else "all"
+
+        cache_key = (
+            f"stage:list:{zone_type or 'all'}:{key_part(min_ap_cost)}:{key_part(max_ap_cost)}:{skip}:{limit}"
+        )
+        return await self.get_list_with_cache(
+            key=cache_key,
+            fetch_func=lambda: self.stage_repo.get_stages_by_filter(zone_type, min_ap_cost, max_ap_cost, skip, limit),
+            schema_model=StageDetailResponse,
+            ttl=3600
+        )
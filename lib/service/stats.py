@@ -0,0 +1,82 @@
+from typing import List, Optional
+import numpy as np
+from fastapi import HTTPException
+from lib.core.dataset import Dataset
+from lib.core.stats import COLUMNS, StatIndex, StatQuery
+from lib.core.timing import span
+from lib.schemas.stats import OperatorStatsResponse
+
+class StatService:
+    """
+    레벨 / 신뢰도 / 잠재 반영 스탯 계산
+    - 스냅샷 버전별로 미리 만든 StatIndex 배열에서 오퍼레이터 1명 또는 여러 명을 한 번에 보간합니다.
+    """
+    def __init__(self, index: StatIndex, dataset: Dataset):
+        self.index = index
+        self.dataset = dataset
+
+    def _responses(self, rows: np.ndarray, query: StatQuery, stats, levels) -> List[OperatorStatsResponse]:
+        max_levels = self.index.max_levels[rows, query.phase].tolist()
+        with span("validate"):
+            return [
+                OperatorStatsResponse(
+                    code=char.code, name_ko=char.name_ko, rarity=char.rarity,
+                    phase=query.phase, level=level, max_level=max_level,
+                    trust=query.trust, potential=query.potential,
+                    stats=self.index.to_dict(values)
+                )
+                for char, values, level, max_level in zip(
+                    (self.dataset.characters[self.index.codes[row]] for row in rows.tolist()),
+                    stats, levels.tolist(), max_levels
+                )
+            ]
+
+    def get_stats(self, code: str, phase: Optional[int], level: Optional[int], trust: int, potential: int) -> OperatorStatsResponse:
+        if code not in self.index.rows:
+            raise HTTPException(status_code=404, detail="Character not found")
+        rows = self.index.rows_for([code])
+        if phase is None:
+            # 생략하면 도달 가능한 최고 정예화 단계
+            phase = int(np.flatnonzero(self.index.max_levels[rows[0]]).max(initial=0))
+
+        query = StatQuery(phase, level, trust, potential)
+        stats, levels, valid = self.index.compute(rows, query)
+        if not valid[0]:
+            max_level = int(self.index.max_levels[rows[0], phase])
+            if max_level == 0:
+                raise HTTPException(status_code=422, detail=f"{code}: 정예화 {phase}단계가 없습니다.")
+            raise HTTPException(status_code=422, detail=f"{code}: 정예화 {phase}단계 최대 레벨은 {max_level}입니다.")
+        return self._responses(rows, query, stats, levels)[0]
+
+    def compare_stats(
+        self,
+        codes: Optional[List[str]],
+        phase: int,
+        level: Optional[int],
+        trust: int,
+        potential: int,
+        rarity: Optional[int] = None,
+        sort: Optional[str] = None,
+        limit: int = 50
+    ) -> List[OperatorStatsResponse]:
+        """
+        여러 오퍼레이터를 같은 조건으로 한 번에 계산해 비교
+        - 해당 단계가 없거나 level이 최대 레벨을 넘는 오퍼레이터는 결과에서 제외
+        - sort: 스탯 이름 (내림차순), 생략하면 목록 순서(희귀도 높은 순, 코드 순)
+        """
+        try:
+            rows = self.index.rows_for(codes)
+        except KeyError as e:
+            raise HTTPException(status_code=404, detail=f"Character not found: {e.args[0]}")
+        if rarity is not None:
+            rows = rows[self.index.rarities[rows] == rarity]
+
+        query = StatQuery(phase, level, trust, potential)
+        stats, levels, valid = self.index.compute(rows, query)
+        rows, stats, levels = rows[valid], stats[valid], levels[valid]
+
+        if sort is not None:
+            # NaN(알 수 없음)은 맨 뒤로
+            order = np.argsort(np.nan_to_num(-stats[:, COLUMNS[sort]], nan=np.inf), kind="stable")
+            rows, stats, levels = rows[order], stats[order], levels[order]
+        return self._responses(rows[:limit], query, stats[:limit], levels[:limit])
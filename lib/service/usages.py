@@ -0,0 +1,31 @@
+from fastapi import HTTPException
+from lib.core.dataset import Dataset
+from lib.core.timing import span
+from lib.core.usages import empty_totals, get_usage_index
+from lib.schemas.item import ItemUsageResponse
+
+class ItemUsageService:
+    """
+    아이템 소비처 조회
+    - 스냅샷 버전별 역색인(item_code -> 소비처 목록 + 합계)에서 dict 조회 1회로 응답합니다.
+    """
+    def __init__(self, dataset: Dataset):
+        self.dataset = dataset
+        self.usages = get_usage_index(dataset)
+
+    def get_item_usages(self, item_code: str) -> ItemUsageResponse:
+        item = self.dataset.items.get(item_code)
+        if item is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        usage = self.usages.get(item_code)
+        with span("validate"):
+            if usage is None:
+                # 어떤 육성 비용에도 쓰이지 않는 아이템
+                return ItemUsageResponse(item=item, totals=empty_totals())
+            return ItemUsageResponse(
+                item=item,
+                totals=usage.totals,
+                consumer_count=usage.consumers,
+                usages=[record._asdict() for record in usage.usages]
+            )
@@ -0,0 +1,14 @@
+# tests/conftest.py
+"""
+테스트 공용 픽스처
+- dataset: lib.bench.fixtures의 합성 원본으로 만든 Dataset (DB / data/ 없이 ETL 변환 -> build_dataset 경로 그대로)
+  색인은 불변이므로 세션당 1회만 만들어 모든 테스트가 공유합니다.
+"""
+import pytest
+
+from lib.bench.fixtures import synthetic_dataset
+
+
+@pytest.fixture(scope="session")
+def dataset():
+    return synthetic_dataset()
@@ -0,0 +1,86 @@
+# tests/test_blackboard.py
+"""blackboard 열 저장소: 조건 조회 결과가 행을 하나씩 검사한 결과와 같아야 함"""
+import operator
+import random
+
+import pytest
+
+from lib.core.blackboard import (
+    BlackboardError, BlackboardRow, BlackboardStore, Predicate, _numeric, get_blackboard_index, parse_predicate
+)
+
+OPERATORS = {">=": operator.ge, "<=": operator.le, ">": operator.gt, "<": operator.lt, "=": operator.eq}
+
+
+def row_matches(row: BlackboardRow, predicate: Predicate) -> bool:
+    if predicate.key not in row.values:
+        return False
+    if predicate.op is None:
+        return True
+    number = _numeric(row.values[predicate.key])
+    return number is not None and OPERATORS[predicate.op](number, predicate.value)
+
+
+def brute_force(store: BlackboardStore, predicates, level=None):
+    return [
+        index for index, row in enumerate(store.rows)
+        if all(row_matches(row, p) for p in predicates) and (level is None or row.level == level)
+    ]
+
+
+@pytest.fixture(scope="module")
+def index(dataset):
+    return get_blackboard_index(dataset)
+
+
+def test_parse_predicate():
+    assert parse_predicate("atk") == Predicate("atk")
+    assert parse_predicate(" ATK >= 1.5 ") == Predicate("atk", ">=", 1.5)
+    assert parse_predicate("attack@max_target=2") == Predicate("attack@max_target", "=", 2.0)
+    assert parse_predicate("prob<0.3") == Predicate("prob", "<", 0.3)
+    for text in ("", "atk >", "atk >= abc", "atk >= nan", "a b"):
+        with pytest.raises(BlackboardError):
+            parse_predicate(text)
+
+
+def test_rows_cover_every_skill_level_and_talent(dataset, index):
+    assert len(index.skill.rows) == sum(len(skill.levels) for skill in dataset.skills.values())
+    assert len(index.talent.rows) == sum(len(char.talents) for char in dataset.character_order)
+
+
+@pytest.mark.parametrize("source", ["skill", "talent"])
+def test_query_matches_brute_force(index, source):
+    store = index.store(source)
+    rng = random.Random(11)
+    keys = list(store.keys)
+    for _ in range(300):
+        predicates = []
+        for _ in range(rng.randint(0, 3)):
+            key = rng.choice(keys + ["unknown_key"])
+            op = rng.choice([None, *OPERATORS])
+            value = None if op is None else rng.choice([0.0, 0.5, 1.0, 1.5, 2.0, round(rng.uniform(0, 3), 2)])
+            predicates.append(Predicate(key, op, value))
+        level = rng.choice([None, 1, 7, 10])
+        assert store.query(predicates, level).tolist() == brute_force(store, predicates, level), (predicates, level)
+
+
+def test_equality_uses_exact_values(index):
+    store = index.skill
+    value = float(store.keys["atk"].values[len(store.keys["atk"].values) // 2])
+    rows = store.query([Predicate("atk", "=", value)])
+
+    assert len(rows) > 0
+    assert all(store.rows[row].values["atk"] == value for row in rows.tolist())
+
+
+def test_non_numeric_values_only_satisfy_existence():
+    store = BlackboardStore([
+        BlackboardRow("a", "a", 1, None, {"atk": 1.0, "tag": "stun"}),
+        BlackboardRow("b", "b", 1, None, {"atk": True, "tag": None}),
+        BlackboardRow("c", "c", 2, None, {"atk": 3}),
+    ])
+
+    assert store.query([Predicate("tag")]).tolist() == [0, 1]
+    assert store.query([Predicate("atk", ">=", 0)]).tolist() == [0, 2]
+    assert store.query([Predicate("atk")], level=2).tolist() == [2]
+    assert store.describe() == [("atk", 3, 1.0, 3.0), ("tag", 2, None, None)]
@@ -0,0 +1,99 @@
+# tests/test_facets.py
+"""다중 패싯 필터: 비트셋 결과 / 정렬 / 패싯별 개수가 레코드를 직접 거른 결과와 같아야 함"""
+import random
+
+import pytest
+
+from lib.core.facets import FACETS, ORDERINGS, FacetQuery, get_facet_index
+
+
+def facet_values(char, facet: str) -> set:
+    if facet == "rarity":
+        return {char.rarity}
+    if facet == "profession":
+        return {char.profession.profession_id} if char.profession else set()
+    if facet == "sub_profession":
+        return {char.sub_profession.sub_profession_id} if char.sub_profession else set()
+    if facet == "tag":
+        return {tag.tag_name for tag in char.tags}
+    return {bool(char.modules)}
+
+
+def matches(char, query: FacetQuery, skip_facet: str = None) -> bool:
+    for facet in FACETS:
+        if facet == skip_facet:
+            continue
+        selected = getattr(query, facet)
+        if facet == "module":
+            if selected is not None and bool(char.modules) != selected:
+                return False
+        elif selected:
+            values = facet_values(char, facet)
+            if facet == "tag" and query.tag_mode == "and":
+                if not set(selected) <= values:
+                    return False
+            elif not values & set(selected):
+                return False
+    return True
+
+
+def random_query(rng: random.Random, index) -> FacetQuery:
+    def pick(facet, most):
+        values = list(index.facets[facet])
+        return tuple(rng.sample(values, rng.randint(1, most))) if rng.random() < 0.5 else None
+
+    return FacetQuery(
+        rarity=pick("rarity", 3),
+        profession=pick("profession", 3),
+        sub_profession=pick("sub_profession", 2),
+        tag=pick("tag", 2),
+        module=rng.choice((None, True, False)),
+        tag_mode=rng.choice(("and", "or")),
+    )
+
+
+@pytest.fixture(scope="module")
+def index(dataset):
+    return get_facet_index(dataset)
+
+
+def test_match_equals_direct_filter(dataset, index):
+    rng = random.Random(5)
+    for _ in range(200):
+        query = random_query(rng, index)
+        expected = [char for char in dataset.character_order if matches(char, query)]
+        assert index.select(index.match(query), limit=len(dataset.characters)) == expected, query
+
+
+def test_empty_query_matches_everything(dataset, index):
+    assert FacetQuery().is_empty()
+    assert index.match(FacetQuery()) == index.all_bits
+    assert index.select(index.all_bits, limit=5) == list(dataset.character_order[:5])
+
+
+@pytest.mark.parametrize("sort", list(ORDERINGS))
+def test_select_sorts_and_pages(dataset, index, sort):
+    query = FacetQuery(rarity=(3, 4, 5))
+    expected = sorted((c for c in dataset.character_order if matches(c, query)), key=ORDERINGS[sort])
+
+    assert index.select(index.match(query), sort=sort, skip=3, limit=7) == expected[3:10]
+
+
+def test_counts_exclude_own_facet(dataset, index):
+    rng = random.Random(9)
+    for _ in range(50):
+        query = random_query(rng, index)
+        total, counts = index.counts(query)
+        assert total == sum(matches(c, query) for c in dataset.character_order)
+        for facet in FACETS:
+            # 태그 AND 모드는 값을 더 고를수록 좁아지므로 현재 결과 기준
+            skip = None if facet == "tag" and query.tag_mode == "and" else facet
+            base = [c for c in dataset.character_order if matches(c, query, skip_facet=skip)]
+            for value, count in counts[facet]:
+                assert count == sum(value.value in facet_values(c, facet) for c in base), (query, facet, value.value)
+
+
+def test_unknown_values_match_nothing(index):
+    assert index.match(FacetQuery(tag=("없는태그",))) == 0
+    assert index.match(FacetQuery(rarity=(9,))) == 0
+    assert index.select(0) == []
@@ -0,0 +1,80 @@
+# tests/test_fields.py
+"""fields= / include= 투영: 경로 트리 파싱, 리스트 원소별 가지치기, 라우트 응답 봉투와 헤더 유지"""
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from lib.api.fields import Projection, field_projection, parse_fields, project
+from lib.api.http_cache import cache_control
+
+
+def document(char) -> dict:
+    """캐릭터 상세 응답과 같은 모양의 문서 (profile / skills 섹션)"""
+    return {
+        "profile": {
+            "code": char.code,
+            "name_ko": char.name_ko,
+            "rarity": char.rarity,
+            "stats": [{"phase": s.phase, "max_hp": s.max_hp, "atk": s.max_atk} for s in char.stats],
+        },
+        "skills": {"skills": [{"code": code, "levels": [{"level": 1}, {"level": 2}]} for code in char.skill_slots or () if code]},
+    }
+
+
+@pytest.fixture
+def char(dataset):
+    return next(c for c in dataset.character_order if len(c.stats) == 3 and c.skill_slots.phase_2_code)
+
+
+def test_parse_fields_builds_path_tree():
+    assert parse_fields(None, "") is None
+    assert parse_fields("profile", "skills.skills.levels.level") == {
+        "profile": None,
+        "skills": {"skills": {"levels": {"level": None}}},
+    }
+    assert parse_fields(None, "profile.name_ko, profile.stats.max_hp,,") == {
+        "profile": {"name_ko": None, "stats": {"max_hp": None}},
+    }
+
+
+def test_whole_section_wins_over_nested_paths():
+    # include로 섹션 전체를 고르면 같은 섹션의 세부 경로는 무시
+    assert parse_fields("profile", "profile.name_ko") == {"profile": None}
+
+
+def test_project_prunes_each_list_element(char):
+    data = document(char)
+    projected = project(data, parse_fields(None, "profile.name_ko,profile.stats.max_hp,skills.skills.code"))
+
+    assert projected == {
+        "profile": {"name_ko": char.name_ko, "stats": [{"max_hp": s.max_hp} for s in char.stats]},
+        "skills": {"skills": [{"code": skill["code"]} for skill in data["skills"]["skills"]]},
+    }
+
+
+def test_project_ignores_unknown_paths(char):
+    data = document(char)
+
+    assert project(data, parse_fields(None, "profile.unknown,nothing")) == {"profile": {}}
+    assert project(data, None) is data
+
+
+def test_route_keeps_envelope_and_cache_headers(char):
+    app = FastAPI()
+
+    @app.get("/characters/{code}", dependencies=[Depends(cache_control(60))])
+    async def detail(code: str, projection: Projection = Depends(field_projection)):
+        return projection.respond(document(char))
+
+    with TestClient(app) as client:
+        full = client.get(f"/characters/{char.code}")
+        sparse = client.get(f"/characters/{char.code}?include=skills&fields=profile.rarity")
+
+    assert full.json()["data"] == document(char)
+    assert sparse.json() == {
+        "success": True,
+        "data": {"profile": {"rarity": char.rarity}, "skills": document(char)["skills"]},
+        "status": 200,
+        "message": "OK",
+    }
+    assert sparse.headers["Cache-Control"] == full.headers["Cache-Control"] == "public, max-age=60"
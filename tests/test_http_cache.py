@@ -0,0 +1,246 @@
+# tests/test_http_cache.py
+"""
+HTTPCacheMiddleware: 첫 200 응답을 보관해 엔드포인트 없이 응답, ETag / 304, 선언된 쿼리만 캐시 키, 바이트 한도,
+표현(인코딩)별 압축본과 ETag
+"""
+import gzip
+import time
+import zlib
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi.testclient import TestClient
+
+from lib.api.http_cache import (
+    MIN_COMPRESS_SIZE, CachedPayload, HTTPCacheMiddleware, ResponseCache, cache_control, clear_response_caches,
+    compress_variants, etag_matches, negotiate_encoding
+)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def middleware(calls):
+    app = FastAPI()
+
+    @app.get("/items", dependencies=[Depends(cache_control(60))])
+    async def items(rarity: int = Query(None), name: str = Query(None)):
+        calls.append("items")
+        return {"rarity": rarity, "name": name}
+
+    @app.get("/large", dependencies=[Depends(cache_control(60))])
+    async def large():
+        calls.append("large")
+        return {"rows": [{"index": index, "name": "합성 오퍼레이터"} for index in range(200)]}
+
+    @app.get("/uncached")
+    async def uncached():
+        calls.append("uncached")
+        return {"ok": True}
+
+    @app.get("/missing", dependencies=[Depends(cache_control(60))])
+    async def missing():
+        calls.append("missing")
+        raise HTTPException(status_code=404, detail="없음")
+
+    return HTTPCacheMiddleware(app)
+
+
+@pytest.fixture
+def client(middleware):
+    with TestClient(middleware) as client:
+        yield client
+
+
+def test_second_request_is_served_from_cache(client, calls):
+    first = client.get("/items?rarity=5")
+    second = client.get("/items?rarity=5")
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json() == {"rarity": 5, "name": None}
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["Cache-Control"] == "public, max-age=60"
+    assert calls == ["items"]
+
+
+def test_if_none_match_returns_304_without_body(client, calls):
+    etag = client.get("/items").headers["ETag"]
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get("/items", headers={"If-None-Match": header})
+        assert response.status_code == 304, header
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    assert client.get("/items", headers={"If-None-Match": '"stale"'}).status_code == 200
+    assert calls == ["items"]
+
+
+def test_cache_key_normalizes_declared_query_order(client, calls):
+    client.get("/items?rarity=5&name=a")
+    response = client.get("/items?name=a&rarity=5")
+
+    assert response.headers["X-Cache"] == "HIT"
+    assert calls == ["items"]
+
+
+def test_undeclared_query_parameter_is_not_cached(client, calls):
+    client.get("/items")
+    for _ in range(2):
+        response = client.get("/items?_bust=1")
+        assert response.status_code == 200
+        assert "X-Cache" not in response.headers
+
+    assert calls == ["items", "items", "items"]
+
+
+def test_only_200_responses_with_cache_control_are_cached(client, calls):
+    client.get("/uncached")
+    client.get("/missing")
+    uncached = client.get("/uncached")
+    missing = client.get("/missing")
+
+    assert missing.status_code == 404
+    assert "X-Cache" not in uncached.headers and "X-Cache" not in missing.headers
+    assert calls == ["uncached", "missing", "uncached", "missing"]
+
+
+def test_request_no_store_bypasses_cache(client, calls):
+    client.get("/items")
+    response = client.get("/items", headers={"Cache-Control": "no-store"})
+
+    assert "X-Cache" not in response.headers
+    assert calls == ["items", "items"]
+
+
+def test_clear_response_caches_forces_a_miss(client, middleware, calls):
+    client.get("/items")
+    assert clear_response_caches() >= 1
+    assert len(middleware.cache.entries) == 0
+
+    assert client.get("/items").headers["X-Cache"] == "MISS"
+    assert calls == ["items", "items"]
+
+
+def test_etag_matches_only_the_given_representation():
+    assert etag_matches('"a"', '"a"')
+    assert etag_matches('W/"a"', '"a"')
+    assert not etag_matches('"a-gzip"', '"a"')
+    assert not etag_matches(None, '"a"')
+
+
+def payload(size: int) -> CachedPayload:
+    return CachedPayload(b"x" * size, "application/json", "public, max-age=60", 60, variants={})
+
+
+def test_response_cache_evicts_least_recently_used_over_byte_cap():
+    cache = ResponseCache(max_entries=10, max_bytes=250)
+    cache.put("a", payload(100))
+    cache.put("b", payload(100))
+    cache.get("a")  # a가 최근 사용 -> b가 먼저 밀려남
+    cache.put("c", payload(100))
+
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.size == 200
+
+
+def test_response_cache_skips_entry_larger_than_cap():
+    cache = ResponseCache(max_entries=10, max_bytes=250)
+    cache.put("a", payload(100))
+    cache.put("huge", payload(300))
+
+    assert list(cache.entries) == ["a"]
+    assert cache.size == 100
+
+
+def test_response_cache_limits_entry_count():
+    cache = ResponseCache(max_entries=2, max_bytes=10_000)
+    for key in "abc":
+        cache.put(key, payload(10))
+
+    assert list(cache.entries) == ["b", "c"]
+
+
+# ==========================================
+# 압축본 (표현별 본문 / ETag)
+# ==========================================
+def wait_for_variants(middleware: HTTPCacheMiddleware, key: str) -> CachedPayload:
+    """백그라운드 압축 작업이 캐시 항목을 교체할 때까지 대기"""
+    for _ in range(200):
+        entry = middleware.cache.entries.get(key)
+        if entry is not None and entry.variants:
+            return entry
+        time.sleep(0.01)
+    raise AssertionError(f"{key}: 압축본이 만들어지지 않음")
+
+
+def test_compressed_variant_is_chosen_by_accept_encoding(client, middleware, calls):
+    identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+    entry = wait_for_variants(middleware, "/large?")
+
+    compressed = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+    assert compressed.headers["ETag"] == entry.etags["gzip"] != entry.etag
+    assert compressed.json() == identity.json()
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["ETag"] == identity.headers["ETag"] == entry.etag
+    assert calls == ["large"]
+
+
+def test_304_only_for_the_representation_being_sent(client, middleware):
+    client.get("/large")
+    entry = wait_for_variants(middleware, "/large?")
+
+    # 원본 ETag만 가진 클라이언트가 gzip을 받게 되면 가진 적 없는 표현이므로 200 + 전체 본문
+    cross = client.get("/large", headers={"Accept-Encoding": "gzip", "If-None-Match": entry.etag})
+    assert cross.status_code == 200
+    assert cross.headers["Content-Encoding"] == "gzip"
+    assert len(cross.json()["rows"]) == 200
+
+    same = client.get("/large", headers={"Accept-Encoding": "gzip", "If-None-Match": entry.etags["gzip"]})
+    assert same.status_code == 304
+    assert same.headers["ETag"] == entry.etags["gzip"]
+    assert same.headers["Content-Encoding"] == "gzip"
+
+    identity = client.get("/large", headers={"Accept-Encoding": "identity", "If-None-Match": entry.etags["gzip"]})
+    assert identity.status_code == 200
+
+
+def test_compress_variants_round_trip_and_skip_small_bodies():
+    assert compress_variants(b"x" * (MIN_COMPRESS_SIZE - 1)) == {}
+
+    body = b'{"name": "' + "합성 오퍼레이터".encode() * 200 + b'"}'
+    variants = compress_variants(body)
+    assert gzip.decompress(variants["gzip"]) == body
+    assert zlib.decompress(variants["deflate"]) == body
+    assert all(len(data) < len(body) for data in variants.values())
+
+
+def test_negotiate_encoding():
+    available = {"gzip": b"", "deflate": b""}
+    assert negotiate_encoding(None, available) is None
+    assert negotiate_encoding("gzip, deflate", {}) is None
+    assert negotiate_encoding("gzip, deflate", available) == "gzip"
+    assert negotiate_encoding("gzip;q=0.5, deflate", available) == "deflate"
+    assert negotiate_encoding("gzip;q=0, deflate;q=0", available) is None
+    assert negotiate_encoding("*", available) == "gzip"
+    assert negotiate_encoding("br", available) is None
+
+
+def test_variants_count_toward_byte_cap():
+    body = b"0123456789" * 200
+    entry = CachedPayload(body, "application/json", "public, max-age=60", 60)
+    assert entry.variants
+    assert entry.size == len(body) + sum(len(data) for data in entry.variants.values())
+
+    cache = ResponseCache(max_entries=10, max_bytes=len(body))
+    cache.put("a", entry)
+    assert "a" not in cache.entries
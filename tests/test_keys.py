@@ -0,0 +1,72 @@
+# tests/test_keys.py
+"""KeyResolver: 테이블당 INSERT 1회 + SELECT 1회로 자연키 -> id 매핑"""
+from types import SimpleNamespace
+
+from lib.etl.keys import KeyResolver
+
+
+class RecordingCursor:
+    """execute_values가 쓰는 부분만 가진 커서 (실행한 SQL을 기록, SELECT는 rows를 돌려줌)"""
+
+    connection = SimpleNamespace(encoding="UTF8")
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+
+    def mogrify(self, template: bytes, args) -> bytes:
+        return template % tuple(repr(value).encode() for value in args)
+
+    def execute(self, sql):
+        self.statements.append(sql.decode() if isinstance(sql, bytes) else sql)
+
+    def fetchall(self):
+        return self.rows
+
+
+def test_insert_dedupes_keys_in_one_statement():
+    cur = RecordingCursor()
+    resolver = KeyResolver("items", "item_code", "item_id")
+
+    count = resolver.insert(cur, [("a", "첫 이름"), ("b", "B"), ("a", "나중 이름")], columns=("item_code", "name_ko"))
+
+    assert count == 2
+    assert len(cur.statements) == 1
+    statement = cur.statements[0]
+    assert statement.startswith("INSERT INTO items (item_code, name_ko) VALUES ")
+    assert statement.endswith("ON CONFLICT (item_code) DO NOTHING")
+    # 같은 키는 마지막 행만 남음 (DO UPDATE가 한 문장 안에서 같은 키를 두 번 만나지 않도록)
+    assert "'나중 이름'" in statement and "'첫 이름'" not in statement
+
+
+def test_insert_updates_only_listed_columns():
+    cur = RecordingCursor()
+    KeyResolver("items", "item_code", "item_id").insert(
+        cur, [("a", "A", 3)], columns=("item_code", "name_ko", "rarity"), update_columns=("name_ko", "rarity")
+    )
+
+    assert cur.statements[0].endswith(
+        "ON CONFLICT (item_code) DO UPDATE SET name_ko = EXCLUDED.name_ko, rarity = EXCLUDED.rarity"
+    )
+
+
+def test_insert_without_rows_runs_no_query():
+    cur = RecordingCursor()
+
+    assert KeyResolver("tag", "tag_name", "tag_id").insert(cur, []) == 0
+    assert cur.statements == []
+
+
+def test_resolve_loads_whole_table_once():
+    cur = RecordingCursor(rows=[("a", 1), ("b", 2), ("old", 7)])
+    resolver = KeyResolver("tag", "tag_name", "tag_id").resolve(cur, [("a",), ("b",)])
+
+    assert cur.statements[-1] == "SELECT tag_name, tag_id FROM tag"
+    assert len(cur.statements) == 2
+    # 이번에 넣지 않은 기존 키도 매핑에 포함
+    assert resolver["old"] == 7
+    assert resolver.get("a") == 1
+    assert resolver.get("missing") is None
+    assert "b" in resolver and "missing" not in resolver
+    assert sorted(resolver) == ["a", "b", "old"]
+    assert len(resolver) == 3
@@ -0,0 +1,114 @@
+# tests/test_planner.py
+"""육성 재료 플래너: 행렬 행 구간 합계가 비용 레코드를 직접 더한 값과 같아야 함"""
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from lib.core.planner import PlannerError, PlanState, get_planner_index
+
+
+def expected_totals(dataset, code: str, current: PlanState, target: PlanState) -> Counter:
+    """비용 레코드를 직접 훑어 계산한 기준값 (item_code -> 개수)"""
+    char = dataset.characters[code]
+    totals = Counter()
+
+    def add(costs, before: int, after: int):
+        for cost in costs:
+            if before < cost.level <= after:
+                totals[cost.item.item_code] += cost.count
+
+    add(char.promotion_costs, current.phase, target.phase)
+    add(char.skill_costs, current.skill_level, target.skill_level)
+    skill_codes = [c for c in (char.skill_slots.phase_0_code, char.skill_slots.phase_1_code, char.skill_slots.phase_2_code) if c]
+    for slot, code in enumerate(skill_codes):
+        before = current.masteries[slot] if slot < len(current.masteries) else 0
+        after = target.masteries[slot] if slot < len(target.masteries) else 0
+        add(dataset.skills[code].mastery_costs, before, after)
+    current_modules, target_modules = dict(current.modules), dict(target.modules)
+    for module in char.modules:
+        add(module.costs, current_modules.get(module.module_code, 0), target_modules.get(module.module_code, 0))
+    return +totals
+
+
+def as_counter(index, totals: np.ndarray) -> Counter:
+    return Counter({item.item_code: count for item, count in index.nonzero(totals)})
+
+
+def maxed(char) -> PlanState:
+    slots = sum(bool(code) for code in char.skill_slots)
+    return PlanState(2, 7, (3,) * slots, tuple((module.module_code, 3) for module in char.modules))
+
+
+@pytest.fixture(scope="module")
+def index(dataset):
+    return get_planner_index(dataset)
+
+
+@pytest.fixture(scope="module")
+def six_star(dataset):
+    return next(c for c in dataset.character_order if c.rarity == 5 and c.modules)
+
+
+def test_index_is_built_once_per_snapshot(dataset, index):
+    assert dataset.index("planner") is index
+    assert index.version == dataset.version
+    assert not index.matrix.flags.writeable
+
+
+def test_columns_are_only_materials_used_by_costs(dataset, index):
+    used = {
+        cost.item.item_code
+        for char in dataset.character_order
+        for costs in (char.promotion_costs, char.skill_costs, *(m.costs for m in char.modules))
+        for cost in costs
+    } | {cost.item.item_code for skill in dataset.skills.values() for cost in skill.mastery_costs}
+
+    assert {item.item_code for item in index.items} == used
+    assert [item.item_id for item in index.items] == sorted(item.item_id for item in index.items)
+
+
+def test_full_plan_matches_cost_records(dataset, index, six_star):
+    current, target = PlanState(), maxed(six_star)
+    totals = index.total([index.rows(six_star.code, current, target)])
+
+    assert as_counter(index, totals) == expected_totals(dataset, six_star.code, current, target)
+
+
+def test_partial_plan_only_counts_levels_above_current(dataset, index, six_star):
+    module_code = six_star.modules[0].module_code
+    current = PlanState(1, 4, (0, 1, 2), ((module_code, 1),))
+    target = PlanState(2, 7, (0, 3, 2), ((module_code, 2),))
+    totals = index.total([index.rows(six_star.code, current, target)])
+
+    assert as_counter(index, totals) == expected_totals(dataset, six_star.code, current, target)
+
+
+def test_roster_total_is_sum_of_operators(dataset, index):
+    roster = [char for char in dataset.character_order if char.rarity >= 3][:20]
+    plans = [(char.code, PlanState(0, 1), maxed(char)) for char in roster]
+    totals = index.total(index.rows(code, current, target) for code, current, target in plans)
+
+    expected = Counter()
+    for code, current, target in plans:
+        expected += expected_totals(dataset, code, current, target)
+    assert as_counter(index, totals) == expected
+
+
+def test_target_at_or_below_current_costs_nothing(index, six_star):
+    state = maxed(six_star)
+
+    assert index.rows(six_star.code, state, state) == []
+    assert index.rows(six_star.code, state, PlanState()) == []
+    assert not index.total([index.rows(six_star.code, state, PlanState())]).any()
+    assert index.total([]).shape == (len(index.items),)
+
+
+def test_invalid_requests(dataset, index):
+    low = next(c for c in dataset.character_order if c.rarity == 3)
+    with pytest.raises(PlannerError):
+        index.rows(low.code, PlanState(), PlanState(masteries=(3, 3)))
+    with pytest.raises(PlannerError):
+        index.rows(low.code, PlanState(), PlanState(modules=(("uniequip_unknown", 1),)))
+    with pytest.raises(KeyError):
+        index.rows("char_unknown", PlanState(), PlanState(phase=1))
@@ -0,0 +1,96 @@
+# tests/test_ranges.py
+"""공격 범위 비트마스크: 타일 포함 / 부분집합 조회가 grids를 직접 비교한 결과와 같아야 함"""
+import pytest
+
+from lib.core.ranges import get_range_index
+
+
+def tiles(record) -> set:
+    return {(grid["row"], grid["col"]) for grid in record.grids}
+
+
+@pytest.fixture(scope="module")
+def index(dataset):
+    return get_range_index(dataset)
+
+
+def matched_ids(index, matched) -> set:
+    return {range_id for range_id, hit in zip(index.range_ids, matched.tolist()) if hit}
+
+
+def test_bounding_box_covers_every_tile(dataset, index):
+    all_tiles = set().union(*(tiles(record) for record in dataset.ranges.values()))
+
+    assert index.row_min == min(row for row, _ in all_tiles)
+    assert index.col_min == min(col for _, col in all_tiles)
+    assert index.rows == max(row for row, _ in all_tiles) - index.row_min + 1
+    assert index.cols == max(col for _, col in all_tiles) - index.col_min + 1
+
+
+def test_covering_matches_grids(dataset, index):
+    for row in range(index.row_min - 1, index.row_min + index.rows + 1):
+        for col in range(index.col_min - 1, index.col_min + index.cols + 1):
+            expected = {range_id for range_id, record in dataset.ranges.items() if (row, col) in tiles(record)}
+            assert matched_ids(index, index.covering(row, col)) == expected, (row, col)
+
+
+def test_supersets_match_grids(dataset, index):
+    for query in ([(0, 0)], [(0, 1), (0, 2)], [(-1, 1), (1, 1)], [(-2, 4)], [(0, 0), (-1, 1)]):
+        expected = {range_id for range_id, record in dataset.ranges.items() if set(query) <= tiles(record)}
+        assert matched_ids(index, index.supersets(index.compile(query))) == expected, query
+
+
+def test_tiles_outside_grid(index):
+    outside = (index.row_min + index.rows, 0)
+
+    assert not index.covering(*outside).any()
+    with pytest.raises(ValueError):
+        index.compile([outside])
+
+
+def test_select_operators_by_phase(dataset, index):
+    matched = index.covering(0, 0)  # 모든 범위가 자기 칸 포함
+    operators, skills = index.select(matched)
+
+    top = {char.code: char.stats[-1] for char in dataset.character_order if char.stats}
+    assert {(entry.code, entry.phase) for entry in operators} == {(code, stat.phase) for code, stat in top.items()}
+    phase_one, _ = index.select(matched, phase=1)
+    assert {entry.code for entry in phase_one} == {c.code for c in dataset.character_order if len(c.stats) > 1}
+    assert all(entry.phase == 1 for entry in phase_one)
+
+    # 스킬: 가장 높은 레벨의 범위, 범위 없는 스킬은 제외
+    with_range = {code: skill.levels[-1].range_id for code, skill in dataset.skills.items() if skill.levels[-1].range_id}
+    assert {entry.code: entry.range_id for entry in skills} == with_range
+
+
+def test_compact_masks_decode_to_grids(dataset, index):
+    compact = index.compact()
+    for entry in compact["ranges"]:
+        value = int(entry["mask"], 16)
+        decoded = {
+            (compact["row_min"] + bit // compact["cols"], compact["col_min"] + bit % compact["cols"])
+            for bit in range(compact["rows"] * compact["cols"]) if value >> bit & 1
+        }
+        assert decoded == tiles(dataset.ranges[entry["range_id"]])
+
+
+
+def test_masks_spanning_several_words(dataset, index, monkeypatch):
+    from lib.core import ranges
+
+    queries = ([(0, 0)], [(-2, 4)], [(1, 3), (-1, 1)])
+    tiles_to_check = [(2, 4), (-2, 0), (0, 3)]
+    expected_supersets = [index.supersets(index.compile(query)) for query in queries]
+    expected_covering = [index.covering(row, col) for row, col in tiles_to_check]
+    expected_masks = [entry["mask"] for entry in index.compact()["ranges"]]
+
+    # 단어 경계를 넘는 비트가 생기도록 단어 크기를 줄여 다시 생성
+    monkeypatch.setattr(ranges, "WORD_BITS", 8)
+    narrow = ranges.RangeIndex(dataset)
+
+    assert narrow.words > 1
+    for query, expected in zip(queries, expected_supersets):
+        assert (narrow.supersets(narrow.compile(query)) == expected).all(), query
+    for (row, col), expected in zip(tiles_to_check, expected_covering):
+        assert (narrow.covering(row, col) == expected).all(), (row, col)
+    assert [entry["mask"] for entry in narrow.compact()["ranges"]] == expected_masks
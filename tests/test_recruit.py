@@ -0,0 +1,86 @@
+# tests/test_recruit.py
+"""공개모집 계산표: 조회 결과가 선택 태그의 모든 부분집합을 직접 탐색한 결과와 같아야 함"""
+import itertools
+import random
+
+import pytest
+
+from lib.core.recruit import (
+    MAX_SELECTED_TAGS, POSITION_TAGS, PROFESSION_TAGS, TOP_OPERATOR_TAG, RecruitError, get_recruit_index
+)
+
+
+def brute_force(index, selected):
+    """태그 조합 -> 오퍼레이터 코드 (최고 희귀도는 고급특별채용이 있을 때만)"""
+    found = {}
+    for size in range(1, min(3, len(selected)) + 1):
+        for subset in itertools.combinations(selected, size):
+            members = [
+                char.code for char in index.pool
+                if set(subset) <= set(index.operator_tags(char))
+                and (char.rarity != index.top_rarity or TOP_OPERATOR_TAG in subset)
+            ]
+            if members:
+                found[frozenset(subset)] = members
+    return found
+
+
+@pytest.fixture(scope="module")
+def index(dataset):
+    return get_recruit_index(dataset)
+
+
+def test_operator_tags(dataset, index):
+    char = next(c for c in index.pool if c.rarity == index.top_rarity)
+    tags = index.operator_tags(char)
+
+    assert PROFESSION_TAGS[char.profession.name_ko] in tags
+    assert POSITION_TAGS[char.position] in tags
+    assert TOP_OPERATOR_TAG in tags
+    assert {tag.tag_name for tag in char.tags} <= set(tags)
+    assert len(index.pool) == len(dataset.characters)
+
+
+def test_lookup_matches_brute_force(index):
+    rng = random.Random(3)
+    for _ in range(200):
+        selected = rng.sample(index.tags, rng.randint(1, MAX_SELECTED_TAGS))
+        got = {frozenset(c.tags): [op.code for op in index.operators(c)] for c in index.lookup(selected)}
+        assert got == brute_force(index, selected), selected
+
+
+def test_top_rarity_needs_top_operator_tag(index):
+    top = next(c for c in index.pool if c.rarity == index.top_rarity)
+    profession = PROFESSION_TAGS[top.profession.name_ko]
+
+    without = index.lookup([profession])
+    with_top = {frozenset(c.tags): c for c in index.lookup([profession, TOP_OPERATOR_TAG])}
+
+    assert all(top not in index.operators(c) for c in without)
+    expected = [
+        op for op in index.pool
+        if op.rarity == index.top_rarity and PROFESSION_TAGS[op.profession.name_ko] == profession
+    ]
+    assert index.operators(with_top[frozenset((profession, TOP_OPERATOR_TAG))]) == expected
+
+
+def test_guaranteed_rarity_and_order(index):
+    combinations = index.lookup([TOP_OPERATOR_TAG, "가드", "딜러", "근거리", "범위공격"])
+    for combination in combinations:
+        rarities = [op.rarity for op in index.operators(combination)]
+        high = [rarity for rarity in rarities if rarity >= index.floor_rarity]
+        assert combination.min_rarity == min(high or rarities)
+    keys = [(-c.min_rarity, len(c.members), len(c.tags), c.tags) for c in combinations]
+    assert keys == sorted(keys)
+    assert combinations[0].min_rarity == index.top_rarity
+
+
+def test_invalid_selections(index):
+    with pytest.raises(RecruitError):
+        index.lookup([])
+    with pytest.raises(RecruitError):
+        index.lookup(list(index.tags[:MAX_SELECTED_TAGS + 1]))
+    with pytest.raises(RecruitError):
+        index.lookup(["없는태그"])
+    # 중복 태그는 1개로 취급
+    assert index.lookup(["가드", "가드"]) == index.lookup(["가드"])
@@ -0,0 +1,99 @@
+# tests/test_search.py
+"""BM25 통합 검색: 토큰화, CSR postings 점수가 문서를 직접 훑어 계산한 BM25와 같아야 함, 순위 / 종류 필터"""
+import math
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from lib.core.search import B, DOC_TYPES, K1, _documents, get_search_index, tokenize
+
+
+def reference_scores(dataset, query: str) -> np.ndarray:
+    """문서마다 필드 가중 토큰 빈도를 세어 BM25를 직접 계산"""
+    frequencies, lengths = [], []
+    for _, fields in _documents(dataset):
+        counter = Counter()
+        length = 0.0
+        for text, weight in fields:
+            tokens = tokenize(text, index=True)
+            length += weight * len(tokens)
+            for token in tokens:
+                counter[token] += weight
+        frequencies.append(counter)
+        lengths.append(length)
+    n = len(frequencies)
+    average = sum(lengths) / n
+    scores = np.zeros(n)
+    for token in set(tokenize(query)):
+        df = sum(token in counter for counter in frequencies)
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for doc, counter in enumerate(frequencies):
+            tf = counter.get(token, 0.0)
+            if tf:
+                scores[doc] += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * lengths[doc] / average))
+    return scores
+
+
+@pytest.fixture(scope="module")
+def index(dataset):
+    return get_search_index(dataset)
+
+
+def test_tokenize():
+    assert tokenize("공격력") == ["공격", "격력"]
+    assert tokenize("공격력", index=True) == ["공격", "격력", "공", "격", "력"]
+    assert tokenize("칩") == ["칩"]
+    # 서식 태그 / 치환자 제거, NFKC + 소문자
+    assert tokenize("<@ba.vup>{atk:0%}</> ＡＴＫ 증가") == ["at", "tk", "증가"]
+    assert tokenize(None) == [] and tokenize("") == []
+
+
+def test_documents_cover_every_type(dataset, index):
+    counts = Counter(doc.doc_type for doc in index.documents)
+
+    assert counts["operator"] == len(dataset.characters)
+    assert counts["skill"] == len(dataset.skills)
+    assert counts["module"] == sum(len(char.modules) for char in dataset.character_order)
+    assert counts["item"] == len(dataset.items)
+
+
+@pytest.mark.parametrize("query", ["고급 메모리칩", "공격력을 증가", "칩", "합성 오퍼레이터 17", "전술"])
+def test_scores_match_reference_bm25(dataset, index, query):
+    assert np.allclose(index.scores(query), reference_scores(dataset, query), rtol=1e-4)
+
+
+def test_exact_name_ranks_first(index):
+    _, results = index.search("고급 메모리칩")
+
+    assert (results[0][0].doc_type, results[0][0].name_ko) == ("item", "고급 메모리칩")
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_inflected_and_single_character_queries_match(index):
+    # 조사가 붙은 형태 / 1글자 검색어도 bigram / unigram으로 찾음
+    counts, _ = index.search("공격력을")
+    assert counts["skill"] > 0
+    _, results = index.search("칩", types=["item"])
+    assert results and all("칩" in doc.name_ko for doc, _ in results)
+
+
+def test_type_filter_and_limit(index):
+    counts, results = index.search("메모리칩", types=["module"], limit=3)
+    all_counts, all_results = index.search("메모리칩", limit=1000)
+
+    assert counts == all_counts  # 종류별 개수는 필터와 무관
+    assert set(counts) == set(DOC_TYPES)
+    assert len(results) == min(3, counts["module"])
+    assert all(doc.doc_type == "module" and doc.character_code for doc, _ in results)
+    assert len(all_results) == sum(all_counts.values())
+    # 같은 점수끼리는 상위 limit개 경계에서 어느 쪽이 남을지 정해지지 않으므로 점수로 비교
+    assert [score for _, score in results] == [score for doc, score in all_results if doc.doc_type == "module"][:3]
+
+
+def test_unknown_query_matches_nothing(index):
+    counts, results = index.search("존재하지않는검색어")
+
+    assert results == []
+    assert sum(counts.values()) == 0
@@ -0,0 +1,132 @@
+# tests/test_stats.py
+"""스탯 보간 엔진: 벡터 계산 결과가 오퍼레이터 1명씩 키프레임을 직접 보간한 값과 같아야 함"""
+import math
+import random
+
+import pytest
+
+from lib.core.stats import ATTRIBUTES, INTEGER_ATTRIBUTES, StatIndex, StatQuery, _stat_keyframes, get_stat_index
+
+
+def expected_stats(char, query: StatQuery) -> dict:
+    """키프레임 선형 보간 + 신뢰도 + 잠재 보정 기준값"""
+    stat = next(s for s in char.stats if s.phase == query.phase)
+    level = stat.max_level if query.level is None else query.level
+    frames = sorted(_stat_keyframes(stat), key=lambda kf: kf["level"])
+    lower = max((kf for kf in frames[:-1] if kf["level"] <= level), key=lambda kf: kf["level"], default=frames[0])
+    upper = frames[frames.index(lower) + 1] if frames.index(lower) + 1 < len(frames) else lower
+    span = upper["level"] - lower["level"]
+    ratio = min(max((level - lower["level"]) / span, 0.0), 1.0) if span else 0.0
+
+    values = {}
+    for name in ATTRIBUTES:
+        if lower.get(name) is None:
+            values[name] = math.nan
+            continue
+        values[name] = lower[name] + (upper[name] - lower[name]) * ratio
+    if char.favor is not None:
+        trust = min(query.trust, char.favor.max_favor_level) / char.favor.max_favor_level
+        for name, bonus in (("max_hp", char.favor.bonus_hp), ("atk", char.favor.bonus_atk), ("def", char.favor.bonus_def)):
+            values[name] += bonus * trust
+    for potential in char.potentials:
+        if potential.potential_rank + 2 <= query.potential:
+            for attribute in potential.attributes:
+                values[attribute["attribute"]] += attribute["value"]
+    return {
+        name: None if math.isnan(value) else (int(round(value)) if name in INTEGER_ATTRIBUTES else round(value, 3))
+        for name, value in values.items()
+    }
+
+
+def compute_one(index: StatIndex, code: str, query: StatQuery):
+    stats, levels, valid = index.compute(index.rows_for([code]), query)
+    return StatIndex.to_dict(stats[0]), int(levels[0]), bool(valid[0])
+
+
+@pytest.fixture(scope="module")
+def index(dataset):
+    return get_stat_index(dataset)
+
+
+def test_keyframe_endpoints(dataset, index):
+    char = next(c for c in dataset.character_order if c.rarity == 5)
+    for stat in char.stats:
+        first, last = stat.keyframes[0], stat.keyframes[-1]
+        at_one, _, _ = compute_one(index, char.code, StatQuery(stat.phase, 1))
+        at_max, level, valid = compute_one(index, char.code, StatQuery(stat.phase))
+        assert valid and level == stat.max_level
+        assert (at_one["max_hp"], at_one["atk"], at_one["def"]) == (first["max_hp"], first["atk"], first["def"])
+        assert (at_max["max_hp"], at_max["atk"], at_max["def"]) == (last["max_hp"], last["atk"], last["def"])
+        assert at_max["base_attack_time"] == last["base_attack_time"]
+
+
+def test_three_keyframes_interpolate_per_segment(dataset, index):
+    char = next(c for c in dataset.character_order if any(len(s.keyframes) == 3 for s in c.stats))
+    stat = next(s for s in char.stats if len(s.keyframes) == 3)
+    middle = stat.keyframes[1]
+
+    at_middle, _, _ = compute_one(index, char.code, StatQuery(stat.phase, middle["level"]))
+    assert at_middle["max_hp"] == middle["max_hp"]
+    # 중간 키프레임 이후 구간은 (중간 -> 최대) 기울기로 보간
+    level = middle["level"] + (stat.max_level - middle["level"]) // 2
+    after, _, _ = compute_one(index, char.code, StatQuery(stat.phase, level))
+    assert after == expected_stats(char, StatQuery(stat.phase, level))
+
+
+def test_vectorized_compute_matches_reference(dataset, index):
+    rng = random.Random(3)
+    rows = index.rows_for()
+    for _ in range(30):
+        query = StatQuery(rng.randint(0, 2), rng.choice([None, 1, 20, 35]), rng.randint(0, 200), rng.randint(1, 6))
+        stats, levels, valid = index.compute(rows, query)
+        for row, char in enumerate(dataset.character_order):
+            if not valid[row]:
+                continue
+            assert StatIndex.to_dict(stats[row]) == expected_stats(char, query), (char.code, query)
+
+
+def test_trust_bonus_stops_at_max_favor(dataset, index):
+    char = next(c for c in dataset.character_order if c.favor is not None and c.favor.bonus_hp)
+    base, _, _ = compute_one(index, char.code, StatQuery(0, 1, trust=0))
+    half, _, _ = compute_one(index, char.code, StatQuery(0, 1, trust=50))
+    full, _, _ = compute_one(index, char.code, StatQuery(0, 1, trust=100))
+    over, _, _ = compute_one(index, char.code, StatQuery(0, 1, trust=200))
+
+    assert full == over
+    assert full["max_hp"] - base["max_hp"] == char.favor.bonus_hp
+    assert half["max_hp"] - base["max_hp"] == round(char.favor.bonus_hp / 2)
+
+
+def test_potentials_accumulate(dataset, index):
+    char = dataset.character_order[0]
+    by_potential = [compute_one(index, char.code, StatQuery(0, 1, potential=p))[0] for p in range(1, 7)]
+
+    # 합성 원본: 2잠 코스트 -1, 3잠 재배치 -4, 4잠 공격력 +25, 6잠 코스트 -1
+    assert [stats["cost"] for stats in by_potential] == [by_potential[0]["cost"] - d for d in (0, 1, 1, 1, 1, 2)]
+    assert by_potential[2]["respawn_time"] == by_potential[0]["respawn_time"] - 4
+    assert by_potential[3]["atk"] == by_potential[0]["atk"] + 25
+
+
+def test_missing_phase_or_level_over_max_is_invalid(dataset, index):
+    low = next(c for c in dataset.character_order if len(c.stats) == 1)
+    _, _, valid = compute_one(index, low.code, StatQuery(2, 1))
+    assert not valid
+    _, _, valid = compute_one(index, low.code, StatQuery(0, low.stats[0].max_level + 1))
+    assert not valid
+    with pytest.raises(KeyError):
+        index.rows_for(["char_unknown"])
+
+
+def test_records_without_keyframes_use_base_and_max():
+    from lib.core.dataset import StatRecord
+
+    stat = StatRecord(0, 50, None, 100, 10, 5, 300, 30, 15, 0, 10, 2, 100, None, ())
+    frames = _stat_keyframes(stat)
+
+    assert [(kf["level"], kf["max_hp"], kf["atk"], kf["def"]) for kf in frames] == [(1, 100, 10, 5), (50, 300, 30, 15)]
+    assert all(kf["cost"] == 10 and kf["block_cnt"] == 2 for kf in frames)
+    assert "base_attack_time" not in frames[0]  # 알 수 없는 스탯은 NaN -> 응답 null
+
+
+def test_arrays_are_read_only(index):
+    assert not any(array.flags.writeable for array in (index.levels, index.values, index.potentials, index.favor))
@@ -0,0 +1,55 @@
+# tests/test_transform.py
+"""character_table 단일 패스 변환: 프로세스 풀 shard 결과가 단일 프로세스 결과와 같아야 함"""
+import pytest
+
+from lib.bench.fixtures import synthetic_sources
+from lib.etl import transform
+from lib.etl.rows import RowBatches
+from lib.etl.transform import transform_all, transform_character_table
+
+
+@pytest.fixture(scope="module")
+def sources():
+    return synthetic_sources(operators=150, seed=7)
+
+
+def test_sharded_transform_matches_single_process(sources, monkeypatch):
+    single = transform_all(sources, workers=1)
+    # 작은 데이터에서도 여러 shard로 나뉘도록 최소 크기를 낮춤 (150명 / 3워커 x 4 = 13명씩 12개 shard)
+    monkeypatch.setattr(transform, "MIN_SHARD_SIZE", 8)
+    sharded = transform_all(sources, workers=3)
+
+    assert sharded.counts() == single.counts()
+    for table in single.tables:
+        assert sharded[table] == single[table], table
+    assert sharded.skipped == single.skipped
+    assert sharded.fingerprint() == single.fingerprint()
+
+
+def test_sharded_transform_keeps_source_order_and_unique_masters(sources, monkeypatch):
+    monkeypatch.setattr(transform, "MIN_SHARD_SIZE", 8)
+    out = RowBatches()
+    transform_character_table(sources["character"], out, workers=3)
+
+    obtainable = [code for code, info in sources["character"].items() if not info.get("isNotObtainable")]
+    assert [row.code for row in out["characters"]] == obtainable
+    assert out.skipped[("characters", "not_obtainable")] == 1
+
+    # 직군 / 태그 마스터는 shard마다 수집되지만 최초 등장 순서로 1번씩만 남음
+    first_seen = list(dict.fromkeys(info["profession"] for info in sources["character"].values()))
+    assert [row.code for row in out["professions"]] == first_seen
+    tags = [row.name for row in out["tags"]]
+    assert len(tags) == len(set(tags))
+    assert set(tags) == {tag for info in sources["character"].values() for tag in info.get("tagList") or ()}
+
+
+def test_small_tables_stay_in_process(sources, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("MIN_SHARD_SIZE보다 작은 입력은 프로세스 풀을 쓰지 않아야 함")
+
+    monkeypatch.setattr(transform, "ProcessPoolExecutor", fail)
+    small = dict(list(sources["character"].items())[:transform.MIN_SHARD_SIZE - 1])
+    out = RowBatches()
+    transform_character_table(small, out, workers=8)
+
+    assert len(out["characters"]) == len(small) - sum(bool(info.get("isNotObtainable")) for info in small.values())
@@ -0,0 +1,73 @@
+# tests/test_usages.py
+"""아이템 -> 소비처 역색인: 종류별 합계가 비용 레코드를 직접 더한 값과 같아야 함"""
+from collections import Counter, defaultdict
+
+import pytest
+
+from lib.core.usages import CONSUMER_TYPES, empty_totals, get_usage_index
+
+
+def expected_usages(dataset):
+    """item_code -> (종류별 합계, 소비처 집합)"""
+    totals = defaultdict(Counter)
+    consumers = defaultdict(set)
+
+    def add(consumer_type: str, code: str, costs):
+        for cost in costs:
+            totals[cost.item.item_code][consumer_type] += cost.count
+            consumers[cost.item.item_code].add((consumer_type, code))
+
+    for char in dataset.character_order:
+        add("promotion", char.code, char.promotion_costs)
+        add("skill", char.code, char.skill_costs)
+        for module in char.modules:
+            add("module", module.module_code, module.costs)
+    for skill in dataset.skills.values():
+        add("mastery", skill.skill_code, skill.mastery_costs)
+    return totals, consumers
+
+
+@pytest.fixture(scope="module")
+def index(dataset):
+    return get_usage_index(dataset)
+
+
+def test_totals_match_cost_records(dataset, index):
+    totals, consumers = expected_usages(dataset)
+
+    assert set(index) == set(totals)
+    for item_code, usage in index.items():
+        expected = {**empty_totals(), **totals[item_code]}
+        expected["all"] = sum(totals[item_code].values())
+        assert usage.totals == expected, item_code
+        assert usage.consumers == len(consumers[item_code])
+        assert sum(record.count for record in usage.usages) == expected["all"]
+
+
+def test_usages_are_sorted_by_type_code_and_level(index):
+    order = {consumer_type: position for position, consumer_type in enumerate(CONSUMER_TYPES)}
+    for usage in index.values():
+        keys = [(order[r.consumer_type], r.consumer_code, r.level) for r in usage.usages]
+        assert keys == sorted(keys)
+
+
+def test_mastery_usage_points_to_skill_owner(dataset, index):
+    owners = {}
+    for char in dataset.character_order:
+        for code in char.skill_slots or ():
+            if code:
+                owners.setdefault(code, char.code)
+
+    records = [r for usage in index.values() for r in usage.usages if r.consumer_type == "mastery"]
+    assert records
+    for record in records:
+        assert record.character_code == owners[record.consumer_code]
+        assert record.name_ko == dataset.skills[record.consumer_code].name_ko
+        assert 1 <= record.level <= 3
+
+
+def test_items_without_consumers_use_empty_totals(dataset, index):
+    assert set(index) <= set(dataset.items)
+    # 소비처가 없는 아이템 응답도 같은 키를 가짐
+    assert empty_totals() == {"promotion": 0, "skill": 0, "mastery": 0, "module": 0, "all": 0}
+    assert all(usage.totals.keys() == empty_totals().keys() for usage in index.values())